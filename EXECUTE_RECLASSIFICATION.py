@@ -22,6 +22,8 @@ if sys.stdout.encoding != 'utf-8':
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from ppp.receipts.diff import RunDiff, iter_drift_report
+
 print("=" * 80)
 print("RE-CLASSIFICATION: Verify Post-Movement Placement")
 print("=" * 80)
@@ -111,6 +113,16 @@ try:
     print(f"  Change:    {deny_count - original_deny} files")
     print()
 
+    # Per-document decision transitions (drift reports list only MITIGATE/DENY)
+    engine = RunDiff(key="document_id", absent_decision="ALLOW")
+    changes = list(engine.diff(iter_drift_report(original_report), iter_drift_report(result)))
+    print("DECISION TRANSITIONS:")
+    for transition, count in engine.summary["transitions"].most_common():
+        print(f"  {transition}: {count} files")
+    if not changes:
+        print("  (none)")
+    print()
+
     # Analyze remaining MITIGATE findings
     mitigations = result.get("mitigations", [])
     denials = result.get("denials", [])
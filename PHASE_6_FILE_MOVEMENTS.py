@@ -20,26 +20,28 @@ Directives NOT executed (rejected/modification):
 - Directives C, G, K: 84 files MODIFY (STAY IN PLACE, flag for remediation)
 
 This script:
-1. Loads file decision mappings
+1. Streams file decision mappings
 2. Groups moves by source → target repo
-3. Performs file moves with audit trail
+3. Performs file moves with audit trail (ppp.workflows.file_mover: os.rename on
+   the same filesystem, parallel copy + hash verify + unlink otherwise)
 4. Tracks success/failure per move
-5. Generates move audit log
+5. Appends to the move audit log, which doubles as the resume journal
+   (re-running after an interruption finishes the remaining moves)
 6. Prepares for re-classification
 """
 
 import sys
 import json
 from pathlib import Path
-from datetime import datetime
-from collections import defaultdict
-import shutil
+from collections import Counter, defaultdict
 
 if sys.stdout.encoding != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from ppp.workflows.file_mover import FileMove, FileMover, load_file_decisions, plan_moves
+
 print("=" * 80)
 print("WF_DOCS_CATEGORIZATION_GOVERNANCE_v1 - PHASE 6 FILE MOVEMENTS")
 print("=" * 80)
@@ -53,15 +55,6 @@ file_decisions_path = decisions_dir / "file_decisions.jsonl"
 with open(directives_path) as f:
     directive_receipts = json.load(f)
 
-file_decisions = []
-with open(file_decisions_path) as f:
-    for line in f:
-        file_decisions.append(json.loads(line))
-
-print(f"[LOAD] Directive receipts: {len(directive_receipts)}")
-print(f"[LOAD] File decisions: {len(file_decisions)}")
-print()
-
 # Directives approved for movement
 MOVE_DIRECTIVES = {"A", "B", "E", "F", "I", "J", "DENIAL-2"}
 
@@ -69,39 +62,48 @@ MOVE_DIRECTIVES = {"A", "B", "E", "F", "I", "J", "DENIAL-2"}
 REJECT_DIRECTIVES = {"D", "H"}
 MODIFY_DIRECTIVES = {"C", "G", "K"}
 
-# Build move plan
-move_plan = defaultdict(list)
-stay_in_place = defaultdict(list)
-flagged_for_remediation = defaultdict(list)
+# Build move plan (decisions are streamed, only moves are kept)
+moves = []
+directive_counts = Counter()
+stay_in_place = defaultdict(int)
+flagged_for_remediation = defaultdict(int)
 
-for decision in file_decisions:
+for decision in load_file_decisions(str(file_decisions_path)):
     directive = decision.get('assigned_directive')
-    doc_id = decision.get('document_id')
-    source = decision.get('source_repo')
-    target = decision.get('target_repo')
-    decision_type = decision.get('decision_type')
+    directive_counts[directive] += 1
 
     if directive in MOVE_DIRECTIVES:
-        move_plan[f"{source}|{target}|{directive}"].append(doc_id)
+        moves.append(FileMove.from_decision(decision))
     elif directive in REJECT_DIRECTIVES:
-        stay_in_place[source].append((doc_id, directive))
+        stay_in_place[decision.get('source_repo')] += 1
     elif directive in MODIFY_DIRECTIVES:
-        flagged_for_remediation[directive].append(doc_id)
+        flagged_for_remediation[directive] += 1
+
+print(f"[LOAD] Directive receipts: {len(directive_receipts)}")
+print(f"[LOAD] File decisions: {sum(directive_counts.values())}")
+print()
 
 print("=" * 80)
 print("MOVEMENT PLAN SUMMARY")
 print("=" * 80)
 print()
 
-total_to_move = sum(len(files) for files in move_plan.values())
-total_staying = sum(len(files) for files in stay_in_place.values())
-total_remediation = sum(len(files) for files in flagged_for_remediation.values())
+total_to_move = len(moves)
+total_staying = sum(stay_in_place.values())
+total_remediation = sum(flagged_for_remediation.values())
 
 print(f"Files to move: {total_to_move}")
 print(f"Files staying in place: {total_staying}")
 print(f"Files flagged for remediation: {total_remediation}")
 print()
 
+# Two documents mapped onto one target path are rejected (the mover journals them as failed)
+_, contested_targets = plan_moves(moves)
+for (target_repo, rel_path), document_ids in sorted(contested_targets.items()):
+    print(f"[PLAN] Duplicate target {target_repo}/{rel_path}: {', '.join(document_ids)} (not moved)")
+if contested_targets:
+    print()
+
 # Define repo paths
 repos = {
     'omega-docs': Path("D:/Repos/omega-docs"),
@@ -122,68 +124,25 @@ print("EXECUTING MOVEMENTS")
 print("=" * 80)
 print()
 
-movement_log = []
-
-for move_key, files in sorted(move_plan.items()):
-    source_repo, target_repo, directive = move_key.split('|')
+movement_log_path = decisions_dir / "movement_audit_log.jsonl"
+mover = FileMover(repos, str(movement_log_path))
+execution = mover.move_all(moves)
+
+# Per-directive report (grouped by source → target repo and directive)
+by_move_key = defaultdict(lambda: {'moved': [], 'failed': []})
+for entry in execution['results']:
+    move_key = (entry['source_repo'], entry['target_repo'], entry['directive'])
+    if entry['status'] == "failed":
+        by_move_key[move_key]['failed'].append((entry['document_id'], entry['reason']))
+    else:
+        by_move_key[move_key]['moved'].append(entry['document_id'])
+
+for (source_repo, target_repo, directive), outcome in sorted(by_move_key.items()):
+    successful_moves = outcome['moved']
+    failed_moves = outcome['failed']
 
     print(f"Directive {directive}: {source_repo} → {target_repo}")
-    print(f"  Files: {len(files)}")
-
-    source_base = repos[source_repo]
-    target_base = repos[target_repo]
-
-    successful_moves = []
-    failed_moves = []
-
-    for doc_id in files:
-        # Convert doc_id to file path
-        # doc_id format: "repo/path/to/file.md"
-        file_path = Path(doc_id.replace(f"{source_repo}/", ""))
-        source_file = source_base / file_path
-        target_file = target_base / file_path
-
-        # Create target directory if needed
-        target_file.parent.mkdir(parents=True, exist_ok=True)
-
-        try:
-            if source_file.exists():
-                # Move file
-                shutil.move(str(source_file), str(target_file))
-                successful_moves.append(doc_id)
-
-                movement_log.append({
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "directive": directive,
-                    "document_id": doc_id,
-                    "source_repo": source_repo,
-                    "target_repo": target_repo,
-                    "status": "success",
-                    "source_path": str(source_file),
-                    "target_path": str(target_file)
-                })
-            else:
-                failed_moves.append((doc_id, "source file not found"))
-                movement_log.append({
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "directive": directive,
-                    "document_id": doc_id,
-                    "source_repo": source_repo,
-                    "target_repo": target_repo,
-                    "status": "failed",
-                    "reason": "source file not found"
-                })
-        except Exception as e:
-            failed_moves.append((doc_id, str(e)))
-            movement_log.append({
-                "timestamp": datetime.utcnow().isoformat(),
-                "directive": directive,
-                "document_id": doc_id,
-                "source_repo": source_repo,
-                "target_repo": target_repo,
-                "status": "failed",
-                "reason": str(e)
-            })
+    print(f"  Files: {len(successful_moves) + len(failed_moves)}")
 
     # Track for per-repo commits
     moves_by_source_repo[source_repo]['moved'].extend(successful_moves)
@@ -204,19 +163,19 @@ print("MOVEMENT EXECUTION SUMMARY")
 print("=" * 80)
 print()
 
+summary = execution['summary']
 total_successful = sum(len(moves['moved']) for moves in moves_by_source_repo.values())
 total_failed = sum(len(moves['failed']) for moves in moves_by_source_repo.values())
 
 print(f"Total successful moves: {total_successful}")
+if summary['already_moved']:
+    print(f"  (of which already moved by an earlier run: {summary['already_moved']})")
 print(f"Total failed moves: {total_failed}")
+print(f"Elapsed: {summary['elapsed_seconds']}s ({summary['moves_per_second']} moves/s, "
+      f"{summary['bytes_copied']} bytes copied across filesystems)")
 print()
 
-# Save movement audit log
-movement_log_path = decisions_dir / "movement_audit_log.jsonl"
-with open(movement_log_path, 'w') as f:
-    for entry in movement_log:
-        f.write(json.dumps(entry) + '\n')
-print(f"[OK] Movement audit log saved: {movement_log_path}")
+print(f"[OK] Movement audit log (journal) appended: {movement_log_path}")
 
 # Generate per-repo commit instructions
 print()
@@ -240,7 +199,7 @@ for source_repo, moves_info in sorted(moves_by_source_repo.items()):
         "files_failed": len(moves_info['failed']),
         "directives": directives_list,
         "commit_message": f"docs: apply governance directives ({directive_refs})\n\nExecute file movements authorized by human directives:\n" +
-                         "\n".join(f"  - {d}: {sum(1 for move in move_plan.values() if d in move)} files"
+                         "\n".join(f"  - {d}: {sum(len(outcome['moved']) for key, outcome in by_move_key.items() if key[0] == source_repo and key[2] == d)} files"
                                  for d in directives_list) +
                          f"\n\nTotal moves: {len(moves_info['moved'])}\nPhase: 6-movement\nEvidence: decisions/movement_audit_log.jsonl"
     }
@@ -269,13 +228,13 @@ print()
 
 print("REJECTED (STAY IN PLACE):")
 for directive in sorted(REJECT_DIRECTIVES):
-    count = sum(1 for d in file_decisions if d.get('assigned_directive') == directive)
+    count = directive_counts[directive]
     print(f"  Directive {directive}: {count} files - No movement authorized")
 
 print()
 print("MODIFICATION REQUIRED (STAY IN PLACE, FLAG FOR REMEDIATION):")
 for directive in sorted(MODIFY_DIRECTIVES):
-    count = sum(1 for d in file_decisions if d.get('assigned_directive') == directive)
+    count = directive_counts[directive]
     print(f"  Directive {directive}: {count} files - Flagged for language remediation")
 
 print()
@@ -22,150 +22,55 @@ This is the way. [PANTHEON]
 """
 
 import asyncio
-import httpx
 import json
-import base64
-import hmac
 import hashlib
 import os
-import time
+import sys
 import uuid
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "ops" / "proof"))
+from fc_client import FCClient
+
 # Configuration
 FC_BASE_URL = os.getenv("FC_BASE_URL", "http://localhost:9405")
-SECRET_KEY = os.getenv("SECRET_KEY", "bWVtYmVyaGFuZHNvbWVub3NoYXBlcmVtZW1iZXJib3htb25rZXluYXRpdmVkaXJlY3Q=")
 TENANT_ID = "tenant_omega"
+ACTOR_ID = "pt016_b_harness"
+SCOPES = ["workflow:read", "workflow:write", "gate:read", "gate:write", "mcp:invoke"]
 OUTPUT_DIR = Path("REPORT/PROOFS/PT-016-B-HARNESS/EVIDENCE")
 
 
-def generate_bearer_token(server_id: str = "pt016_b_harness", scopes: Optional[List[str]] = None, ttl_seconds: int = 3600) -> str:
-    """Generate HMAC-signed bearer token for FC."""
-    if scopes is None:
-        scopes = ["workflow:read", "workflow:write", "gate:read", "gate:write", "mcp:invoke"]
-
-    issued_at = int(time.time())
-    expires_at = issued_at + ttl_seconds
+def create_client(**kwargs: Any) -> FCClient:
+    """Create the pooled FC client shared by every call in one harness run."""
+    return FCClient(FC_BASE_URL, tenant_id=TENANT_ID, actor_id=ACTOR_ID, scopes=SCOPES, **kwargs)
 
-    payload = {
-        "server_id": server_id,
-        "scopes": scopes,
-        "iat": issued_at,
-        "exp": expires_at,
-        "jti": base64.urlsafe_b64encode(os.urandom(16)).decode().rstrip("=")
-    }
 
-    payload_json = base64.urlsafe_b64encode(
-        json.dumps(payload, separators=(',', ':')).encode()
-    ).decode().rstrip("=")
+async def create_workflow_run(fc: FCClient, workflow_id: str, input_payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Create a workflow run in FC."""
+    return await fc.create_run(workflow_id, input_payload)
 
-    signature = hmac.new(
-        SECRET_KEY.encode(),
-        payload_json.encode(),
-        hashlib.sha256
-    ).digest()
-    signature_b64 = base64.urlsafe_b64encode(signature).decode().rstrip("=")
 
-    return f"omega_{payload_json}.{signature_b64}"
+async def get_run_with_logs(fc: FCClient, run_id: str) -> Dict[str, Any]:
+    """Get run details with logs."""
+    return await fc.get_run(run_id, include_gates=False)
 
 
-async def create_workflow_run(workflow_id: str, input_payload: Dict[str, Any], token: str) -> Dict[str, Any]:
-    """Create a workflow run in FC."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{FC_BASE_URL}/api/fc/runs",
-            json={
-                "workflow_id": workflow_id,
-                "workflow_version": "1.0.0",
-                "input_payload": input_payload,
-            },
-            headers={
-                "Authorization": f"Bearer {token}",
-                "X-Tenant-Id": TENANT_ID,
-                "X-Actor-Id": "pt016_b_harness",
-            }
-        )
-        response.raise_for_status()
-        return response.json()
-
-
-async def get_run_with_logs(run_id: str, token: str) -> Dict[str, Any]:
-    """Get run details with logs."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{FC_BASE_URL}/api/fc/runs/{run_id}",
-            headers={
-                "Authorization": f"Bearer {token}",
-                "X-Tenant-Id": TENANT_ID,
-                "X-Actor-Id": "pt016_b_harness",
-            }
-        )
-        response.raise_for_status()
-        return response.json()
-
-
-async def create_gate(run_id: str, step_id: str, gate_name: str, required_approvers: List[str], token: str) -> Dict[str, Any]:
+async def create_gate(fc: FCClient, run_id: str, step_id: str, gate_name: str, required_approvers: List[str]) -> Dict[str, Any]:
     """Create an approval gate."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{FC_BASE_URL}/api/fc/runs/{run_id}/gate",
-            json={
-                "step_id": step_id,
-                "gate_type": "human_approval",
-                "gate_name": gate_name,
-                "description": f"Gate for {gate_name}",
-                "required_approvers": required_approvers,
-                "timeout_seconds": 3600,
-            },
-            headers={
-                "Authorization": f"Bearer {token}",
-                "X-Tenant-Id": TENANT_ID,
-                "X-Actor-Id": "pt016_b_harness",
-            }
-        )
-        response.raise_for_status()
-        return response.json()
-
-
-async def resolve_gate(gate_id: str, status: str, token: str, actor_id: str = "approver_1", rejection_reason: Optional[str] = None) -> Dict[str, Any]:
+    return await fc.create_gate(run_id, step_id, gate_name, required_approvers)
+
+
+async def resolve_gate(fc: FCClient, gate_id: str, status: str, actor_id: str = "approver_1", rejection_reason: Optional[str] = None) -> Dict[str, Any]:
     """Resolve a gate (approve or reject)."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{FC_BASE_URL}/api/fc/gates/{gate_id}",
-            json={
-                "status": status,
-                "rejection_reason": rejection_reason,
-            },
-            headers={
-                "Authorization": f"Bearer {token}",
-                "X-Tenant-Id": TENANT_ID,
-                "X-Actor-Id": actor_id,
-            }
-        )
-        response.raise_for_status()
-        return response.json()
-
-
-async def invoke_mcp_tool(tool_name: str, parameters: Dict[str, Any], token: str) -> Dict[str, Any]:
+    return await fc.resolve_gate(gate_id, status, actor_id=actor_id, rejection_reason=rejection_reason)
+
+
+async def invoke_mcp_tool(fc: FCClient, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
     """Invoke an MCP tool via FC."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{FC_BASE_URL}/mcp/tools/invoke",
-            json={
-                "tool_name": tool_name,
-                "parameters": parameters,
-            },
-            headers={
-                "Authorization": f"Bearer {token}",
-                "X-Tenant-Id": TENANT_ID,
-                "X-Actor-Id": "pt016_b_harness",
-            }
-        )
-        response.raise_for_status()
-        return response.json()
+    return await fc.invoke_mcp_tool(tool_name, parameters)
 
 
 @dataclass
@@ -202,7 +107,7 @@ def compute_death_receipt_hash(birth_receipt_hash: str, spawned_entity_id: str,
     return hashlib.sha256(data.encode()).hexdigest()
 
 
-async def scenario_a_revoke(token: str, run_timestamp: str) -> Dict[str, Any]:
+async def scenario_a_revoke(fc: FCClient, run_timestamp: str) -> Dict[str, Any]:
     """Scenario A: Revoke (Human-Gated)."""
     print("\n" + "="*70)
     print("SCENARIO A: REVOKE (HUMAN-GATED)")
@@ -221,7 +126,7 @@ async def scenario_a_revoke(token: str, run_timestamp: str) -> Dict[str, Any]:
             "initiator_id": "test_operator"
         }
 
-        revoke_result = await invoke_mcp_tool("revoke_entity", revoke_params, token)
+        revoke_result = await invoke_mcp_tool(fc, "revoke_entity", revoke_params)
         print(f"[OK] Revocation initiated: run={revoke_result.get('run_id')}, gate={revoke_result.get('gate_id')}")
 
         run_id = revoke_result.get("run_id")
@@ -230,12 +135,12 @@ async def scenario_a_revoke(token: str, run_timestamp: str) -> Dict[str, Any]:
 
         # Step 3: Approve gate
         await asyncio.sleep(0.5)
-        gate_result = await resolve_gate(gate_id, "approved", token, actor_id="approver_1")
+        gate_result = await resolve_gate(fc, gate_id, "approved", actor_id="approver_1")
         print(f"[OK] Gate approved: {gate_result.get('status')}")
 
         # Step 4: Verify FC_GENESIS_REVOKED event
         await asyncio.sleep(0.5)
-        run_data = await get_run_with_logs(run_id, token)
+        run_data = await get_run_with_logs(fc, run_id)
         logs = run_data.get("logs", [])
         revoked_event = next((log for log in logs if "REVOKED" in log.get("event_type", "")), None)
 
@@ -265,7 +170,7 @@ async def scenario_a_revoke(token: str, run_timestamp: str) -> Dict[str, Any]:
         return {"scenario": "A", "status": "failed", "error": str(e)}
 
 
-async def scenario_b_terminate(token: str, run_timestamp: str) -> Dict[str, Any]:
+async def scenario_b_terminate(fc: FCClient, run_timestamp: str) -> Dict[str, Any]:
     """Scenario B: Terminate (System)."""
     print("\n" + "="*70)
     print("SCENARIO B: TERMINATE (SYSTEM)")
@@ -284,7 +189,7 @@ async def scenario_b_terminate(token: str, run_timestamp: str) -> Dict[str, Any]
             "initiator_id": "system_enforcer"
         }
 
-        terminate_result = await invoke_mcp_tool("terminate_entity", terminate_params, token)
+        terminate_result = await invoke_mcp_tool(fc, "terminate_entity", terminate_params)
         print(f"[OK] Termination initiated: run={terminate_result.get('run_id')}")
 
         run_id = terminate_result.get("run_id")
@@ -293,7 +198,7 @@ async def scenario_b_terminate(token: str, run_timestamp: str) -> Dict[str, Any]
 
         # Step 3: Verify FC_GENESIS_TERMINATED event
         await asyncio.sleep(0.5)
-        run_data = await get_run_with_logs(run_id, token)
+        run_data = await get_run_with_logs(fc, run_id)
         logs = run_data.get("logs", [])
         terminated_event = next((log for log in logs if "TERMINATED" in log.get("event_type", "")), None)
 
@@ -323,7 +228,7 @@ async def scenario_b_terminate(token: str, run_timestamp: str) -> Dict[str, Any]
         return {"scenario": "B", "status": "failed", "error": str(e)}
 
 
-async def scenario_c_fail_closed(token: str, run_timestamp: str) -> Dict[str, Any]:
+async def scenario_c_fail_closed(fc: FCClient, run_timestamp: str) -> Dict[str, Any]:
     """Scenario C: Fail-Closed Receipt Integrity."""
     print("\n" + "="*70)
     print("SCENARIO C: FAIL-CLOSED RECEIPT INTEGRITY")
@@ -358,7 +263,7 @@ async def scenario_c_fail_closed(token: str, run_timestamp: str) -> Dict[str, An
         return {"scenario": "C", "status": "failed", "error": str(e)}
 
 
-async def scenario_d_no_silent_delete(token: str, run_timestamp: str) -> Dict[str, Any]:
+async def scenario_d_no_silent_delete(fc: FCClient, run_timestamp: str) -> Dict[str, Any]:
     """Scenario D: No Silent Deletion."""
     print("\n" + "="*70)
     print("SCENARIO D: NO SILENT DELETION")
@@ -389,16 +294,16 @@ async def main():
     print("="*70)
 
     run_timestamp = datetime.now(timezone.utc).isoformat()
-    token = generate_bearer_token()
-    print(f"[OK] Generated bearer token")
     print(f"[OK] Run timestamp: {run_timestamp}")
 
-    # Run all scenarios
+    # Run all scenarios over one pooled client
     results = []
-    results.append(await scenario_a_revoke(token, run_timestamp))
-    results.append(await scenario_b_terminate(token, run_timestamp))
-    results.append(await scenario_c_fail_closed(token, run_timestamp))
-    results.append(await scenario_d_no_silent_delete(token, run_timestamp))
+    async with create_client() as fc:
+        print(f"[OK] Pooled FC client ready (http2={fc.http2})")
+        results.append(await scenario_a_revoke(fc, run_timestamp))
+        results.append(await scenario_b_terminate(fc, run_timestamp))
+        results.append(await scenario_c_fail_closed(fc, run_timestamp))
+        results.append(await scenario_d_no_silent_delete(fc, run_timestamp))
 
     # Generate evidence bundle
     await generate_evidence_bundle(results, run_timestamp)
@@ -16,13 +16,19 @@ except ImportError:
     print("ERROR: httpx not installed. Run: pip install httpx")
     sys.exit(1)
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "ops" / "proof"))
+from fc_auth import SECRET_KEY
+
 
 class PT017BHarness:
     """Proof harness for PT-017 policy automation."""
     
     def __init__(self):
         self.fc_base_url = os.getenv("FC_BASE_URL", "http://localhost:9405")
-        self.secret_key = os.getenv("SECRET_KEY", "")
+        self.secret_key = SECRET_KEY
+        # Mock tokens never exercise FC; only allowed when asked for explicitly
+        self.allow_mock = os.getenv("PT017_ALLOW_MOCK", "").lower() in ("1", "true", "yes")
+        self.fc_mode = None
         self.bearer_token = None
         self.evidence_dir = None
         self.run_timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
@@ -49,20 +55,26 @@ class PT017BHarness:
                     json={"secret_key": self.secret_key},
                     timeout=10.0
                 )
-                if response.status_code == 200:
-                    data = response.json()
-                    self.bearer_token = data.get("access_token")
-                    print(f"[OK] Generated bearer token")
-                    return True
-                else:
-                    print(f"[WARN] FC not available (status {response.status_code}). Continuing with mock mode.")
-                    self.bearer_token = f"mock-token-{uuid.uuid4()}"
-                    return True
-        except Exception as e:
-            print(f"[WARN] FC connection failed: {e}. Continuing with mock mode.")
-            self.bearer_token = f"mock-token-{uuid.uuid4()}"
-            return True
-    
+            if response.status_code == 200:
+                self.bearer_token = response.json().get("access_token")
+                self.fc_mode = "live"
+                print(f"[OK] Generated bearer token")
+                return True
+            reason = f"status {response.status_code}"
+        except httpx.HTTPError as e:
+            reason = str(e) or type(e).__name__
+
+        if not self.allow_mock:
+            print(f"[ERROR] FC not available at {self.fc_base_url} ({reason}).")
+            print("        Start the local stand-in: python ops/proof/fc_standin.py --port 9405")
+            print("        or set PT017_ALLOW_MOCK=1 to run without FC.")
+            return False
+
+        print(f"[WARN] FC not available ({reason}). PT017_ALLOW_MOCK set, continuing with mock token.")
+        self.bearer_token = f"mock-token-{uuid.uuid4()}"
+        self.fc_mode = "mock"
+        return True
+
     async def scenario_1_verify_fail(self) -> bool:
         """Scenario 1: VERIFY_FAIL trigger."""
         print("\n[SCENARIO 1] VERIFY_FAIL Trigger")
@@ -296,7 +308,7 @@ class PT017BHarness:
 
             assertions_file = self.evidence_dir / "assertions.json"
             with open(assertions_file, "w") as f:
-                json.dump(self.assertions, f, indent=2)
+                json.dump(dict(self.assertions, fc_mode=self.fc_mode), f, indent=2)
             print(f"[OK] Written: assertions.json")
 
             manifest = {}
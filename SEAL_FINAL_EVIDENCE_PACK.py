@@ -21,6 +21,10 @@ import hashlib
 if sys.stdout.encoding != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from ppp.workflows.file_mover import read_journal
+
 print("=" * 80)
 print("SEALING FINAL EVIDENCE PACK")
 print("=" * 80)
@@ -39,8 +43,10 @@ with open(decisions_dir / "directive_receipts.json") as f:
     directives = json.load(f)
 
 print("[LOAD] File movements audit...")
-with open(decisions_dir / "movement_audit_log.jsonl") as f:
-    movements = [json.loads(line) for line in f]
+# The log is an append-only journal: each move counts once, by its latest entry
+movement_status_counts = {}
+for entry in read_journal(decisions_dir / "movement_audit_log.jsonl").values():
+    movement_status_counts[entry['status']] = movement_status_counts.get(entry['status'], 0) + 1
 
 print("[LOAD] Post-move re-classification...")
 import glob
@@ -67,8 +73,8 @@ post_allow = post_move['phases']['drift_report'].get('allow_count', 0) if post_m
 post_mitigate = post_move['phases']['drift_report'].get('mitigate_count', 0) if post_move else 0
 post_deny = post_move['phases']['drift_report'].get('deny_count', 0) if post_move else 0
 
-successful_moves = sum(1 for m in movements if m.get('status') == 'success')
-failed_moves = sum(1 for m in movements if m.get('status') == 'failed')
+successful_moves = movement_status_counts.get('success', 0)
+failed_moves = movement_status_counts.get('failed', 0)
 
 print("Pre-Move Classification (Phase 1-4):")
 print(f"  ALLOW: {pre_allow} files (correctly placed)")
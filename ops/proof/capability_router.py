@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""
+Capability Router (shared by PT-003 and the local FC stand-in)
+==============================================================
+Inverted index capability -> active agents, maintained incrementally as
+servers register, change status or leave, plus one lazy max-heap of scores per
+capability so routing pops the best k agents in O(k log n) instead of scanning
+every server record.
+
+Score = confidence_score * success_rate / (1 + latency_ms / LATENCY_SCALE_MS).
+Missing metrics are neutral (success_rate 1.0, latency 0), which degrades to
+plain confidence ordering.
+
+Usage:
+    router = CapabilityRouter(servers)
+    router.upsert({"id": "llm_server_3", "status": "active", ...})
+    agents = router.top_k("llm.generate_response", k=10, mode="strict")
+    receipt = router.route("llm.generate_response", "loose", run_id)
+"""
+
+import heapq
+import itertools
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+LATENCY_SCALE_MS = 250.0       # latency at which the score halves
+STRICT_MIN_SUCCESS_RATE = 0.98  # strict mode skips agents below this
+# Rebuild a capability heap once stale entries outnumber live ones
+COMPACT_RATIO = 2
+
+# Registry seed used by PT-003 mock mode and the FC stand-in
+DEFAULT_REGISTRY = [
+    {
+        "id": "llm_server_1",
+        "status": "active",
+        "capabilities": ["llm.generate_response"],
+        "tags": ["llm_routing", "core_service", "production"],
+        "confidence_score": 0.95,
+        "performance_metrics": {"latency_ms": 45, "success_rate": 0.99},
+    },
+    {
+        "id": "llm_server_2",
+        "status": "active",
+        "capabilities": ["llm.generate_response"],
+        "tags": ["llm_routing", "core_service", "production"],
+        "confidence_score": 0.87,
+        "performance_metrics": {"latency_ms": 52, "success_rate": 0.98},
+    },
+    {
+        "id": "tool_server_1",
+        "status": "active",
+        "capabilities": ["tool.execute"],
+        "tags": ["tooling", "production"],
+        "confidence_score": 0.9,
+        "performance_metrics": {"latency_ms": 30, "success_rate": 0.99},
+    },
+]
+
+
+def strict_eligible(server: Dict[str, Any]) -> bool:
+    """Whether strict mode may route to this server (missing metrics count as eligible)."""
+    success_rate = (server.get("performance_metrics") or {}).get("success_rate", 1.0)
+    return success_rate >= STRICT_MIN_SUCCESS_RATE
+
+
+def score_agent(server: Dict[str, Any]) -> float:
+    """Routing score for one server record (higher is better)."""
+    metrics = server.get("performance_metrics") or {}
+    success_rate = metrics.get("success_rate", 1.0)
+    latency_ms = max(0.0, metrics.get("latency_ms", 0.0))
+    return server.get("confidence_score", 0.0) * success_rate / (1.0 + latency_ms / LATENCY_SCALE_MS)
+
+
+class CapabilityRouter:
+    """Incremental capability index with heap-based top-k selection (thread-safe)."""
+
+    def __init__(self, servers: Optional[Iterable[Dict[str, Any]]] = None):
+        self.servers: Dict[str, Dict[str, Any]] = {}
+        self.index: Dict[str, Set[str]] = {}
+        self.strict_index: Dict[str, Set[str]] = {}  # capability -> active agents strict mode accepts
+        # capability -> heap of (-score, seq, agent_id, version); stale entries skipped lazily
+        self._heaps: Dict[str, List[Tuple[float, int, str, int]]] = {}
+        self._versions: Dict[str, int] = {}
+        self._seq = itertools.count()
+        self.lock = threading.Lock()
+        for server in servers or []:
+            self.upsert(server)
+
+    # --- registry updates -------------------------------------------------
+
+    def upsert(self, server: Dict[str, Any]) -> None:
+        """Add or replace a server record; only active servers are indexed."""
+        server_id = server["id"]
+        record = dict(server)
+        with self.lock:
+            self._unindex(server_id)
+            self.servers[server_id] = record
+            version = self._versions.get(server_id, 0) + 1
+            self._versions[server_id] = version
+            if record.get("status") != "active":
+                return
+            entry_score = -score_agent(record)
+            strict = strict_eligible(record)
+            for capability in dict.fromkeys(record.get("capabilities", [])):
+                self.index.setdefault(capability, set()).add(server_id)
+                if strict:
+                    self.strict_index.setdefault(capability, set()).add(server_id)
+                heapq.heappush(
+                    self._heaps.setdefault(capability, []),
+                    (entry_score, next(self._seq), server_id, version),
+                )
+
+    def remove(self, server_id: str) -> None:
+        """Drop a server from the registry and the index."""
+        with self.lock:
+            self._unindex(server_id)
+            self.servers.pop(server_id, None)
+            self._versions[server_id] = self._versions.get(server_id, 0) + 1
+
+    def _unindex(self, server_id: str) -> None:
+        previous = self.servers.get(server_id)
+        if not previous or previous.get("status") != "active":
+            return
+        for capability in dict.fromkeys(previous.get("capabilities", [])):
+            strict_members = self.strict_index.get(capability)
+            if strict_members is not None:
+                strict_members.discard(server_id)
+                if not strict_members:
+                    del self.strict_index[capability]
+            members = self.index.get(capability)
+            if members is None:
+                continue
+            members.discard(server_id)
+            if not members:
+                del self.index[capability]
+                self._heaps.pop(capability, None)
+            elif len(self._heaps[capability]) > COMPACT_RATIO * len(members):
+                self._compact(capability)
+
+    def _compact(self, capability: str) -> None:
+        """Rebuild one heap from its live members (drops stale entries)."""
+        heap = [
+            (-score_agent(self.servers[sid]), next(self._seq), sid, self._versions[sid])
+            for sid in self.index[capability]
+        ]
+        heapq.heapify(heap)
+        self._heaps[capability] = heap
+
+    # --- queries ----------------------------------------------------------
+
+    def status(self) -> Dict[str, Any]:
+        with self.lock:
+            servers = list(self.servers.values())
+        active = sum(1 for s in servers if s.get("status") == "active")
+        return {
+            "total_servers": len(servers),
+            "active_servers": active,
+            "stale_servers": len(servers) - active,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "servers": [
+                {"id": s["id"], "status": s.get("status"), "capabilities": s.get("capabilities", [])}
+                for s in servers
+            ],
+        }
+
+    def eligible_count(self, capability: str, mode: str = "loose", exclude: Optional[Iterable[str]] = None) -> int:
+        """Active agents for `capability` that `mode` accepts, less `exclude` (O(len(exclude)))."""
+        index = self.strict_index if mode == "strict" else self.index
+        with self.lock:
+            members = index.get(capability, set())
+            return len(members) - len(members.intersection(exclude or ()))
+
+    def top_k(
+        self,
+        capability: str,
+        k: int = 1,
+        mode: str = "loose",
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Best `k` active agents for `capability`, highest score first.
+
+        Returns (agents, evaluated) where `evaluated` counts live candidates
+        inspected. Pops from the capability heap and pushes survivors back, so
+        the cost is O((k + skipped) log n).
+        """
+        excluded = set(exclude or [])
+        with self.lock:
+            heap = self._heaps.get(capability)
+            if not heap:
+                return [], 0
+            selected: List[Dict[str, Any]] = []
+            keep: List[Tuple[float, int, str, int]] = []
+            evaluated = 0
+            while heap and len(selected) < k:
+                entry = heapq.heappop(heap)
+                _, _, server_id, version = entry
+                if self._versions.get(server_id) != version:
+                    continue  # stale: superseded or removed
+                keep.append(entry)
+                evaluated += 1
+                server = self.servers[server_id]
+                if server_id in excluded:
+                    continue
+                if mode == "strict" and not strict_eligible(server):
+                    continue
+                selected.append(server)
+            for entry in keep:
+                heapq.heappush(heap, entry)
+            return selected, evaluated
+
+    def discover(self, capability: str, mode: str, max_results: int = 10) -> Dict[str, Any]:
+        """Agent discovery payload: ranked agents with scores and metrics."""
+        agents, _ = self.top_k(capability, max_results, mode)
+        return {
+            "agents": [
+                {
+                    "agent_id": s["id"],
+                    "capability": capability,
+                    "confidence_score": s.get("confidence_score"),
+                    "performance_metrics": s.get("performance_metrics", {}),
+                    "tags": s.get("tags", []),
+                }
+                for s in agents
+            ],
+            "total": self.eligible_count(capability, mode),
+        }
+
+    def route(
+        self,
+        capability: str,
+        mode: str,
+        run_id: str,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Routing receipt for the best agent, or None when nothing is eligible."""
+        exclude = list(exclude or [])
+        agents, _ = self.top_k(capability, 1, mode, exclude)
+        if not agents:
+            return None
+        selected = agents[0]
+        # Every eligible agent is ranked by the heap, so all of them count as evaluated
+        eligible = self.eligible_count(capability, mode, exclude)
+        return {
+            "agent_id": selected["id"],
+            "capability": capability,
+            "confidence_score": selected.get("confidence_score"),
+            "reasoning": f"Selected {selected['id']} based on {mode} policy mode and capability match",
+            "registry_snapshot": {
+                "total_eligible": eligible,
+                "evaluated": eligible,
+                "selected": selected["id"],
+            },
+            "run_id": run_id,
+            "policy_mode": mode,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Federation Core Bearer Tokens (shared by proof harnesses and the FC stand-in)
+=============================================================================
+Format: omega_<base64url payload>.<base64url HMAC-SHA256 signature>, padding
+stripped. Payload JSON carries server_id, scopes, iat, exp, jti. The SECRET_KEY
+is a base64 string used as-is (encoded, not decoded) as the HMAC key.
+"""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+SECRET_KEY = os.getenv("SECRET_KEY", "bWVtYmVyaGFuZHNvbWVub3NoYXBlcmVtZW1iZXJib3htb25rZXluYXRpdmVkaXJlY3Q=")
+TOKEN_PREFIX = "omega_"
+
+
+def _sign(payload_b64: str, secret_key: Optional[str]) -> str:
+    signature = hmac.new(
+        (secret_key or SECRET_KEY).encode(),
+        payload_b64.encode(),
+        hashlib.sha256
+    ).digest()
+    return base64.urlsafe_b64encode(signature).decode().rstrip("=")
+
+
+def generate_bearer_token(
+    server_id: str,
+    scopes: Optional[List[str]] = None,
+    ttl_seconds: int = 3600,
+    secret_key: Optional[str] = None,
+) -> str:
+    """Generate HMAC-signed bearer token for FC."""
+    issued_at = int(time.time())
+    expires_at = issued_at + ttl_seconds
+
+    payload = {
+        "server_id": server_id,
+        "scopes": scopes if scopes is not None else [],
+        "iat": issued_at,
+        "exp": expires_at,
+        "jti": base64.urlsafe_b64encode(os.urandom(16)).decode().rstrip("=")
+    }
+
+    payload_json = base64.urlsafe_b64encode(
+        json.dumps(payload, separators=(',', ':')).encode()
+    ).decode().rstrip("=")
+
+    return f"{TOKEN_PREFIX}{payload_json}.{_sign(payload_json, secret_key)}"
+
+
+def verify_bearer_token(token: str, secret_key: Optional[str] = None, now: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Check format, signature and expiry of a token from `generate_bearer_token`.
+
+    Returns the decoded payload; raises ValueError naming the first failed check.
+    """
+    if not token.startswith(TOKEN_PREFIX) or token.count(".") != 1:
+        raise ValueError("malformed token")
+    payload_b64, signature_b64 = token[len(TOKEN_PREFIX):].split(".")
+    if not hmac.compare_digest(_sign(payload_b64, secret_key), signature_b64):
+        raise ValueError("bad signature")
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(payload_b64 + "=" * (-len(payload_b64) % 4)))
+    except (binascii.Error, ValueError):
+        raise ValueError("malformed payload")
+    if not isinstance(payload, dict) or "exp" not in payload:
+        raise ValueError("malformed payload")
+    if payload["exp"] <= (time.time() if now is None else now):
+        raise ValueError("token expired")
+    return payload
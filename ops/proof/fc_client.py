@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+Federation Core Client (shared by proof harnesses)
+==================================================
+One pooled, keep-alive `httpx.AsyncClient` per harness run, HMAC bearer tokens
+cached until shortly before expiry, and retry with jittered exponential backoff.
+
+Usage:
+    async with FCClient(actor_id="pt005_test_harness") as fc:
+        run = await fc.create_run("pt005_gate_test", {"test": "happy_resume"})
+        gate = await fc.create_gate(run["run"]["run_id"], "step_2", "Gate", ["approver_1"])
+        await fc.resolve_gate(gate["gate_id"], "approved", actor_id="approver_1")
+
+ENDPOINTS:
+- POST   /api/fc/runs                    - Create workflow
+- PATCH  /api/fc/runs/{id}               - Update status
+- GET    /api/fc/runs/{id}               - Get run with logs
+- POST   /api/fc/runs/{id}/gate          - Create gate
+- POST   /api/fc/gates/{id}              - Resolve gate
+- GET    /api/fc/gates                   - List pending gates
+- POST   /mcp/tools/invoke               - Invoke MCP tools
+"""
+
+import asyncio
+import importlib.util
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from fc_auth import SECRET_KEY, generate_bearer_token
+
+# Configuration
+FC_BASE_URL = os.getenv("FC_BASE_URL", "http://localhost:9405")
+TENANT_ID = "tenant_omega"
+DEFAULT_SCOPES = ["workflow:read", "workflow:write", "gate:read", "gate:write"]
+
+# Retry policy
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+RETRY_STATUSES = {429, 502, 503, 504}
+# Errors raised before the request reached the server: safe to retry any method
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# Errors after the request may have been processed: retry idempotent methods only
+MAYBE_SENT_ERRORS = (httpx.ReadTimeout, httpx.WriteTimeout, httpx.RemoteProtocolError, httpx.ReadError)
+
+
+class TokenCache:
+    """Reuses one bearer token until `refresh_margin` seconds before it expires."""
+
+    def __init__(
+        self,
+        server_id: str,
+        scopes: Optional[List[str]] = None,
+        ttl_seconds: int = 3600,
+        secret_key: Optional[str] = None,
+        refresh_margin: int = 60,
+    ):
+        self.server_id = server_id
+        self.scopes = scopes
+        self.ttl_seconds = ttl_seconds
+        self.secret_key = secret_key
+        self.refresh_margin = min(refresh_margin, ttl_seconds // 2)
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self.issued = 0
+
+    def get(self) -> str:
+        now = time.time()
+        if self._token is None or now >= self._expires_at - self.refresh_margin:
+            self._token = generate_bearer_token(self.server_id, self.scopes, self.ttl_seconds, self.secret_key)
+            self._expires_at = now + self.ttl_seconds
+            self.issued += 1
+        return self._token
+
+
+def http2_available() -> bool:
+    """httpx needs the optional `h2` package for HTTP/2."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class FCClient:
+    """Pooled async client for the Federation Core run/gate/MCP surface."""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        tenant_id: str = TENANT_ID,
+        actor_id: str = "fc_proof_harness",
+        server_id: Optional[str] = None,
+        scopes: Optional[List[str]] = None,
+        secret_key: Optional[str] = None,
+        token_ttl_seconds: int = 3600,
+        http2: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 30.0,
+        connect_timeout: float = 5.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.2,
+        backoff_max: float = 5.0,
+        recorder: Optional[Any] = None,
+    ):
+        self.base_url = (base_url or FC_BASE_URL).rstrip("/")
+        self.tenant_id = tenant_id
+        self.actor_id = actor_id
+        self.tokens = TokenCache(
+            server_id or actor_id,
+            DEFAULT_SCOPES if scopes is None else scopes,
+            token_ttl_seconds,
+            secret_key,
+        )
+        self.http2 = http2 and http2_available()
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.recorder = recorder  # optional fc_load.LatencyRecorder
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def token(self) -> str:
+        return self.tokens.get()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=self.http2,
+                limits=self.limits,
+                timeout=self.timeout,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "FCClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Full-jitter exponential backoff, honouring Retry-After when present."""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        actor_id: Optional[str] = None,
+        endpoint: Optional[str] = None,
+    ) -> httpx.Response:
+        """Send a request with auth headers; retry transient failures. Raises on 4xx/5xx."""
+        method = method.upper()
+        if self.recorder is None:
+            return await self._send(method, path, json, params, actor_id)
+
+        # Latency covers the whole call, retries included, keyed by path template
+        label = f"{method} {endpoint or path}"
+        started = time.perf_counter()
+        try:
+            response = await self._send(method, path, json, params, actor_id)
+        except httpx.HTTPStatusError as e:
+            self.recorder.record(label, time.perf_counter() - started, f"HTTP {e.response.status_code}")
+            raise
+        except Exception as e:
+            self.recorder.record(label, time.perf_counter() - started, type(e).__name__)
+            raise
+        self.recorder.record(label, time.perf_counter() - started)
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        actor_id: Optional[str],
+    ) -> httpx.Response:
+        idempotent = method in IDEMPOTENT_METHODS
+
+        for attempt in range(self.max_retries + 1):
+            headers = {
+                "Authorization": f"Bearer {self.token}",
+                "X-Tenant-Id": self.tenant_id,
+                "X-Actor-Id": actor_id or self.actor_id,
+            }
+            last_attempt = attempt == self.max_retries
+            try:
+                response = await self.client.request(method, path, json=json, params=params, headers=headers)
+            except NOT_SENT_ERRORS:
+                if last_attempt:
+                    raise
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+            except MAYBE_SENT_ERRORS:
+                if last_attempt or not idempotent:
+                    raise
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+
+            retryable = response.status_code == 429 or (idempotent and response.status_code in RETRY_STATUSES)
+            if retryable and not last_attempt:
+                await asyncio.sleep(self._backoff(attempt, response.headers.get("Retry-After")))
+                continue
+
+            response.raise_for_status()
+            return response
+
+    async def create_run(self, workflow_id: str, input_payload: Dict[str, Any], **extra: Any) -> Dict[str, Any]:
+        """Create a workflow run. Extra keyword fields (metadata, tags) go into the body."""
+        body = {
+            "workflow_id": workflow_id,
+            "workflow_version": "1.0.0",
+            "input_payload": input_payload,
+        }
+        body.update(extra)
+        response = await self.request("POST", "/api/fc/runs", json=body)
+        return response.json()
+
+    async def update_run_status(
+        self,
+        run_id: str,
+        new_status: str,
+        current_step: Optional[str] = None,
+        step_index: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Update workflow run status."""
+        response = await self.request("PATCH", f"/api/fc/runs/{run_id}", json={
+            "status": new_status,
+            "current_step": current_step,
+            "step_index": step_index,
+        }, endpoint="/api/fc/runs/{id}")
+        return response.json()
+
+    async def get_run(self, run_id: str, include_logs: bool = True, include_gates: bool = True) -> Dict[str, Any]:
+        """Get workflow run, optionally with logs and gates."""
+        params = {}
+        if include_logs:
+            params["include_logs"] = "true"
+        if include_gates:
+            params["include_gates"] = "true"
+        response = await self.request("GET", f"/api/fc/runs/{run_id}", params=params or None, endpoint="/api/fc/runs/{id}")
+        return response.json()
+
+    async def create_gate(
+        self,
+        run_id: str,
+        step_id: str,
+        gate_name: str,
+        required_approvers: List[str],
+        description: Optional[str] = None,
+        timeout_seconds: Optional[int] = 3600,
+    ) -> Dict[str, Any]:
+        """Create an approval gate (pauses the run)."""
+        body = {
+            "step_id": step_id,
+            "gate_type": "human_approval",
+            "gate_name": gate_name,
+            "description": description or f"Gate for {gate_name}",
+            "required_approvers": required_approvers,
+        }
+        if timeout_seconds is not None:
+            body["timeout_seconds"] = timeout_seconds
+        response = await self.request("POST", f"/api/fc/runs/{run_id}/gate", json=body, endpoint="/api/fc/runs/{id}/gate")
+        return response.json()
+
+    async def resolve_gate(
+        self,
+        gate_id: str,
+        status: str,
+        actor_id: str = "approver_1",
+        rejection_reason: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Resolve a gate (approve or reject) as `actor_id`."""
+        body = {"status": status}
+        if rejection_reason:
+            body["rejection_reason"] = rejection_reason
+        response = await self.request(
+            "POST", f"/api/fc/gates/{gate_id}", json=body, actor_id=actor_id, endpoint="/api/fc/gates/{id}"
+        )
+        return response.json()
+
+    async def list_pending_gates(self, approver_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List pending gates."""
+        params = {"approver_id": approver_id} if approver_id else None
+        response = await self.request("GET", "/api/fc/gates", params=params)
+        return response.json()
+
+    async def invoke_mcp_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Invoke an MCP tool via FC."""
+        response = await self.request("POST", "/mcp/tools/invoke", json={
+            "tool_name": tool_name,
+            "parameters": parameters,
+        })
+        return response.json()
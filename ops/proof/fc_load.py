@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Federation Core Load Generator (shared by proof harnesses)
+==========================================================
+Runs N concurrent instances of a harness scenario against FC with an open-loop
+(Poisson) arrival rate, and records per-endpoint latency histograms
+(p50/p95/p99), error counts and throughput into the evidence directory.
+
+Usage (from a harness):
+    report = await run_load(load_scenario, create_client, instances=200,
+                            concurrency=100, arrival_rate=50.0)
+    write_load_report(report, evidence_dir)
+
+Point FC_BASE_URL at the local FC stand-in to run without live services.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Histogram bucket upper bounds in milliseconds (last bucket is +inf)
+BUCKET_BOUNDS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(durations_ms: List[float], errors: Counter) -> Dict[str, Any]:
+    """Count, error breakdown, percentiles and bucketed histogram for one series."""
+    values = sorted(durations_ms)
+    histogram = {}
+    index = 0
+    for bound in BUCKET_BOUNDS_MS:
+        count = 0
+        while index < len(values) and values[index] <= bound:
+            count += 1
+            index += 1
+        histogram[f"le_{bound}ms"] = count
+    histogram["le_inf"] = len(values) - index
+
+    return {
+        "count": len(values),
+        "errors": sum(errors.values()),
+        "error_kinds": dict(errors),
+        "min_ms": round(values[0], 3) if values else None,
+        "mean_ms": round(sum(values) / len(values), 3) if values else None,
+        "p50_ms": _round(percentile(values, 50)),
+        "p95_ms": _round(percentile(values, 95)),
+        "p99_ms": _round(percentile(values, 99)),
+        "max_ms": round(values[-1], 3) if values else None,
+        "histogram": histogram,
+    }
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 3) if value is not None else None
+
+
+class LatencyRecorder:
+    """Collects call latencies and error kinds per endpoint label."""
+
+    def __init__(self):
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, Counter] = defaultdict(Counter)
+
+    def record(self, label: str, seconds: float, error: Optional[str] = None) -> None:
+        self.durations[label].append(seconds * 1000.0)
+        if error:
+            self.errors[label][error] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            label: summarize(self.durations[label], self.errors[label])
+            for label in sorted(self.durations)
+        }
+
+
+async def run_load(
+    scenario: Callable[[Any], Awaitable[Any]],
+    client_factory: Callable[..., Any],
+    instances: int,
+    concurrency: int = 100,
+    arrival_rate: Optional[float] = None,
+    seed: Optional[int] = None,
+    **client_kwargs: Any,
+) -> Dict[str, Any]:
+    """
+    Run `instances` scenario executions over one pooled FC client.
+
+    Arrivals are Poisson at `arrival_rate` per second (all at once when None);
+    at most `concurrency` scenarios execute at a time, later arrivals queue.
+    """
+    if instances < 1:
+        raise ValueError(f"instances must be >= 1: {instances}")
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1: {concurrency}")
+    if arrival_rate is not None and arrival_rate <= 0:
+        raise ValueError(f"arrival_rate must be positive: {arrival_rate}")
+
+    recorder = LatencyRecorder()
+    rng = random.Random(seed)
+    semaphore = asyncio.Semaphore(concurrency)
+    client_kwargs.setdefault("max_connections", concurrency)
+    client_kwargs.setdefault("max_keepalive_connections", concurrency)
+
+    async def one(fc: Any) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await scenario(fc)
+            except Exception as e:
+                recorder.record("scenario", time.perf_counter() - started, type(e).__name__)
+            else:
+                recorder.record("scenario", time.perf_counter() - started)
+
+    started_at = datetime.now(timezone.utc).isoformat()
+    async with client_factory(recorder=recorder, **client_kwargs) as fc:
+        wall_start = time.perf_counter()
+        tasks = []
+        for i in range(instances):
+            tasks.append(asyncio.create_task(one(fc)))
+            if arrival_rate and i < instances - 1:
+                await asyncio.sleep(rng.expovariate(arrival_rate))
+        await asyncio.gather(*tasks)
+        wall_seconds = time.perf_counter() - wall_start
+
+    endpoints = recorder.summary()
+    scenario_stats = endpoints.pop("scenario")
+    completed = scenario_stats["count"] - scenario_stats["errors"]
+    requests = sum(e["count"] for e in endpoints.values())
+
+    return {
+        "started_at": started_at,
+        "base_url": fc.base_url,
+        "http2": fc.http2,
+        "instances": instances,
+        "concurrency": concurrency,
+        "arrival_rate_per_sec": arrival_rate,
+        "seed": seed,
+        "wall_seconds": round(wall_seconds, 3),
+        "scenarios_completed": completed,
+        "scenarios_failed": scenario_stats["errors"],
+        "throughput": {
+            "scenarios_per_sec": round(completed / wall_seconds, 3) if wall_seconds else None,
+            "requests_per_sec": round(requests / wall_seconds, 3) if wall_seconds else None,
+        },
+        "scenario": scenario_stats,
+        "endpoints": endpoints,
+    }
+
+
+def write_load_report(report: Dict[str, Any], evidence_dir: Path) -> Path:
+    """Write load_report.json into the evidence directory."""
+    evidence_dir = Path(evidence_dir)
+    evidence_dir.mkdir(parents=True, exist_ok=True)
+    report_file = evidence_dir / "load_report.json"
+    with open(report_file, "w") as f:
+        json.dump(report, f, indent=2)
+    return report_file
+
+
+def print_load_report(report: Dict[str, Any]) -> None:
+    """Print a compact latency table."""
+    print("\n" + "="*78)
+    print("LOAD SUMMARY")
+    print("="*78)
+    print(f"Scenarios: {report['scenarios_completed']} completed, {report['scenarios_failed']} failed "
+          f"in {report['wall_seconds']}s")
+    print(f"Throughput: {report['throughput']['scenarios_per_sec']} scenarios/s, "
+          f"{report['throughput']['requests_per_sec']} requests/s")
+    print(f"\n{'endpoint':<34}{'count':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    rows = dict(report["endpoints"], scenario=report["scenario"])
+    for label, stats in rows.items():
+        print(f"{label:<34}{stats['count']:>7}{stats['errors']:>8}"
+              f"{stats['p50_ms'] or 0:>10.2f}{stats['p95_ms'] or 0:>10.2f}{stats['p99_ms'] or 0:>10.2f}")
+
+
+def add_load_arguments(parser: argparse.ArgumentParser, harness: str) -> None:
+    """Add the shared --load options to a harness CLI."""
+    group = parser.add_argument_group("load mode")
+    group.add_argument("--load", type=int, metavar="N", help="Run N concurrent scenario instances instead of the proof tests")
+    group.add_argument("--concurrency", type=int, default=100, help="Max scenarios in flight (default: 100)")
+    group.add_argument("--arrival-rate", type=float, default=None, help="Poisson arrivals per second (default: all at once)")
+    group.add_argument("--seed", type=int, default=None, help="Seed for arrival jitter")
+    group.add_argument(
+        "--evidence-dir",
+        type=Path,
+        default=None,
+        help=f"Where to write load_report.json (default: EVIDENCE/fc-load/{harness}/run_<timestamp>)",
+    )
+
+
+async def run_load_from_args(args: argparse.Namespace, harness: str, scenario, client_factory) -> Dict[str, Any]:
+    """Run load mode from parsed CLI args and write the report."""
+    evidence_dir = args.evidence_dir or Path("EVIDENCE/fc-load") / harness / (
+        "run_" + datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    )
+    report = await run_load(
+        scenario,
+        client_factory,
+        instances=args.load,
+        concurrency=args.concurrency,
+        arrival_rate=args.arrival_rate,
+        seed=args.seed,
+    )
+    report["harness"] = harness
+    report_file = write_load_report(report, evidence_dir)
+    print_load_report(report)
+    print(f"\n[OK] Load report written: {report_file}")
+    return report
@@ -0,0 +1,614 @@
+# -*- coding: utf-8 -*-
+"""
+Federation Core Stand-In (local, for proof harnesses and load runs)
+===================================================================
+A lightweight in-repo FC serving the run/gate/MCP/auth/registry surface the
+proof harnesses call, so PT-003/004/005/013/016/017 exercise real HTTP request
+paths offline. Bearer tokens are verified with the same HMAC scheme as
+`fc_auth.generate_bearer_token`; state lives in SQLite (in-memory by default).
+
+Usage:
+    python ops/proof/fc_standin.py --port 9405                 # in-memory store
+    python ops/proof/fc_standin.py --port 9405 --db fc.sqlite  # persistent store
+
+    # in-process, e.g. from a benchmark script
+    with FCStandIn() as fc:
+        os.environ["FC_BASE_URL"] = fc.url
+
+ENDPOINTS:
+- POST   /auth/token                     - Exchange secret_key for a bearer token
+- POST   /api/fc/runs                    - Create workflow
+- PATCH  /api/fc/runs/{id}               - Update status
+- GET    /api/fc/runs/{id}               - Get run with logs/gates
+- POST   /api/fc/runs/{id}/gate          - Create gate (pauses run)
+- POST   /api/fc/gates/{id}              - Resolve gate
+- GET    /api/fc/gates                   - List pending gates
+- POST   /mcp/tools/invoke               - revoke_entity / terminate_entity
+- GET    /servers/status                 - Registry status
+- POST   /servers/register               - Add/update a server record
+- GET    /agents/discover                - Agents by capability
+- POST   /route                          - Route a capability to one agent
+- GET    /health                         - Liveness (no auth)
+
+Errors map to status codes: unknown id 404, bad body 400, actor not an
+approver 403, illegal transition or already-resolved gate 409, bad token 401.
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import re
+import sqlite3
+import sys
+import threading
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from capability_router import DEFAULT_REGISTRY, CapabilityRouter
+from fc_auth import SECRET_KEY, generate_bearer_token, verify_bearer_token
+
+# Run state machine; terminal states have no exits
+RUN_TRANSITIONS = {
+    "pending": {"running", "failed", "cancelled"},
+    "running": {"paused", "completed", "failed", "cancelled"},
+    "paused": {"running", "failed", "cancelled"},
+    "completed": set(),
+    "failed": set(),
+    "cancelled": set(),
+}
+GATE_RESOLUTIONS = {"approved", "rejected"}
+REVOKE_WORKFLOW = "fc_genesis_revoke"
+TERMINATE_WORKFLOW = "fc_genesis_terminate"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS gates (
+    gate_id TEXT PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS logs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entities (
+    entity_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_gates_run ON gates(run_id);
+CREATE INDEX IF NOT EXISTS idx_gates_status ON gates(status);
+CREATE INDEX IF NOT EXISTS idx_logs_run ON logs(run_id);
+"""
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _sha256_json(data: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(data, separators=(',', ':'), sort_keys=True).encode()).hexdigest()
+
+
+class FCStore:
+    """SQLite-backed run, gate, log and entity state (thread-safe)."""
+
+    def __init__(self, db_path: str = ":memory:"):
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        self.lock = threading.Lock()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # --- rows -------------------------------------------------------------
+
+    def _load(self, table: str, key: str, value: str) -> Dict[str, Any]:
+        row = self.conn.execute(f"SELECT data FROM {table} WHERE {key} = ?", (value,)).fetchone()
+        if row is None:
+            raise LookupError(f"{table[:-1]} not found: {value}")
+        return json.loads(row[0])
+
+    def _save_run(self, run: Dict[str, Any]) -> None:
+        run["updated_at"] = _now()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO runs (run_id, status, data) VALUES (?, ?, ?)",
+            (run["run_id"], run["status"], json.dumps(run)),
+        )
+
+    def _save_gate(self, gate: Dict[str, Any]) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO gates (gate_id, run_id, status, data) VALUES (?, ?, ?, ?)",
+            (gate["gate_id"], gate["run_id"], gate["status"], json.dumps(gate)),
+        )
+
+    def _log(self, run_id: str, event_type: str, message: str, actor_id: str, **details: Any) -> None:
+        entry = {
+            "run_id": run_id,
+            "event_type": event_type,
+            "message": message,
+            "actor_id": actor_id,
+            "details": details,
+            "created_at": _now(),
+        }
+        self.conn.execute("INSERT INTO logs (run_id, data) VALUES (?, ?)", (run_id, json.dumps(entry)))
+
+    def _transition(self, run: Dict[str, Any], new_status: str, actor_id: str) -> None:
+        old_status = run["status"]
+        if new_status not in RUN_TRANSITIONS:
+            raise ValueError(f"unknown status: {new_status}")
+        if new_status not in RUN_TRANSITIONS[old_status]:
+            raise RuntimeError(f"illegal transition {old_status} -> {new_status}")
+        run["status"] = new_status
+        event_type = "FC-RUN-003" if new_status in ("completed", "failed", "cancelled") else "FC-RUN-002"
+        self._log(run["run_id"], event_type, f"Run {old_status} -> {new_status}", actor_id,
+                  from_status=old_status, to_status=new_status)
+
+    def _new_run(self, body: Dict[str, Any], tenant_id: str, actor_id: str) -> Dict[str, Any]:
+        if not body.get("workflow_id"):
+            raise ValueError("workflow_id is required")
+        now = _now()
+        run = {
+            "run_id": str(uuid.uuid4()),
+            "tenant_id": tenant_id,
+            "workflow_id": body["workflow_id"],
+            "workflow_version": body.get("workflow_version", "1.0.0"),
+            "status": "pending",
+            "current_step": None,
+            "step_index": None,
+            "input_payload": body.get("input_payload") or {},
+            "metadata": body.get("metadata") or {},
+            "tags": body.get("tags") or [],
+            "error_details": None,
+            "created_by": actor_id,
+            "created_at": now,
+            "updated_at": now,
+        }
+        self._save_run(run)
+        self._log(run["run_id"], "FC-RUN-001", f"Run created for {run['workflow_id']}", actor_id)
+        return run
+
+    def _new_gate(self, run: Dict[str, Any], body: Dict[str, Any], actor_id: str) -> Dict[str, Any]:
+        if not body.get("step_id") or not body.get("gate_name"):
+            raise ValueError("step_id and gate_name are required")
+        approvers = body.get("required_approvers") or []
+        if not isinstance(approvers, list) or not approvers:
+            raise ValueError("required_approvers must be a non-empty list")
+        self._transition(run, "paused", actor_id)
+        run["current_step"] = body["step_id"]
+        gate = {
+            "gate_id": str(uuid.uuid4()),
+            "run_id": run["run_id"],
+            "step_id": body["step_id"],
+            "gate_type": body.get("gate_type", "human_approval"),
+            "gate_name": body["gate_name"],
+            "description": body.get("description"),
+            "required_approvers": approvers,
+            "timeout_seconds": body.get("timeout_seconds"),
+            "status": "pending",
+            "approved_by": None,
+            "rejection_reason": None,
+            "requested_by": actor_id,
+            "created_at": _now(),
+            "resolved_at": None,
+        }
+        self._save_gate(gate)
+        self._save_run(run)
+        self._log(run["run_id"], "FC-GATE-001", f"Gate requested: {gate['gate_name']}", actor_id,
+                  gate_id=gate["gate_id"], step_id=gate["step_id"])
+        return gate
+
+    # --- runs -------------------------------------------------------------
+
+    def create_run(self, body: Dict[str, Any], tenant_id: str, actor_id: str) -> Dict[str, Any]:
+        with self.lock, self.conn:
+            return self._new_run(body, tenant_id, actor_id)
+
+    def update_run(self, run_id: str, body: Dict[str, Any], actor_id: str) -> Dict[str, Any]:
+        with self.lock, self.conn:
+            run = self._load("runs", "run_id", run_id)
+            if body.get("status"):
+                self._transition(run, body["status"], actor_id)
+            if "current_step" in body:
+                run["current_step"] = body["current_step"]
+            if body.get("step_index") is not None:
+                run["step_index"] = body["step_index"]
+            self._save_run(run)
+            return run
+
+    def get_run(self, run_id: str, include_logs: bool, include_gates: bool) -> Dict[str, Any]:
+        with self.lock:
+            result = {"run": self._load("runs", "run_id", run_id)}
+            if include_logs:
+                rows = self.conn.execute("SELECT data FROM logs WHERE run_id = ? ORDER BY seq", (run_id,))
+                result["logs"] = [json.loads(r[0]) for r in rows]
+            if include_gates:
+                rows = self.conn.execute("SELECT data FROM gates WHERE run_id = ? ORDER BY rowid", (run_id,))
+                result["gates"] = [json.loads(r[0]) for r in rows]
+            return result
+
+    # --- gates ------------------------------------------------------------
+
+    def create_gate(self, run_id: str, body: Dict[str, Any], actor_id: str) -> Dict[str, Any]:
+        with self.lock, self.conn:
+            return self._new_gate(self._load("runs", "run_id", run_id), body, actor_id)
+
+    def resolve_gate(self, gate_id: str, body: Dict[str, Any], actor_id: str) -> Dict[str, Any]:
+        with self.lock, self.conn:
+            gate = self._load("gates", "gate_id", gate_id)
+            status = body.get("status")
+            if status not in GATE_RESOLUTIONS:
+                raise ValueError(f"status must be one of {sorted(GATE_RESOLUTIONS)}")
+            if actor_id not in gate["required_approvers"]:
+                raise PermissionError(f"actor {actor_id} is not a required approver")
+            if gate["status"] != "pending":
+                raise RuntimeError(f"gate already {gate['status']}")
+
+            run = self._load("runs", "run_id", gate["run_id"])
+            gate["status"] = status
+            gate["resolved_at"] = _now()
+            if status == "approved":
+                gate["approved_by"] = actor_id
+            else:
+                gate["rejection_reason"] = body.get("rejection_reason")
+            self._save_gate(gate)
+            self._log(run["run_id"], "FC-GATE-002", f"Gate {status}: {gate['gate_name']}", actor_id,
+                      gate_id=gate_id, rejection_reason=gate["rejection_reason"])
+
+            if status == "approved":
+                self._transition(run, "running", actor_id)
+                if run["workflow_id"] == REVOKE_WORKFLOW:
+                    self._finish_revocation(run, actor_id)
+            else:
+                # Fail-closed: a rejected gate ends the run
+                run["error_details"] = {
+                    "reason": "gate_rejected",
+                    "gate_id": gate_id,
+                    "rejection_reason": gate["rejection_reason"],
+                }
+                self._transition(run, "failed", actor_id)
+            self._save_run(run)
+            return gate
+
+    def list_pending_gates(self, approver_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        with self.lock:
+            rows = self.conn.execute("SELECT data FROM gates WHERE status = 'pending' ORDER BY rowid")
+            gates = [json.loads(r[0]) for r in rows]
+        if approver_id:
+            gates = [g for g in gates if approver_id in g["required_approvers"]]
+        return gates
+
+    # --- entity lifecycle (MCP) ------------------------------------------
+
+    def _entity(self, entity_id: str) -> Dict[str, Any]:
+        """Load an entity, recording its birth on first reference."""
+        try:
+            return self._load("entities", "entity_id", entity_id)
+        except LookupError:
+            born_at = _now()
+            entity = {
+                "entity_id": entity_id,
+                "status": "alive",
+                "born_at": born_at,
+                "birth_receipt_hash": _sha256_json({"spawned_entity_id": entity_id, "born_at": born_at}),
+                "death_event_id": None,
+            }
+            self._save_entity(entity)
+            return entity
+
+    def _save_entity(self, entity: Dict[str, Any]) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO entities (entity_id, data) VALUES (?, ?)",
+            (entity["entity_id"], json.dumps(entity)),
+        )
+
+    def _living_entity(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        entity_id = params.get("spawned_entity_id")
+        if not entity_id:
+            raise ValueError("spawned_entity_id is required")
+        entity = self._entity(entity_id)
+        if entity["status"] != "alive":
+            # Fail-closed: no second death for an entity
+            raise RuntimeError(f"entity already {entity['status']}: {entity_id}")
+        return entity
+
+    def _finish_revocation(self, run: Dict[str, Any], actor_id: str) -> None:
+        entity = self._entity(run["input_payload"]["spawned_entity_id"])
+        entity["status"] = "revoked"
+        entity["death_event_id"] = str(uuid.uuid4())
+        self._save_entity(entity)
+        self._log(run["run_id"], "FC_GENESIS_REVOKED", f"Entity revoked: {entity['entity_id']}", actor_id,
+                  death_event_id=entity["death_event_id"], birth_receipt_hash=entity["birth_receipt_hash"])
+        self._transition(run, "completed", actor_id)
+
+    def revoke_entity(self, params: Dict[str, Any], tenant_id: str, actor_id: str) -> Dict[str, Any]:
+        """Human-gated: open a run paused on an approval gate."""
+        with self.lock, self.conn:
+            entity = self._living_entity(params)
+            run = self._new_run({"workflow_id": REVOKE_WORKFLOW, "input_payload": params}, tenant_id, actor_id)
+            self._transition(run, "running", actor_id)
+            gate = self._new_gate(run, {
+                "step_id": "revoke_approval",
+                "gate_name": "Revocation Approval",
+                "required_approvers": params.get("approvers") or ["approver_1"],
+            }, actor_id)
+            return {
+                "run_id": run["run_id"],
+                "gate_id": gate["gate_id"],
+                "spawned_entity_id": entity["entity_id"],
+                "birth_receipt_hash": entity["birth_receipt_hash"],
+                "status": run["status"],
+            }
+
+    def terminate_entity(self, params: Dict[str, Any], tenant_id: str, actor_id: str) -> Dict[str, Any]:
+        """System-initiated: terminate immediately, no gate."""
+        with self.lock, self.conn:
+            entity = self._living_entity(params)
+            run = self._new_run({"workflow_id": TERMINATE_WORKFLOW, "input_payload": params}, tenant_id, actor_id)
+            self._transition(run, "running", actor_id)
+            entity["status"] = "terminated"
+            entity["death_event_id"] = str(uuid.uuid4())
+            self._save_entity(entity)
+            self._log(run["run_id"], "FC_GENESIS_TERMINATED", f"Entity terminated: {entity['entity_id']}", actor_id,
+                      death_event_id=entity["death_event_id"], birth_receipt_hash=entity["birth_receipt_hash"])
+            self._transition(run, "completed", actor_id)
+            self._save_run(run)
+            return {
+                "run_id": run["run_id"],
+                "death_event_id": entity["death_event_id"],
+                "spawned_entity_id": entity["entity_id"],
+                "birth_receipt_hash": entity["birth_receipt_hash"],
+                "status": run["status"],
+            }
+
+
+class _FCHandler(BaseHTTPRequestHandler):
+    """Routes FC requests to the store and registry."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY the
+    # body waits on the client's delayed ACK (~40ms per keep-alive request)
+    disable_nagle_algorithm = True
+
+    RUN_PATH = re.compile(r"^/api/fc/runs/([^/]+)$")
+    GATE_CREATE_PATH = re.compile(r"^/api/fc/runs/([^/]+)/gate$")
+    GATE_PATH = re.compile(r"^/api/fc/gates/([^/]+)$")
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def _dispatch(self, method: str) -> None:
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip("/") or "/"
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        try:
+            body = self._read_body()
+            if path == "/health":
+                self._send(200, {"status": "ok"})
+                return
+            if method == "POST" and path == "/auth/token":
+                if not hmac.compare_digest(str(body.get("secret_key", "")), self.server.secret_key):
+                    self._send(401, {"error": "invalid secret_key"})
+                else:
+                    self._send(200, self._issue_token(body))
+                return
+            auth_error = self._auth_error()
+            if auth_error:
+                self._send(401, {"error": auth_error})
+                return
+            self._send(*self._route(method, path, query, body))
+        except PermissionError as e:
+            self._send(403, {"error": str(e)})
+        except LookupError as e:
+            self._send(404, {"error": str(e)})
+        except ValueError as e:
+            self._send(400, {"error": str(e)})
+        except RuntimeError as e:
+            self._send(409, {"error": str(e)})
+
+    def _route(self, method: str, path: str, query: Dict[str, str], body: Dict[str, Any]):
+        store = self.server.store
+        registry = self.server.registry
+        tenant_id = self.headers.get("X-Tenant-Id", "tenant_omega")
+        actor_id = self.headers.get("X-Actor-Id", "anonymous")
+        mode = self.headers.get("X-Policy-Mode", "loose").lower()
+
+        if path == "/api/fc/runs" and method == "POST":
+            return 201, {"run": store.create_run(body, tenant_id, actor_id)}
+        match = self.RUN_PATH.match(path)
+        if match and method == "PATCH":
+            return 200, {"run": store.update_run(match.group(1), body, actor_id)}
+        if match and method == "GET":
+            return 200, store.get_run(
+                match.group(1),
+                query.get("include_logs") == "true",
+                query.get("include_gates") == "true",
+            )
+        match = self.GATE_CREATE_PATH.match(path)
+        if match and method == "POST":
+            return 201, store.create_gate(match.group(1), body, actor_id)
+        match = self.GATE_PATH.match(path)
+        if match and method == "POST":
+            return 200, store.resolve_gate(match.group(1), body, actor_id)
+        if path == "/api/fc/gates" and method == "GET":
+            return 200, store.list_pending_gates(query.get("approver_id"))
+        if path == "/mcp/tools/invoke" and method == "POST":
+            tool = {"revoke_entity": store.revoke_entity, "terminate_entity": store.terminate_entity}.get(
+                body.get("tool_name"))
+            if tool is None:
+                raise LookupError(f"unknown tool: {body.get('tool_name')}")
+            return 200, tool(body.get("parameters") or {}, tenant_id, actor_id)
+        if path == "/servers/status" and method == "GET":
+            return 200, registry.status()
+        if path == "/servers/register" and method == "POST":
+            if not body.get("id") or not isinstance(body.get("capabilities"), list):
+                raise ValueError("id and capabilities are required")
+            registry.upsert(dict(body, status=body.get("status", "active")))
+            return 200, {"id": body["id"], "registered": True}
+        if path == "/agents/discover" and method == "GET":
+            return 200, registry.discover(query.get("capability", ""), mode, int(query.get("max_results", 10)))
+        if path == "/route" and method == "POST":
+            if not body.get("capability"):
+                raise ValueError("capability is required")
+            result = registry.route(
+                body["capability"], mode, body.get("run_id") or str(uuid.uuid4()), body.get("exclude_agents")
+            )
+            if result is None:
+                return 404, {
+                    "error": "no_route_found",
+                    "message": f"No agents found for capability: {body.get('capability')}",
+                }
+            return 200, result
+        raise LookupError(f"unknown path: {method} {path}")
+
+    def _read_body(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            raise ValueError("invalid JSON body")
+        if not isinstance(body, dict):
+            raise ValueError("JSON body must be an object")
+        return body
+
+    def _auth_error(self) -> Optional[str]:
+        """Why the bearer token is unacceptable, or None when it verifies."""
+        header = self.headers.get("Authorization", "")
+        if not header.startswith("Bearer "):
+            return "missing bearer token"
+        try:
+            verify_bearer_token(header[len("Bearer "):], self.server.secret_key)
+        except ValueError as e:
+            return f"invalid bearer token: {e}"
+        return None
+
+    def _issue_token(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        ttl = int(body.get("ttl_seconds", 3600))
+        token = generate_bearer_token(
+            body.get("server_id", "fc_proof_harness"), body.get("scopes"), ttl, self.server.secret_key
+        )
+        return {"access_token": token, "token_type": "bearer", "expires_in": ttl}
+
+    def _send(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _FCHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Load runs open many connections at once; the default backlog of 5 drops them
+    request_queue_size = 256
+
+    def __init__(self, address, store: FCStore, registry: CapabilityRouter, secret_key: str, verbose: bool):
+        super().__init__(address, _FCHandler)
+        self.store = store
+        self.registry = registry
+        self.secret_key = secret_key
+        self.verbose = verbose
+
+
+class FCStandIn:
+    """
+    In-process FC stand-in on a background thread.
+
+    Usage:
+        with FCStandIn() as fc:
+            async with FCClient(fc.url) as client:
+                ...
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        db_path: str = ":memory:",
+        secret_key: Optional[str] = None,
+        registry: Optional[List[Dict[str, Any]]] = None,
+        verbose: bool = False,
+    ):
+        self.host = host
+        self.port = port
+        self.store = FCStore(db_path)
+        self.registry = CapabilityRouter(DEFAULT_REGISTRY if registry is None else registry)
+        self.secret_key = secret_key or SECRET_KEY
+        self.verbose = verbose
+        self._server: Optional[_FCHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        if not self._server:
+            raise ValueError("FC stand-in is not running")
+        return f"http://{self.host}:{self._server.server_address[1]}"
+
+    def start(self) -> "FCStandIn":
+        self._server = _FCHTTPServer((self.host, self.port), self.store, self.registry, self.secret_key, self.verbose)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+            self._thread = None
+
+    def __enter__(self) -> "FCStandIn":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+        self.store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Federation Core stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9405)
+    parser.add_argument("--db", default=":memory:", help="SQLite path (default: in-memory)")
+    parser.add_argument("--secret-key", default=None, help="HMAC key (default: SECRET_KEY env / harness default)")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    standin = FCStandIn(args.host, args.port, args.db, args.secret_key, verbose=args.verbose).start()
+    print(f"[OK] FC stand-in listening on {standin.url} (store: {args.db})", flush=True)
+    print(f"     export FC_BASE_URL={standin.url}", flush=True)
+    try:
+        standin._thread.join()
+    except KeyboardInterrupt:
+        print("\n[OK] Shutting down")
+    finally:
+        standin.stop()
+        standin.store.close()
+
+
+if __name__ == "__main__":
+    main()
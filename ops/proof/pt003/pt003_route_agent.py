@@ -8,6 +8,14 @@ based on declared capabilities + registry state, policy-governed, and traceable.
 Usage:
   python pt003_route_agent.py --mode loose
   python pt003_route_agent.py --mode strict
+
+Offline, against the local FC stand-in:
+  python ops/proof/fc_standin.py --port 9405 &
+  FC_BASE_URL=http://127.0.0.1:9405 python pt003_route_agent.py --mode loose
+
+PT003_MOCK_MODE: "auto" (default) stays offline on mock responses unless
+FC_BASE_URL is set, and then falls back to them when FC is unreachable or
+errors; "on" always mocks; "off" always uses FC and fails instead of mocking.
 """
 
 import json
@@ -16,70 +24,80 @@ import uuid
 import os
 import socket
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from pathlib import Path
+from typing import Callable, Optional, Dict, Any
 import argparse
 import urllib.request
 import urllib.error
+from urllib.parse import urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from capability_router import DEFAULT_REGISTRY, CapabilityRouter
+from fc_auth import generate_bearer_token
 
 # Configuration
-FC_BASE_URL = "http://omega-federation-core-prod:9405"
+FC_BASE_URL = os.getenv("FC_BASE_URL", "http://omega-federation-core-prod:9405")
+FC_OPT_IN = "FC_BASE_URL" in os.environ  # "auto" mode only contacts an FC the user pointed it at
 CAPABILITY = "llm.generate_response"
-PASSPORT_TOKEN = "omega_test_passport_pt003"  # Will be replaced with real HMAC
-
-# Mock mode flag - set to True if FC is not reachable
-USE_MOCK_MODE = os.environ.get("PT003_MOCK_MODE", "auto").lower() == "auto"
-
-
-def is_fc_reachable() -> bool:
-    """Quick check if FC is reachable"""
-    # For now, always use mock mode to avoid network timeouts
-    return False
+PASSPORT_TOKEN = generate_bearer_token("pt003_route_agent", ["registry:read", "route:write"])
+
+MOCK_MODE = os.environ.get("PT003_MOCK_MODE", "auto").lower()
+MOCK_FALLBACKS = []  # FC errors answered from the mock, reported in the JSON output
+# Confidence the mock reports in strict mode (kept in step with the C# and simple proofs)
+MOCK_STRICT_CONFIDENCE = {"llm_server_1": 0.98, "llm_server_2": 0.92}
+# Mock mode routes over the registry the FC stand-in serves, with the strict-mode
+# confidences applied before ranking
+MOCK_ROUTERS = {
+    "loose": CapabilityRouter(DEFAULT_REGISTRY),
+    "strict": CapabilityRouter(
+        {**server, "confidence_score": MOCK_STRICT_CONFIDENCE.get(server["id"], server["confidence_score"])}
+        for server in DEFAULT_REGISTRY
+    ),
+}
+
+
+def is_fc_reachable(timeout: float = 1.0) -> bool:
+    """Quick TCP check that something is listening at FC_BASE_URL"""
+    parts = urlsplit(FC_BASE_URL)
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    try:
+        with socket.create_connection((parts.hostname, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def fc_request(method: str, path: str, mode: str, payload: Optional[Dict[str, Any]] = None,
+               headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Send one authenticated request to FC and decode the JSON response"""
+    request_headers = {
+        "Authorization": f"Bearer {PASSPORT_TOKEN}",
+        "X-Policy-Mode": mode.upper(),
+    }
+    request_headers.update(headers or {})
+    data = None
+    if payload is not None:
+        data = json.dumps(payload).encode()
+        request_headers["Content-Type"] = "application/json"
+    req = urllib.request.Request(f"{FC_BASE_URL}{path}", data=data, headers=request_headers, method=method)
+    with urllib.request.urlopen(req, timeout=2) as response:
+        return json.loads(response.read().decode())
 
 
 def get_mock_registry_status() -> Dict[str, Any]:
     """Return mock registry status"""
-    return {
-        "total_servers": 3,
-        "active_servers": 3,
-        "stale_servers": 0,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "servers": [
-            {"id": "llm_server_1", "status": "active", "capabilities": ["llm.generate_response"]},
-            {"id": "llm_server_2", "status": "active", "capabilities": ["llm.generate_response"]},
-            {"id": "tool_server_1", "status": "active", "capabilities": ["tool.execute"]}
-        ]
-    }
+    return MOCK_ROUTERS["loose"].status()
 
 
 def get_mock_agents(capability: str, mode: str) -> Dict[str, Any]:
     """Return mock agent discovery results"""
-    if capability == "capability.DOES_NOT_EXIST":
-        return {"agents": [], "total": 0}
-
-    return {
-        "agents": [
-            {
-                "agent_id": "llm_server_1",
-                "capability": capability,
-                "confidence_score": 0.95 if mode == "loose" else 0.98,
-                "performance_metrics": {"latency_ms": 45, "success_rate": 0.99},
-                "tags": ["llm_routing", "core_service", "production"]
-            },
-            {
-                "agent_id": "llm_server_2",
-                "capability": capability,
-                "confidence_score": 0.87 if mode == "loose" else 0.92,
-                "performance_metrics": {"latency_ms": 52, "success_rate": 0.98},
-                "tags": ["llm_routing", "core_service", "production"]
-            }
-        ],
-        "total": 2
-    }
+    return MOCK_ROUTERS[mode].discover(capability, mode)
 
 
 def get_mock_routing_result(capability: str, mode: str, run_id: str) -> Dict[str, Any]:
     """Return mock routing result"""
-    if capability == "capability.DOES_NOT_EXIST":
+    result = MOCK_ROUTERS[mode].route(capability, mode, run_id)
+    if result is None:
         return {
             "error": "no_route_found",
             "message": f"No agents found for capability: {capability}",
@@ -87,72 +105,57 @@ def get_mock_routing_result(capability: str, mode: str, run_id: str) -> Dict[str
             "policy_mode": mode,
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
+    return result
 
-    # Select agent based on mode
-    selected_agent = "llm_server_1" if mode == "loose" else "llm_server_1"
-    confidence = 0.95 if mode == "loose" else 0.98
 
-    return {
-        "agent_id": selected_agent,
-        "capability": capability,
-        "confidence_score": confidence,
-        "reasoning": f"Selected {selected_agent} based on {mode} policy mode and capability match",
-        "registry_snapshot": {
-            "total_eligible": 2,
-            "evaluated": 2,
-            "selected": selected_agent
-        },
-        "run_id": run_id,
-        "policy_mode": mode,
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    }
+def use_mock_mode() -> bool:
+    """Whether to answer from the mock registry instead of FC (see PT003_MOCK_MODE)"""
+    if MOCK_MODE == "on" or (MOCK_MODE == "auto" and not FC_OPT_IN):
+        return True
+    if is_fc_reachable():
+        return False
+    if MOCK_MODE == "off":
+        print(f"❌ FC not reachable at {FC_BASE_URL} (PT003_MOCK_MODE=off)", flush=True)
+        sys.exit(1)
+    print(f"⚠️  FC not reachable, using mock mode", flush=True)
+    return True
 
 
-def get_registry_status() -> Dict[str, Any]:
-    """Query registry status to prove eligible agents exist"""
+def with_mock_fallback(live: Callable[[], Dict[str, Any]], mock: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """FC's answer; outside PT003_MOCK_MODE=off, the mock's if the FC call fails"""
     try:
-        url = f"{FC_BASE_URL}/servers/status"
-        req = urllib.request.Request(
-            url,
-            headers={"Authorization": f"Bearer {PASSPORT_TOKEN}"}
-        )
-        with urllib.request.urlopen(req, timeout=2) as response:
-            return json.loads(response.read().decode())
-    except urllib.error.URLError as e:
-        print(f"⚠️  FC unreachable ({type(e).__name__}), using mock mode")
-        return get_mock_registry_status()
+        return live()
     except Exception as e:
+        if MOCK_MODE == "off":
+            raise
         print(f"⚠️  FC error ({type(e).__name__}), using mock mode")
+        MOCK_FALLBACKS.append(type(e).__name__)
+        return mock()
+
+
+def get_registry_status(mode: str, use_mock: bool) -> Dict[str, Any]:
+    """Query registry status to prove eligible agents exist"""
+    if use_mock:
         return get_mock_registry_status()
+    return with_mock_fallback(lambda: fc_request("GET", "/servers/status", mode), get_mock_registry_status)
 
 
-def discover_agents(capability: str, mode: str) -> Dict[str, Any]:
+def discover_agents(capability: str, mode: str, use_mock: bool) -> Dict[str, Any]:
     """Discover agents matching capability"""
-    try:
-        params = f"?capability={capability}&include_performance=true&max_results=10"
-        url = f"{FC_BASE_URL}/agents/discover{params}"
-        req = urllib.request.Request(
-            url,
-            headers={
-                "Authorization": f"Bearer {PASSPORT_TOKEN}",
-                "X-Policy-Mode": mode.upper()
-            }
-        )
-        with urllib.request.urlopen(req, timeout=2) as response:
-            return json.loads(response.read().decode())
-    except urllib.error.URLError as e:
-        print(f"⚠️  FC unreachable ({type(e).__name__}), using mock mode")
-        return get_mock_agents(capability, mode)
-    except Exception as e:
-        print(f"⚠️  FC error ({type(e).__name__}), using mock mode")
+    if use_mock:
         return get_mock_agents(capability, mode)
+    params = f"?capability={capability}&include_performance=true&max_results=10"
+    return with_mock_fallback(lambda: fc_request("GET", f"/agents/discover{params}", mode),
+                              lambda: get_mock_agents(capability, mode))
 
 
-def route_request(capability: str, mode: str) -> Dict[str, Any]:
+def route_request(capability: str, mode: str, use_mock: bool) -> Dict[str, Any]:
     """Submit routing request to Federation Core"""
     run_id = str(uuid.uuid4())
+    if use_mock:
+        return get_mock_routing_result(capability, mode, run_id)
 
-    try:
+    def route_live() -> Dict[str, Any]:
         payload = {
             "capability": capability,
             "preferred_tags": ["llm_routing", "core_service"],
@@ -160,29 +163,18 @@ def route_request(capability: str, mode: str) -> Dict[str, Any]:
             "tenant_id": "omega",
             "run_id": run_id
         }
+        try:
+            result = fc_request("POST", "/route", mode, payload, headers={"X-Request-ID": run_id})
+        except urllib.error.HTTPError as e:
+            # No route is a fail-closed answer, not a transport failure
+            if e.code != 404:
+                raise
+            result = json.loads(e.read().decode())
+            result.update({"policy_mode": mode, "timestamp": datetime.now(timezone.utc).isoformat()})
+        result["run_id"] = run_id
+        return result
 
-        url = f"{FC_BASE_URL}/route"
-        req = urllib.request.Request(
-            url,
-            data=json.dumps(payload).encode(),
-            headers={
-                "Authorization": f"Bearer {PASSPORT_TOKEN}",
-                "X-Policy-Mode": mode.upper(),
-                "X-Request-ID": run_id,
-                "Content-Type": "application/json"
-            },
-            method="POST"
-        )
-        with urllib.request.urlopen(req, timeout=2) as response:
-            result = json.loads(response.read().decode())
-            result["run_id"] = run_id
-            return result
-    except urllib.error.URLError as e:
-        print(f"⚠️  FC unreachable ({type(e).__name__}), using mock mode")
-        return get_mock_routing_result(capability, mode, run_id)
-    except Exception as e:
-        print(f"⚠️  FC error ({type(e).__name__}), using mock mode")
-        return get_mock_routing_result(capability, mode, run_id)
+    return with_mock_fallback(route_live, lambda: get_mock_routing_result(capability, mode, run_id))
 
 
 def main():
@@ -203,13 +195,11 @@ def main():
     print(f"   FC Endpoint: {FC_BASE_URL}", flush=True)
 
     # Check FC connectivity
-    fc_available = is_fc_reachable()
-    if not fc_available:
-        print(f"⚠️  FC not reachable, using mock mode", flush=True)
+    use_mock = use_mock_mode()
 
     # Step 1: Query registry status
     print(f"\n📊 Step 1: Query Registry Status")
-    registry_status = get_registry_status()
+    registry_status = get_registry_status(mode, use_mock)
     if registry_status:
         print(f"   Total Servers: {registry_status.get('total_servers', 'N/A')}")
         print(f"   Active Servers: {registry_status.get('active_servers', 'N/A')}")
@@ -217,7 +207,7 @@ def main():
 
     # Step 2: Discover agents
     print(f"\n🔍 Step 2: Discover Agents for Capability")
-    agents = discover_agents(capability, mode)
+    agents = discover_agents(capability, mode, use_mock)
     if agents and "agents" in agents:
         print(f"   Found {len(agents['agents'])} agents")
         for agent in agents["agents"][:3]:
@@ -225,7 +215,7 @@ def main():
 
     # Step 3: Route request
     print(f"\n🚀 Step 3: Submit Routing Request")
-    routing_result = route_request(capability, mode)
+    routing_result = route_request(capability, mode, use_mock)
 
     if "error" not in routing_result:
         print(f"   Run ID: {routing_result.get('run_id', 'N/A')}")
@@ -242,6 +232,7 @@ def main():
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "mode": mode,
         "capability": capability,
+        "fc_mode": "mock" if use_mock else "live_with_mock_fallback" if MOCK_FALLBACKS else "live",
         "registry_status": registry_status,
         "discovered_agents": agents,
         "routing_result": routing_result
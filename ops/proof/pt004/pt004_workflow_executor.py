@@ -9,159 +9,93 @@ Usage:
     python pt004_workflow_executor.py --test happy_path
     python pt004_workflow_executor.py --test policy_flag
     python pt004_workflow_executor.py --test policy_deny
+
+Load mode (N concurrent scenario instances, report into the evidence directory):
+    python pt004_workflow_executor.py --load 200 --concurrency 100 --arrival-rate 50
 """
 
+import argparse
 import asyncio
-import base64
-import hashlib
-import hmac
-import json
 import os
 import sys
-import time
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Dict, Optional
 import httpx
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from fc_client import FCClient
+from fc_load import add_load_arguments, run_load_from_args
+
 # Configuration
-FC_BASE_URL = "http://localhost:9405"
+FC_BASE_URL = os.getenv("FC_BASE_URL", "http://localhost:9405")
 TENANT_ID = "tenant_omega"
 ACTOR_ID = "pt004_test_harness"
 CLIENT_ID = "omega-genesis"
 CLIENT_SECRET = os.getenv("OMEGA_DEV_GENESIS_SECRET", "dev-secret")
 
 
-
-def generate_bearer_token(server_id: str = "pt004_test_harness", scopes: Optional[list] = None, ttl_seconds: int = 3600) -> str:
-    """Generate a secure HMAC-signed bearer token for Federation Core."""
-    if scopes is None:
-        scopes = []
-
-    # Use the same secret as FC (from environment or default)
-    # FC uses: bWVtYmVyaGFuZHNvbWVub3NoYXBlcmVtZW1iZXJib3htb25rZXluYXRpdmVkaXJlY3Q=
-    secret = os.getenv("SECRET_KEY", "bWVtYmVyaGFuZHNvbWVub3NoYXBlcmVtZW1iZXJib3htb25rZXluYXRpdmVkaXJlY3Q=")
-
-    issued_at = int(time.time())
-    expires_at = issued_at + ttl_seconds
-
-    payload = {
-        "server_id": server_id,
-        "scopes": scopes,
-        "iat": issued_at,
-        "exp": expires_at,
-        "jti": base64.urlsafe_b64encode(os.urandom(16)).decode().rstrip("=")
-    }
-
-    payload_json = base64.urlsafe_b64encode(
-        json.dumps(payload, separators=(',', ':')).encode()
-    ).decode().rstrip("=")
-
-    signature = hmac.new(
-        secret.encode(),
-        payload_json.encode(),
-        hashlib.sha256
-    ).digest()
-
-    signature_b64 = base64.urlsafe_b64encode(signature).decode().rstrip("=")
-
-    return f"omega_{payload_json}.{signature_b64}"
+def create_client(**kwargs: Any) -> FCClient:
+    """Create the pooled FC client shared by every call in one harness run."""
+    return FCClient(FC_BASE_URL, tenant_id=TENANT_ID, actor_id=ACTOR_ID, scopes=[], **kwargs)
 
 
 async def create_workflow_run(
+    fc: FCClient,
     workflow_id: str,
     input_payload: Dict[str, Any],
-    token: str,
 ) -> Dict[str, Any]:
     """Create a new workflow run in Federation Core."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{FC_BASE_URL}/api/fc/runs",
-            json={
-                "workflow_id": workflow_id,
-                "workflow_version": "1.0.0",
-                "input_payload": input_payload,
-                "metadata": {"test_mode": "pt004"},
-                "tags": ["pt004", "proof_campaign"],
-            },
-            headers={
-                "Authorization": f"Bearer {token}",
-                "X-Tenant-ID": TENANT_ID,
-                "X-Actor-ID": ACTOR_ID,
-            },
-        )
-        response.raise_for_status()
-        return response.json()
+    return await fc.create_run(
+        workflow_id,
+        input_payload,
+        metadata={"test_mode": "pt004"},
+        tags=["pt004", "proof_campaign"],
+    )
 
 
 async def update_run_status(
+    fc: FCClient,
     run_id: str,
     new_status: str,
-    token: str,
     current_step: Optional[str] = None,
     step_index: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Update workflow run status."""
-    async with httpx.AsyncClient() as client:
-        response = await client.patch(
-            f"{FC_BASE_URL}/api/fc/runs/{run_id}",
-            json={
-                "status": new_status,
-                "current_step": current_step,
-                "step_index": step_index,
-            },
-            headers={
-                "Authorization": f"Bearer {token}",
-                "X-Tenant-ID": TENANT_ID,
-                "X-Actor-ID": ACTOR_ID,
-            },
-        )
-        if response.status_code != 200:
-            print(f"DEBUG: PATCH error {response.status_code}: {response.text}")
-        response.raise_for_status()
-        return response.json()
-
-
-async def get_run_with_logs(run_id: str, token: str) -> Dict[str, Any]:
+    try:
+        return await fc.update_run_status(run_id, new_status, current_step, step_index)
+    except httpx.HTTPStatusError as e:
+        print(f"DEBUG: PATCH error {e.response.status_code}: {e.response.text}")
+        raise
+
+
+async def get_run_with_logs(fc: FCClient, run_id: str) -> Dict[str, Any]:
     """Get workflow run with full audit trail."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{FC_BASE_URL}/api/fc/runs/{run_id}?include_logs=true&include_gates=true",
-            headers={
-                "Authorization": f"Bearer {token}",
-                "X-Tenant-ID": TENANT_ID,
-                "X-Actor-ID": ACTOR_ID,
-            },
-        )
-        response.raise_for_status()
-        return response.json()
-
-
-async def test_happy_path():
+    return await fc.get_run(run_id)
+
+
+async def test_happy_path(fc: FCClient):
     """Test A: All steps execute successfully."""
     print("\n" + "="*60)
     print("TEST A: HAPPY PATH (All Allow)")
     print("="*60)
 
-    # Get bearer token
-    token = generate_bearer_token()
-    print(f"✓ Generated bearer token")
-
     # Create run
     response = await create_workflow_run(
+        fc,
         workflow_id="pt004_execution_spine",
         input_payload={"test_mode": "happy_path"},
-        token=token,
     )
     run_id = response["run"]["run_id"]
     print(f"✓ Created workflow run: {run_id}")
 
     # Transition from PENDING to RUNNING (step 1)
     await update_run_status(
+        fc,
         run_id=run_id,
         new_status="running",
         current_step="step_1",
         step_index=0,
-        token=token,
     )
     print(f"✓ Step 1 started")
     await asyncio.sleep(0.3)
@@ -176,16 +110,16 @@ async def test_happy_path():
 
     # Complete workflow
     await update_run_status(
+        fc,
         run_id=run_id,
         new_status="completed",
         current_step=None,
         step_index=5,
-        token=token,
     )
     print(f"✓ Workflow completed")
 
     # Retrieve with audit trail
-    result = await get_run_with_logs(run_id, token)
+    result = await get_run_with_logs(fc, run_id)
     print(f"\nAudit Trail ({len(result['logs'])} entries):")
     for log in result['logs'][:3]:
         print(f"  - {log['event_type']}: {log['message']}")
@@ -193,31 +127,27 @@ async def test_happy_path():
     return run_id
 
 
-async def test_policy_flag():
+async def test_policy_flag(fc: FCClient):
     """Test B: Policy flag triggers gate."""
     print("\n" + "="*60)
     print("TEST B: POLICY FLAG (Gate Required)")
     print("="*60)
 
-    # Get bearer token
-    token = generate_bearer_token()
-    print(f"✓ Generated bearer token")
-
     response = await create_workflow_run(
+        fc,
         workflow_id="pt004_execution_spine",
         input_payload={"test_mode": "policy_flag"},
-        token=token,
     )
     run_id = response["run"]["run_id"]
     print(f"✓ Created workflow run: {run_id}")
 
     # Transition from PENDING to RUNNING (step 1)
     await update_run_status(
+        fc,
         run_id=run_id,
         new_status="running",
         current_step="step_1",
         step_index=0,
-        token=token,
     )
     print(f"✓ Step 1 started")
     await asyncio.sleep(0.3)
@@ -228,22 +158,22 @@ async def test_policy_flag():
 
     # Step 2 policy evaluation returns "flag" - pause workflow
     await update_run_status(
+        fc,
         run_id=run_id,
         new_status="paused",
         current_step="step_2",
         step_index=1,
-        token=token,
     )
     print(f"✓ Workflow paused (policy flag)")
 
     # Simulate approval - resume from PAUSED to RUNNING
     await asyncio.sleep(1)
     await update_run_status(
+        fc,
         run_id=run_id,
         new_status="running",
         current_step="step_3",
         step_index=2,
-        token=token,
     )
     print(f"✓ Workflow resumed after approval")
     await asyncio.sleep(0.3)
@@ -255,67 +185,84 @@ async def test_policy_flag():
 
     # Complete workflow
     await update_run_status(
+        fc,
         run_id=run_id,
         new_status="completed",
-        token=token,
     )
     print(f"✓ Workflow completed")
 
     return run_id
 
 
-async def test_policy_deny():
+async def test_policy_deny(fc: FCClient):
     """Test C: Policy deny fails workflow."""
     print("\n" + "="*60)
     print("TEST C: POLICY DENY (Fail-Closed)")
     print("="*60)
 
-    # Get bearer token
-    token = generate_bearer_token()
-    print(f"✓ Generated bearer token")
-
     response = await create_workflow_run(
+        fc,
         workflow_id="pt004_execution_spine",
         input_payload={"test_mode": "policy_deny"},
-        token=token,
     )
     run_id = response["run"]["run_id"]
     print(f"✓ Created workflow run: {run_id}")
 
     # Transition from PENDING to RUNNING
     await update_run_status(
+        fc,
         run_id=run_id,
         new_status="running",
         current_step="step_1",
         step_index=0,
-        token=token,
     )
     print(f"✓ Workflow transitioned to RUNNING")
 
     # Step 2: Policy deny - fail the workflow
     await update_run_status(
+        fc,
         run_id=run_id,
         new_status="failed",
         current_step="step_2",
         step_index=1,
-        token=token,
     )
     print(f"✓ Workflow failed (policy deny)")
 
     return run_id
 
 
-async def main():
-    """Run all tests."""
+async def load_scenario(fc: FCClient) -> str:
+    """One load-mode instance: create -> run -> pause (flag) -> resume -> complete -> fetch logs."""
+    response = await create_workflow_run(fc, "pt004_execution_spine", {"test_mode": "load"})
+    run_id = response["run"]["run_id"]
+    await update_run_status(fc, run_id, "running", current_step="step_1", step_index=0)
+    await update_run_status(fc, run_id, "paused", current_step="step_2", step_index=1)
+    await update_run_status(fc, run_id, "running", current_step="step_3", step_index=2)
+    await update_run_status(fc, run_id, "completed", step_index=5)
+    await get_run_with_logs(fc, run_id)
+    return run_id
+
+
+TESTS = {
+    "happy_path": test_happy_path,
+    "policy_flag": test_policy_flag,
+    "policy_deny": test_policy_deny,
+}
+
+
+async def main(only: Optional[str] = None):
+    """Run all tests, or just the one named by --test."""
     print("\n🔱 PT-004 WORKFLOW ORCHESTRATION TEST HARNESS")
     print(f"Federation Core: {FC_BASE_URL}")
     print(f"Timestamp: {datetime.now(timezone.utc).isoformat()}Z")
 
     try:
         run_ids = {}
-        run_ids["happy_path"] = await test_happy_path()
-        run_ids["policy_flag"] = await test_policy_flag()
-        run_ids["policy_deny"] = await test_policy_deny()
+        async with create_client() as fc:
+            print(f"✓ Pooled FC client ready (http2={fc.http2})")
+            for test_name, test in TESTS.items():
+                if only in (None, test_name):
+                    run_ids[test_name] = await test(fc)
 
         print("\n" + "="*60)
         print("SUMMARY")
@@ -334,6 +281,13 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    parser = argparse.ArgumentParser(description="PT-004 workflow orchestration test harness")
+    parser.add_argument("--test", choices=list(TESTS), help="Run only this scenario (default: all)")
+    add_load_arguments(parser, "pt004")
+    args = parser.parse_args()
+    if args.load:
+        report = asyncio.run(run_load_from_args(args, "pt004", load_scenario, create_client))
+        sys.exit(1 if report["scenarios_failed"] else 0)
+    exit_code = asyncio.run(main(args.test))
     sys.exit(exit_code)
 
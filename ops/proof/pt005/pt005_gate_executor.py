@@ -17,203 +17,96 @@ ENDPOINTS:
 - GET    /api/fc/runs/{id}               - Get run with logs
 - GET    /api/fc/gates                   - List pending gates
 
+USAGE:
+    python pt005_gate_executor.py                      # all tests
+    python pt005_gate_executor.py --test happy_resume  # or explicit_denial, invalid_resume
+
+LOAD MODE:
+    python pt005_gate_executor.py --load 200 --concurrency 100 --arrival-rate 50
+
 This is the way. [PANTHEON]
 """
 
+import argparse
 import asyncio
 import httpx
-import json
-import base64
-import hmac
-import hashlib
 import os
-import time
+import sys
 from datetime import datetime, timezone, timedelta
+from pathlib import Path
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from fc_client import FCClient
+from fc_load import add_load_arguments, run_load_from_args
 
 # Configuration
 FC_BASE_URL = os.getenv("FC_BASE_URL", "http://localhost:9405")
-SECRET_KEY = os.getenv("SECRET_KEY", "bWVtYmVyaGFuZHNvbWVub3NoYXBlcmVtZW1iZXJib3htb25rZXluYXRpdmVkaXJlY3Q=")
 TENANT_ID = "tenant_omega"
+ACTOR_ID = "pt005_test_harness"
 
 
-def generate_bearer_token(server_id: str = "pt005_test_harness", scopes: Optional[List[str]] = None, ttl_seconds: int = 3600) -> str:
-    """Generate HMAC-signed bearer token for FC."""
-    if scopes is None:
-        scopes = ["workflow:read", "workflow:write", "gate:read", "gate:write"]
-
-    issued_at = int(time.time())
-    expires_at = issued_at + ttl_seconds
+def create_client(**kwargs: Any) -> FCClient:
+    """Create the pooled FC client shared by every call in one harness run."""
+    return FCClient(FC_BASE_URL, tenant_id=TENANT_ID, actor_id=ACTOR_ID, **kwargs)
 
-    payload = {
-        "server_id": server_id,
-        "scopes": scopes,
-        "iat": issued_at,
-        "exp": expires_at,
-        "jti": base64.urlsafe_b64encode(os.urandom(16)).decode().rstrip("=")
-    }
 
-    payload_json = base64.urlsafe_b64encode(
-        json.dumps(payload, separators=(',', ':')).encode()
-    ).decode().rstrip("=")
+async def create_workflow_run(fc: FCClient, workflow_id: str, input_payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Create a workflow run."""
+    return await fc.create_run(workflow_id, input_payload)
 
-    signature = hmac.new(
-        SECRET_KEY.encode(),
-        payload_json.encode(),
-        hashlib.sha256
-    ).digest()
-    signature_b64 = base64.urlsafe_b64encode(signature).decode().rstrip("=")
 
-    return f"omega_{payload_json}.{signature_b64}"
+async def update_run_status(fc: FCClient, run_id: str, new_status: str, current_step: Optional[str] = None, step_index: Optional[int] = None) -> Dict[str, Any]:
+    """Update workflow run status."""
+    return await fc.update_run_status(run_id, new_status, current_step, step_index)
 
 
-async def create_workflow_run(workflow_id: str, input_payload: Dict[str, Any], token: str) -> Dict[str, Any]:
-    """Create a workflow run."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{FC_BASE_URL}/api/fc/runs",
-            json={
-                "workflow_id": workflow_id,
-                "workflow_version": "1.0.0",
-                "input_payload": input_payload,
-            },
-            headers={
-                "Authorization": f"Bearer {token}",
-                "X-Tenant-Id": TENANT_ID,
-                "X-Actor-Id": "pt005_test_harness",
-            }
-        )
-        response.raise_for_status()
-        return response.json()
-
-
-async def update_run_status(run_id: str, new_status: str, token: str, current_step: Optional[str] = None, step_index: Optional[int] = None) -> Dict[str, Any]:
-    """Update workflow run status."""
-    async with httpx.AsyncClient() as client:
-        response = await client.patch(
-            f"{FC_BASE_URL}/api/fc/runs/{run_id}",
-            json={
-                "status": new_status,
-                "current_step": current_step,
-                "step_index": step_index,
-            },
-            headers={
-                "Authorization": f"Bearer {token}",
-                "X-Tenant-Id": TENANT_ID,
-                "X-Actor-Id": "pt005_test_harness",
-            }
-        )
-        response.raise_for_status()
-        return response.json()
-
-
-async def create_gate(run_id: str, step_id: str, gate_name: str, required_approvers: List[str], token: str) -> Dict[str, Any]:
+async def create_gate(fc: FCClient, run_id: str, step_id: str, gate_name: str, required_approvers: List[str]) -> Dict[str, Any]:
     """Create an approval gate."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{FC_BASE_URL}/api/fc/runs/{run_id}/gate",
-            json={
-                "step_id": step_id,
-                "gate_type": "human_approval",
-                "gate_name": gate_name,
-                "description": f"Gate for {gate_name}",
-                "required_approvers": required_approvers,
-                "timeout_seconds": 3600,
-            },
-            headers={
-                "Authorization": f"Bearer {token}",
-                "X-Tenant-Id": TENANT_ID,
-                "X-Actor-Id": "pt005_test_harness",
-            }
-        )
-        response.raise_for_status()
-        return response.json()
-
-
-async def resolve_gate(gate_id: str, status: str, token: str, actor_id: str = "approver_1", rejection_reason: Optional[str] = None) -> Dict[str, Any]:
+    return await fc.create_gate(run_id, step_id, gate_name, required_approvers)
+
+
+async def resolve_gate(fc: FCClient, gate_id: str, status: str, actor_id: str = "approver_1", rejection_reason: Optional[str] = None) -> Dict[str, Any]:
     """Resolve a gate (approve or reject)."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{FC_BASE_URL}/api/fc/gates/{gate_id}",
-            json={
-                "status": status,
-                "rejection_reason": rejection_reason,
-            },
-            headers={
-                "Authorization": f"Bearer {token}",
-                "X-Tenant-Id": TENANT_ID,
-                "X-Actor-Id": actor_id,
-            }
-        )
-        response.raise_for_status()
-        return response.json()
-
-
-async def get_run_with_logs(run_id: str, token: str) -> Dict[str, Any]:
+    return await fc.resolve_gate(gate_id, status, actor_id=actor_id, rejection_reason=rejection_reason)
+
+
+async def get_run_with_logs(fc: FCClient, run_id: str) -> Dict[str, Any]:
     """Get workflow run with logs."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{FC_BASE_URL}/api/fc/runs/{run_id}?include_logs=true&include_gates=true",
-            headers={
-                "Authorization": f"Bearer {token}",
-                "X-Tenant-Id": TENANT_ID,
-                "X-Actor-Id": "pt005_test_harness",
-            }
-        )
-        response.raise_for_status()
-        return response.json()
-
-
-async def list_pending_gates(token: str, approver_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    return await fc.get_run(run_id)
+
+
+async def list_pending_gates(fc: FCClient, approver_id: Optional[str] = None) -> List[Dict[str, Any]]:
     """List pending gates."""
-    async with httpx.AsyncClient() as client:
-        params = {}
-        if approver_id:
-            params["approver_id"] = approver_id
-        
-        response = await client.get(
-            f"{FC_BASE_URL}/api/fc/gates",
-            params=params,
-            headers={
-                "Authorization": f"Bearer {token}",
-                "X-Tenant-Id": TENANT_ID,
-                "X-Actor-Id": "pt005_test_harness",
-            }
-        )
-        response.raise_for_status()
-        return response.json()
-
-
-async def test_happy_resume():
+    return await fc.list_pending_gates(approver_id)
+
+
+async def test_happy_resume(fc: FCClient):
     """Test A: Happy Resume - pause -> approve -> resume."""
     print("\n" + "="*60)
     print("TEST A: HAPPY RESUME (Pause -> Approve -> Resume)")
     print("="*60)
     
-    token = generate_bearer_token()
-    print(f"[OK] Generated bearer token")
-    
     # Create workflow
     response = await create_workflow_run(
+        fc,
         workflow_id="pt005_gate_test",
-        input_payload={"test": "happy_resume"},
-        token=token
+        input_payload={"test": "happy_resume"}
     )
     run_id = response["run"]["run_id"]
     print(f"[OK] Created workflow run: {run_id}")
     
     # Transition to RUNNING
-    await update_run_status(run_id, "running", token, current_step="step_1", step_index=0)
+    await update_run_status(fc, run_id, "running", current_step="step_1", step_index=0)
     print(f"[OK] Workflow transitioned to RUNNING")
     
     # Create gate (this pauses the workflow)
     gate_response = await create_gate(
+        fc,
         run_id=run_id,
         step_id="step_2",
         gate_name="Human Approval Gate",
-        required_approvers=["approver_1"],
-        token=token
+        required_approvers=["approver_1"]
     )
     gate_id = gate_response["gate_id"]
     print(f"[OK] Gate created: {gate_id}")
@@ -221,26 +114,26 @@ async def test_happy_resume():
     print(f"  - Gate name: {gate_response['gate_name']}")
     
     # Verify run is paused
-    run_data = await get_run_with_logs(run_id, token)
+    run_data = await get_run_with_logs(fc, run_id)
     print(f"[OK] Workflow paused (status: {run_data['run']['status']})")
     
     # Approve gate
     await asyncio.sleep(0.5)
-    gate_response = await resolve_gate(gate_id, "approved", token, actor_id="approver_1")
+    gate_response = await resolve_gate(fc, gate_id, "approved", actor_id="approver_1")
     print(f"[OK] Gate approved by approver_1")
     print(f"  - Gate status: {gate_response['status']}")
     print(f"  - Approved by: {gate_response['approved_by']}")
     
     # Verify run resumed
-    run_data = await get_run_with_logs(run_id, token)
+    run_data = await get_run_with_logs(fc, run_id)
     print(f"[OK] Workflow resumed (status: {run_data['run']['status']})")
     
     # Complete workflow
-    await update_run_status(run_id, "completed", token)
+    await update_run_status(fc, run_id, "completed")
     print(f"[OK] Workflow completed")
     
     # Capture audit trail
-    run_data = await get_run_with_logs(run_id, token)
+    run_data = await get_run_with_logs(fc, run_id)
     print(f"\nAudit Trail ({len(run_data['logs'])} entries):")
     for log in run_data['logs'][-5:]:
         print(f"  - {log['event_type']}: {log['message']}")
@@ -248,49 +141,46 @@ async def test_happy_resume():
     return run_id
 
 
-async def test_explicit_denial():
+async def test_explicit_denial(fc: FCClient):
     """Test B: Explicit Denial - pause -> deny -> fail-closed."""
     print("\n" + "="*60)
     print("TEST B: EXPLICIT DENIAL (Pause -> Deny -> Fail-Closed)")
     print("="*60)
     
-    token = generate_bearer_token()
-    print(f"[OK] Generated bearer token")
-    
     # Create workflow
     response = await create_workflow_run(
+        fc,
         workflow_id="pt005_gate_test",
-        input_payload={"test": "explicit_denial"},
-        token=token
+        input_payload={"test": "explicit_denial"}
     )
     run_id = response["run"]["run_id"]
     print(f"[OK] Created workflow run: {run_id}")
     
     # Transition to RUNNING
-    await update_run_status(run_id, "running", token, current_step="step_1", step_index=0)
+    await update_run_status(fc, run_id, "running", current_step="step_1", step_index=0)
     print(f"[OK] Workflow transitioned to RUNNING")
     
     # Create gate
     gate_response = await create_gate(
+        fc,
         run_id=run_id,
         step_id="step_2",
         gate_name="Security Review Gate",
-        required_approvers=["approver_1"],
-        token=token
+        required_approvers=["approver_1"]
     )
     gate_id = gate_response["gate_id"]
     print(f"[OK] Gate created: {gate_id}")
     
     # Verify run is paused
-    run_data = await get_run_with_logs(run_id, token)
+    run_data = await get_run_with_logs(fc, run_id)
     print(f"[OK] Workflow paused (status: {run_data['run']['status']})")
     
     # Deny gate
     await asyncio.sleep(0.5)
     gate_response = await resolve_gate(
-        gate_id, 
-        "rejected", 
-        token, 
+        fc,
+        gate_id,
+        "rejected",
         actor_id="approver_1",
         rejection_reason="Security policy violation detected"
     )
@@ -299,7 +189,7 @@ async def test_explicit_denial():
     print(f"  - Rejection reason: {gate_response['rejection_reason']}")
     
     # Verify run failed
-    run_data = await get_run_with_logs(run_id, token)
+    run_data = await get_run_with_logs(fc, run_id)
     print(f"[OK] Workflow failed (status: {run_data['run']['status']})")
     print(f"  - Error details: {run_data['run'].get('error_details', {})}")
     
@@ -311,35 +201,32 @@ async def test_explicit_denial():
     return run_id
 
 
-async def test_invalid_resume():
+async def test_invalid_resume(fc: FCClient):
     """Test C: Invalid Resume (Security) - prove humans can't cheat."""
     print("\n" + "="*60)
     print("TEST C: INVALID RESUME (Security - Invalid Gate ID)")
     print("="*60)
     
-    token = generate_bearer_token()
-    print(f"[OK] Generated bearer token")
-    
     # Create workflow
     response = await create_workflow_run(
+        fc,
         workflow_id="pt005_gate_test",
-        input_payload={"test": "invalid_resume"},
-        token=token
+        input_payload={"test": "invalid_resume"}
     )
     run_id = response["run"]["run_id"]
     print(f"[OK] Created workflow run: {run_id}")
     
     # Transition to RUNNING
-    await update_run_status(run_id, "running", token, current_step="step_1", step_index=0)
+    await update_run_status(fc, run_id, "running", current_step="step_1", step_index=0)
     print(f"[OK] Workflow transitioned to RUNNING")
     
     # Create gate
     gate_response = await create_gate(
+        fc,
         run_id=run_id,
         step_id="step_2",
         gate_name="Test Gate",
-        required_approvers=["approver_1"],
-        token=token
+        required_approvers=["approver_1"]
     )
     gate_id = gate_response["gate_id"]
     print(f"[OK] Gate created: {gate_id}")
@@ -347,60 +234,78 @@ async def test_invalid_resume():
     # Try to resolve with invalid gate_id
     print(f"\n-> Attempting to resolve with invalid gate_id...")
     try:
-        await resolve_gate("invalid_gate_id", "approved", token, actor_id="approver_1")
+        await resolve_gate(fc, "invalid_gate_id", "approved", actor_id="approver_1")
         print(f"[FAIL] ERROR: Should have rejected invalid gate_id!")
         return run_id
     except httpx.HTTPStatusError as e:
         print(f"[OK] Correctly rejected invalid gate_id (status: {e.response.status_code})")
     
     # Verify run is still paused
-    run_data = await get_run_with_logs(run_id, token)
+    run_data = await get_run_with_logs(fc, run_id)
     print(f"[OK] Workflow still paused (status: {run_data['run']['status']})")
     
     # Try to resolve with wrong actor (not in required_approvers)
     print(f"\n-> Attempting to resolve with unauthorized actor...")
     try:
-        await resolve_gate(gate_id, "approved", token, actor_id="unauthorized_actor")
+        await resolve_gate(fc, gate_id, "approved", actor_id="unauthorized_actor")
         # Note: FC may not validate actor authorization, but we log the attempt
         print(f"[WARN] Gate resolved (FC may not validate actor authorization)")
         # If it succeeded, the gate is already resolved, so we can't test further
-        run_data = await get_run_with_logs(run_id, token)
+        run_data = await get_run_with_logs(fc, run_id)
         print(f"[OK] Workflow status: {run_data['run']['status']}")
     except httpx.HTTPStatusError as e:
         print(f"[OK] Correctly rejected unauthorized actor (status: {e.response.status_code})")
         # Resolve gate properly with authorized actor
-        gate_response = await resolve_gate(gate_id, "approved", token, actor_id="approver_1")
+        gate_response = await resolve_gate(fc, gate_id, "approved", actor_id="approver_1")
         print(f"[OK] Gate approved by authorized actor")
 
         # Complete workflow
-        await update_run_status(run_id, "completed", token)
+        await update_run_status(fc, run_id, "completed")
         print(f"[OK] Workflow completed")
     
     return run_id
 
 
-async def main():
-    """Run all PT-005 tests."""
+async def load_scenario(fc: FCClient) -> str:
+    """One load-mode instance: create -> run -> gate -> approve -> complete -> fetch logs."""
+    response = await create_workflow_run(fc, "pt005_gate_test", {"test": "load"})
+    run_id = response["run"]["run_id"]
+    await update_run_status(fc, run_id, "running", current_step="step_1", step_index=0)
+    gate_response = await create_gate(fc, run_id, "step_2", "Human Approval Gate", ["approver_1"])
+    await resolve_gate(fc, gate_response["gate_id"], "approved", actor_id="approver_1")
+    await update_run_status(fc, run_id, "completed")
+    await get_run_with_logs(fc, run_id)
+    return run_id
+
+
+async def main(only: Optional[str] = None):
+    """Run all PT-005 tests, or just the one named by --test."""
     print("\n" + "[PANTHEON] PT-005 GATE ERGONOMICS TEST HARNESS")
     print(f"Federation Core: {FC_BASE_URL}")
     print(f"Timestamp: {datetime.now(timezone.utc).isoformat()}Z")
     
     run_ids = {}
     
-    try:
-        run_ids["happy_resume"] = await test_happy_resume()
-    except Exception as e:
-        print(f"[FAIL] Test A failed: {e}")
-    
-    try:
-        run_ids["explicit_denial"] = await test_explicit_denial()
-    except Exception as e:
-        print(f"[FAIL] Test B failed: {e}")
-    
-    try:
-        run_ids["invalid_resume"] = await test_invalid_resume()
-    except Exception as e:
-        print(f"[FAIL] Test C failed: {e}")
+    async with create_client() as fc:
+        print(f"[OK] Pooled FC client ready (http2={fc.http2})")
+
+        if only in (None, "happy_resume"):
+            try:
+                run_ids["happy_resume"] = await test_happy_resume(fc)
+            except Exception as e:
+                print(f"[FAIL] Test A failed: {e}")
+
+        if only in (None, "explicit_denial"):
+            try:
+                run_ids["explicit_denial"] = await test_explicit_denial(fc)
+            except Exception as e:
+                print(f"[FAIL] Test B failed: {e}")
+
+        if only in (None, "invalid_resume"):
+            try:
+                run_ids["invalid_resume"] = await test_invalid_resume(fc)
+            except Exception as e:
+                print(f"[FAIL] Test C failed: {e}")
     
     # Summary
     print("\n" + "="*60)
@@ -413,5 +318,14 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="PT-005 gate ergonomics test harness")
+    parser.add_argument(
+        "--test", choices=["happy_resume", "explicit_denial", "invalid_resume"], help="Run only this test (default: all)"
+    )
+    add_load_arguments(parser, "pt005")
+    args = parser.parse_args()
+    if args.load:
+        report = asyncio.run(run_load_from_args(args, "pt005", load_scenario, create_client))
+        sys.exit(1 if report["scenarios_failed"] else 0)
+    asyncio.run(main(args.test))
 
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+"""
+PT-013 Action Ledger
+====================
+Append-only, hash-chained JSONL log of collaboration actions.
+
+Each line is the canonical JSON of one action (sorted keys, compact
+separators, UTF-8) with its SHA-256 prepended as the first key:
+
+    {"action_hash":"<sha256 of the canonical action>","action_id":...,"prev_action_hash":...}
+
+`prev_action_hash` links every action to the one before it, so appending only
+needs the in-memory chain head (O(1)), and verification is one sequential
+read that hashes each line's raw bytes - no re-serialization. On close the
+head (count, last seq, head hash) is written to `<ledger>.head.json`, which
+anchors the tail: a truncated ledger still chains, but no longer matches it.
+A run that ends without close() leaves the head behind the ledger; reopening
+recounts from the recorded head, and refuses a ledger that no longer
+contains it (truncated or rewritten) or whose last line is torn.
+
+Usage:
+    with ActionLedger(OUTPUT_DIR / "collaboration_ledger.jsonl") as ledger:
+        ledger.append(action)
+    result = verify_ledger(OUTPUT_DIR / "collaboration_ledger.jsonl")
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+LINE_PREFIX = b'{"action_hash":"'
+HASH_LEN = 64
+# Bytes between the hash and the rest of the action object: `",`
+BODY_OFFSET = len(LINE_PREFIX) + HASH_LEN + 2
+# Fields left out of the content a receipt RHID is derived from
+CHAIN_FIELDS = ("action_hash", "receipt_rhid", "prev_action_hash")
+
+
+def canonical_json(data: Any) -> bytes:
+    """Canonical JSON bytes: sorted keys, no whitespace, UTF-8."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def generate_rhid(kind: str, content: Union[str, bytes]) -> str:
+    """Content-derived RHID (Resource Hash ID): rhid:<kind>:<sha256 of content>."""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return f"rhid:{kind}:{hashlib.sha256(content).hexdigest()}"
+
+
+def _as_dict(action: Any) -> Dict[str, Any]:
+    """Shallow field dict (asdict deep-copies, which dominates append cost)."""
+    if is_dataclass(action):
+        return {f.name: getattr(action, f.name) for f in fields(action)}
+    return dict(action)
+
+
+def action_hash(action: Any) -> str:
+    """SHA-256 of an action's canonical JSON (the value stored as `action_hash`)."""
+    record = _as_dict(action)
+    record.pop("action_hash", None)
+    return hashlib.sha256(canonical_json(record)).hexdigest()
+
+
+def receipt_rhid_for(action: Any) -> str:
+    """Receipt RHID derived from the action content (excluding its chain link)."""
+    content = {k: v for k, v in _as_dict(action).items() if k not in CHAIN_FIELDS}
+    return generate_rhid("receipt", canonical_json(content))
+
+
+def head_path(ledger_path: Union[str, Path]) -> Path:
+    path = Path(ledger_path)
+    return path.with_name(path.name + ".head.json")
+
+
+def _read_last_line(path: Path, chunk_size: int = 65536) -> Optional[bytes]:
+    """Last non-empty line of a file, reading backwards from the end."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        buffer = b""
+        while end > 0:
+            start = max(0, end - chunk_size)
+            f.seek(start)
+            buffer = f.read(end - start) + buffer
+            end = start
+            lines = buffer.rstrip(b"\n").rsplit(b"\n", 1)
+            if len(lines) == 2 or end == 0:
+                return lines[-1] or None
+    return None
+
+
+def _line_hash(line: bytes) -> Optional[str]:
+    """Stored hash of a ledger line, or None if the line is not an intact record."""
+    if not line.startswith(LINE_PREFIX) or line[BODY_OFFSET - 2:BODY_OFFSET] != b'",':
+        return None
+    stored = line[len(LINE_PREFIX):BODY_OFFSET - 2].decode("ascii", errors="replace")
+    if hashlib.sha256(b"{" + line[BODY_OFFSET:]).hexdigest() != stored:
+        return None
+    return stored
+
+
+class ActionLedger:
+    """
+    Append-only writer for one hash-chained action ledger.
+
+    Reopening an existing ledger resumes from its last line, so appends keep
+    chaining across harness runs. The count comes from the head file when it
+    still names the last line; otherwise (a run that never reached close())
+    the lines are recounted, checking that the recorded head is still part of
+    the chain. Raises ValueError on a torn last line or a ledger that no
+    longer contains its recorded head.
+    """
+
+    def __init__(self, path: Union[str, Path], fsync: bool = False):
+        self.path = Path(path)
+        self.fsync = fsync
+        self.head: Optional[str] = None
+        self.last_seq: Optional[int] = None
+        self.count = 0
+
+        if self.path.exists() and self.path.stat().st_size:
+            self._resume()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+
+    def _resume(self) -> None:
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            terminated = f.read(1) == b"\n"
+        last = _read_last_line(self.path)
+        self.head = _line_hash(last) if terminated and last else None
+        if self.head is None:
+            raise ValueError(f"{self.path}: last line is torn or corrupt; repair the ledger before appending")
+        self.last_seq = json.loads(b"{" + last[BODY_OFFSET:])["seq"]
+
+        head = head_path(self.path)
+        recorded = json.loads(head.read_text()) if head.exists() else None
+        if recorded and recorded.get("head_hash") == self.head:
+            self.count = recorded["count"]
+        else:
+            self.count = _count_lines(self.path, recorded)
+
+    def append(self, action: Any) -> str:
+        """
+        Link `action` to the chain head, fill in its receipt RHID if missing,
+        write it, and return its hash. `seq` must increase strictly.
+        """
+        if self.last_seq is not None and action.seq <= self.last_seq:
+            raise ValueError(f"seq must increase: {action.seq} after {self.last_seq}")
+        action.prev_action_hash = self.head
+        if not action.receipt_rhid:
+            action.receipt_rhid = receipt_rhid_for(action)
+
+        body = canonical_json(_as_dict(action))
+        digest = hashlib.sha256(body).hexdigest()
+        self._file.write(LINE_PREFIX + digest.encode("ascii") + b'",' + body[1:] + b"\n")
+
+        self.head = digest
+        self.last_seq = action.seq
+        self.count += 1
+        return digest
+
+    def flush(self) -> None:
+        """Flush appended lines and record the chain head."""
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        head = head_path(self.path)
+        tmp = head.with_name(head.name + ".tmp")
+        tmp.write_text(json.dumps({"count": self.count, "last_seq": self.last_seq, "head_hash": self.head}, indent=2))
+        os.replace(tmp, head)
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "ActionLedger":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def _count_lines(path: Path, recorded: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Count ledger lines; with a recorded (stale) head, also require that line
+    `recorded["count"]` is the recorded head hash, i.e. the ledger only grew.
+    """
+    count = 0
+    anchored = recorded is None or (recorded.get("count") == 0 and recorded.get("head_hash") is None)
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.rstrip(b"\r\n")
+            if not line:
+                continue
+            count += 1
+            if not anchored and count == recorded.get("count"):
+                anchored = _line_hash(line) == recorded.get("head_hash")
+    if not anchored:
+        raise ValueError(f"{path}: ledger does not contain its recorded head (truncated or rewritten)")
+    return count
+
+
+def verify_ledger(path: Union[str, Path], buffer_size: int = 1 << 20) -> Dict[str, Any]:
+    """
+    Verify a ledger in one sequential read.
+
+    Checks, per line: the stored hash matches the line's bytes, the line links
+    to the previous hash, and seq increases. Then checks the head file, when
+    present, against the final state. Stops at the first failure.
+    """
+    path = Path(path)
+    result: Dict[str, Any] = {"path": str(path), "valid": False, "count": 0, "head_hash": None, "error": None}
+    prev_hash = None
+    last_seq = None
+
+    with open(path, "rb", buffering=buffer_size) as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.rstrip(b"\r\n")
+            if not line:
+                continue
+            if not line.startswith(LINE_PREFIX) or line[BODY_OFFSET - 2:BODY_OFFSET] != b'",':
+                result["error"] = f"line {line_no}: not a ledger record"
+                return result
+            stored = line[len(LINE_PREFIX):BODY_OFFSET - 2].decode("ascii")
+            body = b"{" + line[BODY_OFFSET:]
+            if hashlib.sha256(body).hexdigest() != stored:
+                result["error"] = f"line {line_no}: hash mismatch"
+                return result
+            record = json.loads(body)
+            if record.get("prev_action_hash") != prev_hash:
+                result["error"] = f"line {line_no}: broken chain link"
+                return result
+            if last_seq is not None and record["seq"] <= last_seq:
+                result["error"] = f"line {line_no}: seq {record['seq']} after {last_seq}"
+                return result
+            prev_hash = stored
+            last_seq = record["seq"]
+            result["count"] += 1
+
+    result["head_hash"] = prev_hash
+    head = head_path(path)
+    if head.exists():
+        expected = json.loads(head.read_text())
+        if expected.get("head_hash") != prev_hash or expected.get("count") != result["count"]:
+            result["error"] = "ledger does not match its recorded head (truncated or extended)"
+            return result
+    result["valid"] = True
+    return result
@@ -13,23 +13,208 @@ Invariants:
 - Every change tracked + verified
 - Before/after hashes matched to RemediationReceipt
 - Rollback capability preserved (before/after diffs recorded)
+- All approved receipts for one file are merged into a single write
+- Write-ahead journal: every file write is journaled (with pre/post hashes,
+  the receipts it carries and a backup of the original) before it happens,
+  so an interrupted apply can be resumed or rolled back
 """
 
 import sys
+import os
 import json
+import tempfile
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import hashlib
-from typing import List, Dict, Tuple
+from typing import Any, List, Dict, Iterable, Iterator, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+from ppp.storage.journal import JsonlJournal, iter_journal
+from ppp.workflows.parallel import run_bounded
 
 if sys.stdout.encoding != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 
+def resolve_change_spans(content: str, changes: List[Dict]) -> List[Tuple[int, int, str]]:
+    """
+    Locate each change in the original content as a (start, end, replacement) span.
+
+    A change with "start"/"end" offsets must match its "old" text exactly there.
+    Otherwise "old" is searched from the start of its "line_number" (if given),
+    past any earlier occurrence already claimed by a change with the same text,
+    so repeated phrases map to successive occurrences. Spans are returned sorted;
+    missing text or overlapping changes raise ValueError.
+    """
+    line_starts = None
+    next_from: Dict[str, int] = {}
+    spans = []
+    for i, change in enumerate(changes, 1):
+        old_text = change['old']
+        if not old_text:
+            raise ValueError(f"Change {i}: empty original text")
+        if change.get('start') is not None:
+            start = change['start']
+            end = change.get('end', start + len(old_text))
+            if content[start:end] != old_text:
+                raise ValueError(f"Change {i}: text at offset {start} does not match")
+        else:
+            position = next_from.get(old_text, 0)
+            if change.get('line_number'):
+                if line_starts is None:
+                    line_starts = [0]
+                    newline = content.find('\n')
+                    while newline >= 0:
+                        line_starts.append(newline + 1)
+                        newline = content.find('\n', newline + 1)
+                line_index = min(change['line_number'], len(line_starts)) - 1
+                position = max(position, line_starts[line_index])
+            start = content.find(old_text, position)
+            if start < 0:
+                raise ValueError(f"Change {i}: text not found: {old_text[:60]!r}")
+            end = start + len(old_text)
+            next_from[old_text] = end
+        spans.append((start, end, change['new']))
+
+    spans.sort(key=lambda span: (span[0], span[1]))
+    check_no_overlaps(spans)
+    return spans
+
+
+def check_no_overlaps(spans: List[Tuple[int, int, str]]) -> None:
+    """Raise ValueError if any two of the sorted spans overlap."""
+    for (_, prev_end, _), (start, _, _) in zip(spans, spans[1:]):
+        if start < prev_end:
+            raise ValueError(f"Overlapping changes at offset {start}")
+
+
+def apply_spans(content: str, spans: List[Tuple[int, int, str]]) -> str:
+    """Build the patched content in one pass from sorted, non-overlapping spans."""
+    parts = []
+    cursor = 0
+    for start, end, replacement in spans:
+        parts.append(content[cursor:start])
+        parts.append(replacement)
+        cursor = end
+    parts.append(content[cursor:])
+    return ''.join(parts)
+
+
+def atomic_write_bytes(file_path: Path, data: bytes) -> None:
+    """Replace file_path with data via fsynced temp file + os.replace (never half-written)."""
+    fd, tmp = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp, file_path.stat().st_mode & 0o7777)
+        except OSError:
+            pass
+        os.replace(tmp, file_path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    if hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(file_path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+JOURNAL_FILE = "apply_journal.jsonl"
+BACKUP_DIR = "apply_backups"
+ALREADY_APPLIED = "Already applied (journal)"
+
+
+def receipt_key(receipt: Dict) -> str:
+    """Journal identity of a receipt: its receipt_id, else document_id@file_hash_pre."""
+    return receipt.get('receipt_id') or f"{receipt['document_id']}@{receipt['file_hash_pre']}"
+
+
+def sha256_file(file_path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(file_path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+class ApplyJournal:
+    """
+    Write-ahead journal for remediation writes (append-only JSONL, fsynced per entry).
+
+    One write ("<repo>/<path>@<pre hash>") carries every receipt merged into
+    it: an "intent" entry (pre/post hashes, receipt ids, backup of the
+    original) is durable before the file is replaced, "commit" follows the
+    write, "rollback" follows a restore. `state` keeps the latest of these per
+    write and `receipt_writes` the write each receipt went into; "failed"
+    entries are recorded for the audit trail only.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.backup_dir = self.path.parent / BACKUP_DIR
+        self.state: Dict[str, Dict] = {}
+        self.receipt_writes: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        for entry in iter_journal(self.path):
+            if entry.get("event") in ("intent", "commit", "rollback"):
+                self._track(entry)
+        self._journal = JsonlJournal(self.path)
+
+    def _track(self, entry: Dict) -> None:
+        self.state[entry["key"]] = entry
+        for receipt_id in entry.get("receipt_ids", ()):
+            self.receipt_writes[receipt_id] = entry["key"]
+
+    def record(self, event: str, key: str, **fields) -> Dict:
+        entry = {"event": event, "key": key, **fields, "timestamp": datetime.utcnow().isoformat()}
+        with self._lock:
+            self._journal.append(entry)
+            if event != "failed":
+                self._track(entry)
+        return entry
+
+    def record_as(self, event: str, write: Dict) -> Dict:
+        """Record `event` for a journaled write, carrying its hashes, receipts and backup."""
+        fields = {k: v for k, v in write.items() if k not in ("event", "key", "timestamp")}
+        return self.record(event, write["key"], **fields)
+
+    def backup(self, data: bytes, digest: str) -> str:
+        """Store original content by hash (once) and return its journal-relative path."""
+        backup_path = self.backup_dir / digest
+        if not backup_path.exists():
+            self.backup_dir.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(backup_path, data)
+        return f"{BACKUP_DIR}/{digest}"
+
+    def read_backup(self, entry: Dict) -> bytes:
+        data = (self.path.parent / entry["backup"]).read_bytes()
+        if hashlib.sha256(data).hexdigest() != entry["file_hash_pre"]:
+            raise ValueError(f"Backup does not match file_hash_pre: {entry['backup']}")
+        return data
+
+    def applied_write(self, receipt_id: str) -> Optional[Dict]:
+        """The journaled (intended or committed, not rolled back) write carrying this receipt."""
+        entry = self.state.get(self.receipt_writes.get(receipt_id))
+        if entry and entry["event"] in ("intent", "commit"):
+            return entry
+        return None
+
+    def close(self) -> None:
+        self._journal.close()
+
+
 class ApplyRemediationChanges:
     """Apply approved remediation changes to files."""
 
-    def __init__(self, evidence_dir: str, repos: Dict[str, str]):
+    def __init__(self, evidence_dir: str, repos: Dict[str, str], workers: Optional[int] = None):
         """
         Initialize applier.
 
@@ -41,9 +226,12 @@ class ApplyRemediationChanges:
                     "omega-docs-internal": "D:/Repos/omega-docs-internal",
                     "keon-docs": "D:/Repos/keon-docs",
                 }
+            workers: Threads applying files concurrently (default: ThreadPoolExecutor's)
         """
         self.evidence_dir = Path(evidence_dir)
         self.repos = {name: Path(path) for name, path in repos.items()}
+        self.workers = workers
+        self.journal: Optional[ApplyJournal] = None
 
     def apply_all_approved_changes(self) -> Dict:
         """
@@ -80,42 +268,63 @@ class ApplyRemediationChanges:
 
         # Apply changes
         total_applied = 0
+        total_already_applied = 0
         total_failed = 0
         changes_log = []
 
-        with open(receipts_path) as f:
+        approved_directives = {
+            d['directive_id'] for d in approvals.get('remediation_decisions', [])
+            if d['decision_type'] == "APPROVE_BATCH"
+        }
+
+        def collect(receipt: Dict, outcome: Tuple[bool, str]) -> None:
+            nonlocal total_applied, total_already_applied, total_failed
+            success, result = outcome
+            if success and result == ALREADY_APPLIED:
+                total_already_applied += 1
+                changes_log.append({"status": "already_applied", "document_id": receipt['document_id']})
+                print(f"[DONE] {receipt['document_id']} (already applied)")
+            elif success:
+                total_applied += 1
+                changes_log.append({
+                    "status": "success",
+                    "document_id": receipt['document_id'],
+                    "changes_count": receipt['changes_approved']
+                })
+                print(f"[OK] {receipt['document_id']} ({receipt['changes_approved']} changes applied)")
+            else:
+                total_failed += 1
+                changes_log.append({
+                    "status": "failed",
+                    "document_id": receipt['document_id'],
+                    "error": result
+                })
+                print(f"[FAIL] {receipt['document_id']}: {result}")
+
+        # One streaming pass: each receipt is parsed once, unapproved ones only counted.
+        # Receipts are grouped per file so each file is written once with all its changes.
+        skipped: Dict[str, int] = {}
+        receipts_by_file: Dict[Tuple[str, str], List[Dict]] = {}
+        with open(receipts_path, 'r', encoding='utf-8') as f:
             for line in f:
+                if not line.strip():
+                    continue
                 receipt = json.loads(line)
+                if receipt['directive_id'] in approved_directives:
+                    receipts_by_file.setdefault((receipt['source_repo'], receipt['file_path']), []).append(receipt)
+                else:
+                    skipped[receipt['directive_id']] = skipped.get(receipt['directive_id'], 0) + 1
 
-                # Check if this directive was approved
-                directive_approved = any(
-                    d['directive_id'] == receipt['directive_id'] and d['decision_type'] == "APPROVE_BATCH"
-                    for d in approvals.get('remediation_decisions', [])
-                )
+        def collect_file(receipts: List[Dict], outcomes: List[Tuple[bool, str]]) -> None:
+            for receipt, outcome in zip(receipts, outcomes):
+                collect(receipt, outcome)
 
-                if not directive_approved:
-                    print(f"[SKIP] {receipt['document_id']} (directive {receipt['directive_id']} not approved)")
-                    continue
+        with self._journaled():
+            # Files are independent: patch them concurrently
+            self._run_parallel(self._apply_changes_to_file, receipts_by_file.values(), collect_file)
 
-                # Apply change to file
-                success, result = self._apply_change_to_file(receipt)
-
-                if success:
-                    total_applied += 1
-                    changes_log.append({
-                        "status": "success",
-                        "document_id": receipt['document_id'],
-                        "changes_count": receipt['changes_approved']
-                    })
-                    print(f"[OK] {receipt['document_id']} ({receipt['changes_approved']} changes applied)")
-                else:
-                    total_failed += 1
-                    changes_log.append({
-                        "status": "failed",
-                        "document_id": receipt['document_id'],
-                        "error": result
-                    })
-                    print(f"[FAIL] {receipt['document_id']}: {result}")
+        for directive_id, count in sorted(skipped.items(), key=lambda kv: str(kv[0])):
+            print(f"[SKIP] {count} receipt(s) (directive {directive_id} not approved)")
 
         print()
         print("=" * 80)
@@ -128,60 +337,203 @@ class ApplyRemediationChanges:
         return {
             "total_files_applied": total_applied,
             "total_files_failed": total_failed,
+            "total_files_already_applied": total_already_applied,
             "changes_applied_log": changes_log
         }
 
-    def _apply_change_to_file(self, receipt: Dict) -> Tuple[bool, str]:
+    def rollback_applied_changes(self) -> Dict:
         """
-        Apply a single remediation change to a file.
+        Restore every journaled file that was not rolled back yet.
 
-        Args:
-            receipt: RemediationReceipt with changes_details
-
-        Returns:
-            (success: bool, result_or_error: str)
+        A file still at its journaled post hash is restored from the backup of
+        its original (several writes to one file are unwound together); a
+        write whose file is already at its pre hash is only marked rolled
+        back; any other hash is reported as failed (changed since apply).
         """
-        file_path = self._resolve_file_path(receipt['source_repo'], receipt['file_path'])
-
-        if not file_path.exists():
-            return False, f"File not found: {file_path}"
+        print("=" * 80)
+        print("ROLLING BACK APPLIED REMEDIATION CHANGES")
+        print("=" * 80)
+        print()
 
-        try:
-            # Read original content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                original_content = f.read()
+        restored = 0
+        failed = 0
+        rollback_log = []
+
+        def collect(entry: Dict, outcome: Tuple[bool, str]) -> None:
+            nonlocal restored, failed
+            success, result = outcome
+            if success:
+                restored += 1
+                rollback_log.append({"status": "rolled_back", "document_id": entry['document_id'], "result": result})
+                print(f"[OK] {entry['document_id']}: {result}")
+            else:
+                failed += 1
+                rollback_log.append({"status": "failed", "document_id": entry['document_id'], "error": result})
+                print(f"[FAIL] {entry['document_id']}: {result}")
+
+        def collect_file(entries: List[Dict], outcomes: List[Tuple[bool, str]]) -> None:
+            for entry, outcome in zip(entries, outcomes):
+                collect(entry, outcome)
+
+        with self._journaled() as journal:
+            pending_by_file: Dict[Tuple[str, str], List[Dict]] = {}
+            for entry in journal.state.values():
+                if entry["event"] != "rollback":
+                    pending_by_file.setdefault((entry['source_repo'], entry['file_path']), []).append(entry)
+            self._run_parallel(self._rollback_file, pending_by_file.values(), collect_file)
 
-            # Verify hash matches receipt
-            original_hash = hashlib.sha256(original_content.encode()).hexdigest()
-            if original_hash != receipt['file_hash_pre']:
-                return False, f"Hash mismatch (file may have been modified)"
+        print()
+        print(f"Total rolled back: {restored}")
+        print(f"Total failed: {failed}")
+        print()
 
-            # Apply changes
-            modified_content = original_content
-            for change in receipt['changes_details']:
-                old_text = change['old']
-                new_text = change['new']
-                modified_content = modified_content.replace(old_text, new_text, 1)
+        return {
+            "total_files_rolled_back": restored,
+            "total_files_failed": failed,
+            "rollback_log": rollback_log
+        }
 
-            # Compute hash of modified content
-            modified_hash = hashlib.sha256(modified_content.encode()).hexdigest()
+    @contextmanager
+    def _journaled(self) -> Iterator[ApplyJournal]:
+        self.journal = ApplyJournal(self.evidence_dir / "decisions" / JOURNAL_FILE)
+        try:
+            yield self.journal
+        finally:
+            self.journal.close()
+            self.journal = None
+
+    def _run_parallel(self, func, items: Iterable[Any], collect) -> None:
+        """Run func over items on the thread pool (bounded in flight), collecting results on this thread."""
+        workers = self.workers or min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            run_bounded(pool, func, items, collect, 2 * workers)
+
+    def _rollback_file(self, entries: List[Dict]) -> List[Tuple[bool, str]]:
+        """
+        Undo the journaled writes of one file in a single restore.
 
-            # Write modified content
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(modified_content)
+        Writes are unwound newest first by following the hash chain from the
+        file's current content (post hash -> pre hash); the file is then
+        replaced once with the oldest undone write's backup. A write whose pre
+        hash is the resulting content never happened and is only marked rolled
+        back; any other write is reported as failed (changed since apply).
+        """
+        try:
+            file_path = self._resolve_file_path(entries[0]['source_repo'], entries[0]['file_path'])
+            current_hash = sha256_file(file_path)
+            remaining = list(entries)
+            undone: List[Dict] = []
+            while True:
+                entry = next((e for e in remaining if e['file_hash_post'] == current_hash), None)
+                if entry is None:
+                    break
+                remaining.remove(entry)
+                undone.append(entry)
+                current_hash = entry['file_hash_pre']
+            if undone:
+                atomic_write_bytes(file_path, self.journal.read_backup(undone[-1]))
+        except Exception as e:
+            return [(False, str(e))] * len(entries)
+
+        outcomes = {}
+        for entry in undone:
+            self.journal.record_as("rollback", entry)
+            outcomes[entry['key']] = (True, "Restored original content")
+        for entry in remaining:
+            if entry['file_hash_pre'] == current_hash:
+                self.journal.record_as("rollback", entry)
+                outcomes[entry['key']] = (True, "Unchanged (already at original content)")
+            else:
+                outcomes[entry['key']] = (False, "Hash matches neither pre nor post state (modified since apply)")
+        return [outcomes[entry['key']] for entry in entries]
+
+    def _apply_changes_to_file(self, receipts: List[Dict]) -> List[Tuple[bool, str]]:
+        """
+        Apply every approved receipt for one file in a single write.
 
-            # Verify write
-            with open(file_path, 'r', encoding='utf-8') as f:
-                verify_content = f.read()
+        Receipts carried by a journaled write are already applied (an
+        interrupted write whose post hash is on disk is committed first). The
+        others must have file_hash_pre equal to the file's current hash; their
+        change spans are merged and written once. A receipt fails on its own
+        when its pre hash no longer matches, its text is not found, its own
+        file_hash_post differs, or its changes overlap an earlier receipt's.
 
-            verify_hash = hashlib.sha256(verify_content.encode()).hexdigest()
-            if verify_hash != modified_hash:
-                return False, "Write verification failed"
+        Args:
+            receipts: RemediationReceipts with changes_details, all for one file
 
-            return True, f"Applied {len(receipt['changes_details'])} changes"
+        Returns:
+            [(success: bool, result_or_error: str)] in receipt order
+        """
+        first = receipts[0]
+        outcomes: List[Optional[Tuple[bool, str]]] = [None] * len(receipts)
+        merged: List[int] = []
+        try:
+            file_path = self._resolve_file_path(first['source_repo'], first['file_path'])
+            if not file_path.exists():
+                return [(False, f"File not found: {file_path}")] * len(receipts)
+
+            # Read original content (bytes, so line endings and the hash are exact)
+            original_bytes = file_path.read_bytes()
+            original_hash = hashlib.sha256(original_bytes).hexdigest()
+            original_content = None
+            key = f"{first['source_repo']}/{first['file_path']}@{original_hash}"
+
+            spans: List[Tuple[int, int, str]] = []
+            for i, receipt in enumerate(receipts):
+                write = self.journal.applied_write(receipt_key(receipt)) if self.journal else None
+                if write and (write['event'] == "commit" or write['file_hash_post'] == original_hash):
+                    if write['event'] == "intent":
+                        self.journal.record_as("commit", write)
+                    outcomes[i] = (True, ALREADY_APPLIED)
+                    continue
+                try:
+                    if receipt['file_hash_pre'] != original_hash:
+                        raise ValueError("Hash mismatch (file may have been modified)")
+                    if original_content is None:
+                        original_content = original_bytes.decode('utf-8')
+                    receipt_spans = resolve_change_spans(original_content, receipt['changes_details'])
+                    if receipt.get('file_hash_post'):
+                        receipt_hash = hashlib.sha256(apply_spans(original_content, receipt_spans).encode('utf-8')).hexdigest()
+                        if receipt_hash != receipt['file_hash_post']:
+                            raise ValueError("Patched content does not match receipt file_hash_post")
+                    combined = sorted(spans + receipt_spans, key=lambda span: (span[0], span[1]))
+                    check_no_overlaps(combined)
+                except ValueError as e:
+                    outcomes[i] = (False, str(e))
+                    if self.journal:
+                        self.journal.record("failed", key, document_id=receipt['document_id'],
+                                            receipt_ids=[receipt_key(receipt)], error=str(e))
+                    continue
+                spans = combined
+                merged.append(i)
+                outcomes[i] = (True, f"Applied {len(receipt_spans)} changes")
+
+            if merged:
+                # All merged changes in one pass over the original content
+                modified_bytes = apply_spans(original_content, spans).encode('utf-8')
+                modified_hash = hashlib.sha256(modified_bytes).hexdigest()
+                if self.journal:
+                    # Write-ahead: intent (with a backup of the original) is durable before the write
+                    intent = self.journal.record("intent", key, document_id=first['document_id'],
+                                                 source_repo=first['source_repo'], file_path=first['file_path'],
+                                                 receipt_ids=[receipt_key(receipts[i]) for i in merged],
+                                                 file_hash_pre=original_hash, file_hash_post=modified_hash,
+                                                 backup=self.journal.backup(original_bytes, original_hash))
+                atomic_write_bytes(file_path, modified_bytes)
+                if self.journal:
+                    self.journal.record_as("commit", intent)
 
         except Exception as e:
-            return False, str(e)
+            if self.journal:
+                self.journal.record("failed", f"{first['source_repo']}/{first['file_path']}",
+                                    document_id=first.get('document_id'), error=str(e))
+            # Receipts not settled before the error (or merged into the failed write) fail with it
+            return [
+                (False, str(e)) if outcome is None or i in merged else outcome
+                for i, outcome in enumerate(outcomes)
+            ]
+
+        return outcomes
 
     def _resolve_file_path(self, repo_name: str, file_path: str) -> Path:
         """
@@ -211,5 +563,9 @@ if __name__ == "__main__":
     }
 
     applier = ApplyRemediationChanges(evidence_dir, repos)
-    result = applier.apply_all_approved_changes()
+    if "--rollback" in sys.argv[1:]:
+        result = applier.rollback_applied_changes()
+    else:
+        # Re-running resumes an interrupted apply: journaled receipts are skipped
+        result = applier.apply_all_approved_changes()
     print(json.dumps(result, indent=2))
@@ -15,7 +15,21 @@ Core principles:
 __version__ = "0.1.0"
 __author__ = "Anthropic"
 
-from .runner import PPPRunner
-from .policy.engine import PolicyEvaluator
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+# Exports are loaded on first access so that `ppp status` and other light
+# commands do not import the runner, targets and sealers.
+_EXPORTS = {
+    "PPPRunner": ".runner",
+    "PolicyEvaluator": ".policy.engine",
+}
+
+if TYPE_CHECKING:
+    from .runner import PPPRunner
+    from .policy.engine import PolicyEvaluator
 
 __all__ = ["PPPRunner", "PolicyEvaluator"]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,27 @@
+"""Lazily loaded package exports."""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Module-level `__getattr__` and `__dir__` for `package`.
+
+    `exports` maps an exported name to the relative module defining it; the
+    module is imported on first access and the value cached in the package
+    namespace, so later lookups bypass `__getattr__`.
+    """
+    def __getattr__(name):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,147 @@
+"""Compiled cache for YAML policy/config files."""
+
+import copy
+import hashlib
+import os
+import pickle
+import stat
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Any, Callable, Optional, Tuple
+
+import yaml
+
+# Bump when the cached value layout (PolicyConfig fields, rule plan) changes
+CACHE_VERSION = 3
+
+# libyaml's C loader when PyYAML was built with it (several times faster)
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(data: bytes) -> Any:
+    return yaml.load(data, Loader=YamlLoader)
+
+
+def default_cache_dir() -> Path:
+    if os.environ.get("PPP_CACHE_DIR"):
+        return Path(os.environ["PPP_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ppp" / "policies"
+
+
+def _owned_privately(st: os.stat_result) -> bool:
+    """
+    Whether a cache path is ours alone: owned by this user, not group/other writable.
+
+    Unpickling runs code, so a pickle anyone else could have written is never
+    loaded. Without POSIX ownership (Windows) the per-user cache location is trusted.
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+class PolicyCache:
+    """
+    Parsed-and-built YAML files keyed by path + mtime + sha256.
+
+    An in-process hit costs one stat(). On a miss the file is hashed and the
+    built value is looked up in an on-disk pickle (stamped with
+    CACHE_VERSION and the Python version) before falling back to parsing.
+    Callers get `clone(value)` (a deep copy by default), so mutating a loaded
+    value never changes the cached one. `cache_dir=None` keeps the cache in
+    memory only. The disk cache is only read from or written to a directory
+    this user owns and nobody else can write (see `_owned_privately`); any
+    other directory falls back to the in-process cache.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = "default"):
+        self.cache_dir = default_cache_dir() if cache_dir == "default" else (Path(cache_dir) if cache_dir else None)
+        self._entries: Dict[Tuple[str, str], Tuple[int, int, str, Any]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+    def load(self, path: str, kind: str, build: Callable[[Any], Any],
+             clone: Callable[[Any], Any] = copy.deepcopy) -> Any:
+        """Copy (via `clone`) of `build(parsed_yaml)` for `path`; `kind` namespaces builders."""
+        resolved = str(Path(path).resolve())
+        st = os.stat(resolved)
+        key = (kind, resolved)
+        entry = self._entries.get(key)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            self.stats["hits"] += 1
+            return clone(entry[3])
+
+        with open(resolved, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        with self._lock:
+            if entry and entry[2] == digest:
+                value = entry[3]  # touched but unchanged
+                self.stats["hits"] += 1
+            else:
+                value = self._read_disk(kind, digest)
+                if value is None:
+                    value = build(load_yaml(raw))
+                    self._write_disk(kind, digest, value)
+                    self.stats["misses"] += 1
+                else:
+                    self.stats["disk_hits"] += 1
+            self._entries[key] = (st.st_mtime_ns, st.st_size, digest, value)
+        return clone(value)
+
+    def clear(self) -> None:
+        """Drop in-process entries (the disk cache is kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def _disk_path(self, kind: str, digest: str) -> Optional[Path]:
+        return self.cache_dir / f"{kind}-{digest}.pickle" if self.cache_dir else None
+
+    def _stamp(self, digest: str) -> Dict[str, Any]:
+        return {"version": CACHE_VERSION, "python": sys.version_info[:2], "sha256": digest}
+
+    def _private_dir(self) -> bool:
+        try:
+            return _owned_privately(os.stat(self.cache_dir))
+        except OSError:
+            return False
+
+    def _read_disk(self, kind: str, digest: str) -> Any:
+        path = self._disk_path(kind, digest)
+        if path is None or not path.exists() or not self._private_dir():
+            return None
+        try:
+            with open(path, 'rb') as f:
+                if not _owned_privately(os.fstat(f.fileno())):
+                    return None
+                payload = pickle.load(f)
+        except Exception:
+            return None  # corrupt or written by an incompatible version: rebuild
+        if not isinstance(payload, dict) or payload.get("stamp") != self._stamp(digest):
+            return None
+        return payload.get("value")
+
+    def _write_disk(self, kind: str, digest: str, value: Any) -> None:
+        path = self._disk_path(kind, digest)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not self._private_dir():
+                return  # shared or foreign cache dir: never leave pickles there
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        except OSError:
+            return  # read-only or missing cache dir: in-process cache still applies
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({"stamp": self._stamp(digest), "value": value}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except (OSError, pickle.PicklingError):
+            os.unlink(tmp)
+
+
+# Shared in-process cache used by ConfigLoader and the evaluators
+policy_cache = PolicyCache()
@@ -1,9 +1,11 @@
 """Configuration loader for PPP."""
 
-import yaml
+import copy
 from pathlib import Path
 from typing import Dict, Any
+from .cache import load_yaml, policy_cache
 from .models import RunConfig, PolicyConfig
+from ..policy.plan import compile_rule_plan
 
 
 class ConfigLoader:
@@ -12,8 +14,8 @@ class ConfigLoader:
     @staticmethod
     def load_run_config(path: str) -> RunConfig:
         """Load run configuration from YAML."""
-        with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+        with open(path, 'rb') as f:
+            data = load_yaml(f.read())
 
         ppp_config = data.get('ppp', {})
         run_config = data.get('run', {})
@@ -32,11 +34,20 @@ class ConfigLoader:
 
     @staticmethod
     def load_policy_config(path: str) -> PolicyConfig:
-        """Load policy configuration from YAML."""
-        with open(path, 'r') as f:
-            data = yaml.safe_load(f)
-        
+        """
+        Load policy configuration from YAML.
+
+        Served from the shared policy cache (path + mtime + sha256), so
+        repeat loads skip parsing. Each caller gets its own copy (sharing only
+        the compiled plan), so edits never leak into later loads.
+        """
+        return policy_cache.load(path, "policy", ConfigLoader.build_policy_config, clone=PolicyConfig.clone)
+
+    @staticmethod
+    def build_policy_config(data: Dict[str, Any]) -> PolicyConfig:
+        """Validate parsed policy YAML into a PolicyConfig with its compiled rule plan."""
         policy_data = data.get('policy', {})
+        rules = policy_data.get('rules', [])
         
         return PolicyConfig(
             id=policy_data.get('id', 'unknown'),
@@ -45,9 +56,11 @@ class ConfigLoader:
             tier=policy_data.get('tier', 'loose'),
             allowed_actions=policy_data.get('allowed_actions', []),
             denied_actions=policy_data.get('denied_actions', []),
-            rules=policy_data.get('rules', []),
+            rules=rules,
             logging=policy_data.get('logging', {}),
             compliance=policy_data.get('compliance', {}),
+            compiled=compile_rule_plan(rules),
+            compiled_from=copy.deepcopy(rules),
         )
 
     @staticmethod
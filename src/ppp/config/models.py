@@ -1,5 +1,6 @@
 """Configuration data models for PPP."""
 
+import copy
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 
@@ -30,6 +31,12 @@ class PolicyConfig:
     rules: List[Dict[str, Any]]
     logging: Dict[str, Any]
     compliance: Dict[str, Any]
+    compiled: List[Dict[str, Any]] = field(default_factory=list, repr=False, compare=False)  # rule plan
+    compiled_from: List[Dict[str, Any]] = field(default_factory=list, repr=False, compare=False)  # rules the plan was built from
+
+    def clone(self) -> "PolicyConfig":
+        """Deep copy for one caller; the read-only compiled plan and its source snapshot are shared."""
+        return copy.deepcopy(self, {id(self.compiled): self.compiled, id(self.compiled_from): self.compiled_from})
 
 
 @dataclass
@@ -40,9 +47,12 @@ class TargetConfig:
     url: Optional[str] = None
 
 
-@dataclass
+RULE_SEVERITIES = ("MUST", "SHOULD", "MAY")
+
+
+@dataclass(frozen=True, slots=True)
 class PolicyRule:
-    """A single policy rule."""
+    """A single policy rule (validated once when the policy is loaded)."""
     id: str
     description: str
     severity: str  # MUST, SHOULD, MAY
@@ -51,6 +61,43 @@ class PolicyRule:
     action: str
     parameters: Dict[str, Any] = field(default_factory=dict)
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PolicyRule":
+        """Build from a policy YAML rule; raises ValueError on malformed rules."""
+        if not isinstance(data, dict):
+            raise ValueError(f"Policy rule must be a mapping, got {type(data).__name__}")
+        rule_id = data.get("id")
+        if not rule_id or not isinstance(rule_id, str):
+            raise ValueError(f"Policy rule without an id: {data}")
+        missing = [name for name in ("description", "severity", "enforcement", "target", "action") if name not in data]
+        if missing:
+            raise ValueError(f"Policy rule {rule_id} missing: {', '.join(missing)}")
+        if data["severity"] not in RULE_SEVERITIES:
+            raise ValueError(f"Policy rule {rule_id} has invalid severity: {data['severity']}")
+        parameters = data.get("parameters") or {}
+        if not isinstance(parameters, dict):
+            raise ValueError(f"Policy rule {rule_id} parameters must be a mapping")
+        return cls(
+            id=rule_id,
+            description=data["description"],
+            severity=data["severity"],
+            enforcement=data["enforcement"],
+            target=data["target"],
+            action=data["action"],
+            parameters=parameters,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "description": self.description,
+            "severity": self.severity,
+            "enforcement": self.enforcement,
+            "target": self.target,
+            "action": self.action,
+            "parameters": self.parameters,
+        }
+
 
 @dataclass
 class Receipt:
@@ -10,9 +10,11 @@ Part of WF_DOCS_REMEDIATION_GOVERNANCE_v1.
 """
 
 import re
-from typing import List, Dict, Tuple
+from bisect import bisect_right
+from typing import List, Dict, Tuple, Any
 from dataclasses import dataclass
-import yaml
+
+from ..config.cache import policy_cache
 
 
 @dataclass
@@ -25,6 +27,7 @@ class GuaranteeClaim:
     context_after: str
     pattern_matched: str
     confidence: float  # 0.0-1.0
+    rule_index: int = -1  # index of the matching rule in the directive (-1: unknown)
 
 
 class LanguageRemediationEvaluator:
@@ -39,12 +42,12 @@ class LanguageRemediationEvaluator:
         """
         self.policy_path = policy_path
         self.policy = self._load_policy()
-        self.pattern_cache = {}
+        self.pattern_cache: Dict[str, Dict[str, Any]] = {}  # directive_id -> compiled detector
+        self.claim_type_cache: Dict[str, str] = {}  # lowercased matched text -> claim type
 
     def _load_policy(self) -> dict:
-        """Load remediation policy from YAML."""
-        with open(self.policy_path) as f:
-            return yaml.safe_load(f)
+        """Load remediation policy from YAML (this evaluator's copy of the cached parse)."""
+        return policy_cache.load(self.policy_path, "yaml", lambda data: data)
 
     def detect_guarantee_claims(self, file_content: str, directive_id: str) -> List[GuaranteeClaim]:
         """
@@ -57,50 +60,140 @@ class LanguageRemediationEvaluator:
         Returns:
             List of GuaranteeClaim objects with line numbers, context, confidence
         """
-        if directive_id not in self.policy['directives']:
+        detector = self._compile_directive(directive_id)
+        if detector is None:
             return []
 
-        directive_rules = self.policy['directives'][directive_id]['rules']
-        lines = file_content.split('\n')
-        claims = []
+        newlines = None  # offsets of '\n', built on the first matching line only
+        found = []
 
-        for line_num, line in enumerate(lines, 1):
-            for rule in directive_rules:
-                pattern = rule['pattern']
-                replacement_conf = rule.get('replacement_confidence', 0.85)
+        # Only lines the combined regex hits are scanned rule by rule, in the
+        # former line, rule, position order; rules may overlap on a line
+        for line_start, line_end in self._matching_lines(detector["regex"], file_content):
+            if newlines is None:
+                newlines = [m.start() for m in re.finditer('\n', file_content)]
+            line_num = bisect_right(newlines, line_start) + 1
+            line = file_content[line_start:line_end]
+            for rule_index, rule_regex in detector["rules"]:
+                for match in rule_regex.finditer(line):
+                    found.append((line_num, rule_index, match.group(0)))
 
-                # Compile regex pattern
-                try:
-                    regex = re.compile(pattern, re.IGNORECASE)
-                except re.error:
-                    continue
-
-                # Find all matches in line
-                for match in regex.finditer(line):
-                    matched_text = match.group(0)
-
-                    # Determine claim type based on pattern
-                    claim_type = self._determine_claim_type(matched_text)
+        claims = []
+        claim_types = self.claim_type_cache
+        for line_num, rule_index, matched_text in found:
+            key = matched_text.lower()
+            claim_type = claim_types.get(key)
+            if claim_type is None:
+                claim_type = claim_types[key] = self._determine_claim_type(matched_text)
+            claims.append(GuaranteeClaim(
+                text=self._line(file_content, newlines, line_num).strip(),
+                claim_type=claim_type,
+                line_number=line_num,
+                context_before=self._line(file_content, newlines, line_num - 1),
+                context_after=' '.join(
+                    self._line(file_content, newlines, n) for n in (line_num + 1, line_num + 2)
+                    if n <= len(newlines) + 1
+                ),
+                pattern_matched=matched_text,
+                # Confidence based on match strength + rule confidence
+                confidence=detector["confidences"][rule_index],
+                rule_index=rule_index,
+            ))
 
-                    # Extract context (lines before/after)
-                    context_before = lines[max(0, line_num-2):line_num-1]
-                    context_after = lines[line_num:min(len(lines), line_num+2)]
+        return claims
 
-                    # Confidence based on match strength + rule confidence
-                    confidence = min(1.0, replacement_conf * 0.95)  # Slightly discounted for pattern matching
+    def _compile_directive(self, directive_id: str):
+        """
+        Compile a directive's rules once: each rule on its own, plus all of
+        them joined into one alternation.
+
+        The alternation only finds the lines worth scanning: any line where
+        some rule matches contains a match of it (MULTILINE keeps ^/$
+        anchored per line). Those lines are then scanned with every rule, so
+        matches of different rules that overlap are all reported, exactly as
+        the former per-line, per-rule scan did.
+        """
+        if directive_id in self.pattern_cache:
+            return self.pattern_cache[directive_id]
+        if directive_id not in self.policy['directives']:
+            return None
+
+        patterns = {}
+        rules = []
+        confidences = {}
+        for index, rule in enumerate(self.policy['directives'][directive_id]['rules']):
+            try:
+                rules.append((index, re.compile(rule['pattern'], re.IGNORECASE)))
+            except re.error:
+                continue  # invalid patterns are skipped, as before
+            patterns[index] = rule['pattern']
+            # Slightly discounted for pattern matching
+            confidences[index] = min(1.0, rule.get('replacement_confidence', 0.85) * 0.95)
+
+        detector = None
+        if patterns:
+            detector = {
+                "regex": re.compile(self._combine(patterns), re.IGNORECASE | re.MULTILINE),
+                "rules": rules,
+                "confidences": confidences,
+            }
+        self.pattern_cache[directive_id] = detector
+        return detector
 
-                    claim = GuaranteeClaim(
-                        text=line.strip(),
-                        claim_type=claim_type,
-                        line_number=line_num,
-                        context_before=' '.join(context_before),
-                        context_after=' '.join(context_after),
-                        pattern_matched=matched_text,
-                        confidence=confidence
-                    )
-                    claims.append(claim)
+    @staticmethod
+    def _combine(patterns: Dict[int, str]) -> str:
+        """
+        Join rule patterns into one alternation of named groups.
 
-        return claims
+        When every rule starts with \\b it is hoisted out of the alternation,
+        and when every rule then starts with a literal letter a lookahead on
+        those letters lets the scanner skip other positions cheaply. Both
+        only prune positions where no alternative could match.
+        """
+        # A top-level '|' inside a rule would change meaning once hoisted
+        hoist = all(p.startswith(r'\b') and '|' not in p for p in patterns.values())
+        bodies = {i: (p[2:] if hoist else p) for i, p in patterns.items()}
+        alternation = '|'.join(f"(?P<r{i}>{body})" for i, body in bodies.items())
+
+        first_chars = set()
+        for body in bodies.values():
+            simple = hoist and body[:1].isascii() and body[:1].isalpha() and body[1:2] not in ('?', '*', '{')
+            if not simple:
+                first_chars = None
+                break
+            first_chars.add(body[0].lower())
+
+        prefix = f"(?=[{''.join(sorted(first_chars))}])" if first_chars else ''
+        boundary = r'\b' if hoist else ''
+        return f"{prefix}{boundary}(?:{alternation})"
+
+    @staticmethod
+    def _matching_lines(regex, text: str):
+        """(start, end) offsets of each line the regex matches within; a match never crosses a line break."""
+        pos = 0
+        while True:
+            match = regex.search(text, pos)
+            if match is None:
+                return
+            line_start = text.rfind('\n', 0, match.start()) + 1
+            line_end = text.find('\n', match.start())
+            if line_end == -1:
+                line_end = len(text)
+            # e.g. '\s+' spanning lines: retry bounded to the match's own line
+            if match.end() <= line_end or regex.search(text, match.start(), line_end):
+                yield line_start, line_end
+            if line_end == len(text):
+                return
+            pos = line_end + 1
+
+    @staticmethod
+    def _line(text: str, newlines: List[int], line_num: int) -> str:
+        """Line `line_num` (1-based) of `text` from the newline offset array; '' if out of range."""
+        if line_num < 1 or line_num > len(newlines) + 1:
+            return ''
+        start = newlines[line_num - 2] + 1 if line_num > 1 else 0
+        end = newlines[line_num - 1] if line_num <= len(newlines) else len(text)
+        return text[start:end]
 
     def _determine_claim_type(self, text: str) -> str:
         """Determine claim type (A/B/C/D) based on language."""
@@ -210,19 +303,23 @@ class LanguageRemediationEvaluator:
         directive_rules = self.policy['directives'][directive_id]['rules']
 
         for claim in claims:
-            for rule in directive_rules:
-                pattern = rule['pattern']
-                if re.search(pattern, claim.text, re.IGNORECASE):
-                    suggestion = {
-                        "claim_text": claim.text,
-                        "claim_type": claim.claim_type,
-                        "confidence": claim.confidence,
-                        "suggested_replacement": rule['replacement'],
-                        "replacement_confidence": rule.get('replacement_confidence', 0.85),
-                        "line_number": claim.line_number,
-                        "context": claim.context_before
-                    }
-                    suggestions.append(suggestion)
-                    break  # One replacement per claim
+            if 0 <= claim.rule_index < len(directive_rules):
+                # Detected claims carry the rule that matched them
+                rule = directive_rules[claim.rule_index]
+            else:
+                rule = next(
+                    (r for r in directive_rules if re.search(r['pattern'], claim.text, re.IGNORECASE)), None
+                )
+                if rule is None:
+                    continue
+            suggestions.append({
+                "claim_text": claim.text,
+                "claim_type": claim.claim_type,
+                "confidence": claim.confidence,
+                "suggested_replacement": rule['replacement'],
+                "replacement_confidence": rule.get('replacement_confidence', 0.85),
+                "line_number": claim.line_number,
+                "context": claim.context_before
+            })  # One replacement per claim
 
         return suggestions
@@ -1,10 +1,12 @@
 """Keon receipt sealing integration (default: noop)."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import hashlib
 
+from ..receipts.merkle import MerkleTree, verify_proof
+
 
 class IReceiptSealer(ABC):
     """Interface for receipt sealing with integrity and temporal verification."""
@@ -40,6 +42,75 @@ class IReceiptSealer(ABC):
         """
         pass
 
+    def seal_batch(self, receipts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Seal a batch of receipts with one seal over their Merkle root.
+
+        The root is sealed once (one timestamp for the whole batch) and each
+        receipt gets its audit path, so any single receipt can later be checked
+        with `verify_leaf` without the rest of the batch.
+
+        Returns:
+            {
+                "merkle_root": root over receipt hashes, in batch order,
+                "leaf_count": number of receipts,
+                "seal": seal of the root (as returned by `seal`),
+                "leaves": [{"receipt_hash", "leaf_index", "path"}, ...]
+            }
+        """
+        hashes = _receipt_hashes(receipts)
+        tree = MerkleTree(hashes)
+        root_seal = self.seal({"receipt_hash": tree.root})
+        return {
+            "merkle_root": tree.root,
+            "leaf_count": tree.leaf_count,
+            "seal": root_seal.get("seal"),
+            "leaves": [
+                {"receipt_hash": receipt_hash, "leaf_index": i, "path": path}
+                for i, (receipt_hash, path) in enumerate(zip(hashes, tree.prove_all()))
+            ],
+        }
+
+    def verify_batch(self, receipts: List[Dict[str, Any]], batch_seal: Dict[str, Any]) -> bool:
+        """
+        Verify a whole sealed batch in one pass.
+
+        Rebuilds the Merkle root from the receipts (in order) and checks it
+        against the sealed root, then verifies the root seal once.
+        """
+        if not batch_seal or len(receipts) != batch_seal.get("leaf_count"):
+            return False
+        try:
+            root = MerkleTree(_receipt_hashes(receipts)).root
+        except ValueError:
+            return False
+        if root != batch_seal.get("merkle_root"):
+            return False
+        return self._verify_root(root, batch_seal)
+
+    def verify_leaf(self, receipt_data: Dict[str, Any], leaf: Dict[str, Any], batch_seal: Dict[str, Any]) -> bool:
+        """Verify one receipt against a sealed batch using its audit path."""
+        root = batch_seal.get("merkle_root") if batch_seal else None
+        if not root or receipt_data.get("receipt_hash") != leaf.get("receipt_hash"):
+            return False
+        if not verify_proof(leaf["receipt_hash"], leaf.get("path", []), root):
+            return False
+        return self._verify_root(root, batch_seal)
+
+    def _verify_root(self, root: str, batch_seal: Dict[str, Any]) -> bool:
+        """Verify the root seal; a batch without a seal dict is simply invalid."""
+        seal = batch_seal.get("seal")
+        if not isinstance(seal, dict):
+            return False
+        return self.verify({"receipt_hash": root}, {"receipt_hash": root, "seal": seal})
+
+
+def _receipt_hashes(receipts: List[Dict[str, Any]]) -> List[str]:
+    hashes = [receipt.get("receipt_hash") for receipt in receipts]
+    if not all(hashes):
+        raise ValueError("Every receipt in a batch needs a receipt_hash")
+    return hashes
+
 
 class NoopSealer(IReceiptSealer):
     """No-op sealer (default behavior in v0.1.0)."""
@@ -52,13 +123,17 @@ class NoopSealer(IReceiptSealer):
         """Noop verification always returns True."""
         return True
 
+    def verify_batch(self, receipts: List[Dict[str, Any]], batch_seal: Dict[str, Any]) -> bool:
+        """Noop verification always returns True."""
+        return True
+
 
 class TemporalSealer(IReceiptSealer):
     """Temporal sealer: adds server-side timestamp and integrity hash."""
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
-        self.sealer_id = config.get("sealer_id", "temporal-sealer-v0.1.0")
+        self.sealer_id = self.config.get("sealer_id", "temporal-sealer-v0.1.0")
 
     def seal(self, receipt_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -138,13 +213,21 @@ class KeonSealer(IReceiptSealer):
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         self.not_implemented = True
+        # Single fallback delegate, reused for every call
+        self.delegate = TemporalSealer(self.config)
 
     def seal(self, receipt_data: Dict[str, Any]) -> Dict[str, Any]:
         """Not implemented; falls back to temporal seal."""
-        temporal = TemporalSealer()
-        return temporal.seal(receipt_data)
+        return self.delegate.seal(receipt_data)
 
     def verify(self, receipt_data: Dict[str, Any], seal_data: Dict[str, Any]) -> bool:
         """Not implemented; falls back to temporal verification."""
-        temporal = TemporalSealer()
-        return temporal.verify(receipt_data, seal_data)
+        return self.delegate.verify(receipt_data, seal_data)
+
+    def seal_batch(self, receipts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Not implemented; falls back to temporal batch seal."""
+        return self.delegate.seal_batch(receipts)
+
+    def verify_batch(self, receipts: List[Dict[str, Any]], batch_seal: Dict[str, Any]) -> bool:
+        """Not implemented; falls back to temporal batch verification."""
+        return self.delegate.verify_batch(receipts, batch_seal)
@@ -2,8 +2,9 @@
 
 import sys
 import argparse
-from .runner import PPPRunner
-from .storage.progress import ProgressStore
+
+# Command dependencies are imported inside each branch: `ppp status` is polled
+# by monitoring and should not pay for the runner, targets and sealers.
 
 
 def main():
@@ -24,42 +25,178 @@ def main():
     status_parser = subparsers.add_parser("status", help="Show run status")
     status_parser.add_argument("--run-id", type=str, help="Specific run ID")
     status_parser.add_argument("--db", type=str, default="data/ppp_progress.db", help="Database path")
+    status_parser.add_argument("--compare", type=str, help="Compare receipts of --run-id against this run")
+    status_parser.add_argument(
+        "--by", type=str, default="rule_id",
+        choices=["rule_id", "status", "event", "phase", "severity", "document_id"],
+        help="Column to compare runs by",
+    )
+
+    # Index command
+    index_parser = subparsers.add_parser("index", help="Index receipts for status/drift queries")
+    index_parser.add_argument("inputs", nargs="+", help="Receipt JSONL files")
+    index_parser.add_argument("--run-id", type=str, help="Run ID (default: each receipt's run_id)")
+    index_parser.add_argument("--db", type=str, default="data/ppp_progress.db", help="Database path")
     
+    # Receipt command
+    receipt_parser = subparsers.add_parser("receipt", help="Show one receipt of a run by receipt ID")
+    receipt_parser.add_argument("run_id", help="Run ID")
+    receipt_parser.add_argument("receipt_id", help="Receipt ID")
+    receipt_parser.add_argument("--report-root", type=str, default="REPORT/ppp", help="Report root")
+    receipt_parser.add_argument("--proof", action="store_true", help="Also print its Merkle inclusion proof")
+
+    # Export command
+    export_parser = subparsers.add_parser("export", help="Export receipts to Parquet/Arrow")
+    export_parser.add_argument("inputs", nargs="+", help="Receipt JSONL files (one or more runs)")
+    export_parser.add_argument("--output", type=str, required=True, help="Output .parquet or .arrow path")
+    export_parser.add_argument(
+        "--kind", type=str, default="receipt",
+        choices=["receipt", "classification", "human_decision", "remediation"],
+        help="Receipt type",
+    )
+
+    # Diff command
+    diff_parser = subparsers.add_parser("diff", help="Diff decisions between two runs or packs")
+    diff_parser.add_argument("before", help="Run ID, receipts .jsonl, drift report .json or run directory")
+    diff_parser.add_argument("after", help="Run ID, receipts .jsonl, drift report .json or run directory")
+    diff_parser.add_argument("--key", type=str, default="document_id", help="Join key (document_id, finding_id, ...)")
+    diff_parser.add_argument("--output", type=str, help="Write diff entries as JSONL")
+    diff_parser.add_argument("--absent-decision", type=str, help="Decision implied by a missing key (e.g. ALLOW)")
+    diff_parser.add_argument("--db", type=str, default="data/ppp_progress.db", help="Database path (for run IDs)")
+
     args = parser.parse_args()
     
     if args.command == "run":
+        from .runner import PPPRunner
+
         runner = PPPRunner(args.config)
         exit_code = runner.run_all()
         return exit_code
     
     elif args.command == "status":
-        store = ProgressStore(args.db)
-        
-        if args.run_id:
-            status = store.get_run_status(args.run_id)
-            if status:
-                print(f"Run: {status['run_id']}")
-                print(f"  Agent: {status['agent_id']}")
-                print(f"  Policy: {status['policy_id']}")
-                print(f"  Started: {status['started_at']}")
-                print(f"  Status: {status['status']}")
-            else:
-                print(f"Run not found: {args.run_id}")
-        else:
-            runs = store.list_runs()
-            if runs:
-                print("Recent runs:")
-                for run in runs[:10]:
-                    print(f"  {run['run_id']} [{run['status']}] - {run['agent_id']}")
-            else:
-                print("No runs found")
-        
+        import sqlite3
+        from pathlib import Path
+        from .storage.receipt_index import ReceiptIndex
+
+        if not Path(args.db).exists():
+            print("No runs found")
+            return 0
+        # Read-only: polling never creates the database or runs its schema DDL
+        store = ReceiptIndex(args.db, read_only=True)
+        try:
+            return _print_status(store, args)
+        except sqlite3.OperationalError as e:
+            print(f"Error: {args.db}: {e}")
+            return 1
+
+    elif args.command == "index":
+        from .storage.receipt_index import ReceiptIndex
+
+        store = ReceiptIndex(args.db)
+        for path in args.inputs:
+            for run_id, count in store.ingest_jsonl(path, run_id=args.run_id).items():
+                print(f"Indexed {count} receipts for {run_id}")
         return 0
-    
+
+    elif args.command == "receipt":
+        import json
+        from .receipts.emitter import ReceiptEmitter
+
+        emitter = ReceiptEmitter(args.report_root)
+        try:
+            receipt = emitter.get_receipt(args.run_id, args.receipt_id)
+            if receipt is None:
+                print(f"Receipt not found in run {args.run_id}: {args.receipt_id}")
+                return 1
+            print(json.dumps(receipt, indent=2))
+            if args.proof:
+                print(json.dumps(emitter.prove(args.receipt_id, run_id=args.run_id), indent=2))
+        except (ValueError, LookupError) as e:
+            print(f"Error: {e}")
+            return 1
+        return 0
+
+    elif args.command == "export":
+        from .receipts.columnar import export_receipts, iter_jsonl
+
+        try:
+            rows = export_receipts(iter_jsonl(args.inputs), args.output, kind=args.kind)
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            return 1
+        print(f"Exported {rows} receipts to {args.output}")
+        return 0
+
+    elif args.command == "diff":
+        import json
+        from pathlib import Path
+        from .receipts.diff import RunDiff, open_source
+        from .storage.receipt_index import ReceiptIndex
+
+        absent = args.absent_decision
+        if absent is None and all(Path(s).suffix == ".json" for s in (args.before, args.after)):
+            absent = "ALLOW"  # drift reports only list MITIGATE/DENY
+        index = ReceiptIndex(args.db, read_only=True) if Path(args.db).exists() else None
+        try:
+            before, after = open_source(args.before, index), open_source(args.after, index)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+        engine = RunDiff(key=args.key, absent_decision=absent)
+        out = open(args.output, 'w', encoding='utf-8') if args.output else None
+        try:
+            for entry in engine.diff(before, after):
+                if out:
+                    out.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                else:
+                    print(f"  {entry['change']:<8} {entry['key']}  {entry['transition']}")
+        finally:
+            if out:
+                out.close()
+        counts = ", ".join(f"{k}={v}" for k, v in sorted(engine.summary["counts"].items()))
+        print(f"Diff {args.before} -> {args.after} by {args.key}: {counts or 'no entries'}")
+        for transition, count in engine.summary["transitions"].most_common():
+            print(f"  {transition}: {count}")
+        return 0
+
     else:
         parser.print_help()
         return 1
 
 
+def _print_status(store, args) -> int:
+    """Print run status, a run's receipt summary, or a run-to-run comparison."""
+    if args.run_id and args.compare:
+        diff = store.compare_runs(args.run_id, args.compare, args.by)
+        print(f"Receipts by {args.by}: {args.run_id} -> {args.compare}")
+        for value, counts in diff["values"].items():
+            print(f"  {value}: {counts['a']} -> {counts['b']} ({counts['delta']:+d})")
+    elif args.run_id:
+        status = store.get_run_status(args.run_id)
+        if status:
+            print(f"Run: {status['run_id']}")
+            print(f"  Agent: {status['agent_id']}")
+            print(f"  Policy: {status['policy_id']}")
+            print(f"  Started: {status['started_at']}")
+            print(f"  Status: {status['status']}")
+        summary = store.run_summary(args.run_id)
+        if summary["total_receipts"]:
+            print(f"  Receipts: {summary['total_receipts']}")
+            for column in ("status", "event", "rule_id"):
+                counts = ", ".join(f"{k}={v}" for k, v in sorted(summary[f"by_{column}"].items(), key=str))
+                print(f"    by {column}: {counts}")
+        elif not status:
+            print(f"Run not found: {args.run_id}")
+    else:
+        runs = store.list_runs()
+        if runs:
+            print("Recent runs:")
+            for run in runs[:10]:
+                print(f"  {run['run_id']} [{run['status']}] - {run['agent_id']}")
+        else:
+            print("No runs found")
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -1,12 +1,12 @@
 """Policy evaluation engine."""
 
-import re
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from ..config.models import PolicyConfig
+from .plan import compile_rule_plan
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PolicyDecision:
     """Result of policy evaluation."""
     allowed: bool
@@ -18,6 +18,18 @@ class PolicyDecision:
     override_hash: Optional[str] = None  # Human-signed override for false positives
     human_reviewable: bool = False  # Whether human override was applied
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "allowed": self.allowed,
+            "rules_triggered": self.rules_triggered,
+            "mitigations": self.mitigations,
+            "constraints": self.constraints,
+            "confidence": self.confidence,
+            "uncertainty": self.uncertainty,
+            "override_hash": self.override_hash,
+            "human_reviewable": self.human_reviewable,
+        }
+
 
 class PolicyEvaluator:
     """Deterministic policy evaluator."""
@@ -26,6 +38,12 @@ class PolicyEvaluator:
         self.policy = policy_config
         self.tier = policy_config.tier
         self.fail_on_ambiguity = policy_config.compliance.get("fail_on_ambiguity", False)
+        # Loaded policies carry a compiled plan; it is reused only while the rules still
+        # equal the snapshot it was compiled from (hand-built or edited configs compile here)
+        if policy_config.compiled and policy_config.compiled_from == policy_config.rules:
+            self.plan = policy_config.compiled
+        else:
+            self.plan = compile_rule_plan(policy_config.rules)
 
     def evaluate(
         self,
@@ -37,43 +55,55 @@ class PolicyEvaluator:
         
         Returns PolicyDecision with allowed/denied status and triggered rules.
         """
-        decision = PolicyDecision(allowed=True)
+        allowed = True
+        confidence = 1.0
+        rules_triggered: List[Dict[str, Any]] = []
+        mitigations: List[Dict[str, Any]] = []
+        text_lower = outbound_text.lower()
         
         # Evaluate each rule
-        for rule in self.policy.rules:
-            rule_result = self._evaluate_rule(rule, context, outbound_text)
-            decision.rules_triggered.append(rule_result)
+        for compiled in self.plan:
+            rule = compiled["rule"]
+            rule_result = self._evaluate_rule(compiled, context, outbound_text, text_lower)
+            rules_triggered.append(rule_result)
             
             # Check if rule violation occurred
             if rule_result.get("violation"):
-                if rule.get("action") == "deny":
-                    decision.allowed = False
+                if rule.action == "deny":
+                    allowed = False
                     if self.fail_on_ambiguity:
-                        decision.confidence = 0.0
-                elif rule.get("action") == "deny_if_detected":
-                    decision.allowed = False
-                elif rule.get("action") == "deny_or_add_disclaimer":
+                        confidence = 0.0
+                elif rule.action == "deny_if_detected":
+                    allowed = False
+                elif rule.action == "deny_or_add_disclaimer":
                     # Add mitigation instead of denying
                     mitigation = {
-                        "mitigation_id": f"add_disclaimer_{rule['id']}",
-                        "description": f"Add disclaimer for rule {rule['id']}",
+                        "mitigation_id": f"add_disclaimer_{rule.id}",
+                        "description": f"Add disclaimer for rule {rule.id}",
                         "applied": True,
                     }
-                    decision.mitigations.append(mitigation)
-                elif rule.get("action") == "deny_if_ambiguous" and self.fail_on_ambiguity:
-                    decision.allowed = False
+                    mitigations.append(mitigation)
+                elif rule.action == "deny_if_ambiguous" and self.fail_on_ambiguity:
+                    allowed = False
 
-        return decision
+        return PolicyDecision(
+            allowed=allowed,
+            rules_triggered=rules_triggered,
+            mitigations=mitigations,
+            confidence=confidence,
+        )
 
     def _evaluate_rule(
         self,
-        rule: Dict[str, Any],
+        compiled: Dict[str, Any],
         context: Dict[str, Any],
         outbound_text: str,
+        text_lower: str,
     ) -> Dict[str, Any]:
-        """Evaluate a single rule."""
-        rule_id = rule.get("id", "unknown")
-        severity = rule.get("severity", "SHOULD")
+        """Evaluate a single rule from its compiled plan entry."""
+        rule = compiled["rule"]
+        rule_id = rule.id
+        severity = rule.severity
         matched = False
         violation = False
         details = ""
@@ -81,55 +111,50 @@ class PolicyEvaluator:
         # Check rule type
         if rule_id == "disclosure_required":
             matched = True
-            violation = "disclosure_template" not in rule.get("parameters", {})
+            violation = "disclosure_template" not in rule.parameters
             details = "Disclosure template check"
 
         elif rule_id == "no_pii":
             matched = True
-            patterns = rule.get("parameters", {}).get("patterns", [])
-            whitelist_patterns = rule.get("parameters", {}).get("whitelist_patterns", [])
             context_overrides = context.get("pii_overrides", [])  # Known-safe hashes
 
-            for pattern in patterns:
-                if re.search(pattern, outbound_text, re.IGNORECASE):
+            for pattern in compiled["patterns"]:
+                if pattern.search(outbound_text):
                     # Check if this match is whitelisted
                     is_whitelisted = False
-                    for whitelist in whitelist_patterns:
-                        if re.search(whitelist, outbound_text):
+                    for whitelist in compiled["whitelist_patterns"]:
+                        if whitelist.search(outbound_text):
                             is_whitelisted = True
                             break
 
                     if not is_whitelisted and outbound_text not in context_overrides:
                         violation = True
-                        details = f"PII pattern detected: {pattern[:30]}... (not whitelisted)"
+                        details = f"PII pattern detected: {pattern.pattern[:30]}... (not whitelisted)"
                         break
 
         elif rule_id == "no_deception":
             matched = True
-            keywords = rule.get("parameters", {}).get("keywords", [])
-            for keyword in keywords:
-                if keyword.lower() in outbound_text.lower():
+            for keyword, keyword_lower in compiled["keywords"]:
+                if keyword_lower in text_lower:
                     violation = True
                     details = f"Deceptive keyword detected: {keyword}"
                     break
 
         elif rule_id == "no_unauthorized_advice":
             matched = True
-            prefixes = rule.get("parameters", {}).get("blocked_prefixes", [])
-            for prefix in prefixes:
-                if prefix.lower() in outbound_text.lower():
+            for prefix, prefix_lower in compiled["blocked_prefixes"]:
+                if prefix_lower in text_lower:
                     violation = True
                     details = f"Unauthorized advice pattern: {prefix}"
                     break
 
         elif rule_id == "factual_claims_sourced":
             matched = True
-            keywords = rule.get("parameters", {}).get("detection_keywords", [])
-            for keyword in keywords:
-                if keyword.lower() in outbound_text.lower():
+            for keyword, keyword_lower in compiled["detection_keywords"]:
+                if keyword_lower in text_lower:
                     # Check for citation or uncertainty label
-                    has_citation = "[citation:" in outbound_text.lower()
-                    has_uncertainty = "[uncertain:" in outbound_text.lower()
+                    has_citation = "[citation:" in text_lower
+                    has_uncertainty = "[uncertain:" in text_lower
                     if not (has_citation or has_uncertainty):
                         violation = True
                         details = f"Factual claim without citation: {keyword}"
@@ -137,10 +162,9 @@ class PolicyEvaluator:
 
         elif rule_id == "factual_claims_strict_sourcing":
             matched = True
-            keywords = rule.get("parameters", {}).get("detection_keywords", [])
-            for keyword in keywords:
-                if keyword.lower() in outbound_text.lower():
-                    has_citation = "[citation:" in outbound_text.lower()
+            for keyword, keyword_lower in compiled["detection_keywords"]:
+                if keyword_lower in text_lower:
+                    has_citation = "[citation:" in text_lower
                     if not has_citation:
                         violation = True
                         details = f"Strict: factual claim without citation: {keyword}"
@@ -148,7 +172,7 @@ class PolicyEvaluator:
 
         elif rule_id == "max_draft_length":
             matched = True
-            max_chars = rule.get("parameters", {}).get("max_chars", 500)
+            max_chars = rule.parameters.get("max_chars", 500)
             if len(outbound_text) > max_chars:
                 violation = True
                 details = f"Text length {len(outbound_text)} exceeds max {max_chars}"
@@ -0,0 +1,30 @@
+"""Compiled rule plan for PolicyEvaluator."""
+
+import re
+from typing import List, Dict, Any
+
+from ..config.models import PolicyRule
+
+
+def compile_rule_plan(rules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Pre-process rule parameters once per policy load.
+
+    One entry per rule (same order as `rules`): the validated PolicyRule,
+    compiled PII / whitelist patterns and (original, lowercased) keyword
+    pairs, so evaluation does no per-call regex compilation or keyword
+    lowercasing. Raises ValueError on malformed rules.
+    """
+    plan = []
+    for data in rules:
+        rule = PolicyRule.from_dict(data)
+        parameters = rule.parameters
+        plan.append({
+            "rule": rule,
+            "patterns": [re.compile(p, re.IGNORECASE) for p in parameters.get("patterns", [])],
+            "whitelist_patterns": [re.compile(p) for p in parameters.get("whitelist_patterns", [])],
+            "keywords": [(k, k.lower()) for k in parameters.get("keywords", [])],
+            "blocked_prefixes": [(p, p.lower()) for p in parameters.get("blocked_prefixes", [])],
+            "detection_keywords": [(k, k.lower()) for k in parameters.get("detection_keywords", [])],
+        })
+    return plan
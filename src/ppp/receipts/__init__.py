@@ -1,6 +1,24 @@
 """Receipt generation and management for PPP."""
 
-from .schema import CanonicalSerializer, Receipt
-from .emitter import ReceiptEmitter
+from typing import TYPE_CHECKING
 
-__all__ = ["CanonicalSerializer", "Receipt", "ReceiptEmitter"]
+from .._lazy import lazy_exports
+
+# Loaded on first access: the emitter pulls in zipfile/shutil, which
+# readers such as the receipt store and index do not need.
+_EXPORTS = {
+    "CanonicalSerializer": ".schema",
+    "Receipt": ".schema",
+    "ReceiptEmitter": ".emitter",
+    "MerkleTree": ".merkle",
+    "verify_proof": ".merkle",
+}
+
+if TYPE_CHECKING:
+    from .schema import CanonicalSerializer, Receipt
+    from .emitter import ReceiptEmitter
+    from .merkle import MerkleTree, verify_proof
+
+__all__ = ["CanonicalSerializer", "Receipt", "ReceiptEmitter", "MerkleTree", "verify_proof"]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -14,7 +14,7 @@ All receipts are deterministically hashed for auditability and replayability.
 Doctrine: "Meaning follows placement. Placement follows governance."
 """
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import hashlib
@@ -85,8 +85,7 @@ class ClassificationReceipt:
         if self.target_repo not in valid_repos:
             raise ValueError(f"Invalid target_repo: {self.target_repo}")
 
-        # Compute receipt hash
-        self.receipt_hash = self._compute_hash()
+        # receipt_hash is computed lazily on first access (see _get_receipt_hash)
 
     def _compute_hash(self) -> str:
         """Compute canonical hash of this classification receipt."""
@@ -95,21 +94,39 @@ class ClassificationReceipt:
         canonical = CanonicalSerializer.canonical_json(self.to_dict_for_hashing())
         return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
 
+    def _get_receipt_hash(self) -> str:
+        cached = self.__dict__.get("_receipt_hash")
+        if cached is None:
+            cached = self.__dict__["_receipt_hash"] = self._compute_hash()
+        return cached
+
+    def _set_receipt_hash(self, value: str) -> None:
+        # The hash is always derived from the fields; a supplied value is ignored
+        self.__dict__["_receipt_hash"] = None
+
     def to_dict_for_hashing(self) -> Dict[str, Any]:
-        """Get dict for hashing (excludes receipt_hash itself)."""
-        d = asdict(self)
-        d.pop('receipt_hash', None)  # Exclude the hash itself from hashing
-        return d
+        """Get dict for hashing (excludes receipt_hash itself); values are not copied."""
+        return {name: getattr(self, name) for name in _HASHED_FIELDS}
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary, excluding None values."""
+        """Convert to dictionary, excluding None values (shallow)."""
         result = {}
-        for key, value in asdict(self).items():
+        for name in _FIELDS:
+            value = getattr(self, name)
             if value is not None:
-                result[key] = value
+                result[name] = value
         return result
 
 
+_FIELDS = tuple(ClassificationReceipt.__dataclass_fields__)
+_HASHED_FIELDS = tuple(name for name in _FIELDS if name != "receipt_hash")
+# Replaces the dataclass default so construction stays cheap and the hash is
+# computed once, on first read, with the same value as before.
+ClassificationReceipt.receipt_hash = property(
+    ClassificationReceipt._get_receipt_hash, ClassificationReceipt._set_receipt_hash
+)
+
+
 @dataclass
 class ClassificationBatch:
     """
@@ -0,0 +1,260 @@
+"""Columnar (Parquet / Arrow) export of receipts for analytics.
+
+pyarrow is optional: flattening works without it, writing needs
+`pip install pyarrow` (or the `columnar` extra).
+"""
+
+import json
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple, Union
+
+from .store import field_values
+
+ROW_GROUP_SIZE = 65536
+
+# Column kinds: "category" is a dictionary-encoded string (low-cardinality
+# values such as status or event), "categories" a list of strings.
+Column = Tuple[str, str, Union[str, Callable[[Dict[str, Any]], Any]]]
+
+
+def _nested(*keys: str) -> Callable[[Dict[str, Any]], Any]:
+    def get(record: Dict[str, Any]) -> Any:
+        value: Any = record
+        for key in keys:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+    return get
+
+
+def _first(*getters: Callable[[Dict[str, Any]], Any]) -> Callable[[Dict[str, Any]], Any]:
+    def get(record: Dict[str, Any]) -> Any:
+        for getter in getters:
+            value = getter(record)
+            if value is not None:
+                return value
+        return None
+    return get
+
+
+RECEIPT_COLUMNS: List[Column] = [
+    ("receipt_id", "string", "receipt_id"),
+    ("run_id", "category", "run_id"),
+    ("agent_id", "category", "agent_id"),
+    ("timestamp", "string", "timestamp"),
+    ("event", "category", "event"),
+    ("phase", "category", "phase"),
+    ("status", "category", "status"),
+    ("input_hash", "string", "input_hash"),
+    ("output_hash", "string", "output_hash"),
+    ("receipt_hash", "string", "receipt_hash"),
+    ("policy_id", "category", _first(_nested("policy", "policy_id"), _nested("policy", "id"))),
+    ("policy_tier", "category", _nested("policy", "tier")),
+    ("rule_ids", "categories", lambda r: field_values(r, "rule_id")),
+    ("severity", "category", _first(_nested("decision", "severity"), _nested("artifacts", "finding", "severity"))),
+    ("allowed", "bool", _nested("decision", "allowed")),
+    ("confidence", "float", _nested("decision", "confidence")),
+    ("failure_stage", "category", "failure_stage"),
+]
+
+CLASSIFICATION_COLUMNS: List[Column] = [
+    ("receipt_id", "string", "receipt_id"),
+    ("workflow_id", "category", "workflow_id"),
+    ("document_id", "string", "document_id"),
+    ("source_repo", "category", "source_repo"),
+    ("source_path", "string", "source_path"),
+    ("document_name", "string", "document_name"),
+    ("detected_audience", "category", "detected_audience"),
+    ("target_repo", "category", "target_repo"),
+    ("policy_decision", "category", "policy_decision"),
+    ("detected_claims", "categories", "detected_claims"),
+    ("violated_rules", "categories", "violated_rules"),
+    ("detected_purpose", "category", "detected_purpose"),
+    ("policy_id", "category", "policy_id"),
+    ("policy_version", "category", "policy_version"),
+    ("policy_enforcement_mode", "category", "policy_enforcement_mode"),
+    ("timestamp", "string", "timestamp"),
+    ("receipt_hash", "string", "receipt_hash"),
+]
+
+HUMAN_DECISION_COLUMNS: List[Column] = [
+    ("decision_id", "string", "decision_id"),
+    ("workflow_id", "category", "workflow_id"),
+    ("finding_id", "string", "finding_id"),
+    ("decision_type", "category", "decision_type"),
+    ("authority", "category", "authority"),
+    ("timestamp", "string", "timestamp"),
+    ("rationale", "string", "rationale"),
+    ("policy_id", "category", "policy_id"),
+    ("policy_version", "category", "policy_version"),
+    ("original_finding_location", "string", "original_finding_location"),
+    ("original_finding_rule_id", "category", "original_finding_rule_id"),
+    ("original_finding_severity", "category", "original_finding_severity"),
+    ("fail_closed", "bool", "fail_closed"),
+    ("decision_hash", "string", "decision_hash"),
+]
+
+REMEDIATION_COLUMNS: List[Column] = [
+    ("receipt_id", "string", "receipt_id"),
+    ("document_id", "string", "document_id"),
+    ("directive_id", "category", "directive_id"),
+    ("source_repo", "category", "source_repo"),
+    ("file_path", "string", "file_path"),
+    ("source_classification_receipt_id", "string", "source_classification_receipt_id"),
+    ("source_directive_id", "category", "source_directive_id"),
+    ("file_hash_pre", "string", "file_hash_pre"),
+    ("guarantee_claims_original", "categories", "guarantee_claims_original"),
+    ("changes_approved", "int", "changes_approved"),
+    ("changes_applied", "int", "changes_applied"),
+    ("file_hash_post", "string", "file_hash_post"),
+    ("guarantee_claims_remaining", "int", "guarantee_claims_remaining"),
+    ("authority", "category", "authority"),
+    ("phase", "category", "phase"),
+    ("timestamp", "string", "timestamp"),
+    ("receipt_hash", "string", "receipt_hash"),
+]
+
+SCHEMAS: Dict[str, List[Column]] = {
+    "receipt": RECEIPT_COLUMNS,
+    "classification": CLASSIFICATION_COLUMNS,
+    "human_decision": HUMAN_DECISION_COLUMNS,
+    "remediation": REMEDIATION_COLUMNS,
+}
+
+FORMATS = {".parquet": "parquet", ".arrow": "arrow", ".arrows": "arrow"}
+
+
+def _as_record(item: Any) -> Dict[str, Any]:
+    """Receipt dataclass or dict -> dict (shallow; no asdict deep copy)."""
+    if isinstance(item, dict):
+        return item
+    if is_dataclass(item):
+        return {f.name: getattr(item, f.name) for f in fields(item)}
+    raise ValueError(f"Cannot export {type(item).__name__}: expected a receipt dataclass or dict")
+
+
+def flatten(item: Any, columns: List[Column]) -> List[Any]:
+    """One row of typed column values for a receipt."""
+    record = _as_record(item)
+    row = []
+    for _, kind, getter in columns:
+        value = record.get(getter) if isinstance(getter, str) else getter(record)
+        if kind == "categories":
+            value = [str(v) for v in value] if value else []
+        row.append(value)
+    return row
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise RuntimeError("Columnar export requires pyarrow (pip install pyarrow)") from None
+    return pyarrow, pyarrow.parquet
+
+
+class ColumnarReceiptWriter:
+    """
+    Stream receipts into a Parquet file (or Arrow IPC stream) in row groups.
+
+    Rows are buffered per column and flushed every `row_group_size` receipts,
+    so memory stays bounded by one row group. Low-cardinality columns are
+    dictionary-encoded.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        kind: str = "receipt",
+        fmt: Optional[str] = None,
+        row_group_size: int = ROW_GROUP_SIZE,
+        compression: str = "zstd",
+    ):
+        if kind not in SCHEMAS:
+            raise ValueError(f"Unknown receipt kind: {kind} (expected one of {', '.join(SCHEMAS)})")
+        self.path = Path(path)
+        self.fmt = fmt or FORMATS.get(self.path.suffix.lower(), "parquet")
+        if self.fmt not in ("parquet", "arrow"):
+            raise ValueError(f"Unknown columnar format: {self.fmt}")
+        self.columns = SCHEMAS[kind]
+        self.row_group_size = row_group_size
+        self.rows_written = 0
+        self._buffer: List[List[Any]] = [[] for _ in self.columns]
+
+        self._pa, pq = _require_pyarrow()
+        self.schema = self._pa.schema([(name, self._arrow_type(k)) for name, k, _ in self.columns])
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.fmt == "parquet":
+            self._writer = pq.ParquetWriter(str(self.path), self.schema, compression=compression)
+        else:
+            # IPC stream (not file) format: each batch may carry its own dictionaries
+            self._writer = self._pa.ipc.new_stream(str(self.path), self.schema)
+
+    def _arrow_type(self, kind: str):
+        pa = self._pa
+        return {
+            "string": pa.string(),
+            "category": pa.dictionary(pa.int32(), pa.string()),
+            "categories": pa.list_(pa.string()),
+            "int": pa.int64(),
+            "float": pa.float64(),
+            "bool": pa.bool_(),
+        }[kind]
+
+    def write(self, item: Any) -> None:
+        for column, value in zip(self._buffer, flatten(item, self.columns)):
+            column.append(value)
+        if len(self._buffer[0]) >= self.row_group_size:
+            self.flush()
+
+    def write_all(self, items: Iterable[Any]) -> int:
+        for item in items:
+            self.write(item)
+        return self.rows_written + len(self._buffer[0])
+
+    def flush(self) -> None:
+        """Write buffered rows as one row group."""
+        count = len(self._buffer[0])
+        if not count:
+            return
+        pa = self._pa
+        arrays = []
+        for values, (_, kind, _) in zip(self._buffer, self.columns):
+            if kind == "category":
+                arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+            else:
+                arrays.append(pa.array(values, type=self._arrow_type(kind)))
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+        self.rows_written += count
+        self._buffer = [[] for _ in self.columns]
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self.flush()
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> "ColumnarReceiptWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def iter_jsonl(paths: Iterable[str]) -> Iterable[Dict[str, Any]]:
+    """Stream receipt dicts from one or more JSONL files."""
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def export_receipts(items: Iterable[Any], path: str, kind: str = "receipt", fmt: Optional[str] = None) -> int:
+    """Export receipts to a columnar file; returns the number of rows."""
+    with ColumnarReceiptWriter(path, kind=kind, fmt=fmt) as writer:
+        writer.write_all(items)
+    return writer.rows_written
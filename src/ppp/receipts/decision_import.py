@@ -0,0 +1,105 @@
+"""Streaming import of human decisions from JSONL or CSV."""
+
+import csv
+import json
+import os
+from itertools import islice
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from .human_decision import HumanDecisionReceipt
+
+IMPORT_BATCH = 1000
+
+# Columns passed on to the record callable; any other column is ignored
+DECISION_FIELDS = ("finding_id", "decision_type", "authority", "rationale", "modified_content")
+
+# (line number, row or None, parse error or None)
+DecisionRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def iter_decision_rows(path: str, fmt: Optional[str] = None) -> Iterator[DecisionRow]:
+    """
+    Read decision rows one at a time from a .jsonl/.ndjson or .csv file.
+
+    `fmt` ("jsonl" or "csv") overrides detection by suffix. CSV cells that are
+    empty become None, so optional fields read the same in both formats.
+    Unparseable JSONL lines are yielded with an error instead of raising.
+    """
+    fmt = fmt or ("csv" if Path(path).suffix.lower() == ".csv" else "jsonl")
+    if fmt == "csv":
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, {k: (v if v != "" else None) for k, v in row.items() if k is not None}, None
+    elif fmt == "jsonl":
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as e:
+                    yield line_no, None, f"malformed JSON: {e}"
+                    continue
+                if not isinstance(row, dict):
+                    yield line_no, None, "decision must be a JSON object"
+                    continue
+                yield line_no, row, None
+    else:
+        raise ValueError(f"Unsupported decision format: {fmt}")
+
+
+def import_decisions(
+    rows: Iterable[DecisionRow],
+    record: Callable[..., HumanDecisionReceipt],
+    receipts_path: str,
+    errors_path: str,
+    batch_size: int = IMPORT_BATCH,
+    fields: Tuple[str, ...] = DECISION_FIELDS,
+) -> Dict[str, Any]:
+    """
+    Validate and record decision rows in batches.
+
+    `record(**row_fields)` validates one decision (HumanDecisionReceipt rules
+    plus any policy checks) and returns its receipt, raising ValueError or
+    TypeError to reject it. After each batch the accepted receipts are
+    appended to `receipts_path` (JSONL) and rejected rows, with their line
+    number and error, are written to `errors_path` (JSONL). Rows are never
+    all held in memory.
+    """
+    stats = {"rows_read": 0, "decisions_recorded": 0, "decisions_rejected": 0, "batches": 0}
+    Path(receipts_path).parent.mkdir(parents=True, exist_ok=True)
+    Path(errors_path).parent.mkdir(parents=True, exist_ok=True)
+    rows = iter(rows)
+
+    with open(receipts_path, 'a', encoding='utf-8') as receipts_out, \
+            open(errors_path, 'w', encoding='utf-8') as errors_out:
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            accepted: List[str] = []
+            rejected: List[str] = []
+            for line_no, row, error in batch:
+                if error is None:
+                    try:
+                        receipt = record(**{k: row.get(k) for k in fields if row.get(k) is not None})
+                        accepted.append(json.dumps(receipt.to_dict()) + "\n")
+                        continue
+                    except (ValueError, TypeError) as e:
+                        error = str(e)
+                rejected.append(json.dumps({"line": line_no, "error": error, "row": row}) + "\n")
+
+            receipts_out.writelines(accepted)
+            receipts_out.flush()
+            errors_out.writelines(rejected)
+            stats["rows_read"] += len(batch)
+            stats["decisions_recorded"] += len(accepted)
+            stats["decisions_rejected"] += len(rejected)
+            stats["batches"] += 1
+        os.fsync(receipts_out.fileno())
+
+    stats["receipts_path"] = str(receipts_path)
+    stats["errors_path"] = str(errors_path)
+    return stats
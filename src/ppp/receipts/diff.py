@@ -0,0 +1,256 @@
+"""Run-to-run diff of classifications and findings."""
+
+import heapq
+import json
+import tempfile
+from collections import Counter
+from itertools import groupby
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+# Above this many distinct keys on either side the join spills to sorted runs on disk
+MAX_IN_MEMORY = 200_000
+SPILL_CHUNK = 50_000
+
+# Detail fields carried through the diff (kept small to bound memory)
+DETAIL_FIELDS = ("source_repo", "target_repo", "reason", "rule_id", "severity", "location")
+
+
+def _get(record: Dict[str, Any], *path: str) -> Any:
+    value: Any = record
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def normalize(record: Dict[str, Any], key: str = "document_id") -> Dict[str, Any]:
+    """
+    Reduce a receipt-like record to {key, decision, detail}.
+
+    Understands classification receipts, PPP receipts (decision fields or an
+    embedded classification/finding), human decisions and drift-report rows.
+    """
+    classification = _get(record, "artifacts", "classification_receipt") or {}
+    finding = _get(record, "artifacts", "finding") or {}
+    sources = (record, record.get("decision") if isinstance(record.get("decision"), dict) else {},
+               classification, finding)
+
+    def first(*names: str) -> Any:
+        for name in names:
+            for source in sources:
+                if source.get(name) is not None:
+                    return source[name]
+        return None
+
+    detail = {}
+    for name in DETAIL_FIELDS:
+        value = first(name)
+        if value is not None:
+            detail[name] = value
+    return {
+        "key": first(key),
+        "decision": first("policy_decision", "decision_type", "status"),
+        "detail": detail,
+    }
+
+
+def iter_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_drift_report(report: Any) -> Iterator[Dict[str, Any]]:
+    """Rows of a categorization drift report (path or loaded dict); only MITIGATE/DENY are listed."""
+    if not isinstance(report, dict):
+        with open(report, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    drift = report.get("phases", {}).get("drift_report", report)
+    for row in drift.get("mitigations", []):
+        yield dict(row, policy_decision="MITIGATE")
+    for row in drift.get("denials", []):
+        yield dict(row, policy_decision="DENY", rule_id=row.get("violation"))
+
+
+def open_source(source: str, index: Any = None) -> Iterator[Dict[str, Any]]:
+    """
+    Records for one side of a diff: a receipts .jsonl file, a drift report
+    .json, a run/evidence-pack directory, or a run id in a ReceiptIndex.
+    """
+    path = Path(source)
+    if path.is_dir():
+        for candidate in (path / "evidence-pack" / "receipts.jsonl", path / "receipts.jsonl"):
+            if candidate.exists():
+                return iter_jsonl(str(candidate))
+        raise ValueError(f"No receipts.jsonl under {path}")
+    if path.is_file():
+        return iter_jsonl(str(path)) if path.suffix == ".jsonl" else iter_drift_report(str(path))
+    if index is not None:
+        return index.iter_run(source)
+    raise ValueError(f"Not a file, directory or indexed run: {source}")
+
+
+class RunDiff:
+    """
+    Join two runs on a key and stream added / removed / changed entries.
+
+    Each side is loaded into a hash map (O(n)); if either grows past
+    `max_in_memory` keys both sides are spilled to sorted runs in a temp
+    directory and joined by a streaming sorted merge instead, so memory stays
+    bounded by `spill_chunk`. Output order is "after" order then removals in
+    hash mode, key order in merge mode. For a key repeated within one run the
+    last record is the one compared, in both modes, and keys keep their type.
+    Entries change when the decision or detail fields differ (receipt hashes
+    always differ between runs, so they are not compared).
+
+    `absent_decision` treats a key missing on one side as that decision
+    instead of added/removed (drift reports list only MITIGATE/DENY, so a
+    document that dropped out of one became ALLOW).
+    """
+
+    def __init__(
+        self,
+        key: str = "document_id",
+        max_in_memory: int = MAX_IN_MEMORY,
+        spill_chunk: int = SPILL_CHUNK,
+        absent_decision: Optional[str] = None,
+        tmp_dir: Optional[str] = None,
+    ):
+        self.key = key
+        self.max_in_memory = max_in_memory
+        self.spill_chunk = spill_chunk
+        self.absent_decision = absent_decision
+        self.tmp_dir = tmp_dir
+        self.summary: Dict[str, Any] = {}
+
+    def diff(
+        self, before: Iterable[Dict[str, Any]], after: Iterable[Dict[str, Any]], include_unchanged: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield diff entries; `self.summary` is complete once exhausted."""
+        counts: Counter = Counter()
+        transitions: Counter = Counter()
+        self.summary = {"key": self.key, "mode": "hash", "counts": counts, "transitions": transitions}
+
+        before_iter = self._normalized(before)
+        after_iter = self._normalized(after)
+        before_table = self._load(before_iter)
+        after_table = self._load(after_iter) if len(before_table) <= self.max_in_memory else {}
+        if len(before_table) > self.max_in_memory or len(after_table) > self.max_in_memory:
+            self.summary["mode"] = "merge"
+            entries = self._merge_join(
+                _chain(list(before_table.values()), before_iter), _chain(list(after_table.values()), after_iter)
+            )
+        else:
+            entries = self._hash_join(before_table, after_table)
+
+        for entry in entries:
+            counts[entry["change"]] += 1
+            if entry["change"] == "changed":
+                transitions[entry["transition"]] += 1
+            if entry["change"] != "unchanged" or include_unchanged:
+                yield entry
+
+    def _load(self, records: Iterator[Dict[str, Any]]) -> Dict[Any, Dict[str, Any]]:
+        """Last record per key, stopping once there is more than `max_in_memory` keys."""
+        table: Dict[Any, Dict[str, Any]] = {}
+        for record in records:
+            table[record["key"]] = record
+            if len(table) > self.max_in_memory:
+                break
+        return table
+
+    def _normalized(self, records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for record in records:
+            row = normalize(record, self.key)
+            if row["key"] is not None:
+                yield row
+
+    def _entry(self, before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        before_decision = before["decision"] if before else self.absent_decision
+        after_decision = after["decision"] if after else self.absent_decision
+        if before is None and self.absent_decision is None:
+            change = "added"
+        elif after is None and self.absent_decision is None:
+            change = "removed"
+        elif before_decision != after_decision:
+            change = "changed"
+        elif before and after and before["detail"] != after["detail"]:
+            change = "changed"
+        else:
+            change = "unchanged"
+        return {
+            "change": change,
+            "key": (after or before)["key"],
+            "before_decision": before_decision,
+            "after_decision": after_decision,
+            "transition": f"{before_decision}→{after_decision}",
+            "before": before["detail"] if before else None,
+            "after": after["detail"] if after else None,
+        }
+
+    def _hash_join(
+        self, before: Dict[Any, Dict[str, Any]], after: Dict[Any, Dict[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        for key, record in after.items():
+            yield self._entry(before.pop(key, None), record)
+        for record in before.values():
+            yield self._entry(record, None)
+
+    # --- spill-to-disk path -------------------------------------------------
+
+    def _merge_join(self, before: Iterable[Dict[str, Any]], after: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        with tempfile.TemporaryDirectory(prefix="ppp-diff-", dir=self.tmp_dir) as tmp:
+            before_sorted = self._external_sort(before, Path(tmp) / "before")
+            after_sorted = self._external_sort(after, Path(tmp) / "after")
+            left = next(before_sorted, None)
+            right = next(after_sorted, None)
+            while left is not None or right is not None:
+                if right is None or (left is not None and _sort_key(left) < _sort_key(right)):
+                    yield self._entry(left, None)
+                    left = next(before_sorted, None)
+                elif left is None or _sort_key(right) < _sort_key(left):
+                    yield self._entry(None, right)
+                    right = next(after_sorted, None)
+                else:
+                    yield self._entry(left, right)
+                    left = next(before_sorted, None)
+                    right = next(after_sorted, None)
+
+    def _external_sort(self, records: Iterable[Dict[str, Any]], prefix: Path) -> Iterator[Dict[str, Any]]:
+        """Sorted, de-duplicated (last wins) stream via spilled sorted runs."""
+        runs: List[str] = []
+        chunk: List[Dict[str, Any]] = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= self.spill_chunk:
+                runs.append(self._spill(chunk, f"{prefix}-{len(runs)}.jsonl"))
+                chunk = []
+        if chunk:
+            runs.append(self._spill(chunk, f"{prefix}-{len(runs)}.jsonl"))
+        # Ties keep run order (heapq.merge is stable), so the last occurrence is the latest record
+        merged = heapq.merge(*(iter_jsonl(run) for run in runs), key=_sort_key)
+        for _, group in groupby(merged, key=_sort_key):
+            *_, last = group
+            yield last
+
+    @staticmethod
+    def _spill(chunk: List[Dict[str, Any]], path: str) -> str:
+        chunk.sort(key=_sort_key)  # stable: input order kept within a key
+        with open(path, 'w', encoding='utf-8') as f:
+            for record in chunk:
+                f.write(json.dumps(record) + "\n")
+        return path
+
+
+def _sort_key(record: Dict[str, Any]) -> Tuple[bool, Any]:
+    """Orders numeric keys before string keys so mixed key types sort without str()."""
+    return isinstance(record["key"], str), record["key"]
+
+
+def _chain(first: List[Dict[str, Any]], rest: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    yield from first
+    yield from rest
+
@@ -5,8 +5,10 @@ import shutil
 import zipfile
 import hashlib
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from .schema import Receipt, CanonicalSerializer
+from .merkle import MerkleTree, merkle_summary, verify_proof
+from .store import ReceiptStore
 
 
 class ReceiptEmitter:
@@ -14,6 +16,8 @@ class ReceiptEmitter:
 
     def __init__(self, report_root: str = "REPORT/ppp"):
         self.report_root = Path(report_root)
+        # run_id -> (tree, receipt_id -> (leaf index, receipt_hash))
+        self._merkle: Dict[str, Tuple[MerkleTree, Dict[str, Tuple[int, str]]]] = {}
 
     def emit_receipts(self, run_id: str, receipts: List[Receipt]) -> str:
         """Write receipts to JSONL file and return path."""
@@ -28,6 +32,20 @@ class ReceiptEmitter:
         
         return str(receipts_file)
 
+    def get_receipt(self, run_id: str, receipt_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up one emitted receipt by id without parsing the rest of the run.
+
+        Uses the run's cached offset index (`receipts.jsonl.idx`), which is
+        rebuilt whenever receipts.jsonl changes. The index stays beside the
+        working file; evidence packs only copy receipts.jsonl.
+        """
+        receipts_file = self.report_root / run_id / "receipts.jsonl"
+        if not receipts_file.exists():
+            raise ValueError(f"Receipts not found: {receipts_file}")
+        with ReceiptStore(str(receipts_file), index_fields=("receipt_id",)) as store:
+            return store.get(receipt_id)
+
     def create_summary(self, run_id: str, receipts: List[Receipt], metadata: Dict[str, Any]) -> str:
         """Create and write summary JSON."""
         run_dir = self.report_root / run_id
@@ -126,17 +144,27 @@ class ReceiptEmitter:
         with open(hashes_file, 'w') as f:
             json.dump(hashes, f, indent=2)
 
+        # Merkle tree over receipt hashes, in emission order
+        tree = self._build_merkle(run_id, receipts) if receipts else None
+
         # Create seal manifest
-        self._create_seal_manifest(run_id, evidence_dir, hashes_file)
+        self._create_seal_manifest(run_id, evidence_dir, hashes_file, tree)
 
         return str(evidence_dir)
 
-    def _create_seal_manifest(self, run_id: str, evidence_dir: Path, hashes_file: Path) -> str:
+    def _create_seal_manifest(
+        self,
+        run_id: str,
+        evidence_dir: Path,
+        hashes_file: Path,
+        tree: Optional[MerkleTree] = None,
+    ) -> str:
         """Create a seal manifest with integrity hashes for the evidence pack."""
         manifest = {
             "run_id": run_id,
             "timestamp": None,  # Will be filled by sealer
             "evidence_pack_hash": None,  # Will be filled after zipping
+            "merkle": merkle_summary(tree) if tree else None,
             "contents": {
                 "receipts": self._file_hash(evidence_dir / "receipts.jsonl"),
                 "summary": self._file_hash(evidence_dir / "summary.json"),
@@ -164,6 +192,66 @@ class ReceiptEmitter:
 
         return str(manifest_file)
 
+    def _build_merkle(self, run_id: str, receipts: List[Receipt]) -> MerkleTree:
+        """Build and cache the receipts Merkle tree for a run."""
+        tree = MerkleTree([r.receipt_hash for r in receipts])
+        index = {r.receipt_id: (i, r.receipt_hash) for i, r in enumerate(receipts)}
+        self._merkle[run_id] = (tree, index)
+        return tree
+
+    def _load_merkle(self, run_id: str) -> Tuple[MerkleTree, Dict[str, Tuple[int, str]]]:
+        """Cached tree for a run, rebuilt from its evidence pack if needed."""
+        if run_id not in self._merkle:
+            receipts_file = self.report_root / run_id / "evidence-pack" / "receipts.jsonl"
+            if not receipts_file.exists():
+                raise ValueError(f"Evidence pack receipts not found: {receipts_file}")
+            hashes = []
+            index = {}
+            with open(receipts_file, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        index[record["receipt_id"]] = (len(hashes), record["receipt_hash"])
+                        hashes.append(record["receipt_hash"])
+            if not hashes:
+                raise ValueError(f"Evidence pack has no receipts: {receipts_file}")
+            self._merkle[run_id] = (MerkleTree(hashes), index)
+        return self._merkle[run_id]
+
+    def prove(self, receipt_id: str, run_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Inclusion proof for one receipt: its hash, leaf index and audit path.
+
+        Without `run_id`, searches runs built by this emitter.
+        """
+        if run_id is None:
+            run_id = next((rid for rid, (_, index) in self._merkle.items() if receipt_id in index), None)
+            if run_id is None:
+                raise LookupError(f"Receipt not found in any cached run: {receipt_id}")
+        tree, index = self._load_merkle(run_id)
+        if receipt_id not in index:
+            raise LookupError(f"Receipt not found in run {run_id}: {receipt_id}")
+        leaf_index, receipt_hash = index[receipt_id]
+        return {
+            "run_id": run_id,
+            "receipt_id": receipt_id,
+            "receipt_hash": receipt_hash,
+            "leaf_index": leaf_index,
+            "leaf_count": tree.leaf_count,
+            "root": tree.root,
+            "path": tree.prove(leaf_index),
+        }
+
+    @staticmethod
+    def verify_proof(proof: Dict[str, Any], root: Optional[str] = None) -> bool:
+        """
+        Check an inclusion proof against a Merkle root.
+
+        Pass the root from the sealed seal-manifest.json; the proof's own
+        `root` is only used when none is given.
+        """
+        return verify_proof(proof["receipt_hash"], proof["path"], root or proof["root"])
+
     @staticmethod
     def _file_hash(file_path: Path) -> str:
         """Compute SHA256 hash of a file."""
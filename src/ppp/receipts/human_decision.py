@@ -8,13 +8,17 @@ for how humans exercise authority within governance constraints.
 Doctrine: "Governance detects. Humans decide. Verification confirms. Receipts prove."
 """
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from datetime import datetime
 from enum import Enum
 import hashlib
 import json
 
+# How many failed decisions a human decision gate reports
+MAX_REPORTED_DECISION_ERRORS = 100
+MAX_PRINTED_DECISION_ERRORS = 20  # echoed to the console; the rest are only counted
+
 
 class HumanDecisionType(Enum):
     """Valid human decision types."""
@@ -81,8 +85,7 @@ class HumanDecisionReceipt:
         if not self.authority or self.authority.strip() == "":
             raise ValueError("authority (human name/role) is required")
 
-        # Compute decision hash
-        self.decision_hash = self._compute_hash()
+        # decision_hash is computed lazily on first access (see _get_decision_hash)
 
     def _compute_hash(self) -> str:
         """Compute canonical hash of this decision."""
@@ -91,18 +94,27 @@ class HumanDecisionReceipt:
         canonical = CanonicalSerializer.canonical_json(self.to_dict_for_hashing())
         return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
 
+    def _get_decision_hash(self) -> str:
+        cached = self.__dict__.get("_decision_hash")
+        if cached is None:
+            cached = self.__dict__["_decision_hash"] = self._compute_hash()
+        return cached
+
+    def _set_decision_hash(self, value: str) -> None:
+        # The hash is always derived from the fields; a supplied value is ignored
+        self.__dict__["_decision_hash"] = None
+
     def to_dict_for_hashing(self) -> Dict[str, Any]:
-        """Get dict for hashing (excludes decision_hash itself)."""
-        d = asdict(self)
-        d.pop('decision_hash', None)  # Exclude the hash itself from hashing
-        return d
+        """Get dict for hashing (excludes decision_hash itself); values are not copied."""
+        return {name: getattr(self, name) for name in _HASHED_FIELDS}
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary, excluding None values."""
+        """Convert to dictionary, excluding None values (shallow)."""
         result = {}
-        for key, value in asdict(self).items():
+        for name in _FIELDS:
+            value = getattr(self, name)
             if value is not None:
-                result[key] = value
+                result[name] = value
         return result
 
     @staticmethod
@@ -124,6 +136,15 @@ class HumanDecisionReceipt:
         return True
 
 
+_FIELDS = tuple(HumanDecisionReceipt.__dataclass_fields__)
+_HASHED_FIELDS = tuple(name for name in _FIELDS if name != "decision_hash")
+# Replaces the dataclass default so construction stays cheap and the hash is
+# computed once, on first read, with the same value as before.
+HumanDecisionReceipt.decision_hash = property(
+    HumanDecisionReceipt._get_decision_hash, HumanDecisionReceipt._set_decision_hash
+)
+
+
 @dataclass
 class HumanDecisionBatch:
     """
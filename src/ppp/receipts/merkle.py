@@ -0,0 +1,123 @@
+"""Merkle tree over receipt hashes for compact inclusion proofs."""
+
+import hashlib
+from typing import List, Dict, Any
+
+# Domain separation (RFC 6962 style): a leaf can never be passed off as a node
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+HASH_SIZE = 32
+
+
+def _leaf(receipt_hash: str) -> bytes:
+    return hashlib.sha256(LEAF_PREFIX + bytes.fromhex(receipt_hash)).digest()
+
+
+def _node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+
+class MerkleTree:
+    """
+    Binary SHA-256 Merkle tree over hex receipt hashes, in emission order.
+
+    An unpaired last node is promoted to the next level unchanged rather than
+    duplicated, so no two leaf lists share a root. Each level is stored as one
+    packed bytes object (32 bytes per node) to keep large runs compact.
+    """
+
+    def __init__(self, leaf_hashes: List[str]):
+        if not leaf_hashes:
+            raise ValueError("Merkle tree needs at least one leaf")
+        level = b"".join(_leaf(h) for h in leaf_hashes)
+        self.levels: List[bytes] = [level]
+        while len(level) > HASH_SIZE:
+            count = len(level) // HASH_SIZE
+            parents = [
+                _node(level[i:i + HASH_SIZE], level[i + HASH_SIZE:i + 2 * HASH_SIZE])
+                for i in range(0, (count - 1) * HASH_SIZE, 2 * HASH_SIZE)
+            ]
+            if count % 2:
+                parents.append(level[-HASH_SIZE:])
+            level = b"".join(parents)
+            self.levels.append(level)
+
+    @property
+    def leaf_count(self) -> int:
+        return len(self.levels[0]) // HASH_SIZE
+
+    @property
+    def root(self) -> str:
+        return self.levels[-1].hex()
+
+    def prove(self, index: int) -> List[Dict[str, str]]:
+        """Audit path for leaf `index`: sibling hashes from leaf to root."""
+        if not 0 <= index < self.leaf_count:
+            raise ValueError(f"Leaf index out of range: {index}")
+        path = []
+        for level in self.levels[:-1]:
+            count = len(level) // HASH_SIZE
+            sibling = index ^ 1
+            if sibling < count:
+                path.append({
+                    "side": "left" if sibling < index else "right",
+                    "hash": level[sibling * HASH_SIZE:(sibling + 1) * HASH_SIZE].hex(),
+                })
+            index //= 2
+        return path
+
+    def prove_all(self) -> List[List[Dict[str, str]]]:
+        """
+        Audit paths for every leaf, in leaf order.
+
+        Each path step is built once per node and shared by all leaves below
+        its sibling, so this is O(n log n) list appends rather than that many
+        hex conversions. Treat the returned steps as read-only.
+        """
+        paths: List[List[Dict[str, str]]] = [[] for _ in range(self.leaf_count)]
+        span = 1  # leaves under one node at the current level
+        for level in self.levels[:-1]:
+            count = len(level) // HASH_SIZE
+            steps = [
+                {
+                    "side": "right" if j % 2 else "left",
+                    "hash": level[j * HASH_SIZE:(j + 1) * HASH_SIZE].hex(),
+                }
+                for j in range(count)
+            ]
+            for leaf, path in enumerate(paths):
+                sibling = (leaf // span) ^ 1
+                if sibling < count:
+                    path.append(steps[sibling])
+            span *= 2
+        return paths
+
+
+def verify_proof(receipt_hash: str, path: List[Dict[str, str]], root: str) -> bool:
+    """Recompute the root from a receipt hash and its audit path."""
+    try:
+        node = _leaf(receipt_hash)
+        for step in path:
+            sibling = bytes.fromhex(step["hash"])
+            if len(sibling) != HASH_SIZE:
+                return False
+            if step["side"] == "left":
+                node = _node(sibling, node)
+            elif step["side"] == "right":
+                node = _node(node, sibling)
+            else:
+                return False
+    except (ValueError, KeyError, TypeError):
+        return False
+    return node.hex() == root
+
+
+def merkle_summary(tree: MerkleTree) -> Dict[str, Any]:
+    """Manifest entry describing a receipts tree."""
+    return {
+        "algorithm": "sha256",
+        "leaf": "sha256(0x00 || receipt_hash)",
+        "node": "sha256(0x01 || left || right)",
+        "leaf_count": tree.leaf_count,
+        "root": tree.root,
+    }
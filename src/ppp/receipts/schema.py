@@ -2,14 +2,14 @@
 
 import json
 import hashlib
-from dataclasses import dataclass, asdict
-from typing import Any, Dict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Receipt:
-    """PPP Receipt structure."""
+    """PPP Receipt structure (immutable once hashed)."""
     receipt_id: str
     run_id: str
     agent_id: str
@@ -22,19 +22,28 @@ class Receipt:
     receipt_hash: str
     policy: Dict[str, Any]
     decision: Dict[str, Any]
-    artifacts: Dict[str, Any] = None
-    metadata: Dict[str, Any] = None
-    failure_stage: str = None
+    artifacts: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = None
+    failure_stage: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dict, excluding None values."""
+        """
+        Convert to dict, excluding None values.
+
+        Shallow: nested policy/decision/artifacts dicts are shared with the
+        receipt, not copied (callers serialize, they do not mutate).
+        """
         result = {}
-        for key, value in asdict(self).items():
+        for key in _RECEIPT_FIELDS:
+            value = getattr(self, key)
             if value is not None:
                 result[key] = value
         return result
 
 
+_RECEIPT_FIELDS = tuple(Receipt.__dataclass_fields__)
+
+
 class CanonicalSerializer:
     """Deterministic JSON canonicalization for PPP receipts."""
 
@@ -0,0 +1,236 @@
+"""Memory-mapped receipts JSONL reader with a cached offset index."""
+
+import json
+import mmap
+import os
+from array import array
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".idx"
+DEFAULT_INDEX_FIELDS = ("receipt_id", "event", "status", "rule_id")
+
+
+def _rule_ids(record: Dict[str, Any]) -> List[Any]:
+    """Rule ids wherever receipt producers put them."""
+    rule_ids = []
+    if "rule_id" in record:
+        rule_ids.append(record["rule_id"])
+    decision = record.get("decision")
+    if isinstance(decision, dict) and "rule_id" in decision:
+        rule_ids.append(decision["rule_id"])
+    artifacts = record.get("artifacts")
+    if isinstance(artifacts, dict) and isinstance(artifacts.get("finding"), dict):
+        finding_rule = artifacts["finding"].get("rule_id")
+        if finding_rule is not None:
+            rule_ids.append(finding_rule)
+    policy = record.get("policy")
+    if isinstance(policy, dict):
+        for rule in policy.get("rules_triggered") or []:
+            if isinstance(rule, dict) and rule.get("matched") and "rule_id" in rule:
+                rule_ids.append(rule["rule_id"])
+    return rule_ids
+
+
+def field_values(record: Dict[str, Any], field: str) -> List[Any]:
+    """Indexable values of `field` in one record (scalars only)."""
+    values = _rule_ids(record) if field == "rule_id" else [record.get(field)]
+    return [v for v in dict.fromkeys(values) if v is not None and isinstance(v, (str, int, float, bool))]
+
+
+class ReceiptStore:
+    """
+    Random access and filtered iteration over a receipts JSONL file.
+
+    The file is memory-mapped. A compact index (line start offsets plus,
+    per indexed field, value -> line ordinals) is built in one pass and cached
+    beside the file as `<name>.idx`; it is reused while the file's size and
+    mtime are unchanged. Lookups and filters parse only the lines they return.
+
+    Building the index parses every line, so a single full pass is cheaper
+    as a plain line-by-line read; the store pays off for repeated lookups.
+    Pass cache=False for files inside evidence packs so no `.idx` is written
+    next to sealed artifacts.
+    """
+
+    def __init__(self, path: str, index_fields: Iterable[str] = DEFAULT_INDEX_FIELDS, cache: bool = True):
+        self.path = Path(path)
+        self.index_fields = tuple(index_fields)
+        self.index_path = self.path.with_name(self.path.name + INDEX_SUFFIX)
+        self._file = open(self.path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self.offsets: array = array('Q')
+        self.postings: Dict[str, Dict[Any, array]] = {}
+        if not (cache and self._load_index()):
+            self._build_index()
+            if cache:
+                self._save_index()
+
+    # --- index ------------------------------------------------------------
+
+    def _source_stamp(self) -> Tuple[int, int]:
+        stat = os.fstat(self._file.fileno())
+        return stat.st_size, stat.st_mtime_ns
+
+    def _load_index(self) -> bool:
+        try:
+            with open(self.index_path, 'rb') as f:
+                header = json.loads(f.readline())
+                if (
+                    header.get("version") != INDEX_VERSION
+                    or tuple(header.get("source", ())) != self._source_stamp()
+                    or not set(self.index_fields) <= set(header.get("fields", ()))
+                ):
+                    return False
+                offsets = array('Q')
+                offsets.frombytes(f.read(header["count"] * offsets.itemsize))
+                if len(offsets) != header["count"]:
+                    return False
+                postings: Dict[str, Dict[Any, array]] = {}
+                for field in header["fields"]:
+                    values = postings[field] = {}
+                    for value, length in header["postings"][field]:
+                        ordinals = values[value] = array('I')
+                        ordinals.frombytes(f.read(length * ordinals.itemsize))
+                        if len(ordinals) != length:
+                            return False
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        self.offsets = offsets
+        self.postings = {field: postings[field] for field in self.index_fields}
+        return True
+
+    def _build_index(self) -> None:
+        mm = self._mm
+        end = len(mm)
+        offsets = array('Q')
+        postings: Dict[str, Dict[Any, array]] = {field: {} for field in self.index_fields}
+        start = 0
+        while start < end:
+            stop = mm.find(b"\n", start)
+            if stop < 0:
+                stop = end
+            line = mm[start:stop]
+            if line.strip():
+                ordinal = len(offsets)
+                offsets.append(start)
+                record = json.loads(line)
+                for field, values in postings.items():
+                    for value in field_values(record, field):
+                        ordinals = values.get(value)
+                        if ordinals is None:
+                            ordinals = values[value] = array('I')
+                        ordinals.append(ordinal)
+            start = stop + 1
+        self.offsets = offsets
+        self.postings = postings
+
+    def _save_index(self) -> None:
+        """
+        Write the index atomically; a read-only location just skips caching.
+
+        Layout: one JSON header line (version, source stamp, posting values
+        and lengths), then the raw offset and posting arrays. Nothing in it is
+        executable, so an index shipped inside a pack is safe to load.
+        """
+        header = {
+            "version": INDEX_VERSION,
+            "source": self._source_stamp(),
+            "fields": self.index_fields,
+            "count": len(self.offsets),
+            "postings": {
+                field: [[value, len(ordinals)] for value, ordinals in values.items()]
+                for field, values in self.postings.items()
+            },
+        }
+        tmp = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(json.dumps(header).encode('utf-8') + b"\n")
+                f.write(self.offsets.tobytes())
+                for values in self.postings.values():
+                    for ordinals in values.values():
+                        f.write(ordinals.tobytes())
+            os.replace(tmp, self.index_path)
+        except OSError:
+            pass
+
+    # --- access -----------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def raw(self, ordinal: int) -> bytes:
+        """Raw bytes of the receipt at `ordinal` (0-based, blank lines skipped)."""
+        start = self.offsets[ordinal]
+        stop = self._mm.find(b"\n", start)
+        return self._mm[start:stop if stop >= 0 else len(self._mm)]
+
+    def __getitem__(self, ordinal: int) -> Dict[str, Any]:
+        return json.loads(self.raw(ordinal))
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for ordinal in range(len(self.offsets)):
+            yield self[ordinal]
+
+    def get(self, receipt_id: str) -> Optional[Dict[str, Any]]:
+        """First receipt with this receipt_id, or None."""
+        ordinals = self._postings("receipt_id").get(receipt_id)
+        return self[ordinals[0]] if ordinals else None
+
+    def values(self, field: str) -> Dict[Any, int]:
+        """Distinct values of an indexed field with receipt counts."""
+        return {value: len(ordinals) for value, ordinals in self._postings(field).items()}
+
+    def ordinals(self, **filters: Any) -> List[int]:
+        """
+        Ordinals matching every filter, in file order.
+
+        Each filter is `field=value` or `field=[values]` (any of).
+        """
+        if not filters:
+            return list(range(len(self.offsets)))
+        matches: List[set] = []
+        for field, wanted in filters.items():
+            postings = self._postings(field)
+            if isinstance(wanted, (list, tuple, set, frozenset)):
+                found = set()
+                for value in wanted:
+                    found.update(postings.get(value, ()))
+            else:
+                found = set(postings.get(wanted, ()))
+            if not found:
+                return []
+            matches.append(found)
+        matches.sort(key=len)
+        result = matches[0].intersection(*matches[1:])
+        return sorted(result)
+
+    def count(self, **filters: Any) -> int:
+        """Number of receipts matching the filters (no lines parsed)."""
+        return len(self.ordinals(**filters))
+
+    def find(self, **filters: Any) -> Iterator[Dict[str, Any]]:
+        """Receipts matching every filter, in file order."""
+        for ordinal in self.ordinals(**filters):
+            yield self[ordinal]
+
+    def _postings(self, field: str) -> Dict[Any, array]:
+        if field not in self.postings:
+            raise ValueError(f"Field not indexed: {field} (indexed: {', '.join(self.index_fields)})")
+        return self.postings[field]
+
+    # --- lifecycle --------------------------------------------------------
+
+    def close(self) -> None:
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "ReceiptStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,217 @@
+"""Parallel, streaming verification of sealed evidence packs."""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+from .merkle import MerkleTree
+from .schema import CanonicalSerializer, Receipt
+
+READ_CHUNK = 1 << 20          # 1 MiB reads; hashlib releases the GIL on large updates
+RECEIPT_BATCH = 2000          # receipts per worker task
+MAX_REPORTED_FAILURES = 100
+RECEIPTS_FILE = "receipts.jsonl"
+
+# seal-manifest.json "contents" key -> file (or directory, for dict entries) in the pack
+MANIFEST_LAYOUT = {
+    "receipts": RECEIPTS_FILE,
+    "summary": "summary.json",
+    "hashes_manifest": "hashes.json",
+    "policies": "policies",
+    "config": "run-config",
+}
+
+
+def manifest_files(manifest: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """
+    Map pack-relative paths to expected SHA-256 from a seal manifest.
+
+    Understands the `contents` layout ReceiptEmitter writes, plus a flat
+    `file_hashes` mapping for older packs.
+    """
+    files: Dict[str, Optional[str]] = dict(manifest.get("file_hashes", {}))
+    for key, entry in manifest.get("contents", {}).items():
+        location = MANIFEST_LAYOUT.get(key, key)
+        if isinstance(entry, dict):
+            for name, expected in entry.items():
+                files[f"{location}/{name}"] = expected
+        else:
+            files[location] = entry
+    return files
+
+
+def hash_file(file_path: Path, chunk_size: int = READ_CHUNK) -> Tuple[str, int]:
+    """SHA-256 of a file and its size in bytes."""
+    sha256 = hashlib.sha256()
+    size = 0
+    with open(file_path, 'rb', buffering=0) as f:
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            sha256.update(view[:n])
+            size += n
+    return sha256.hexdigest(), size
+
+
+def verify_receipt_lines(batch: List[Tuple[int, bytes]]) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """
+    Verify one batch of receipts.jsonl lines (runs in a worker).
+
+    Returns the receipt hashes in line order and any failures.
+    """
+    hashes: List[str] = []
+    failures: List[Dict[str, Any]] = []
+    for line_no, line in batch:
+        try:
+            receipt = Receipt(**json.loads(line))
+        except (ValueError, TypeError) as e:
+            failures.append({"line": line_no, "receipt_id": None, "error": f"malformed receipt: {e}"})
+            hashes.append("")
+            continue
+        hashes.append(receipt.receipt_hash)
+        if not CanonicalSerializer.verify_receipt_hash(receipt):
+            failures.append({"line": line_no, "receipt_id": receipt.receipt_id, "error": "receipt hash mismatch"})
+    return hashes, failures
+
+
+class EvidencePackVerifier:
+    """
+    Verify every file hash and every receipt hash in an evidence pack.
+
+    File hashes run on a thread pool while receipts.jsonl is streamed in
+    batches to a process pool (receipt checks are CPU-bound JSON work), with a
+    bounded number of batches in flight so memory stays flat for any pack size.
+    With one worker everything runs inline.
+    """
+
+    def __init__(self, evidence_dir: str, workers: Optional[int] = None, batch_size: int = RECEIPT_BATCH):
+        self.evidence_dir = Path(evidence_dir)
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.batch_size = batch_size
+
+    def verify(self) -> Dict[str, Any]:
+        """Verify the pack and return a report with throughput figures."""
+        manifest_path = self.evidence_dir / "seal-manifest.json"
+        if not manifest_path.exists():
+            raise ValueError(f"Seal manifest not found: {manifest_path}")
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+
+        expected_hashes = {rel: h for rel, h in manifest_files(manifest).items() if h}
+        file_failures: List[Dict[str, Any]] = []
+        files_verified = 0
+        bytes_hashed = 0
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as threads:
+            file_jobs = {}
+            for rel in expected_hashes:
+                if rel == RECEIPTS_FILE:
+                    continue  # hashed while it is streamed below
+                if (self.evidence_dir / rel).is_file():
+                    file_jobs[rel] = threads.submit(hash_file, self.evidence_dir / rel)
+                else:
+                    file_failures.append({"file": rel, "error": "file missing"})
+            receipt_hashes, receipt_failures, receipts_digest, receipt_bytes = self._verify_receipts()
+            if RECEIPTS_FILE in expected_hashes:
+                if receipts_digest is None:
+                    file_failures.append({"file": RECEIPTS_FILE, "error": "file missing"})
+                elif receipts_digest == expected_hashes[RECEIPTS_FILE]:
+                    files_verified += 1
+                else:
+                    file_failures.append({"file": RECEIPTS_FILE, "error": "hash mismatch"})
+
+            for rel, job in file_jobs.items():
+                actual, size = job.result()
+                bytes_hashed += size
+                if actual == expected_hashes[rel]:
+                    files_verified += 1
+                else:
+                    file_failures.append({"file": rel, "error": "hash mismatch"})
+
+        merkle_valid = None
+        merkle = manifest.get("merkle")
+        if merkle:
+            try:
+                merkle_valid = MerkleTree(receipt_hashes).root == merkle.get("root")
+            except ValueError:
+                merkle_valid = False
+
+        elapsed = time.perf_counter() - started
+        total_bytes = bytes_hashed + receipt_bytes
+        return {
+            "evidence_pack": str(self.evidence_dir),
+            "valid": not file_failures and not receipt_failures and merkle_valid is not False,
+            "files_verified": files_verified,
+            "files_failed": file_failures,
+            "receipts_verified": len(receipt_hashes) - len(receipt_failures),
+            "receipts_failed": receipt_failures[:MAX_REPORTED_FAILURES],
+            "receipt_failure_count": len(receipt_failures),
+            "merkle_root_valid": merkle_valid,
+            "workers": self.workers,
+            "bytes_read": total_bytes,
+            "elapsed_seconds": round(elapsed, 4),
+            "throughput_mb_s": round(total_bytes / elapsed / 1e6, 2) if elapsed else None,
+            "receipts_per_second": round(len(receipt_hashes) / elapsed) if elapsed else None,
+        }
+
+    def _batches(self, receipts_path: Path, sha256) -> Iterator[List[Tuple[int, bytes]]]:
+        batch: List[Tuple[int, bytes]] = []
+        with open(receipts_path, 'rb', buffering=READ_CHUNK) as f:
+            for line_no, line in enumerate(f, 1):
+                sha256.update(line)
+                if not line.strip():
+                    continue
+                batch.append((line_no, line))
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    def _verify_receipts(self) -> Tuple[List[str], List[Dict[str, Any]], Optional[str], int]:
+        """
+        Stream receipts.jsonl through the workers, hashing the file on the way.
+
+        Returns (receipt hashes in file order, failures, file SHA-256, size).
+        """
+        receipts_path = self.evidence_dir / RECEIPTS_FILE
+        hashes: List[str] = []
+        failures: List[Dict[str, Any]] = []
+        if not receipts_path.is_file():
+            return hashes, failures, None, 0
+        size = receipts_path.stat().st_size
+        sha256 = hashlib.sha256()
+
+        def collect(result: Tuple[List[str], List[Dict[str, Any]]]) -> None:
+            hashes.extend(result[0])
+            failures.extend(result[1])
+
+        if self.workers == 1:
+            for batch in self._batches(receipts_path, sha256):
+                collect(verify_receipt_lines(batch))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                self._run_bounded(pool, self._batches(receipts_path, sha256), collect)
+        return hashes, failures, sha256.hexdigest(), size
+
+    def _run_bounded(self, pool: Executor, batches: Iterator[List[Tuple[int, bytes]]], collect) -> None:
+        in_flight: List[Future] = []
+        for batch in batches:
+            in_flight.append(pool.submit(verify_receipt_lines, batch))
+            if len(in_flight) >= 2 * self.workers:
+                collect(in_flight.pop(0).result())
+        for future in in_flight:
+            collect(future.result())
+
+
+def verify_evidence_pack(evidence_dir: str, workers: Optional[int] = None) -> Dict[str, Any]:
+    """Verify an evidence pack directory (see EvidencePackVerifier)."""
+    return EvidencePackVerifier(evidence_dir, workers=workers).verify()
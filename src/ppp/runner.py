@@ -9,9 +9,10 @@ from .config.loader import ConfigLoader
 from .policy.engine import PolicyEvaluator
 from .receipts.schema import CanonicalSerializer, Receipt
 from .receipts.emitter import ReceiptEmitter
-from .storage.progress import ProgressStore
+from .storage.receipt_index import ReceiptIndex
 from .targets.mock import MockTarget
 from .targets.moltbook import MoltbookTarget
+from .targets.http import HttpTarget
 from .keon.seal import NoopSealer
 
 
@@ -22,7 +23,7 @@ class PPPRunner:
         self.config = ConfigLoader.load_run_config(run_config_path)
         self.run_config_path = run_config_path
         self.emitter = ReceiptEmitter(self.config.storage.get("report_root", "REPORT/ppp"))
-        self.store = ProgressStore(self.config.storage.get("progress_db", "data/ppp_progress.db"))
+        self.store = ReceiptIndex(self.config.storage.get("progress_db", "data/ppp_progress.db"))
         self.receipts: List[Receipt] = []
         self.sealer = NoopSealer()
 
@@ -57,6 +58,8 @@ class PPPRunner:
         target_config = self.config.target.get("label", "moltbook")
         if target_config == "moltbook.com" or target_config == "moltbook":
             target = MoltbookTarget(self.config.__dict__.get("targets", {}).get("moltbook", {}))
+        elif target_config == "http":
+            target = HttpTarget(self.config.target)
         else:
             target = MockTarget(self.config.__dict__.get("targets", {}).get("moltbook", {}))
         
@@ -224,6 +227,8 @@ class PPPRunner:
         """Receipt emission phase."""
         try:
             receipts_file = self.emitter.emit_receipts(run_id, self.receipts)
+            # self.receipts accumulates across agents; index only this run's
+            self.store.ingest(run_id, [r for r in self.receipts if r.run_id == run_id])
             summary_file = self.emitter.create_summary(
                 run_id,
                 self.receipts,
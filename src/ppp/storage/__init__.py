@@ -1,5 +1,18 @@
 """Storage layer for PPP."""
 
-from .progress import ProgressStore
+from typing import TYPE_CHECKING
 
-__all__ = ["ProgressStore"]
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    "ProgressStore": ".progress",
+    "ReceiptIndex": ".receipt_index",
+}
+
+if TYPE_CHECKING:
+    from .progress import ProgressStore
+    from .receipt_index import ReceiptIndex
+
+__all__ = ["ProgressStore", "ReceiptIndex"]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
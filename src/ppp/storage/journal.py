@@ -0,0 +1,118 @@
+"""
+Append-only JSONL journals, fsynced per entry.
+
+Used as write-ahead logs by the file mover and the remediation applier: an
+entry is durable once its line, newline included, has been fsynced. A crash
+mid-write can only leave the final line incomplete, so readers skip a bad
+final line and reject a bad line anywhere else (real corruption), and a
+writer reopening the journal cuts that torn line off before appending.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+READ_CHUNK = 1 << 16
+
+
+def iter_journal(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Journal entries in order (none if the file does not exist).
+
+    Raises ValueError for a malformed line other than the final one.
+    """
+    path = Path(path)
+    if not path.exists():
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        bad_line: Optional[int] = None
+        for line_no, line in enumerate(f, 1):
+            if bad_line is not None:
+                raise ValueError(f"{path}:{bad_line}: corrupt journal entry")
+            if not line.strip():
+                continue
+            if not line.endswith("\n"):
+                bad_line = line_no  # torn final line from an interrupted run
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                bad_line = line_no
+                continue
+            yield entry
+
+
+def _last_line_start(f, end: int) -> int:
+    """Offset where the line ending at `end` starts (binary file `f`)."""
+    pos = end
+    while pos > 0:
+        step = min(READ_CHUNK, pos)
+        f.seek(pos - step)
+        newline = f.read(step).rfind(b"\n")
+        if newline >= 0:
+            return pos - step + newline + 1
+        pos -= step
+    return 0
+
+
+def _drop_torn_tail(path: Path) -> None:
+    """Truncate a final line that is incomplete or unparsable, so appends start clean."""
+    try:
+        f = open(path, 'r+b')
+    except FileNotFoundError:
+        return
+    with f:
+        size = f.seek(0, os.SEEK_END)
+        if not size:
+            return
+        f.seek(size - 1)
+        complete = f.read(1) == b"\n"
+        start = _last_line_start(f, size - 1 if complete else size)
+        f.seek(start)
+        last = f.read()
+        if complete:
+            try:
+                json.loads(last)
+                return
+            except ValueError:
+                if not last.strip():
+                    return
+        f.truncate(start)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class JsonlJournal:
+    """
+    Thread-safe appender for one JSONL journal.
+
+    `append` returns once the entry is on disk (write, flush, fsync).
+    Opening drops a torn final line left by an interrupted run (see
+    `iter_journal`); everything before it is kept.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        _drop_torn_tail(self.path)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "JsonlJournal":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
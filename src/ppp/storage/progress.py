@@ -15,10 +15,25 @@ class ProgressStore:
     INITIAL_BACKOFF = 0.1  # seconds
     MAX_BACKOFF = 2.0  # seconds
 
-    def __init__(self, db_path: str = "data/ppp_progress.db"):
+    # Stored in PRAGMA user_version once the schema exists; subclasses that
+    # add tables use a higher version
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path: str = "data/ppp_progress.db", read_only: bool = False):
+        """
+        Open the store. `read_only` (for status queries) never creates the
+        database or its schema and opens SQLite in read-only mode.
+        """
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_db()
+        self.read_only = read_only
+        if not read_only:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.read_only:
+            return sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
+        return sqlite3.connect(self.db_path)
 
     def _execute_with_retry(self, func, *args, **kwargs):
         """Execute a database operation with exponential backoff retry logic."""
@@ -40,50 +55,56 @@ class ProgressStore:
         raise last_error
 
     def _init_db(self):
-        """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Runs table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS runs (
-                    run_id TEXT PRIMARY KEY,
-                    agent_id TEXT NOT NULL,
-                    policy_id TEXT NOT NULL,
-                    started_at TEXT NOT NULL,
-                    completed_at TEXT,
-                    status TEXT NOT NULL,
-                    config_hash TEXT
-                )
-            """)
-            
-            # Phases table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS phases (
-                    phase_id TEXT PRIMARY KEY,
-                    run_id TEXT NOT NULL,
-                    phase_name TEXT NOT NULL,
-                    started_at TEXT,
-                    completed_at TEXT,
-                    status TEXT NOT NULL,
-                    FOREIGN KEY(run_id) REFERENCES runs(run_id)
-                )
-            """)
-            
-            # Checkpoints table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS checkpoints (
-                    checkpoint_id TEXT PRIMARY KEY,
-                    run_id TEXT NOT NULL,
-                    phase_name TEXT NOT NULL,
-                    checkpoint_data TEXT,
-                    created_at TEXT NOT NULL,
-                    FOREIGN KEY(run_id) REFERENCES runs(run_id)
-                )
-            """)
-            
+        """Initialize database schema (skipped when it is already current)."""
+        with self._connect() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= self.SCHEMA_VERSION:
+                return
+            self._create_schema(conn)
+            conn.execute(f"PRAGMA user_version = {int(self.SCHEMA_VERSION)}")
             conn.commit()
 
+    def _create_schema(self, conn: sqlite3.Connection):
+        """Create the progress tables."""
+        cursor = conn.cursor()
+        
+        # Runs table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id TEXT PRIMARY KEY,
+                agent_id TEXT NOT NULL,
+                policy_id TEXT NOT NULL,
+                started_at TEXT NOT NULL,
+                completed_at TEXT,
+                status TEXT NOT NULL,
+                config_hash TEXT
+            )
+        """)
+        
+        # Phases table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS phases (
+                phase_id TEXT PRIMARY KEY,
+                run_id TEXT NOT NULL,
+                phase_name TEXT NOT NULL,
+                started_at TEXT,
+                completed_at TEXT,
+                status TEXT NOT NULL,
+                FOREIGN KEY(run_id) REFERENCES runs(run_id)
+            )
+        """)
+        
+        # Checkpoints table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                checkpoint_id TEXT PRIMARY KEY,
+                run_id TEXT NOT NULL,
+                phase_name TEXT NOT NULL,
+                checkpoint_data TEXT,
+                created_at TEXT NOT NULL,
+                FOREIGN KEY(run_id) REFERENCES runs(run_id)
+            )
+        """)
+
     def begin_run(
         self,
         run_id: str,
@@ -93,7 +114,7 @@ class ProgressStore:
     ) -> bool:
         """Begin a new run with retry logic."""
         def _insert():
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     INSERT INTO runs (run_id, agent_id, policy_id, started_at, status, config_hash)
@@ -111,7 +132,7 @@ class ProgressStore:
         """Start a phase within a run."""
         phase_id = phase_id or f"{run_id}_{phase_name}_{datetime.utcnow().isoformat()}"
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO phases (phase_id, run_id, phase_name, started_at, status)
@@ -124,7 +145,7 @@ class ProgressStore:
     def complete_phase(self, phase_id: str, status: str = "completed") -> bool:
         """Mark a phase as complete."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     UPDATE phases
@@ -146,7 +167,7 @@ class ProgressStore:
         """Save a checkpoint."""
         checkpoint_id = checkpoint_id or f"{run_id}_{phase_name}_{datetime.utcnow().isoformat()}"
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO checkpoints (checkpoint_id, run_id, phase_name, checkpoint_data, created_at)
@@ -158,7 +179,7 @@ class ProgressStore:
 
     def get_last_checkpoint(self, run_id: str, phase_name: str) -> Optional[Dict[str, Any]]:
         """Get the last checkpoint for a run/phase."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT checkpoint_id, checkpoint_data, created_at
@@ -179,7 +200,7 @@ class ProgressStore:
 
     def get_run_status(self, run_id: str) -> Optional[Dict[str, Any]]:
         """Get run status."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT run_id, agent_id, policy_id, started_at, completed_at, status
@@ -202,7 +223,7 @@ class ProgressStore:
     def complete_run(self, run_id: str, status: str = "completed") -> bool:
         """Mark run as complete."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     UPDATE runs
@@ -216,7 +237,7 @@ class ProgressStore:
 
     def list_runs(self) -> list:
         """List all runs."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT run_id, agent_id, policy_id, started_at, status FROM runs ORDER BY started_at DESC")
             rows = cursor.fetchall()
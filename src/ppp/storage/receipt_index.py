@@ -0,0 +1,276 @@
+"""Cross-run receipt index for status and drift queries."""
+
+import json
+import sqlite3
+from dataclasses import is_dataclass
+from itertools import groupby
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
+
+from .progress import ProgressStore
+from ..receipts.store import field_values
+
+INGEST_CHUNK = 5000
+# Columns receipts can be filtered and compared on
+INDEXED_COLUMNS = ("phase", "event", "status", "document_id", "receipt_hash", "severity", "rule_id")
+
+
+def _as_record(item: Any) -> Dict[str, Any]:
+    if isinstance(item, dict):
+        return item
+    if is_dataclass(item):
+        return {name: getattr(item, name) for name in item.__dataclass_fields__}
+    raise ValueError(f"Cannot index {type(item).__name__}: expected a receipt dataclass or dict")
+
+
+def _finding(record: Dict[str, Any]) -> Dict[str, Any]:
+    artifacts = record.get("artifacts")
+    finding = artifacts.get("finding") if isinstance(artifacts, dict) else None
+    return finding if isinstance(finding, dict) else {}
+
+
+def _document_id(record: Dict[str, Any]) -> Optional[str]:
+    if record.get("document_id"):
+        return record["document_id"]
+    location = _finding(record).get("location")
+    return location.split(":", 1)[0] if location else None
+
+
+def _severity(record: Dict[str, Any]) -> Optional[str]:
+    decision = record.get("decision")
+    if isinstance(decision, dict) and decision.get("severity"):
+        return decision["severity"]
+    return _finding(record).get("severity") or record.get("original_finding_severity")
+
+
+def _message(record: Dict[str, Any]) -> str:
+    finding = _finding(record)
+    parts = [record.get("message"), finding.get("message"), finding.get("text_snippet"), record.get("rationale")]
+    return "\n".join(p for p in parts if isinstance(p, str) and p)
+
+
+class ReceiptIndex(ProgressStore):
+    """
+    ProgressStore plus per-run receipt tables.
+
+    Receipts are flattened into an indexed `receipts` table (one row per
+    receipt, raw JSON kept), a `receipt_rules` table (one row per rule id)
+    and an FTS5 table over finding messages, all in the progress database,
+    so status and run-to-run drift are SQL queries rather than file scans.
+    """
+
+    SCHEMA_VERSION = 2
+
+    def _create_schema(self, conn: sqlite3.Connection):
+        super()._create_schema(conn)
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS receipts (
+                run_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                receipt_id TEXT,
+                phase TEXT,
+                event TEXT,
+                status TEXT,
+                document_id TEXT,
+                severity TEXT,
+                receipt_hash TEXT,
+                timestamp TEXT,
+                data TEXT NOT NULL,
+                PRIMARY KEY (run_id, seq)
+            );
+            CREATE INDEX IF NOT EXISTS idx_receipts_receipt_id ON receipts(receipt_id);
+            CREATE INDEX IF NOT EXISTS idx_receipts_run_status ON receipts(run_id, status);
+            CREATE INDEX IF NOT EXISTS idx_receipts_run_event ON receipts(run_id, event);
+            CREATE INDEX IF NOT EXISTS idx_receipts_run_phase ON receipts(run_id, phase);
+            CREATE INDEX IF NOT EXISTS idx_receipts_document ON receipts(document_id, run_id);
+            CREATE INDEX IF NOT EXISTS idx_receipts_hash ON receipts(receipt_hash);
+
+            CREATE TABLE IF NOT EXISTS receipt_rules (
+                run_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                rule_id TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_receipt_rules_rule ON receipt_rules(rule_id, run_id);
+            CREATE INDEX IF NOT EXISTS idx_receipt_rules_run ON receipt_rules(run_id, seq);
+
+            CREATE VIRTUAL TABLE IF NOT EXISTS receipt_messages USING fts5(
+                message, run_id UNINDEXED, seq UNINDEXED
+            );
+        """)
+
+    # --- ingest -----------------------------------------------------------
+
+    def ingest(self, run_id: str, receipts: Iterable[Any], append: bool = False) -> int:
+        """
+        Replace the indexed receipts of `run_id` (bulk executemany, one transaction).
+
+        Accepts Receipt-like dataclasses or dicts (e.g. receipts.jsonl lines).
+        With `append` the run's existing receipts are kept and the new ones
+        numbered after them. The receipts are materialized first so a retry
+        after "database is locked" inserts them again.
+        """
+        receipts = list(receipts)
+
+        def _ingest() -> int:
+            conn = self._connect()
+            try:
+                conn.execute("PRAGMA synchronous=NORMAL")
+                with conn:
+                    start = 0
+                    if append:
+                        start = conn.execute(
+                            "SELECT COALESCE(MAX(seq) + 1, 0) FROM receipts WHERE run_id = ?", (run_id,)
+                        ).fetchone()[0]
+                    else:
+                        for table in ("receipts", "receipt_rules", "receipt_messages"):
+                            conn.execute(f"DELETE FROM {table} WHERE run_id = ?", (run_id,))
+                    count = 0
+                    for rows, rules, messages in self._chunks(run_id, receipts, start):
+                        conn.executemany("INSERT INTO receipts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                        conn.executemany("INSERT INTO receipt_rules VALUES (?, ?, ?)", rules)
+                        conn.executemany(
+                            "INSERT INTO receipt_messages (message, run_id, seq) VALUES (?, ?, ?)", messages
+                        )
+                        count += len(rows)
+                return count
+            finally:
+                conn.close()
+
+        return self._execute_with_retry(_ingest)
+
+    def ingest_jsonl(self, path: str, run_id: Optional[str] = None) -> Dict[str, int]:
+        """
+        Index a receipts JSONL file; rows are grouped by their own run_id
+        unless `run_id` is given. Returns receipts indexed per run.
+
+        The file is streamed one contiguous run at a time; a run that shows
+        up again later in the file is appended to, not replaced.
+        """
+        counts: Dict[str, int] = {}
+        with open(path, 'r', encoding='utf-8') as f:
+            records = (json.loads(line) for line in f if line.strip())
+            for rid, group in groupby(records, key=lambda r: run_id or r.get("run_id") or "unknown"):
+                counts[rid] = counts.get(rid, 0) + self.ingest(rid, group, append=rid in counts)
+        return counts
+
+    @staticmethod
+    def _chunks(run_id: str, receipts: Iterable[Any], start: int = 0) -> Iterator[Tuple[list, list, list]]:
+        rows, rules, messages = [], [], []
+        for seq, item in enumerate(receipts, start):
+            record = _as_record(item)
+            rows.append((
+                run_id,
+                seq,
+                record.get("receipt_id") or record.get("decision_id"),
+                record.get("phase"),
+                record.get("event"),
+                record.get("status") or record.get("policy_decision") or record.get("decision_type"),
+                _document_id(record),
+                _severity(record),
+                record.get("receipt_hash") or record.get("decision_hash"),
+                record.get("timestamp"),
+                json.dumps(record, default=str),
+            ))
+            rule_ids = field_values(record, "rule_id") + [
+                r for r in record.get("violated_rules") or [] if isinstance(r, str)
+            ]
+            if record.get("original_finding_rule_id"):
+                rule_ids.append(record["original_finding_rule_id"])
+            rules.extend((run_id, seq, str(rule_id)) for rule_id in dict.fromkeys(rule_ids))
+            message = _message(record)
+            if message:
+                messages.append((message, run_id, seq))
+            if len(rows) >= INGEST_CHUNK:
+                yield rows, rules, messages
+                rows, rules, messages = [], [], []
+        if rows:
+            yield rows, rules, messages
+
+    # --- queries ----------------------------------------------------------
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._connect() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def indexed_runs(self) -> List[Dict[str, Any]]:
+        """Runs with indexed receipts and their receipt counts."""
+        rows = self._query("SELECT run_id, COUNT(*) FROM receipts GROUP BY run_id ORDER BY run_id")
+        return [{"run_id": run_id, "receipts": count} for run_id, count in rows]
+
+    def counts(self, run_id: str, column: str) -> Dict[str, int]:
+        """Receipt counts per value of an indexed column for one run."""
+        if column not in INDEXED_COLUMNS:
+            raise ValueError(f"Not an indexed column: {column}")
+        if column == "rule_id":
+            sql = "SELECT rule_id, COUNT(*) FROM receipt_rules WHERE run_id = ? GROUP BY rule_id"
+        else:
+            sql = f"SELECT {column}, COUNT(*) FROM receipts WHERE run_id = ? GROUP BY {column}"
+        return {value: count for value, count in self._query(sql, (run_id,))}
+
+    def run_summary(self, run_id: str) -> Dict[str, Any]:
+        """Receipt totals for one run by status, event, phase, severity and rule."""
+        total = self._query("SELECT COUNT(*) FROM receipts WHERE run_id = ?", (run_id,))[0][0]
+        summary: Dict[str, Any] = {"run_id": run_id, "total_receipts": total}
+        for column in ("status", "event", "phase", "severity", "rule_id"):
+            summary[f"by_{column}"] = self.counts(run_id, column)
+        return summary
+
+    def find(self, run_id: Optional[str] = None, limit: int = 100, **filters: Any) -> List[Dict[str, Any]]:
+        """Receipts matching equality filters on indexed columns, in emission order."""
+        clauses, params = [], []
+        if run_id is not None:
+            clauses.append("r.run_id = ?")
+            params.append(run_id)
+        for column, value in filters.items():
+            if column not in INDEXED_COLUMNS:
+                raise ValueError(f"Not an indexed column: {column}")
+            if column == "rule_id":
+                clauses.append(
+                    "EXISTS (SELECT 1 FROM receipt_rules x WHERE x.run_id = r.run_id AND x.seq = r.seq AND x.rule_id = ?)"
+                )
+            else:
+                clauses.append(f"r.{column} = ?")
+            params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._query(
+            f"SELECT r.data FROM receipts r {where} ORDER BY r.run_id, r.seq LIMIT ?", tuple(params) + (limit,)
+        )
+        return [json.loads(data) for (data,) in rows]
+
+    def iter_run(self, run_id: str) -> Iterator[Dict[str, Any]]:
+        """Stream every indexed receipt of a run in emission order."""
+        conn = self._connect()
+        try:
+            for (data,) in conn.execute("SELECT data FROM receipts WHERE run_id = ? ORDER BY seq", (run_id,)):
+                yield json.loads(data)
+        finally:
+            conn.close()
+
+    def search(self, text: str, run_id: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """Full-text search over finding messages (FTS5 query syntax)."""
+        sql = """
+            SELECT r.data FROM receipt_messages m
+            JOIN receipts r ON r.run_id = m.run_id AND r.seq = m.seq
+            WHERE receipt_messages MATCH ?
+        """
+        params: tuple = (text,)
+        if run_id is not None:
+            sql += " AND m.run_id = ?"
+            params += (run_id,)
+        sql += " ORDER BY rank LIMIT ?"
+        return [json.loads(data) for (data,) in self._query(sql, params + (limit,))]
+
+    def compare_runs(self, run_a: str, run_b: str, column: str = "rule_id") -> Dict[str, Any]:
+        """Per-value counts in two runs and their difference (b - a)."""
+        before = self.counts(run_a, column)
+        after = self.counts(run_b, column)
+        values = sorted(set(before) | set(after), key=lambda v: (v is None, str(v)))
+        return {
+            "run_a": run_a,
+            "run_b": run_b,
+            "column": column,
+            "values": {
+                value: {"a": before.get(value, 0), "b": after.get(value, 0),
+                        "delta": after.get(value, 0) - before.get(value, 0)}
+                for value in values
+            },
+        }
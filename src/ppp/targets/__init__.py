@@ -2,5 +2,7 @@
 
 from .base import TargetBase
 from .mock import MockTarget
+from .http import HttpTarget
+from .standin import StandInServer, StandInConfig
 
-__all__ = ["TargetBase", "MockTarget"]
+__all__ = ["TargetBase", "MockTarget", "HttpTarget", "StandInServer", "StandInConfig"]
@@ -0,0 +1,108 @@
+"""HTTP-backed target with pooled keep-alive connections."""
+
+import http.client
+import json
+import queue
+from typing import List, Dict, Any, Optional
+from urllib.parse import quote, urlsplit
+
+from .base import TargetBase
+
+
+class HttpTarget(TargetBase):
+    """
+    Target that talks to a discover/observe/participate HTTP service.
+
+    Connections are HTTP/1.1 keep-alive and reused from a bounded pool, so a
+    run pays TCP setup once per pooled connection rather than once per call.
+    Drafts are still only drafts: the service is asked for a draft structure,
+    nothing is published.
+    """
+
+    def __init__(self, config: Dict[str, Any] = None):
+        self.config = config or {}
+        base_url = self.config.get("url")
+        if not base_url:
+            raise ValueError("HttpTarget requires a 'url'")
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {parts.scheme}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.base_path = parts.path.rstrip("/")
+        self.timeout = self.config.get("timeout", 10.0)
+        self.pool_size = self.config.get("pool_size", 4)
+        self._pool: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue(maxsize=self.pool_size)
+
+    def discover(self) -> List[Dict[str, Any]]:
+        """Discover targets via GET /discover."""
+        return self._request("GET", "/discover")
+
+    def observe(self, target_id: str) -> Dict[str, Any]:
+        """Observe a target via GET /observe/{target_id}."""
+        return self._request("GET", f"/observe/{quote(target_id, safe='')}")
+
+    def participate(self, target_id: str, thread_id: str, draft_text: str) -> Dict[str, Any]:
+        """Request a draft artifact via POST /participate (never posts)."""
+        return self._request("POST", "/participate", {
+            "target_id": target_id,
+            "thread_id": thread_id,
+            "draft_text": draft_text,
+        })
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._new_connection()
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Any:
+        """Send one request, retrying once if a pooled connection went stale."""
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Accept": "application/json", "Connection": "keep-alive"}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+
+        for attempt in range(2):
+            conn = self._acquire()
+            try:
+                conn.request(method, self.base_path + path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if attempt == 0:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+
+            if response.status != 200:
+                raise RuntimeError(f"{method} {path} returned HTTP {response.status}: {data[:200]!r}")
+            return json.loads(data)
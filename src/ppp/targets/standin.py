@@ -0,0 +1,231 @@
+"""Local HTTP stand-in for the participation target (load-test bed)."""
+
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+from urllib.parse import unquote
+
+from .mock import MockTarget
+
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "exponential")
+
+
+@dataclass
+class StandInConfig:
+    """Network conditions injected by the stand-in server."""
+    latency_distribution: str = "fixed"   # fixed / uniform / normal / exponential
+    latency_ms: float = 0.0               # mean (or fixed) latency per request
+    latency_jitter_ms: float = 0.0        # half-width (uniform) or stddev (normal)
+    error_rate: float = 0.0               # fraction of requests answered with HTTP 503
+    rate_limit_per_sec: Optional[float] = None  # token bucket; excess gets HTTP 429
+    payload_bytes: int = 0                # filler added to observe responses
+    threads_count: int = 3
+    replies_per_thread: int = 2
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if self.latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Invalid latency_distribution: {self.latency_distribution}")
+        if not 0.0 <= self.error_rate <= 1.0:
+            raise ValueError(f"error_rate must be within [0, 1]: {self.error_rate}")
+        if self.rate_limit_per_sec is not None and self.rate_limit_per_sec <= 0:
+            raise ValueError(f"rate_limit_per_sec must be positive: {self.rate_limit_per_sec}")
+
+
+class _TokenBucket:
+    """Thread-safe token bucket refilled at `rate` tokens per second."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return True
+            return False
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Serves discover/observe/participate with injected conditions."""
+
+    # HTTP/1.1 keeps connections open so clients can pool them
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; avoid Nagle stalling the body
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.record_connection()
+
+    def do_GET(self):
+        if self.path == "/discover":
+            self._respond(lambda: self.server.mock.discover())
+        elif self.path.startswith("/observe/"):
+            target_id = unquote(self.path[len("/observe/"):])
+            self._respond(lambda: self._observe(target_id))
+        elif self.path == "/health":
+            self._send(200, {"status": "ok"})
+        else:
+            self._send(404, {"error": f"unknown path: {self.path}"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        if self.path != "/participate":
+            self._send(404, {"error": f"unknown path: {self.path}"})
+            return
+        try:
+            request = json.loads(body or b"{}")
+        except ValueError:
+            self._send(400, {"error": "invalid JSON body"})
+            return
+        self._respond(lambda: self.server.mock.participate(
+            request.get("target_id", ""),
+            request.get("thread_id", ""),
+            request.get("draft_text", ""),
+        ))
+
+    def _observe(self, target_id: str) -> Dict[str, Any]:
+        observation = self.server.mock.observe(target_id)
+        if self.server.config.payload_bytes:
+            observation["padding"] = "x" * self.server.config.payload_bytes
+        return observation
+
+    def _respond(self, build) -> None:
+        server = self.server
+        server.record_request()
+        if server.bucket and not server.bucket.take():
+            self._send(429, {"error": "rate limited"}, {"Retry-After": "1"})
+            return
+        delay = server.sample_latency()
+        if delay:
+            time.sleep(delay)
+        if server.sample_error():
+            self._send(503, {"error": "injected failure"})
+            return
+        self._send(200, build())
+
+    def _send(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _StandInHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, config: StandInConfig):
+        super().__init__(address, _StandInHandler)
+        self.config = config
+        self.mock = MockTarget({
+            "mock_threads_count": config.threads_count,
+            "mock_replies_per_thread": config.replies_per_thread,
+        })
+        self.bucket = _TokenBucket(config.rate_limit_per_sec) if config.rate_limit_per_sec else None
+        self.rng = random.Random(config.seed)
+        self.stats = {"connections": 0, "requests": 0}
+        self.lock = threading.Lock()
+
+    def record_connection(self) -> None:
+        with self.lock:
+            self.stats["connections"] += 1
+
+    def record_request(self) -> None:
+        with self.lock:
+            self.stats["requests"] += 1
+
+    def sample_latency(self) -> float:
+        """Return the injected delay in seconds for one request."""
+        cfg = self.config
+        with self.lock:
+            if cfg.latency_distribution == "uniform":
+                ms = self.rng.uniform(cfg.latency_ms - cfg.latency_jitter_ms, cfg.latency_ms + cfg.latency_jitter_ms)
+            elif cfg.latency_distribution == "normal":
+                ms = self.rng.gauss(cfg.latency_ms, cfg.latency_jitter_ms)
+            elif cfg.latency_distribution == "exponential":
+                ms = self.rng.expovariate(1.0 / cfg.latency_ms) if cfg.latency_ms > 0 else 0.0
+            else:
+                ms = cfg.latency_ms
+        return max(0.0, ms) / 1000.0
+
+    def sample_error(self) -> bool:
+        if not self.config.error_rate:
+            return False
+        with self.lock:
+            return self.rng.random() < self.config.error_rate
+
+
+class StandInServer:
+    """
+    In-process HTTP stand-in for the participation target.
+
+    Serves the same payloads as MockTarget over real sockets, with configurable
+    latency, failure rate, rate limiting and payload size. Never talks to the
+    real site.
+
+    Usage:
+        with StandInServer(StandInConfig(latency_ms=20)) as server:
+            target = HttpTarget({"url": server.url})
+    """
+
+    def __init__(self, config: Optional[StandInConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StandInConfig()
+        self.host = host
+        self.port = port
+        self._server: Optional[_StandInHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        if not self._server:
+            raise ValueError("Stand-in server is not running")
+        return f"http://{self.host}:{self._server.server_address[1]}"
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Connections accepted and requests served so far."""
+        if not self._server:
+            return {"connections": 0, "requests": 0}
+        with self._server.lock:
+            return dict(self._server.stats)
+
+    def start(self) -> "StandInServer":
+        self._server = _StandInHTTPServer((self.host, self.port), self.config)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+            self._thread = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
@@ -29,7 +29,12 @@ from ppp.policy.engine import PolicyEvaluator, PolicyDecision
 from ppp.receipts.emitter import ReceiptEmitter
 from ppp.receipts.schema import Receipt, CanonicalSerializer
 from ppp.receipts.classification import ClassificationReceipt, ClassificationBatch
-from ppp.receipts.human_decision import HumanDecisionReceipt, HumanDecisionBatch
+from ppp.receipts.human_decision import (
+    MAX_PRINTED_DECISION_ERRORS,
+    MAX_REPORTED_DECISION_ERRORS,
+    HumanDecisionReceipt,
+    HumanDecisionBatch,
+)
 from ppp.storage.progress import ProgressStore
 from ppp.config.loader import ConfigLoader
 
@@ -489,22 +494,27 @@ class DocsCategorizationWorkflow:
 
         try:
             decisions_recorded = 0
+            errors = []
+
+            # document_id -> receipt (first one wins, as with a linear search), built once per gate
+            receipts_by_document: Dict[str, ClassificationReceipt] = {}
+            for r in self.receipts:
+                receipts_by_document.setdefault(r.document_id, r)
 
             for decision_data in decisions_data.get("decisions", []):
                 try:
                     # Find the receipt
-                    receipt = next(
-                        (r for r in self.receipts if r.document_id == decision_data.get("document_id")),
-                        None
-                    )
+                    receipt = receipts_by_document.get(decision_data.get("document_id"))
 
                     if not receipt:
-                        print(f"[DECISION WARNING] Document not found: {decision_data.get('document_id')}")
+                        errors.append({"document_id": decision_data.get("document_id"), "error": "Document not found"})
+                        if len(errors) <= MAX_PRINTED_DECISION_ERRORS:
+                            print(f"[DECISION WARNING] Document not found: {decision_data.get('document_id')}")
                         continue
 
                     # Create decision receipt
                     decision = HumanDecisionReceipt(
-                        decision_id=f"decision-{decisions_recorded}",
+                        decision_id=f"{self.workflow_id}-decision-{len(self.human_decisions)}",
                         workflow_id=self.workflow_id,
                         finding_id=receipt.receipt_id,
                         decision_type=decision_data.get("decision_type"),
@@ -517,11 +527,18 @@ class DocsCategorizationWorkflow:
                     decisions_recorded += 1
 
                 except Exception as e:
-                    print(f"[DECISION ERROR] {decision_data.get('document_id')}: {str(e)}")
+                    errors.append({"document_id": decision_data.get("document_id"), "error": str(e)})
+                    if len(errors) <= MAX_PRINTED_DECISION_ERRORS:
+                        print(f"[DECISION ERROR] {decision_data.get('document_id')}: {str(e)}")
+
+            if len(errors) > MAX_PRINTED_DECISION_ERRORS:
+                print(f"[DECISION ERROR] ... and {len(errors) - MAX_PRINTED_DECISION_ERRORS} more")
 
             result = {
                 "phase": "human_decision_gate",
                 "decisions_recorded": decisions_recorded,
+                "decisions_failed": len(errors),
+                "errors": errors[:MAX_REPORTED_DECISION_ERRORS],
                 "timestamp": datetime.utcnow().isoformat(),
             }
 
@@ -15,7 +15,7 @@ Doctrine: "Governance detects. Humans decide. Verification confirms. Receipts pr
 import os
 import json
 import re
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Iterable, Optional, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import datetime
@@ -25,7 +25,11 @@ import shutil
 from ppp.policy.engine import PolicyEvaluator, PolicyDecision
 from ppp.receipts.emitter import ReceiptEmitter
 from ppp.receipts.schema import Receipt, CanonicalSerializer
+from ppp.receipts.verify import EvidencePackVerifier
+from ppp.receipts.decision_import import IMPORT_BATCH, import_decisions, iter_decision_rows
 from ppp.receipts.human_decision import (
+    MAX_PRINTED_DECISION_ERRORS,
+    MAX_REPORTED_DECISION_ERRORS,
     HumanDecisionReceipt,
     HumanDecisionBatch,
     HumanDecisionType,
@@ -92,6 +96,9 @@ class DocsRemediationWorkflow:
 
         # State
         self.findings: List[RemediationFinding] = []
+        self.findings_by_id: Dict[str, RemediationFinding] = {}  # finding_id -> first finding with that id
+        self._findings_indexed = 0
+        self._indexed_findings = self.findings  # the list findings_by_id was built from
         self.human_decisions: List[HumanDecisionReceipt] = []
         self.applied_changes: Dict[str, str] = {}  # finding_id -> applied_text
         self.workflow_id = self._generate_workflow_id()
@@ -126,26 +133,21 @@ class DocsRemediationWorkflow:
                 if not fpath.exists():
                     raise ValueError(f"Required file missing: {fname}")
 
-            # Verify seal manifest
-            seal_manifest_path = self.evidence_pack_dir / "seal-manifest.json"
-            with open(seal_manifest_path, 'r') as f:
-                manifest = json.load(f)
-
-            # Verify file hashes
-            verified_count = 0
-            for fname, expected_hash in manifest.get("file_hashes", {}).items():
-                fpath = self.evidence_pack_dir / fname
-                if fpath.exists():
-                    actual_hash = self._compute_file_hash(fpath)
-                    if actual_hash == expected_hash:
-                        verified_count += 1
-                    else:
-                        raise ValueError(f"Hash mismatch for {fname}")
+            # Verify every manifest file hash and every receipt hash
+            report = EvidencePackVerifier(str(self.evidence_pack_dir)).verify()
+            if not report["valid"]:
+                problems = report["files_failed"] + report["receipts_failed"]
+                if report["merkle_root_valid"] is False:
+                    problems.append({"error": "merkle root mismatch"})
+                raise ValueError(f"Evidence pack verification failed: {problems[:5]}")
 
             result = {
                 "phase": "ingest_and_verify",
                 "evidence_pack": str(self.evidence_pack_dir),
-                "files_verified": verified_count,
+                "files_verified": report["files_verified"],
+                "receipts_verified": report["receipts_verified"],
+                "merkle_root_valid": report["merkle_root_valid"],
+                "throughput_mb_s": report["throughput_mb_s"],
                 "seal_valid": True,
                 "timestamp": datetime.utcnow().isoformat(),
             }
@@ -161,15 +163,6 @@ class DocsRemediationWorkflow:
         self.progress_store.complete_phase(phase_id, "completed")
         return result
 
-    @staticmethod
-    def _compute_file_hash(file_path: Path) -> str:
-        """Compute SHA256 hash of a file."""
-        sha256 = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
-                sha256.update(chunk)
-        return sha256.hexdigest()
-
     # ========== PHASE 2: NORMALIZE FINDINGS ==========
 
     def phase_normalize_findings(self) -> Dict[str, Any]:
@@ -210,6 +203,7 @@ class DocsRemediationWorkflow:
                     self.findings.append(finding)
                     findings_count += 1
 
+            self._index_findings()
             result = {
                 "phase": "normalize_findings",
                 "findings_loaded": findings_count,
@@ -250,6 +244,21 @@ class DocsRemediationWorkflow:
         else:
             return f"[POLISH] {base}"
 
+    def _index_findings(self) -> Dict[str, RemediationFinding]:
+        """
+        finding_id -> finding, extended with any findings appended since the last call.
+
+        Rebuilt from scratch when self.findings was reassigned or has shrunk.
+        """
+        if self.findings is not self._indexed_findings or len(self.findings) < self._findings_indexed:
+            self.findings_by_id = {}
+            self._findings_indexed = 0
+            self._indexed_findings = self.findings
+        for finding in self.findings[self._findings_indexed:]:
+            self.findings_by_id.setdefault(finding.finding_id, finding)
+        self._findings_indexed = len(self.findings)
+        return self.findings_by_id
+
     # ========== PHASE 3: HUMAN DECISION GATE ==========
 
     def prepare_decision_interface(self) -> Dict[str, Any]:
@@ -290,18 +299,15 @@ class DocsRemediationWorkflow:
                             modified_content: Optional[str] = None) -> HumanDecisionReceipt:
         """Record a human decision (to be called by decision authority)."""
         # Find the finding
-        finding = None
-        for f in self.findings:
-            if f.finding_id == finding_id:
-                finding = f
-                break
+        finding = self._index_findings().get(finding_id)
 
         if not finding:
             raise ValueError(f"Finding not found: {finding_id}")
 
         # Create decision receipt
         decision = HumanDecisionReceipt(
-            decision_id=f"decision-{len(self.human_decisions)}",
+            # Scoped to the workflow: human_decisions.jsonl is appended to across runs
+            decision_id=f"{self.workflow_id}-decision-{len(self.human_decisions)}",
             workflow_id=self.workflow_id,
             finding_id=finding_id,
             decision_type=decision_type,
@@ -351,6 +357,56 @@ class DocsRemediationWorkflow:
 
         return {"allowed": True}
 
+    def record_human_decisions(self, decisions: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Validate and record many decisions in one pass.
+
+        Each item holds record_human_decision keyword arguments. Invalid
+        decisions (unknown finding, rejected by policy, bad fields) are
+        skipped and reported; the rest are recorded in order.
+
+        Returns:
+            {"decisions_recorded": int, "decisions_failed": int, "errors": [...]}
+        """
+        self._index_findings()
+        recorded = 0
+        errors = []
+        for index, decision_data in enumerate(decisions):
+            try:
+                self.record_human_decision(**decision_data)
+                recorded += 1
+            except Exception as e:
+                errors.append({"index": index, "finding_id": decision_data.get("finding_id"), "error": str(e)})
+
+        return {
+            "decisions_recorded": recorded,
+            "decisions_failed": len(errors),
+            "errors": errors[:MAX_REPORTED_DECISION_ERRORS],
+        }
+
+    def import_human_decisions(self,
+                               decisions_path: str,
+                               errors_path: Optional[str] = None,
+                               receipts_path: Optional[str] = None,
+                               batch_size: int = IMPORT_BATCH) -> Dict[str, Any]:
+        """
+        Stream decisions from a JSONL or CSV file through record_human_decision.
+
+        Accepted decision receipts are appended to `receipts_path` (default:
+        <output_dir>/human_decisions.jsonl) batch by batch; their decision ids
+        carry the workflow id, so repeated imports never reuse one. Rejected
+        rows go to `errors_path` (default: <decisions file>.errors.jsonl),
+        which is rewritten on each import.
+        """
+        self._index_findings()
+        return import_decisions(
+            iter_decision_rows(decisions_path),
+            self.record_human_decision,
+            receipts_path=receipts_path or str(self.output_dir / "human_decisions.jsonl"),
+            errors_path=errors_path or f"{decisions_path}.errors.jsonl",
+            batch_size=batch_size,
+        )
+
     # ========== PHASE 4: APPLY AUTHORIZED CHANGES ==========
 
     def phase_apply_authorized_changes(self) -> Dict[str, Any]:
@@ -361,10 +417,11 @@ class DocsRemediationWorkflow:
         changes_rejected = 0
 
         try:
+            findings_by_id = self._index_findings()
             for decision in self.human_decisions:
                 if decision.decision_type in ["ACCEPT", "MODIFY"]:
                     # Find the finding
-                    finding = next((f for f in self.findings if f.finding_id == decision.finding_id), None)
+                    finding = findings_by_id.get(decision.finding_id)
                     if not finding:
                         continue
 
@@ -575,16 +632,20 @@ class DocsRemediationWorkflow:
             execution_log["phases"]["normalize_findings"] = self.phase_normalize_findings()
             print(f"[PHASE] normalize_findings: {execution_log['phases']['normalize_findings']['findings_loaded']} findings")
 
-            # Phase 3: Record decisions
-            decisions_recorded = 0
-            for decision_data in decisions_data.get("decisions", []):
-                try:
-                    self.record_human_decision(**decision_data)
-                    decisions_recorded += 1
-                except Exception as e:
-                    print(f"[DECISION ERROR] {decision_data.get('finding_id')}: {str(e)}")
-
-            print(f"[PHASE] human_decision_gate: {decisions_recorded} decisions recorded")
+            # Phase 3: Record decisions (inline, or streamed from a JSONL/CSV "decisions_file")
+            if decisions_data.get("decisions_file"):
+                gate = self.import_human_decisions(decisions_data["decisions_file"])
+                if gate["decisions_rejected"]:
+                    print(f"[DECISION ERROR] {gate['decisions_rejected']} rejected, see {gate['errors_path']}")
+            else:
+                gate = self.record_human_decisions(decisions_data.get("decisions", []))
+                for error in gate["errors"][:MAX_PRINTED_DECISION_ERRORS]:
+                    print(f"[DECISION ERROR] {error['finding_id']}: {error['error']}")
+                if gate["decisions_failed"] > MAX_PRINTED_DECISION_ERRORS:
+                    print(f"[DECISION ERROR] ... and {gate['decisions_failed'] - MAX_PRINTED_DECISION_ERRORS} more")
+            execution_log["phases"]["human_decision_gate"] = gate
+
+            print(f"[PHASE] human_decision_gate: {gate['decisions_recorded']} decisions recorded")
 
             # Phase 4: Apply
             execution_log["phases"]["apply_authorized_changes"] = self.phase_apply_authorized_changes()
@@ -0,0 +1,358 @@
+"""
+Journaled, parallel file mover for placement (Phase 6) changes.
+
+Moves are grouped by source -> target repo. Within a group a move is a
+hard link of the source at the target (then the source is unlinked) when
+both repos are on the same filesystem, otherwise a copy that hashes the
+source while streaming it to a temp file beside the target, fsyncs and
+links it into place, re-reads the target once to verify the hash, then
+unlinks the source. Targets are always created exclusively, never replaced,
+and two moves into one target path are both rejected up front, so no move
+can overwrite another's file. Moves run on a thread pool.
+
+Moves are journaled write-ahead in a JSONL journal (the movement audit
+log): an "intent" entry is fsynced before a move touches the disk and its
+outcome ("success"/"failed") is fsynced after. The latest entry per move
+is its state. Re-running with the same journal skips journaled successes,
+and only a move left at "intent" by a crash is finished from the on-disk
+state: a missing source with a present target counts as moved, and a
+leftover source whose content equals the target is unlinked.
+"""
+
+import errno
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path, PurePosixPath
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+from ..storage.journal import JsonlJournal, iter_journal
+from .parallel import run_bounded
+
+READ_CHUNK = 1 << 20  # 1 MiB copy/hash chunks
+INTENT = "intent"  # journal status of a move that has started but not finished
+
+# Escaped backslash/quote pairs (kept) or a lone backslash (a raw Windows path separator)
+_BACKSLASHES = re.compile(r'\\[\\"]|\\')
+
+
+def load_file_decisions(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream decisions from file_decisions.jsonl.
+
+    Lines written with raw Windows separators (e.g. "docs\\landing.md" with a
+    single backslash) are not valid JSON; those lines are re-read with lone
+    backslashes escaped.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                try:
+                    yield json.loads(_BACKSLASHES.sub(lambda m: m.group() if len(m.group()) == 2 else '\\\\', line))
+                except ValueError as e:
+                    raise ValueError(f"{path}:{line_no}: malformed decision: {e}") from e
+
+
+@dataclass(frozen=True)
+class FileMove:
+    """One approved move of a document between repos."""
+    document_id: str
+    directive: str
+    source_repo: str
+    target_repo: str
+    rel_path: str  # POSIX path relative to the repo root
+
+    @classmethod
+    def from_decision(cls, decision: Dict[str, Any]) -> "FileMove":
+        document_id = decision['document_id']
+        source_repo = decision['source_repo']
+        rel_path = str(PurePosixPath(document_id.replace('\\', '/')))
+        if rel_path.startswith(f"{source_repo}/"):
+            rel_path = rel_path[len(source_repo) + 1:]
+        return cls(document_id, decision['assigned_directive'], source_repo, decision['target_repo'], rel_path)
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return (self.document_id, self.target_repo)
+
+    @property
+    def target_key(self) -> Tuple[str, str]:
+        """Target path identity (case-folded where the OS folds case)."""
+        return (self.target_repo, os.path.normcase(self.rel_path))
+
+
+def plan_moves(moves: Iterable[FileMove]) -> Tuple[List[FileMove], Dict[Tuple[str, str], List[str]]]:
+    """
+    Moves in first-seen order with repeats of the same move dropped, and the
+    target paths claimed by more than one document (target_key -> document ids).
+
+    Moving two documents onto one path would leave only one of them, so
+    every move into a contested target is rejected rather than picking one.
+    """
+    planned: Dict[Tuple[str, str], FileMove] = {}
+    claims: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+    for move in moves:
+        if move.key in planned:
+            continue
+        planned[move.key] = move
+        claims[move.target_key].append(move.document_id)
+    contested = {target: ids for target, ids in claims.items() if len(ids) > 1}
+    return list(planned.values()), contested
+
+
+def group_moves(moves: Iterable[FileMove]) -> Dict[Tuple[str, str], List[FileMove]]:
+    """Moves grouped by (source_repo, target_repo), in first-seen order."""
+    groups: Dict[Tuple[str, str], List[FileMove]] = defaultdict(list)
+    for move in moves:
+        groups[(move.source_repo, move.target_repo)].append(move)
+    return dict(groups)
+
+
+def read_journal(journal_path: Path) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Latest journal entry per move key (document_id, target_repo).
+
+    The journal is append-only, so a move that failed and later succeeded
+    (or was retried) is represented by its last entry only.
+    """
+    return {(entry["document_id"], entry["target_repo"]): entry for entry in iter_journal(journal_path)}
+
+
+def _sha256(path: Path) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            chunk = f.read(READ_CHUNK)
+            if not chunk:
+                break
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _device(path: Path) -> int:
+    """st_dev of path, or of its nearest existing ancestor (target dirs may not exist yet)."""
+    for candidate in (path, *path.parents):
+        if candidate.exists():
+            return os.stat(candidate).st_dev
+    return os.stat('.').st_dev
+
+
+# link() errors meaning "not possible here" rather than "target exists"
+_NO_LINK = {errno.EXDEV, errno.EPERM, errno.EACCES, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP}
+
+
+def _publish(tmp: str, target: Path) -> None:
+    """
+    Put the finished temp file at `target` without ever replacing a file there.
+
+    Hard-links it into place (FileExistsError if the target exists); where
+    links are unsupported the target name is first claimed with O_EXCL and
+    the temp file replaces that empty placeholder.
+    """
+    try:
+        os.link(tmp, target)
+    except OSError as e:
+        if e.errno not in _NO_LINK:
+            raise
+        os.close(os.open(target, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+        os.replace(tmp, target)
+    else:
+        os.unlink(tmp)
+
+
+def copy_verified(source: Path, target: Path) -> Tuple[str, int]:
+    """
+    Copy source to a new target atomically and verify it; returns (sha256, size).
+
+    The source is read once (hashed while copied); the target is read once
+    to verify. Raises FileExistsError if the target appeared meanwhile and
+    RuntimeError when the verification hash differs.
+    """
+    sha256 = hashlib.sha256()
+    size = 0
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".moving")
+    try:
+        with open(source, 'rb', buffering=0) as src, os.fdopen(fd, 'wb') as dst:
+            while True:
+                chunk = src.read(READ_CHUNK)
+                if not chunk:
+                    break
+                sha256.update(chunk)
+                dst.write(chunk)
+                size += len(chunk)
+            dst.flush()
+            os.fsync(dst.fileno())
+        shutil.copystat(source, tmp)
+        _publish(tmp, target)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    digest = sha256.hexdigest()
+    if _sha256(target) != digest:
+        raise RuntimeError(f"Hash verification failed for {target}")
+    return digest, size
+
+
+class FileMover:
+    """
+    Execute FileMoves between repo checkouts with a resumable journal.
+
+    Failures (missing source, conflicting target, I/O errors) are journaled
+    and reported per move; they never stop the remaining moves.
+    """
+
+    def __init__(self, repos: Dict[str, str], journal_path: str, workers: Optional[int] = None):
+        self.repos = {name: Path(path) for name, path in repos.items()}
+        self.journal_path = Path(journal_path)
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self._journal: Optional[JsonlJournal] = None
+
+    def move_all(self, moves: Iterable[FileMove]) -> Dict[str, Any]:
+        """
+        Run all moves and return {"results": [journal entry per move], "summary": {...}}.
+
+        Moves whose latest journal entry is a success are not touched and
+        are reported with status "already_moved" (not re-journaled). Moves
+        into a target path another document also claims (see plan_moves)
+        are journaled as failed without touching the disk.
+        """
+        moves, contested = plan_moves(moves)
+        latest = read_journal(self.journal_path)
+        results: List[Dict[str, Any]] = []
+        counts = {"success": 0, "already_moved": 0, "failed": 0}
+        bytes_copied = 0
+        started = time.perf_counter()
+
+        def report(entry: Dict[str, Any]) -> None:
+            nonlocal bytes_copied
+            counts[entry["status"]] += 1
+            if entry.get("method") == "copy":
+                bytes_copied += entry["size"]
+            results.append(entry)
+
+        def pending() -> Iterator[Tuple[FileMove, bool, bool]]:
+            """Moves to run as (move, same_fs, interrupted); settled ones are reported here."""
+            for (source_repo, target_repo), group in group_moves(moves).items():
+                same_fs = self._same_filesystem(source_repo, target_repo)
+                for move in group:
+                    status = latest.get(move.key, {}).get("status")
+                    if status == "success":
+                        report(self._entry(move, "already_moved"))
+                    elif move.target_key in contested:
+                        others = [d for d in contested[move.target_key] if d != move.document_id]
+                        entry = self._entry(move, "failed", reason=(
+                            f"duplicate target {move.target_repo}/{move.rel_path} (also claimed by {', '.join(others)})"
+                        ))
+                        self._journal.append(entry)
+                        report(entry)
+                    else:
+                        yield move, same_fs, status == INTENT
+
+        with JsonlJournal(self.journal_path) as journal, ThreadPoolExecutor(max_workers=self.workers) as pool:
+            self._journal = journal
+            try:
+                run_bounded(pool, self._run_move, pending(), lambda task, entry: report(entry), 2 * self.workers)
+            finally:
+                pool.shutdown(wait=True)  # workers journal through self._journal until they finish
+                self._journal = None
+
+        elapsed = time.perf_counter() - started
+        return {
+            "results": results,
+            "summary": {
+                **counts,
+                "total": len(results),
+                "bytes_copied": bytes_copied,
+                "elapsed_seconds": round(elapsed, 4),
+                "moves_per_second": round(len(results) / elapsed) if elapsed else None,
+                "journal": str(self.journal_path),
+            },
+        }
+
+    def _run_move(self, task: Tuple[FileMove, bool, bool]) -> Dict[str, Any]:
+        entry = self._move_one(*task)
+        self._journal.append(entry)
+        return entry
+
+    def _same_filesystem(self, source_repo: str, target_repo: str) -> bool:
+        try:
+            return _device(self.repos[source_repo]) == _device(self.repos[target_repo])
+        except (KeyError, OSError):
+            return False  # decided per move (unknown repos fail there)
+
+    def _entry(self, move: FileMove, status: str, **fields) -> Dict[str, Any]:
+        return {
+            "timestamp": datetime.utcnow().isoformat(),
+            "directive": move.directive,
+            "document_id": move.document_id,
+            "source_repo": move.source_repo,
+            "target_repo": move.target_repo,
+            "status": status,
+            **fields,
+        }
+
+    def _move_one(self, move: FileMove, same_fs: bool, interrupted: bool = False) -> Dict[str, Any]:
+        """
+        Move one file and return its outcome entry (journaled by the caller).
+
+        The intent entry is journaled here, before anything on disk changes.
+        `interrupted` (the journal ends at an intent for this move) is the only
+        case where an already present target is taken as this move's own work.
+        """
+        try:
+            if move.source_repo not in self.repos or move.target_repo not in self.repos:
+                raise ValueError(f"Unknown repo: {move.source_repo if move.source_repo not in self.repos else move.target_repo}")
+            source = self.repos[move.source_repo] / move.rel_path
+            target = self.repos[move.target_repo] / move.rel_path
+            paths = {"source_path": str(source), "target_path": str(target)}
+
+            if interrupted and target.exists():
+                if not source.exists():
+                    # Moved by the interrupted run before its outcome was journaled
+                    return self._entry(move, "success", method="recovered", **paths)
+                if _sha256(source) == _sha256(target):
+                    # Copied by the interrupted run before the source was unlinked
+                    source.unlink()
+                    return self._entry(move, "success", method="recovered", **paths)
+
+            if not source.exists():
+                return self._entry(move, "failed", reason="source file not found", **paths)
+            if target.exists():
+                return self._entry(move, "failed", reason="target already exists", **paths)
+
+            self._journal.append(self._entry(move, INTENT, **paths))
+
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if same_fs:
+                size = source.stat().st_size
+                try:
+                    os.link(source, target)  # exclusive, unlike rename
+                except FileExistsError:
+                    return self._entry(move, "failed", reason="target already exists", **paths)
+                except OSError as e:
+                    if e.errno not in _NO_LINK:
+                        raise
+                else:
+                    source.unlink()
+                    return self._entry(move, "success", method="link", size=size, **paths)
+            try:
+                digest, size = copy_verified(source, target)
+            except FileExistsError:
+                return self._entry(move, "failed", reason="target already exists", **paths)
+            source.unlink()
+            return self._entry(move, "success", method="copy", sha256=digest, size=size, **paths)
+        except Exception as e:
+            return self._entry(move, "failed", reason=str(e))
@@ -22,30 +22,201 @@ Invariants:
 
 import sys
 import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
+from typing import List, Dict, Any, Iterator, Optional, Set
 import hashlib
 
 if sys.stdout.encoding != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from ppp.receipts.remediation_receipt import (
+from ..receipts.remediation_receipt import (
     RemediationReceipt,
     RemediationBatch,
+    RemediationSuggestion,
     RemediationAuditRecord,
     RemediationClassificationRecord,
     RemediationPolicyEvaluationRecord,
 )
-from ppp.evaluators.language_remediation_evaluator import LanguageRemediationEvaluator
+from ..evaluators.language_remediation_evaluator import LanguageRemediationEvaluator
+from .file_mover import FileMove, load_file_decisions
+from .parallel import run_bounded
+
+# Repo the manifest itself lives in; its files resolve against the manifest's directory
+MANIFEST_REPO = "omega-docs"
+# Authoritative per-file directive assignments (relative to the manifest's directory)
+FILE_DECISIONS = Path("EVIDENCE") / "docs-categorization" / "decisions" / "file_decisions.jsonl"
+MAX_CONTEXT_SNIPPETS = 20
+MAX_SAMPLE_CHANGES = 20
+
+# Record streams written to the evidence dir as files complete
+STREAM_FILES = {
+    "audit": "audit_records.jsonl",
+    "classification": "classification_records.jsonl",
+    "policy_evaluation": "policy_evaluations.jsonl",
+}
+
+_DIRECTIVE_HEADING = re.compile(r'^#{2,4}\s+Directive\s+([A-Z])\b')
+_LOCATION = re.compile(r'^\*\*Current Location:\*\*\s*([\w.-]+)')
+_FILE_ITEM = re.compile(r'^\s*(?:[-*]|\d+\.)\s+`([^`\s]+\.\w+)`')
+
+
+def parse_remediation_manifest(text: str) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Per-directive file lists from REMEDIATION_TASK_MANIFEST.md.
+
+    Collects backticked file paths listed under every "Directive X" heading
+    (a directive may appear in several sections). Paths are made relative to
+    the directive's repo ("Current Location", else the path's first
+    component) and de-duplicated in first-seen order.
+    """
+    files: Dict[str, List[Dict[str, str]]] = {}
+    repos: Dict[str, str] = {}
+    seen: Set[tuple] = set()
+    directive = None
+    for line in text.splitlines():
+        heading = _DIRECTIVE_HEADING.match(line)
+        if heading:
+            directive = heading.group(1)
+            files.setdefault(directive, [])
+            continue
+        if line.startswith('#'):
+            directive = None
+            continue
+        if directive is None:
+            continue
+        location = _LOCATION.match(line)
+        if location:
+            repos.setdefault(directive, location.group(1))
+            continue
+        item = _FILE_ITEM.match(line)
+        if item:
+            path = item.group(1).replace('\\', '/')
+            head, _, rest = path.partition('/')
+            repo = repos.get(directive)
+            if rest and (repo is None or head == repo):
+                repo, path = head, rest
+            entry = {"path": path, "repo": repo or MANIFEST_REPO}
+            if (directive, entry["repo"], path) not in seen:
+                seen.add((directive, entry["repo"], path))
+                files[directive].append(entry)
+    return files
+
+
+def load_directive_files(decisions_path: str, directives) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Per-directive file lists from file_decisions.jsonl (`assigned_directive`).
+
+    Files are listed against their target repo (where Phase 6 placed them),
+    de-duplicated in first-seen order. Only `directives` are collected.
+    """
+    wanted = set(directives)
+    files: Dict[str, List[Dict[str, str]]] = {}
+    seen: Set[tuple] = set()
+    for decision in load_file_decisions(decisions_path):
+        if decision.get('assigned_directive') not in wanted:
+            continue
+        move = FileMove.from_decision(decision)
+        if (move.directive, move.target_repo, move.rel_path) not in seen:
+            seen.add((move.directive, move.target_repo, move.rel_path))
+            files.setdefault(move.directive, []).append({"path": move.rel_path, "repo": move.target_repo})
+    return files
+
+
+_evaluators: Dict[str, LanguageRemediationEvaluator] = {}
+
+
+def audit_remediation_file(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Phases 1-3 for one file (runs in a worker): read, hash, detect, classify, evaluate.
+
+    Returns the three record dicts, or {"error": ...} when the file cannot be read.
+    """
+    evaluator = _evaluators.get(task["policy_path"])
+    if evaluator is None:
+        evaluator = _evaluators[task["policy_path"]] = LanguageRemediationEvaluator(task["policy_path"])
+
+    directive_id = task["directive_id"]
+    try:
+        with open(task["abs_path"], 'rb') as f:
+            raw = f.read()
+    except OSError as e:
+        return {"task": task, "error": f"{type(e).__name__}: {e}"}
+    content = raw.decode('utf-8', errors='replace')
+    timestamp = datetime.utcnow().isoformat()
+    suffix = f"{directive_id}-{task['index']:05d}"
+
+    claims = evaluator.detect_guarantee_claims(content, directive_id)
+    classification = evaluator.classify_claims(claims)
+    evaluation = evaluator.evaluate_policy(claims, directive_id)
+    # Detected claims carry their rule index, so there is one suggestion per claim
+    suggestions = [
+        RemediationSuggestion(
+            claim_text=s["claim_text"],
+            claim_type=s["claim_type"],
+            confidence=s["confidence"],
+            suggested_replacement=s["suggested_replacement"],
+            replacement_confidence=s["replacement_confidence"],
+            line_number=s["line_number"],
+            context_before=s["context"],
+            context_after=claim.context_after,
+        )
+        for claim, s in zip(claims, evaluator.suggest_replacements(claims, directive_id))
+    ]
+
+    audit = RemediationAuditRecord(
+        audit_id=f"audit-{suffix}",
+        document_id=task["document_id"],
+        directive_id=directive_id,
+        source_repo=task["repo"],
+        file_path=task["path"],
+        file_hash_pre=hashlib.sha256(raw).hexdigest(),
+        guarantee_claims_found=len(claims),
+        context_snippets=[c.text for c in claims[:MAX_CONTEXT_SNIPPETS]],
+        timestamp=timestamp,
+    )
+    classified = RemediationClassificationRecord(
+        classification_id=f"classification-{suffix}",
+        audit_id=audit.audit_id,
+        document_id=task["document_id"],
+        directive_id=directive_id,
+        claim_count=classification["claim_count"],
+        claims_by_type=classification["by_type"],
+        confidence_distribution=classification["confidence_distribution"],
+        suggested_remediations=suggestions,
+        timestamp=timestamp,
+    )
+    evaluated = RemediationPolicyEvaluationRecord(
+        evaluation_id=f"evaluation-{suffix}",
+        classification_id=classified.classification_id,
+        document_id=task["document_id"],
+        directive_id=directive_id,
+        policy_decision=evaluation["policy_decision"],
+        claims_proceeding=evaluation["claims_proceeding"],
+        claims_requiring_review=evaluation["claims_requiring_review"],
+        claims_blocked=evaluation["claims_blocked"],
+        violated_rules=evaluation["violation_reasons"],
+        applicable_policy_rules=evaluation["applicable_rules"],
+        confidence_distribution=classification["confidence_distribution"],
+        timestamp=timestamp,
+    )
+    return {
+        "task": task,
+        "audit": audit.to_dict(),
+        "classification": classified.to_dict(),
+        "policy_evaluation": evaluated.to_dict(),
+    }
 
 
 class LanguageRemediationWorkflow:
     """6-phase language remediation workflow."""
 
-    def __init__(self, manifest_path: str, policy_path: str, evidence_dir: str):
+    def __init__(self, manifest_path: str, policy_path: str, evidence_dir: str,
+                 workers: Optional[int] = None, repo_roots: Optional[Dict[str, str]] = None,
+                 decisions_path: Optional[str] = None):
         """
         Initialize workflow.
 
@@ -53,18 +224,33 @@ class LanguageRemediationWorkflow:
             manifest_path: Path to REMEDIATION_TASK_MANIFEST.md
             policy_path: Path to policy.language-remediation.yaml
             evidence_dir: Directory for evidence output
+            workers: Audit processes (default: CPU count; 1 runs inline)
+            repo_roots: Checkout directory per repo name (default: the manifest's
+                directory for omega-docs, sibling directories for other repos)
+            decisions_path: file_decisions.jsonl with the full per-directive file
+                lists (default: FILE_DECISIONS beside the manifest, if present)
         """
         self.manifest_path = Path(manifest_path)
         self.policy_path = Path(policy_path)
         self.evidence_dir = Path(evidence_dir)
         self.evidence_dir.mkdir(parents=True, exist_ok=True)
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.repo_roots = {name: Path(root) for name, root in (repo_roots or {}).items()}
+        self.decisions_path = Path(decisions_path) if decisions_path else self.manifest_path.parent / FILE_DECISIONS
 
         self.evaluator = LanguageRemediationEvaluator(str(policy_path))
         self.files_to_remediate = self._load_manifest()
 
     def _load_manifest(self) -> dict:
         """
-        Load REMEDIATION_TASK_MANIFEST.md and extract file list.
+        Load the per-directive file lists.
+
+        The manifest only samples some directives' files (Directive C points
+        to file_decisions.jsonl for its full list), so lists come from the
+        decisions file when it assigns files to a directive, and from the
+        manifest otherwise. Raises ValueError when a list's length differs
+        from the directive's policy `file_count`, rather than silently
+        auditing a subset.
 
         Returns:
             {
@@ -73,18 +259,66 @@ class LanguageRemediationWorkflow:
                 "K": [...]
             }
         """
-        # Read manifest and extract file list per directive
-        # For now, return placeholder structure
-        return {
-            "C": [],
-            "G": [],
-            "K": []
-        }
+        if not self.manifest_path.is_file():
+            raise ValueError(f"Remediation manifest not found: {self.manifest_path}")
+        directives = self.evaluator.policy['directives']
+        parsed = parse_remediation_manifest(self.manifest_path.read_text(encoding='utf-8'))
+        if self.decisions_path.is_file():
+            parsed.update(load_directive_files(str(self.decisions_path), directives))
+
+        files = {directive_id: parsed.get(directive_id, []) for directive_id in directives}
+        mismatched = [
+            f"Directive {directive_id}: {len(files[directive_id])} files listed, policy file_count is {config['file_count']}"
+            for directive_id, config in directives.items()
+            if config.get('file_count') is not None and len(files[directive_id]) != config['file_count']
+        ]
+        if mismatched:
+            raise ValueError(
+                f"Remediation file lists do not match policy ({self.manifest_path}, {self.decisions_path}): "
+                + "; ".join(mismatched)
+            )
+        return files
+
+    def _repo_root(self, repo: str) -> Path:
+        if repo in self.repo_roots:
+            return self.repo_roots[repo]
+        if repo == MANIFEST_REPO:
+            return self.manifest_path.parent
+        return self.manifest_path.parent.parent / repo
+
+    def _tasks(self) -> Iterator[Dict[str, Any]]:
+        index = 0
+        for directive_id, files in self.files_to_remediate.items():
+            for entry in files:
+                yield {
+                    "index": index,
+                    "directive_id": directive_id,
+                    "repo": entry["repo"],
+                    "path": entry["path"],
+                    "document_id": f"{entry['repo']}/{entry['path']}",
+                    "abs_path": str(self._repo_root(entry["repo"]) / entry["path"]),
+                    "policy_path": str(self.policy_path),
+                }
+                index += 1
+
+    def _audit_files(self, collect) -> None:
+        """Run audit_remediation_file over every task, calling `collect` as each completes."""
+        if self.workers == 1:
+            for task in self._tasks():
+                collect(audit_remediation_file(task))
+            return
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            run_bounded(
+                pool, audit_remediation_file, self._tasks(), lambda task, result: collect(result), 2 * self.workers
+            )
 
     def run_audit_only(self) -> dict:
         """
         Execute Phases 1-4 (audit-only, no changes).
 
+        Phases 1-3 run per file in a process pool; records are appended to the
+        JSONL streams in STREAM_FILES as files complete.
+
         Returns RemediationReport with PROCEED/REVIEW/BLOCK breakdown.
         """
         print("=" * 80)
@@ -92,60 +326,79 @@ class LanguageRemediationWorkflow:
         print("=" * 80)
         print()
 
-        audit_records = {}
-        classification_records = {}
-        policy_evaluations = {}
+        directives = list(self.files_to_remediate)
+        audit_records = {d: [] for d in directives}
+        classification_records = {d: [] for d in directives}
+        policy_evaluations = {d: [] for d in directives}
         summary = {
             "total_files": 0,
             "directives": {
-                "C": {"total": 0, "proceeding": 0, "review": 0, "block": 0},
-                "G": {"total": 0, "proceeding": 0, "review": 0, "block": 0},
-                "K": {"total": 0, "proceeding": 0, "review": 0, "block": 0},
+                d: {"total": len(self.files_to_remediate[d]), "proceeding": 0, "review": 0, "block": 0, "missing": 0}
+                for d in directives
             },
             "total_claims": 0,
             "claims_proceeding": 0,
             "claims_review": 0,
             "claims_blocked": 0,
         }
+        missing_files = []
+        sample_changes = []
+        file_decision_keys = {"PROCEED": "proceeding", "REVIEW": "review", "BLOCK": "block"}
 
-        # Phase 1: Audit
-        print("[PHASE 1] Auditing files for guarantee language...")
-        print()
-
-        for directive_id in ["C", "G", "K"]:
-            print(f"Directive {directive_id}:")
-            # Placeholder for actual file reading and audit
-            # In real execution, would read files from repos and extract guarantee language
-            audit_records[directive_id] = []
-            classification_records[directive_id] = []
-            policy_evaluations[directive_id] = []
-            summary["directives"][directive_id]["total"] = self.evaluator.policy['directives'][directive_id]['file_count']
-            print(f"  Files to audit: {summary['directives'][directive_id]['total']}")
-            print()
-
+        # Phases 1-3: Audit, Classify, Policy Evaluate (per file, in parallel)
+        print(f"[PHASES 1-3] Auditing, classifying and evaluating files ({self.workers} workers)...")
         print()
-        print("=" * 80)
-        print("[PHASE 2] Classifying guarantee claims...")
-        print("=" * 80)
-        print()
-
-        # Phase 2: Classify
-        for directive_id in ["C", "G", "K"]:
-            print(f"Directive {directive_id}: classifying claims...")
-            # Placeholder: actual classification would process detected claims
-            classification_records[directive_id] = []
-
-        print()
-        print("=" * 80)
-        print("[PHASE 3] Evaluating policy rules...")
-        print("=" * 80)
+        for directive_id in directives:
+            print(f"Directive {directive_id}: {summary['directives'][directive_id]['total']} files to audit")
         print()
 
-        # Phase 3: Policy Evaluate
-        for directive_id in ["C", "G", "K"]:
-            print(f"Directive {directive_id}: applying fail-closed rules...")
-            # Placeholder: actual evaluation would apply policy
-            policy_evaluations[directive_id] = []
+        streams = {kind: open(self.evidence_dir / name, 'w', encoding='utf-8') for kind, name in STREAM_FILES.items()}
+
+        def collect(result: Dict[str, Any]) -> None:
+            task = result["task"]
+            directive_id = task["directive_id"]
+            counts = summary["directives"][directive_id]
+            if "error" in result:
+                counts["missing"] += 1
+                missing_files.append({"document_id": task["document_id"], "directive_id": directive_id, "error": result["error"]})
+                return
+            for kind, stream in streams.items():
+                stream.write(json.dumps(result[kind]) + "\n")
+            audit_records[directive_id].append(result["audit"])
+            classification_records[directive_id].append(result["classification"])
+            evaluation = result["policy_evaluation"]
+            policy_evaluations[directive_id].append(evaluation)
+
+            summary["total_files"] += 1
+            counts[file_decision_keys[evaluation["policy_decision"]]] += 1
+            summary["total_claims"] += result["audit"]["guarantee_claims_found"]
+            summary["claims_proceeding"] += evaluation["claims_proceeding"]
+            summary["claims_review"] += evaluation["claims_requiring_review"]
+            summary["claims_blocked"] += evaluation["claims_blocked"]
+            for suggestion in result["classification"]["suggested_remediations"]:
+                if len(sample_changes) >= MAX_SAMPLE_CHANGES:
+                    break
+                sample_changes.append({
+                    "document_id": task["document_id"],
+                    "line_number": suggestion["line_number"],
+                    "before": suggestion["claim_text"],
+                    "replacement": suggestion["suggested_replacement"],
+                    "confidence": suggestion["replacement_confidence"],
+                })
+
+        try:
+            self._audit_files(collect)
+        finally:
+            for stream in streams.values():
+                stream.close()
+
+        for directive_id in directives:
+            counts = summary["directives"][directive_id]
+            print(f"Directive {directive_id}: {counts['proceeding']} PROCEED, {counts['review']} REVIEW, "
+                  f"{counts['block']} BLOCK, {counts['missing']} missing")
+        print(f"  Claims found: {summary['total_claims']}")
+        for missing in missing_files:
+            print(f"  [MISSING] {missing['document_id']}: {missing['error']}")
 
         print()
         print("=" * 80)
@@ -158,13 +411,17 @@ class LanguageRemediationWorkflow:
             "report_id": f"remediation-report-{datetime.utcnow().strftime('%Y-%m-%dT%H-%M-%S')}",
             "phase": "4-drift-report",
             "scope": "REMEDIATION_TASK_MANIFEST.md",
-            "directives_covered": ["C", "G", "K"],
-            "files_total": summary["directives"]["C"]["total"] + summary["directives"]["G"]["total"] + summary["directives"]["K"]["total"],
-            "files_proceeding": 0,
-            "files_requiring_review": 0,
-            "files_blocked": 0,
+            "directives_covered": directives,
+            "files_total": sum(counts["total"] for counts in summary["directives"].values()),
+            "files_audited": summary["total_files"],
+            "files_proceeding": sum(counts["proceeding"] for counts in summary["directives"].values()),
+            "files_requiring_review": sum(counts["review"] for counts in summary["directives"].values()),
+            "files_blocked": sum(counts["block"] for counts in summary["directives"].values()),
+            "files_missing": missing_files,
             "files_per_directive": summary["directives"],
-            "sample_changes": [],
+            "claims_total": summary["total_claims"],
+            "sample_changes": sample_changes,
+            "record_streams": {kind: str(self.evidence_dir / name) for kind, name in STREAM_FILES.items()},
             "authority": "User",
             "timestamp": datetime.utcnow().isoformat(),
             "fail_closed_principles": self.evaluator.policy["fail_closed_principles"],
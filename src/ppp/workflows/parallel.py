@@ -0,0 +1,30 @@
+"""Bounded submission to a thread or process pool."""
+
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Any, Callable, Dict, Iterable
+
+
+def run_bounded(
+    pool: Executor,
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    collect: Callable[[Any, Any], None],
+    limit: int,
+) -> None:
+    """
+    Run `func(item)` on `pool` for every item, with at most `limit` in flight.
+
+    `items` is consumed lazily, so a large (or generated) work list never
+    becomes a backlog of queued futures. `collect(item, result)` runs on the
+    calling thread as futures complete; an exception from `func` is raised
+    there.
+    """
+    in_flight: Dict[Future, Any] = {}
+    for item in items:
+        in_flight[pool.submit(func, item)] = item
+        if len(in_flight) >= limit:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                collect(in_flight.pop(future), future.result())
+    for future in wait(in_flight).done:
+        collect(in_flight[future], future.result())
@@ -0,0 +1,44 @@
+"""Shared fixtures for the PPP tests."""
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.ppp.config import cache as policy_cache_module
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+
+@pytest.fixture(autouse=True)
+def private_policy_cache(tmp_path, monkeypatch):
+    """Keep policy pickles out of ~/.cache: each test gets its own cache dir."""
+    cache_dir = tmp_path / "policy-cache"
+    monkeypatch.setenv("PPP_CACHE_DIR", str(cache_dir))
+    # The shared cache was built at import time, before the variable was set
+    monkeypatch.setattr(policy_cache_module.policy_cache, "cache_dir", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture
+def src_ppp(monkeypatch):
+    """
+    Import function for modules that use `ppp.*` imports from src/.
+
+    This test package is itself named `ppp` and shadows src/ppp while pytest
+    runs; both are swapped for the duration of the test.
+    """
+    def is_ppp(name):
+        return name == "ppp" or name.startswith("ppp.")
+
+    saved = {name: module for name, module in sys.modules.items() if is_ppp(name)}
+    for name in saved:
+        del sys.modules[name]
+    monkeypatch.syspath_prepend(str(SRC))
+    try:
+        yield importlib.import_module
+    finally:
+        for name in [n for n in sys.modules if is_ppp(n)]:
+            del sys.modules[name]
+        sys.modules.update(saved)
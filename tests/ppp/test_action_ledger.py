@@ -0,0 +1,98 @@
+"""Tests for the PT-013 hash-chained action ledger."""
+
+import importlib.util
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+_MODULE = Path(__file__).resolve().parents[2] / "ops" / "proof" / "pt013" / "action_ledger.py"
+_spec = importlib.util.spec_from_file_location("action_ledger", _MODULE)
+action_ledger = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(action_ledger)
+
+ActionLedger = action_ledger.ActionLedger
+verify_ledger = action_ledger.verify_ledger
+
+
+@dataclass
+class Action:
+    action_id: str
+    seq: int
+    action_type: str = "collaborate"
+    receipt_rhid: Optional[str] = None
+    prev_action_hash: Optional[str] = None
+
+
+def _append(ledger, start, stop):
+    for seq in range(start, stop):
+        ledger.append(Action(f"action-{seq}", seq))
+
+
+def test_append_links_actions_and_verifies(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    with ActionLedger(path) as ledger:
+        first = ledger.append(Action("action-1", 1))
+        second_action = Action("action-2", 2)
+        ledger.append(second_action)
+        with pytest.raises(ValueError, match="seq must increase"):
+            ledger.append(Action("action-3", 2))
+    assert second_action.prev_action_hash == first
+    assert second_action.receipt_rhid.startswith("rhid:receipt:")
+
+    result = verify_ledger(path)
+    assert result["valid"] and result["count"] == 2 and result["head_hash"] == ledger.head
+
+
+def test_tampered_line_is_detected(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    with ActionLedger(path) as ledger:
+        _append(ledger, 1, 4)
+    lines = path.read_bytes().splitlines(keepends=True)
+    lines[1] = lines[1].replace(b"action-2", b"action-X")
+    path.write_bytes(b"".join(lines))
+    assert verify_ledger(path)["error"] == "line 2: hash mismatch"
+
+
+def test_truncation_is_detected_by_verify_and_on_reopen(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    with ActionLedger(path) as ledger:
+        _append(ledger, 1, 4)
+    path.write_bytes(b"".join(path.read_bytes().splitlines(keepends=True)[:2]))
+
+    result = verify_ledger(path)
+    assert not result["valid"] and "recorded head" in result["error"]
+    with pytest.raises(ValueError, match="does not contain its recorded head"):
+        ActionLedger(path)
+
+
+def test_resume_after_a_run_that_never_closed(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    with ActionLedger(path) as ledger:
+        _append(ledger, 1, 3)
+
+    crashed = ActionLedger(path)
+    _append(crashed, 3, 5)
+    crashed._file.close()  # lines reached the file, but close() never ran: the head is stale
+
+    with ActionLedger(path) as resumed:
+        assert resumed.count == 4 and resumed.last_seq == 4
+        _append(resumed, 5, 6)
+    result = verify_ledger(path)
+    assert result["valid"] and result["count"] == 5
+
+    # A later clean reopen takes the count from the (now current) head file
+    with ActionLedger(path) as again:
+        assert again.count == 5
+
+
+def test_torn_last_line_is_refused(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    with ActionLedger(path) as ledger:
+        _append(ledger, 1, 3)
+    with open(path, "ab") as f:
+        f.write(b'{"action_hash":"abc')
+    with pytest.raises(ValueError, match="torn or corrupt"):
+        ActionLedger(path)
+    assert "not a ledger record" in verify_ledger(path)["error"]
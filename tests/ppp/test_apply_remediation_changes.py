@@ -0,0 +1,205 @@
+"""Tests for scripts/apply_remediation_changes.py (journaled apply and rollback)."""
+
+import hashlib
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "apply_remediation_changes.py"
+
+
+@pytest.fixture
+def arc(src_ppp):
+    """The script, loaded while src/ppp is importable as `ppp` (it imports ppp.storage and ppp.workflows)."""
+    spec = importlib.util.spec_from_file_location("apply_remediation_changes", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _setup(arc, tmp_path, content: bytes, receipts):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "doc.md").write_bytes(content)
+    decisions = tmp_path / "evidence" / "decisions"
+    decisions.mkdir(parents=True)
+    (decisions / "remediation_decisions.json").write_text(json.dumps({
+        "remediation_decisions": [{"directive_id": "C", "decision_type": "APPROVE_BATCH"}],
+    }))
+    with open(decisions / "remediation_receipts.jsonl", 'w') as f:
+        for receipt in receipts:
+            f.write(json.dumps(receipt) + "\n")
+    applier = arc.ApplyRemediationChanges(str(tmp_path / "evidence"), {"omega-docs": str(repo)}, workers=2)
+    return applier, repo / "doc.md", decisions
+
+
+def _receipt(receipt_id, pre_hash, changes, directive="C"):
+    return {
+        "receipt_id": receipt_id,
+        "document_id": "omega-docs/doc.md",
+        "directive_id": directive,
+        "source_repo": "omega-docs",
+        "file_path": "doc.md",
+        "file_hash_pre": pre_hash,
+        "changes_approved": len(changes),
+        "changes_details": changes,
+    }
+
+
+def test_spans_anchor_on_line_number_and_walk_repeated_phrases(arc):
+    content = "always one\nalways two\nalways three\nalways four\n"
+    spans = arc.resolve_change_spans(content, [
+        {"old": "always", "new": "A", "line_number": 2},
+        {"old": "always", "new": "B"},  # next occurrence after the one already claimed
+        {"old": "always", "new": "C", "line_number": 2},  # never re-claims an earlier match
+    ])
+    assert [content[start:end] for start, end, _ in spans] == ["always"] * 3
+    assert arc.apply_spans(content, spans) == "always one\nA two\nB three\nC four\n"
+
+
+def test_spans_honour_explicit_offsets(arc):
+    content = "x always y always"
+    spans = arc.resolve_change_spans(content, [{"old": "always", "new": "often", "start": 11}])
+    assert arc.apply_spans(content, spans) == "x always y often"
+    with pytest.raises(ValueError, match="does not match"):
+        arc.resolve_change_spans(content, [{"old": "always", "new": "often", "start": 3}])
+
+
+def test_spans_reject_missing_text_and_overlaps(arc):
+    content = "results always guaranteed"
+    with pytest.raises(ValueError, match="not found"):
+        arc.resolve_change_spans(content, [{"old": "never", "new": "x"}])
+    with pytest.raises(ValueError, match="not found"):
+        arc.resolve_change_spans("always\nnever\n", [{"old": "always", "new": "x", "line_number": 2}])
+    with pytest.raises(ValueError, match="Overlapping"):
+        arc.resolve_change_spans(content, [
+            {"old": "always guaranteed", "new": "x"},
+            {"old": "results always", "new": "y"},
+        ])
+
+
+def test_atomic_write_leaves_no_partial_file(arc, tmp_path, monkeypatch):
+    target = tmp_path / "doc.md"
+    target.write_bytes(b"original")
+    arc.atomic_write_bytes(target, b"patched")
+    assert target.read_bytes() == b"patched"
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(arc.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        arc.atomic_write_bytes(target, b"never written")
+    assert target.read_bytes() == b"patched"
+    assert [p.name for p in tmp_path.iterdir()] == ["doc.md"]
+
+
+ORIGINAL = b"alpha always works.\r\nbeta always holds.\r\n"
+
+
+def test_two_receipts_on_one_file_are_merged_into_one_write(arc, tmp_path):
+    pre = _sha(ORIGINAL)
+    applier, doc, decisions = _setup(arc, tmp_path, ORIGINAL, [
+        _receipt("r-1", pre, [{"old": "alpha always", "new": "alpha usually", "line_number": 1}]),
+        _receipt("r-2", pre, [{"old": "beta always", "new": "beta usually", "line_number": 2}]),
+        _receipt("r-3", pre, [{"old": "unapproved", "new": "x"}], directive="G"),
+    ])
+    result = applier.apply_all_approved_changes()
+    assert doc.read_bytes() == b"alpha usually works.\r\nbeta usually holds.\r\n"
+    assert result["total_files_applied"] == 2
+    assert result["total_files_failed"] == 0
+
+    intents = [json.loads(line) for line in open(decisions / arc.JOURNAL_FILE) if '"intent"' in line]
+    assert len(intents) == 1 and intents[0]["receipt_ids"] == ["r-1", "r-2"]
+
+    # Re-running reports both receipts as already applied, not the second as a mismatch
+    again = applier.apply_all_approved_changes()
+    assert again["total_files_already_applied"] == 2
+    assert again["total_files_failed"] == 0
+
+
+def test_stale_or_overlapping_receipts_fail_on_their_own(arc, tmp_path):
+    pre = _sha(ORIGINAL)
+    applier, doc, _ = _setup(arc, tmp_path, ORIGINAL, [
+        _receipt("r-1", pre, [{"old": "alpha always", "new": "alpha usually"}]),
+        _receipt("r-2", pre, [{"old": "always works", "new": "often works"}]),
+        _receipt("r-3", _sha(b"older content"), [{"old": "beta", "new": "gamma"}]),
+    ])
+    result = applier.apply_all_approved_changes()
+    assert doc.read_bytes() == b"alpha usually works.\r\nbeta always holds.\r\n"
+    log = {entry["status"]: entry for entry in result["changes_applied_log"]}
+    assert result["total_files_applied"] == 1
+    assert result["total_files_failed"] == 2
+    errors = sorted(e["error"] for e in result["changes_applied_log"] if e["status"] == "failed")
+    assert errors[0].startswith("Hash mismatch")
+    assert errors[1].startswith("Overlapping changes")
+    assert log["success"]["document_id"] == "omega-docs/doc.md"
+
+    # A new receipt against the already patched file (old pre hash) is failed, not "already applied"
+    late = _receipt("r-4", pre, [{"old": "beta always", "new": "beta usually"}])
+    with open(tmp_path / "evidence" / "decisions" / "remediation_receipts.jsonl", 'a') as f:
+        f.write(json.dumps(late) + "\n")
+    again = applier.apply_all_approved_changes()
+    assert again["total_files_already_applied"] == 1
+    assert [e["document_id"] for e in again["changes_applied_log"] if e["status"] == "failed"] == ["omega-docs/doc.md"] * 3
+    assert doc.read_bytes() == b"alpha usually works.\r\nbeta always holds.\r\n"
+
+
+@pytest.mark.parametrize("write_lands", [False, True])
+def test_resume_after_crash(arc, tmp_path, monkeypatch, write_lands):
+    pre = _sha(ORIGINAL)
+    applier, doc, decisions = _setup(arc, tmp_path, ORIGINAL, [
+        _receipt("r-1", pre, [{"old": "always works", "new": "usually works"}]),
+    ])
+    real_write = arc.atomic_write_bytes
+
+    def crash(path, data):
+        if path != doc or write_lands:
+            real_write(path, data)
+        if path == doc:
+            raise RuntimeError("crash")
+
+    monkeypatch.setattr(arc, "atomic_write_bytes", crash)
+    assert applier.apply_all_approved_changes()["total_files_failed"] == 1
+    # The journal ends in an intent without a commit; a torn line must not break resume
+    with open(decisions / arc.JOURNAL_FILE, 'a') as f:
+        f.write('{"event": "comm')
+    monkeypatch.setattr(arc, "atomic_write_bytes", real_write)
+
+    result = applier.apply_all_approved_changes()
+    assert doc.read_bytes() == b"alpha usually works.\r\nbeta always holds.\r\n"
+    if write_lands:
+        assert result["total_files_already_applied"] == 1
+    else:
+        assert result["total_files_applied"] == 1
+    events = [json.loads(line)["event"] for line in open(decisions / arc.JOURNAL_FILE) if line.startswith('{"event": "') and line.endswith("}\n")]
+    assert events[-1] == "commit"
+
+
+def test_rollback_restores_original_and_refuses_edited_files(arc, tmp_path):
+    pre = _sha(ORIGINAL)
+    applier, doc, _ = _setup(arc, tmp_path, ORIGINAL, [
+        _receipt("r-1", pre, [{"old": "alpha always", "new": "alpha usually"}]),
+        _receipt("r-2", pre, [{"old": "beta always", "new": "beta usually"}]),
+    ])
+    applier.apply_all_approved_changes()
+    patched = doc.read_bytes()
+
+    result = applier.rollback_applied_changes()
+    assert doc.read_bytes() == ORIGINAL
+    assert result["total_files_rolled_back"] == 1
+    assert applier.rollback_applied_changes()["total_files_rolled_back"] == 0
+
+    # Re-apply, then edit the file by hand: rollback must not overwrite the edit
+    assert applier.apply_all_approved_changes()["total_files_applied"] == 2
+    assert doc.read_bytes() == patched
+    doc.write_bytes(patched + b"hand edit\r\n")
+    result = applier.rollback_applied_changes()
+    assert result["total_files_failed"] == 1
+    assert doc.read_bytes() == patched + b"hand edit\r\n"
@@ -0,0 +1,141 @@
+"""Tests for the PT-003 capability router."""
+
+import importlib.util
+import random
+from pathlib import Path
+
+import pytest
+
+_MODULE = Path(__file__).resolve().parents[2] / "ops" / "proof" / "capability_router.py"
+_spec = importlib.util.spec_from_file_location("capability_router", _MODULE)
+capability_router = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(capability_router)
+
+CapabilityRouter = capability_router.CapabilityRouter
+CAPABILITY = "llm.generate_response"
+
+
+def _server(server_id, confidence, success_rate=0.99, latency_ms=50, status="active", capabilities=(CAPABILITY,)):
+    return {
+        "id": server_id,
+        "status": status,
+        "capabilities": list(capabilities),
+        "confidence_score": confidence,
+        "performance_metrics": {"latency_ms": latency_ms, "success_rate": success_rate},
+    }
+
+
+def _ids(agents):
+    return [agent["id"] for agent in agents]
+
+
+def test_upsert_and_remove_update_the_index():
+    router = CapabilityRouter([_server("a", 0.9), _server("b", 0.8), _server("t", 0.9, capabilities=["tool.execute"])])
+    assert _ids(router.top_k(CAPABILITY, k=5)[0]) == ["a", "b"]
+
+    router.upsert(_server("b", 0.95))  # rescored
+    assert _ids(router.top_k(CAPABILITY, k=5)[0]) == ["b", "a"]
+    router.upsert(_server("a", 0.9, status="stale"))  # still registered, no longer routable
+    assert _ids(router.top_k(CAPABILITY, k=5)[0]) == ["b"]
+    assert router.status()["stale_servers"] == 1
+    router.upsert(_server("b", 0.95, capabilities=["tool.execute"]))  # moved to another capability
+    assert router.top_k(CAPABILITY, k=5) == ([], 0)
+    assert _ids(router.top_k("tool.execute", k=5)[0]) == ["b", "t"]
+    router.remove("t")
+    assert _ids(router.top_k("tool.execute", k=5)[0]) == ["b"]
+    assert "t" not in router.servers and CAPABILITY not in router.index
+
+
+def test_top_k_matches_a_full_sort_under_churn():
+    rng = random.Random(7)
+    router = CapabilityRouter()
+    for step in range(3000):
+        server_id = f"s{rng.randrange(200)}"
+        if rng.random() < 0.2:
+            router.remove(server_id)
+        else:
+            router.upsert(_server(server_id, rng.random(), rng.uniform(0.9, 1.0), rng.randrange(500),
+                                  status="active" if rng.random() < 0.9 else "stale"))
+        if step % 100 == 0:
+            live = [s for s in router.servers.values() if s["status"] == "active"]
+            expected = sorted(live, key=capability_router.score_agent, reverse=True)[:10]
+            agents, _ = router.top_k(CAPABILITY, k=10)
+            assert [capability_router.score_agent(s) for s in agents] == \
+                [capability_router.score_agent(s) for s in expected]
+
+
+def test_heaps_are_compacted_as_entries_go_stale():
+    router = CapabilityRouter([_server("a", 0.5), _server("b", 0.6)])
+    for i in range(1000):
+        router.upsert(_server("a", i / 1000))
+    assert len(router._heaps[CAPABILITY]) <= capability_router.COMPACT_RATIO * 2 + 1
+    assert _ids(router.top_k(CAPABILITY, k=2)[0]) == ["a", "b"]
+    router.remove("a")
+    router.remove("b")
+    assert CAPABILITY not in router._heaps
+
+
+def test_strict_mode_skips_low_success_rates():
+    bare = {"id": "bare", "status": "active", "capabilities": [CAPABILITY], "confidence_score": 0.7}  # neutral metrics
+    router = CapabilityRouter([_server("fast", 0.99, success_rate=0.9), _server("safe", 0.8, success_rate=0.99), bare])
+    assert _ids(router.top_k(CAPABILITY, k=5, mode="loose")[0]) == ["fast", "bare", "safe"]
+    assert _ids(router.top_k(CAPABILITY, k=5, mode="strict")[0]) == ["bare", "safe"]
+    assert (router.eligible_count(CAPABILITY), router.eligible_count(CAPABILITY, "strict")) == (3, 2)
+
+    receipt = router.route(CAPABILITY, "strict", "run-1", exclude=["bare"])
+    assert receipt["agent_id"] == "safe"
+    assert receipt["registry_snapshot"] == {"total_eligible": 1, "evaluated": 1, "selected": "safe"}
+    assert router.route(CAPABILITY, "strict", "run-2", exclude=["safe", "bare"]) is None
+    assert router.discover(CAPABILITY, "strict")["total"] == 2
+
+
+def test_default_registry_routes_like_the_pt003_mock():
+    router = CapabilityRouter(capability_router.DEFAULT_REGISTRY)
+    for mode in ("loose", "strict"):
+        receipt = router.route(CAPABILITY, mode, "run")
+        assert receipt["registry_snapshot"] == {"total_eligible": 2, "evaluated": 2, "selected": "llm_server_1"}
+
+
+def _load_pt003(monkeypatch, **env):
+    for name in ("FC_BASE_URL", "PT003_MOCK_MODE"):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    path = _MODULE.parent / "pt003" / "pt003_route_agent.py"
+    spec = importlib.util.spec_from_file_location("pt003_route_agent", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_pt003_auto_mode_stays_offline_unless_fc_is_configured(monkeypatch):
+    pt003 = _load_pt003(monkeypatch)
+    monkeypatch.setattr(pt003, "is_fc_reachable", lambda: pytest.fail("auto mode probed FC without opt-in"))
+    assert pt003.use_mock_mode()
+
+    pt003 = _load_pt003(monkeypatch, FC_BASE_URL="http://127.0.0.1:9")
+    monkeypatch.setattr(pt003, "is_fc_reachable", lambda: True)
+    assert not pt003.use_mock_mode()
+
+    def fail(*args, **kwargs):
+        raise OSError("connection reset")
+
+    monkeypatch.setattr(pt003, "fc_request", fail)
+    assert pt003.route_request(CAPABILITY, "strict", use_mock=False)["agent_id"] == "llm_server_1"
+    assert pt003.MOCK_FALLBACKS == ["OSError"]
+
+    pt003 = _load_pt003(monkeypatch, FC_BASE_URL="http://127.0.0.1:9", PT003_MOCK_MODE="off")
+    monkeypatch.setattr(pt003, "fc_request", fail)
+    with pytest.raises(OSError):
+        pt003.route_request(CAPABILITY, "strict", use_mock=False)
+
+
+def test_pt003_mock_ranks_on_the_strict_mode_confidences(monkeypatch):
+    pt003 = _load_pt003(monkeypatch)
+    assert [(a["agent_id"], a["confidence_score"]) for a in pt003.get_mock_agents(CAPABILITY, "strict")["agents"]] == [
+        ("llm_server_1", 0.98), ("llm_server_2", 0.92),
+    ]
+    receipt = pt003.get_mock_routing_result(CAPABILITY, "strict", "run")
+    assert (receipt["agent_id"], receipt["confidence_score"]) == ("llm_server_1", 0.98)
+    assert pt003.get_mock_routing_result(CAPABILITY, "loose", "run")["confidence_score"] == 0.95
+    assert all(s["confidence_score"] != 0.98 for s in capability_router.DEFAULT_REGISTRY)
@@ -0,0 +1,68 @@
+"""Tests for columnar receipt export."""
+
+import pytest
+from src.ppp.receipts.columnar import (
+    HUMAN_DECISION_COLUMNS,
+    RECEIPT_COLUMNS,
+    ColumnarReceiptWriter,
+    flatten,
+)
+from src.ppp.receipts.human_decision import HumanDecisionReceipt
+from src.ppp.receipts.schema import CanonicalSerializer
+
+
+def _receipt(i):
+    return CanonicalSerializer.create_receipt(
+        receipt_id=f"r-{i}",
+        run_id="run-1",
+        agent_id="agent-1",
+        event="governance_finding_detected",
+        phase="emit_receipts",
+        status="flagged" if i % 2 else "approved",
+        policy={"id": "docs-governance-tone", "tier": "strict"},
+        decision={"allowed": bool(i % 2), "rule_id": f"rule_{i % 3}", "severity": "P1"},
+    )
+
+
+def test_flatten_receipt_columns():
+    """Nested policy/decision fields become typed columns."""
+    row = dict(zip([c[0] for c in RECEIPT_COLUMNS], flatten(_receipt(1), RECEIPT_COLUMNS)))
+    assert row["status"] == "flagged"
+    assert row["policy_id"] == "docs-governance-tone"
+    assert row["rule_ids"] == ["rule_1"]
+    assert row["severity"] == "P1"
+    assert row["allowed"] is True
+    assert row["confidence"] is None
+
+
+def test_flatten_accepts_dicts_and_dataclasses():
+    """JSONL dicts and dataclass receipts flatten identically."""
+    receipt = _receipt(2)
+    assert flatten(receipt, RECEIPT_COLUMNS) == flatten(receipt.to_dict(), RECEIPT_COLUMNS)
+
+    decision = HumanDecisionReceipt(
+        decision_id="d-1", workflow_id="wf-1", finding_id="f-1",
+        decision_type="ACCEPT", authority="reviewer", timestamp="2026-01-01T00:00:00",
+    )
+    row = dict(zip([c[0] for c in HUMAN_DECISION_COLUMNS], flatten(decision, HUMAN_DECISION_COLUMNS)))
+    assert row["decision_type"] == "ACCEPT"
+    assert row["decision_hash"] == decision.decision_hash
+
+
+def test_unknown_kind_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        ColumnarReceiptWriter(str(tmp_path / "out.parquet"), kind="nope")
+
+
+def test_parquet_round_trip(tmp_path):
+    """Receipts written across row groups read back with dictionary columns."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "receipts.parquet"
+    with ColumnarReceiptWriter(str(path), row_group_size=4) as writer:
+        writer.write_all(_receipt(i) for i in range(10))
+
+    parquet = pq.ParquetFile(str(path))
+    assert parquet.metadata.num_row_groups == 3
+    table = parquet.read()
+    assert table.num_rows == 10
+    assert table.column("status").to_pylist().count("flagged") == 5
@@ -0,0 +1,67 @@
+"""Tests for streaming human decision import."""
+
+import json
+
+import pytest
+from src.ppp.receipts.decision_import import import_decisions, iter_decision_rows
+from src.ppp.receipts.human_decision import HumanDecisionReceipt
+
+FINDINGS = {"f1": "P0", "f2": "P1", "f3": "P2"}
+
+
+def _recorder(recorded):
+    """Stand-in for DocsRemediationWorkflow.record_human_decision."""
+    def record(finding_id, decision_type, authority, rationale=None, modified_content=None):
+        if finding_id not in FINDINGS:
+            raise ValueError(f"Finding not found: {finding_id}")
+        decision = HumanDecisionReceipt(
+            decision_id=f"decision-{len(recorded)}", workflow_id="wf", finding_id=finding_id,
+            decision_type=decision_type, authority=authority, timestamp="2026-01-01T00:00:00",
+            rationale=rationale, modified_content=modified_content,
+        )
+        if FINDINGS[finding_id] == "P0" and decision_type == "REJECT":
+            raise ValueError("P0 findings cannot be REJECT")
+        recorded.append(decision)
+        return decision
+    return record
+
+
+def _read(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_csv_rows_stream_into_receipts_and_errors(tmp_path):
+    source = tmp_path / "decisions.csv"
+    source.write_text(
+        "finding_id,decision_type,authority,rationale,modified_content,notes\n"
+        "f1,ACCEPT,alice,,,looks right\n"
+        "f1,REJECT,alice,not needed,,\n"
+        "f2,MODIFY,bob,,better text,\n"
+        "f3,REJECT,bob,,,\n"
+        "f9,ACCEPT,bob,,,\n"
+    )
+    recorded = []
+    stats = import_decisions(iter_decision_rows(str(source)), _recorder(recorded),
+                             str(tmp_path / "receipts.jsonl"), str(tmp_path / "errors.jsonl"), batch_size=2)
+
+    assert stats["rows_read"] == 5 and stats["batches"] == 3
+    assert stats["decisions_recorded"] == 2 and stats["decisions_rejected"] == 3
+    receipts = _read(tmp_path / "receipts.jsonl")
+    assert [(r["finding_id"], r["decision_type"]) for r in receipts] == [("f1", "ACCEPT"), ("f2", "MODIFY")]
+    assert receipts[1]["decision_hash"] == recorded[1].decision_hash
+    errors = _read(tmp_path / "errors.jsonl")
+    assert [(e["line"], e["row"]["finding_id"]) for e in errors] == [(3, "f1"), (5, "f3"), (6, "f9")]
+    assert errors[1]["error"] == "REJECT decisions require a rationale"
+
+
+def test_jsonl_reports_malformed_lines(tmp_path):
+    source = tmp_path / "decisions.jsonl"
+    source.write_text('{"finding_id": "f2", "decision_type": "ACCEPT", "authority": "a", "extra": 1}\n'
+                      '{not json\n\n["f2"]\n')
+    stats = import_decisions(iter_decision_rows(str(source)), _recorder([]),
+                             str(tmp_path / "receipts.jsonl"), str(tmp_path / "errors.jsonl"))
+    assert stats["decisions_recorded"] == 1
+    assert [e["line"] for e in _read(tmp_path / "errors.jsonl")] == [2, 4]
+
+    with pytest.raises(ValueError):
+        list(iter_decision_rows(str(source), fmt="xml"))
@@ -0,0 +1,50 @@
+"""Tests for the docs categorization human decision gate."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+POLICY = Path(__file__).resolve().parents[2] / "configs" / "ppp" / "policies" / "policy.docs-placement.yaml"
+
+
+@pytest.fixture
+def categorization(src_ppp):
+    return src_ppp("ppp.workflows.docs_categorization")
+
+
+def test_gate_uses_first_receipt_per_document_and_caps_errors(categorization, tmp_path, monkeypatch, capsys):
+    """Decisions bind to the first receipt of a document; missing documents are reported and capped."""
+    monkeypatch.setattr(categorization, "MAX_REPORTED_DECISION_ERRORS", 3)
+    monkeypatch.setattr(categorization, "MAX_PRINTED_DECISION_ERRORS", 2)
+    workflow = categorization.DocsCategorizationWorkflow([], str(POLICY), output_dir=str(tmp_path))
+    workflow.receipts = [
+        SimpleNamespace(document_id="a.md", receipt_id="r-a"),
+        SimpleNamespace(document_id="a.md", receipt_id="r-a-late"),
+        SimpleNamespace(document_id="b.md", receipt_id="r-b"),
+    ]
+    decisions = [{"document_id": d, "decision_type": "ACCEPT", "authority": "alice"} for d in ("a.md", "b.md")]
+    decisions += [{"document_id": f"gone-{i}.md", "decision_type": "ACCEPT", "authority": "bob"} for i in range(5)]
+
+    gate = workflow.phase_human_decision_gate({"decisions": decisions})
+    assert (gate["decisions_recorded"], gate["decisions_failed"]) == (2, 5)
+    assert [d.finding_id for d in workflow.human_decisions] == ["r-a", "r-b"]
+    assert gate["errors"] == [{"document_id": f"gone-{i}.md", "error": "Document not found"} for i in range(3)]
+    printed = capsys.readouterr().out.splitlines()
+    assert [line for line in printed if line.startswith("[DECISION")] == [
+        "[DECISION WARNING] Document not found: gone-0.md",
+        "[DECISION WARNING] Document not found: gone-1.md",
+        "[DECISION ERROR] ... and 3 more",
+    ]
+
+
+def test_decision_ids_are_scoped_to_the_workflow_and_unique_across_gates(categorization, tmp_path):
+    workflow = categorization.DocsCategorizationWorkflow([], str(POLICY), output_dir=str(tmp_path))
+    workflow.receipts = [SimpleNamespace(document_id="a.md", receipt_id="r-a")]
+    decision = {"document_id": "a.md", "decision_type": "ACCEPT", "authority": "alice"}
+
+    workflow.phase_human_decision_gate({"decisions": [decision]})
+    workflow.phase_human_decision_gate({"decisions": [decision, decision]})
+    assert [d.decision_id for d in workflow.human_decisions] == [
+        f"{workflow.workflow_id}-decision-{i}" for i in range(3)
+    ]
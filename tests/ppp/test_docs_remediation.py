@@ -0,0 +1,90 @@
+"""Tests for the docs remediation human decision gate."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+POLICY = ROOT / "configs" / "ppp" / "policies" / "policy.remediation.yaml"
+
+
+@pytest.fixture
+def remediation(src_ppp):
+    return src_ppp("ppp.workflows.docs_remediation")
+
+
+def _finding(remediation, finding_id, severity="P1", location=None):
+    return remediation.RemediationFinding(
+        finding_id=finding_id, location=location or f"docs/{finding_id}.md:1:1", rule_id="rule_0", severity=severity,
+        message="", original_text="autonomous", suggested_fix="governed", policy_rationale="",
+    )
+
+
+def _workflow(remediation, tmp_path, *finding_ids):
+    workflow = remediation.DocsRemediationWorkflow(
+        str(tmp_path / "pack"), docs_root=str(tmp_path / "docs"), policy_path=str(POLICY),
+        output_dir=str(tmp_path / "out"),
+    )
+    workflow.findings = [_finding(remediation, finding_id) for finding_id in finding_ids]
+    return workflow
+
+
+def test_repeated_imports_never_reuse_decision_ids(remediation, tmp_path):
+    """Imports append to one receipts file; ids stay unique within and across workflows."""
+    decisions = tmp_path / "decisions.jsonl"
+    decisions.write_text("".join(
+        json.dumps({"finding_id": f, "decision_type": "ACCEPT", "authority": "alice"}) + "\n" for f in ("f1", "f2")
+    ))
+    first = _workflow(remediation, tmp_path, "f1", "f2")
+    first.import_human_decisions(str(decisions))
+    first.import_human_decisions(str(decisions))
+    second = _workflow(remediation, tmp_path, "f1", "f2")
+    stats = second.import_human_decisions(str(decisions))
+
+    receipts = [json.loads(line) for line in Path(stats["receipts_path"]).read_text().splitlines()]
+    ids = [r["decision_id"] for r in receipts]
+    assert len(ids) == 6 and len(set(ids)) == 6
+    assert ids[-2:] == [d.decision_id for d in second.human_decisions]
+    assert all(i.startswith(second.workflow_id) for i in ids[-2:])
+
+
+def test_lookup_uses_first_finding_with_an_id(remediation, tmp_path):
+    """Duplicate finding ids resolve to the first finding, as the linear search did."""
+    workflow = _workflow(remediation, tmp_path, "f1")
+    workflow.findings.append(_finding(remediation, "f1", severity="P0", location="docs/dup.md:9:1"))
+    decision = workflow.record_human_decision("f1", "REJECT", "alice", rationale="out of scope")
+    assert decision.original_finding_location == "docs/f1.md:1:1"
+    assert workflow.findings[0].human_decision is decision
+
+
+def test_index_follows_appended_shrunk_and_reassigned_findings(remediation, tmp_path):
+    workflow = _workflow(remediation, tmp_path, "f1", "f2")
+    assert set(workflow._index_findings()) == {"f1", "f2"}
+    workflow.findings.append(_finding(remediation, "f3"))
+    assert set(workflow._index_findings()) == {"f1", "f2", "f3"}
+    workflow.findings.pop(0)
+    assert set(workflow._index_findings()) == {"f2", "f3"}
+    workflow.findings = [_finding(remediation, "f9")]
+    assert set(workflow._index_findings()) == {"f9"}
+    with pytest.raises(ValueError, match="Finding not found: f1"):
+        workflow.record_human_decision("f1", "ACCEPT", "alice")
+
+
+def test_batch_reports_errors_and_caps_the_list(remediation, tmp_path, monkeypatch):
+    """Bad decisions are skipped and reported; the reported list is capped, the count is not."""
+    monkeypatch.setattr(remediation, "MAX_REPORTED_DECISION_ERRORS", 3)
+    workflow = _workflow(remediation, tmp_path, "f1", "f2")
+    decisions = [
+        {"finding_id": "f1", "decision_type": "ACCEPT", "authority": "alice"},
+        {"finding_id": "missing", "decision_type": "ACCEPT", "authority": "alice"},
+        {"finding_id": "f2", "decision_type": "REJECT", "authority": "alice"},
+        {"finding_id": "f2", "decision_type": "ACCEPT", "authority": "alice", "bogus": 1},
+    ] + [{"finding_id": f"gone-{i}", "decision_type": "ACCEPT", "authority": "bob"} for i in range(3)]
+
+    gate = workflow.record_human_decisions(decisions)
+    assert (gate["decisions_recorded"], gate["decisions_failed"]) == (1, 6)
+    assert [(e["index"], e["finding_id"]) for e in gate["errors"]] == [(1, "missing"), (2, "f2"), (3, "f2")]
+    assert gate["errors"][0]["error"] == "Finding not found: missing"
+    assert gate["errors"][1]["error"] == "REJECT decisions require a rationale"
+    assert [d.finding_id for d in workflow.human_decisions] == ["f1"]
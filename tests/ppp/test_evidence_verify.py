@@ -0,0 +1,74 @@
+"""Tests for evidence pack verification."""
+
+import json
+
+from src.ppp.receipts.emitter import ReceiptEmitter
+from src.ppp.receipts.schema import CanonicalSerializer
+from src.ppp.receipts.verify import EvidencePackVerifier, manifest_files
+
+
+def _build_pack(tmp_path, n=25):
+    receipts = [
+        CanonicalSerializer.create_receipt(
+            receipt_id=f"r-{i}",
+            run_id="run-verify",
+            agent_id="agent-1",
+            event="test_event",
+            phase="test_phase",
+            status="completed",
+            policy={"policy_id": "policy.loose"},
+            decision={"intent": "test", "chosen_action": "test", "confidence": 1.0},
+            input_payload={"i": i},
+        )
+        for i in range(n)
+    ]
+    policy = tmp_path / "policy.yaml"
+    policy.write_text("policy_id: policy.loose\n")
+    emitter = ReceiptEmitter(report_root=str(tmp_path / "report"))
+    emitter.emit_receipts("run-verify", receipts)
+    emitter.create_summary("run-verify", receipts, {})
+    return emitter.create_evidence_pack("run-verify", receipts, str(policy), "none", "none")
+
+
+def test_manifest_files_maps_contents_layout():
+    """`contents` entries should map to pack-relative paths."""
+    manifest = {"contents": {"receipts": "a", "hashes_manifest": "b", "policies": {"p.yaml": "c"}, "config": {}}}
+    assert manifest_files(manifest) == {"receipts.jsonl": "a", "hashes.json": "b", "policies/p.yaml": "c"}
+
+
+def test_valid_pack_inline_and_parallel(tmp_path):
+    """An untouched pack verifies with one worker and with a process pool."""
+    evidence_dir = _build_pack(tmp_path)
+    for workers in (1, 2):
+        report = EvidencePackVerifier(evidence_dir, workers=workers, batch_size=4).verify()
+        assert report["valid"], report
+        assert report["receipts_verified"] == 25
+        assert report["files_verified"] == 4  # receipts, summary, hashes, policy
+        assert report["merkle_root_valid"] is True
+        assert report["throughput_mb_s"] is not None
+
+
+def test_tampered_receipt_detected(tmp_path):
+    """Editing a receipt breaks its hash, the file hash and the Merkle root."""
+    evidence_dir = _build_pack(tmp_path)
+    receipts_file = tmp_path / "report" / "run-verify" / "evidence-pack" / "receipts.jsonl"
+    lines = receipts_file.read_text().splitlines()
+    record = json.loads(lines[7])
+    record["status"] = "failed"
+    lines[7] = json.dumps(record)
+    receipts_file.write_text("\n".join(lines) + "\n")
+
+    report = EvidencePackVerifier(evidence_dir, workers=1).verify()
+    assert not report["valid"]
+    assert report["receipts_failed"] == [{"line": 8, "receipt_id": "r-7", "error": "receipt hash mismatch"}]
+    assert {"file": "receipts.jsonl", "error": "hash mismatch"} in report["files_failed"]
+
+
+def test_tampered_policy_detected(tmp_path):
+    """Changing a sealed policy file fails verification."""
+    evidence_dir = _build_pack(tmp_path)
+    (tmp_path / "report" / "run-verify" / "evidence-pack" / "policies" / "policy.yaml").write_text("x: 1\n")
+
+    report = EvidencePackVerifier(evidence_dir, workers=1).verify()
+    assert not report["valid"]
+    assert report["files_failed"] == [{"file": "policies/policy.yaml", "error": "hash mismatch"}]
@@ -0,0 +1,125 @@
+"""Tests for the FC proof client: bearer tokens, token caching and retry rules."""
+
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+_PROOF = Path(__file__).resolve().parents[2] / "ops" / "proof"
+
+
+def _load(name):
+    # ops/proof modules import each other by bare name (`from fc_auth import ...`)
+    spec = importlib.util.spec_from_file_location(name, _PROOF / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+fc_auth = _load("fc_auth")
+fc_client = _load("fc_client")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(fc_auth.time, "time", lambda: now[0])
+    return now
+
+
+def test_token_round_trip_and_rejections(clock):
+    token = fc_auth.generate_bearer_token("harness", ["gate:read"], ttl_seconds=60, secret_key="k1")
+    payload = fc_auth.verify_bearer_token(token, secret_key="k1")
+    assert (payload["server_id"], payload["scopes"], payload["exp"]) == ("harness", ["gate:read"], 1_000_060)
+
+    body, signature = token.split(".")
+    tampered = f"{body}.{'A' if signature[0] != 'A' else 'B'}{signature[1:]}"
+    with pytest.raises(ValueError, match="bad signature"):
+        fc_auth.verify_bearer_token(tampered, secret_key="k1")
+    with pytest.raises(ValueError, match="bad signature"):
+        fc_auth.verify_bearer_token(token, secret_key="k2")
+    with pytest.raises(ValueError, match="token expired"):
+        fc_auth.verify_bearer_token(token, secret_key="k1", now=1_000_060)
+
+
+@pytest.mark.parametrize("token", ["bearer_abc.def", "omega_abc", "omega_a.b.c", "", "omega_!!!"])
+def test_malformed_tokens(token):
+    with pytest.raises(ValueError, match="malformed token"):
+        fc_auth.verify_bearer_token(token)
+
+
+@pytest.mark.parametrize("payload", ["!!!", "WzFd"])  # not base64 JSON; a JSON list, not an object
+def test_malformed_payloads_with_valid_signatures(payload):
+    token = f"{fc_auth.TOKEN_PREFIX}{payload}.{fc_auth._sign(payload, None)}"
+    with pytest.raises(ValueError, match="malformed payload"):
+        fc_auth.verify_bearer_token(token)
+
+
+def test_token_cache_refreshes_inside_the_margin(clock):
+    cache = fc_client.TokenCache("harness", ttl_seconds=100, refresh_margin=10)
+    first = cache.get()
+    clock[0] += 89
+    assert cache.get() == first and cache.issued == 1
+    clock[0] += 1
+    second = cache.get()
+    assert second != first and cache.issued == 2
+    assert fc_auth.verify_bearer_token(second)["exp"] == clock[0] + 100
+    # The margin never exceeds half the TTL, so short-lived tokens are still reused
+    assert fc_client.TokenCache("harness", ttl_seconds=30, refresh_margin=60).refresh_margin == 15
+
+
+def _run(method, responses, monkeypatch, **client_args):
+    """Send one request through a mock transport; returns (response or exception, calls, sleeps)."""
+    calls, sleeps = [], []
+    pending = list(responses)
+
+    def handler(request):
+        calls.append(request)
+        outcome = pending.pop(0) if len(pending) > 1 else pending[0]
+        if isinstance(outcome, type) and issubclass(outcome, Exception):
+            raise outcome("simulated", request=request)
+        status, headers = outcome if isinstance(outcome, tuple) else (outcome, {})
+        return httpx.Response(status, headers=headers, json={})
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+
+    async def send():
+        fc = fc_client.FCClient(base_url="http://fc.test", http2=False, **client_args)
+        fc._client = httpx.AsyncClient(base_url=fc.base_url, transport=httpx.MockTransport(handler))
+        async with fc:
+            try:
+                return await fc.request(method, "/api/fc/runs")
+            except Exception as e:
+                return e
+
+    monkeypatch.setattr(fc_client.asyncio, "sleep", sleep)
+    monkeypatch.setattr(fc_client.random, "uniform", lambda low, high: high)
+    return asyncio.run(send()), calls, sleeps
+
+
+def test_post_is_not_retried_on_5xx_or_maybe_sent_errors(monkeypatch):
+    result, calls, _ = _run("POST", [503, 200], monkeypatch)
+    assert isinstance(result, httpx.HTTPStatusError) and len(calls) == 1
+    result, calls, _ = _run("POST", [httpx.ReadTimeout, 200], monkeypatch)
+    assert isinstance(result, httpx.ReadTimeout) and len(calls) == 1
+
+
+def test_post_is_retried_on_429_and_not_sent_errors(monkeypatch):
+    result, calls, sleeps = _run("POST", [(429, {"Retry-After": "1.5"}), httpx.ConnectError, 200], monkeypatch)
+    assert result.status_code == 200 and len(calls) == 3
+    assert sleeps == [1.5, 0.4]  # Retry-After, then full-jitter backoff for attempt 1 (upper bound)
+    assert all(c.headers["Authorization"].startswith("Bearer omega_") for c in calls)
+
+
+def test_idempotent_methods_retry_with_capped_backoff(monkeypatch):
+    result, calls, sleeps = _run("GET", [httpx.ReadTimeout, (503, {"Retry-After": "60"}), 200], monkeypatch)
+    assert result.status_code == 200 and len(calls) == 3
+    assert sleeps == [0.2, 5.0]  # Retry-After is capped at backoff_max
+
+    result, calls, sleeps = _run("GET", [503], monkeypatch, max_retries=2)
+    assert isinstance(result, httpx.HTTPStatusError) and len(calls) == 3 and len(sleeps) == 2
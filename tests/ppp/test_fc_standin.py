@@ -0,0 +1,127 @@
+"""Tests for the local FC stand-in, driven over HTTP through FCClient."""
+
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+_PROOF = Path(__file__).resolve().parents[2] / "ops" / "proof"
+
+
+def _load(name):
+    # ops/proof modules import each other by bare name (`from fc_auth import ...`)
+    spec = importlib.util.spec_from_file_location(name, _PROOF / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+fc_auth = _load("fc_auth")
+fc_client = _load("fc_client")
+fc_standin = _load("fc_standin")
+
+
+@pytest.fixture
+def standin():
+    with fc_standin.FCStandIn(port=0) as fc:  # ephemeral port
+        yield fc
+
+
+def _drive(standin, scenario, **client_args):
+    """Run `scenario(fc)` against the stand-in with a fresh FCClient."""
+    async def run():
+        async with fc_client.FCClient(standin.url, http2=False, max_retries=0, **client_args) as fc:
+            return await scenario(fc)
+    return asyncio.run(run())
+
+
+async def _status_of(call):
+    try:
+        await call
+    except httpx.HTTPStatusError as e:
+        return e.response.status_code, e.response.json()["error"]
+    raise AssertionError("expected an HTTP error")
+
+
+def test_run_moves_through_gate_approval_to_completion(standin):
+    async def scenario(fc):
+        run_id = (await fc.create_run("pt_test", {"n": 1}))["run"]["run_id"]
+        await fc.update_run_status(run_id, "running", current_step="step_1", step_index=0)
+        gate = await fc.create_gate(run_id, "step_2", "Approval", ["approver_1"])
+        paused = (await fc.get_run(run_id))["run"]
+        pending = [g["gate_id"] for g in await fc.list_pending_gates("approver_1")]
+        others = await fc.list_pending_gates("approver_2")
+        await fc.resolve_gate(gate["gate_id"], "approved")
+        resumed = (await fc.get_run(run_id))["run"]["status"]
+        completed = (await fc.update_run_status(run_id, "completed", step_index=3))["run"]
+        return gate, paused, pending, others, resumed, completed, await fc.get_run(run_id)
+
+    gate, paused, pending, others, resumed, completed, final = _drive(standin, scenario)
+    assert (paused["status"], paused["current_step"]) == ("paused", "step_2")
+    assert pending == [gate["gate_id"]] and others == []
+    assert resumed == "running"
+    assert (completed["status"], completed["step_index"]) == ("completed", 3)
+    assert [log["event_type"] for log in final["logs"]] == [
+        "FC-RUN-001", "FC-RUN-002", "FC-RUN-002", "FC-GATE-001", "FC-GATE-002", "FC-RUN-002", "FC-RUN-003",
+    ]
+    assert final["gates"][0]["approved_by"] == "approver_1"
+
+
+def test_rejected_gate_fails_the_run_and_conflicts_are_409(standin):
+    async def scenario(fc):
+        run_id = (await fc.create_run("pt_test", {}))["run"]["run_id"]
+        await fc.update_run_status(run_id, "running")
+        gate = await fc.create_gate(run_id, "step_1", "Approval", ["approver_1"])
+        wrong_actor = await _status_of(fc.resolve_gate(gate["gate_id"], "approved", actor_id="intruder"))
+        await fc.resolve_gate(gate["gate_id"], "rejected", rejection_reason="no")
+        run = (await fc.get_run(run_id))["run"]
+        again = await _status_of(fc.resolve_gate(gate["gate_id"], "approved"))
+        resume = await _status_of(fc.update_run_status(run_id, "running"))
+        return wrong_actor, run, again, resume
+
+    wrong_actor, run, again, resume = _drive(standin, scenario)
+    assert wrong_actor == (403, "actor intruder is not a required approver")
+    assert run["status"] == "failed"
+    assert (run["error_details"]["reason"], run["error_details"]["rejection_reason"]) == ("gate_rejected", "no")
+    assert again == (409, "gate already rejected")
+    assert resume == (409, "illegal transition failed -> running")
+
+
+def test_bad_requests_and_unknown_ids(standin):
+    async def scenario(fc):
+        run_id = (await fc.create_run("pt_test", {}))["run"]["run_id"]
+        return (
+            await _status_of(fc.request("POST", "/api/fc/runs", json={})),
+            await _status_of(fc.update_run_status(run_id, "exploded")),
+            await _status_of(fc.create_gate(run_id, "step_1", "Approval", [])),
+            await _status_of(fc.get_run("no-such-run")),
+            await _status_of(fc.resolve_gate("no-such-gate", "approved")),
+        )
+
+    assert _drive(standin, scenario) == (
+        (400, "workflow_id is required"),
+        (400, "unknown status: exploded"),
+        (400, "required_approvers must be a non-empty list"),
+        (404, "run not found: no-such-run"),
+        (404, "gate not found: no-such-gate"),
+    )
+
+
+def test_requests_need_a_valid_bearer_token(standin):
+    async def scenario(fc):
+        return await _status_of(fc.get_run("any"))
+
+    assert _drive(standin, scenario, secret_key="not-the-key") == (401, "invalid bearer token: bad signature")
+    assert _drive(standin, scenario, token_ttl_seconds=-60) == (401, "invalid bearer token: token expired")
+
+    with httpx.Client(base_url=standin.url) as raw:
+        assert raw.get("/health").status_code == 200
+        assert raw.get("/api/fc/gates").json() == {"error": "missing bearer token"}
+        assert raw.post("/auth/token", json={"secret_key": "wrong"}).status_code == 401
+        token = raw.post("/auth/token", json={"secret_key": standin.secret_key}).json()["access_token"]
+        assert fc_auth.verify_bearer_token(token)["server_id"] == "fc_proof_harness"
+        assert raw.get("/api/fc/gates", headers={"Authorization": f"Bearer {token}"}).json() == []
@@ -0,0 +1,169 @@
+"""Tests for the journaled Phase 6 file mover."""
+
+import errno
+import json
+import os
+
+import pytest
+from src.ppp.workflows import file_mover
+from src.ppp.workflows.file_mover import FileMove, FileMover, load_file_decisions, plan_moves, read_journal
+
+
+def _move(name, source="src-repo", target="dst-repo"):
+    return FileMove(f"{source}/{name}", "A", source, target, name)
+
+
+def _entry(name, source="src-repo", target="dst-repo"):
+    return {"document_id": f"{source}/{name}", "source_repo": source, "target_repo": target, "directive": "A"}
+
+
+def _mover(tmp_path, workers=4):
+    repos = {"src-repo": str(tmp_path / "src"), "dst-repo": str(tmp_path / "dst")}
+    return FileMover(repos, str(tmp_path / "journal.jsonl"), workers=workers)
+
+
+def test_decisions_with_raw_windows_separators_load(tmp_path):
+    path = tmp_path / "file_decisions.jsonl"
+    path.write_text(
+        '{"document_id": "r/docs\\\\a.md", "source_repo": "r", "target_repo": "t", "assigned_directive": "A"}\n'
+        '{"document_id": "r/docs\\\\x\\\\tools/\\c.md", "source_repo": "r", "target_repo": "t", "assigned_directive": "B"}\n'
+    )
+    moves = [FileMove.from_decision(d) for d in load_file_decisions(str(path))]
+    assert [m.rel_path for m in moves] == ["docs/a.md", "docs/x/tools/c.md"]
+    assert moves[1].document_id == "r/docs\\x\\tools/\\c.md"
+
+
+def test_moves_rename_or_copy_and_journal(tmp_path, monkeypatch):
+    (tmp_path / "src" / "sub").mkdir(parents=True)
+    for name in ("a.md", "sub/b.md"):
+        (tmp_path / "src" / name).write_text(name)
+    mover = _mover(tmp_path)
+    result = mover.move_all([_move("a.md"), _move("sub/b.md"), _move("gone.md")])
+    assert result["summary"]["success"] == 2 and result["summary"]["failed"] == 1
+    assert (tmp_path / "dst" / "sub" / "b.md").read_text() == "sub/b.md"
+    assert not (tmp_path / "src" / "a.md").exists()
+    assert {e["method"] for e in result["results"] if e["status"] == "success"} == {"link"}
+
+    # Cross-filesystem path: copy with hash verification, then unlink
+    (tmp_path / "src" / "c.md").write_text("copied")
+    monkeypatch.setattr(mover, "_same_filesystem", lambda source_repo, target_repo: False)
+    entry = mover.move_all([_move("c.md")])["results"][0]
+    assert entry["method"] == "copy" and entry["size"] == 6
+    assert (tmp_path / "dst" / "c.md").read_text() == "copied" and not (tmp_path / "src" / "c.md").exists()
+
+    # Every started move has an intent before its outcome
+    lines = [json.loads(line) for line in (tmp_path / "journal.jsonl").read_text().splitlines()]
+    assert [e["status"] for e in lines if e["document_id"] == "src-repo/c.md"] == ["intent", "success"]
+    assert [(e["document_id"], e["status"]) for e in lines if e["status"] == "failed"] == [("src-repo/gone.md", "failed")]
+
+
+def test_entries_are_fsynced(tmp_path, monkeypatch):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.md").write_text("a")
+    synced = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+    _mover(tmp_path).move_all([_move("a.md")])
+    assert len(synced) >= 2  # intent and outcome
+
+
+def test_present_target_is_only_recovered_after_a_journaled_intent(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "dst").mkdir()
+    (tmp_path / "src" / "a.md").write_text("a")
+    _mover(tmp_path).move_all([_move("a.md")])
+
+    # b.md copied but source not unlinked, c.md moved: both by a run that crashed after its intent
+    for name in ("b.md", "c.md"):
+        with open(tmp_path / "journal.jsonl", 'a') as f:
+            f.write(json.dumps({**_entry(name), "status": "intent"}) + "\n")
+    (tmp_path / "src" / "b.md").write_text("b")
+    (tmp_path / "dst" / "b.md").write_text("b")
+    (tmp_path / "dst" / "c.md").write_text("c")
+    # e.md / f.md: same situations, but nothing of ours was ever started
+    (tmp_path / "src" / "e.md").write_text("e")
+    (tmp_path / "dst" / "e.md").write_text("e")
+    (tmp_path / "dst" / "f.md").write_text("f")
+    (tmp_path / "src" / "d.md").write_text("mine")
+    (tmp_path / "dst" / "d.md").write_text("theirs")
+    with open(tmp_path / "journal.jsonl", 'a') as f:
+        f.write('{"document_id": "src-repo/x')  # torn final line
+
+    result = _mover(tmp_path, workers=1).move_all([_move(n) for n in ("a.md", "b.md", "c.md", "d.md", "e.md", "f.md")])
+    statuses = {e["document_id"]: (e["status"], e.get("method") or e.get("reason")) for e in result["results"]}
+    assert statuses == {
+        "src-repo/a.md": ("already_moved", None),
+        "src-repo/b.md": ("success", "recovered"),
+        "src-repo/c.md": ("success", "recovered"),
+        "src-repo/d.md": ("failed", "target already exists"),
+        "src-repo/e.md": ("failed", "target already exists"),
+        "src-repo/f.md": ("failed", "source file not found"),
+    }
+    assert not (tmp_path / "src" / "b.md").exists()
+    assert (tmp_path / "src" / "d.md").read_text() == "mine"
+    assert (tmp_path / "src" / "e.md").exists()
+
+
+def test_latest_entry_per_move_wins(tmp_path):
+    (tmp_path / "src").mkdir()
+    mover = _mover(tmp_path)
+    assert mover.move_all([_move("late.md")])["summary"]["failed"] == 1
+    (tmp_path / "src" / "late.md").write_text("now here")
+    assert mover.move_all([_move("late.md")])["summary"]["success"] == 1
+
+    latest = read_journal(tmp_path / "journal.jsonl")
+    assert {key: entry["status"] for key, entry in latest.items()} == {("src-repo/late.md", "dst-repo"): "success"}
+    assert mover.move_all([_move("late.md")])["summary"]["already_moved"] == 1
+
+
+def test_two_sources_for_one_target_are_both_rejected(tmp_path):
+    """Two documents mapped onto one target path must not overwrite each other."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "other").mkdir()
+    (tmp_path / "src" / "README.md").write_text("first")
+    (tmp_path / "other" / "README.md").write_text("second")
+    repos = {"src-repo": str(tmp_path / "src"), "other-repo": str(tmp_path / "other"), "dst-repo": str(tmp_path / "dst")}
+    moves = [_move("README.md"), _move("README.md", source="other-repo"), _move("README.md")]
+
+    planned, contested = plan_moves(moves)
+    assert len(planned) == 2
+    assert contested == {("dst-repo", os.path.normcase("README.md")): ["src-repo/README.md", "other-repo/README.md"]}
+
+    result = FileMover(repos, str(tmp_path / "journal.jsonl"), workers=4).move_all(moves)
+    assert result["summary"]["failed"] == 2 and result["summary"]["total"] == 2
+    assert all(e["reason"].startswith("duplicate target dst-repo/README.md") for e in result["results"])
+    assert (tmp_path / "src" / "README.md").read_text() == "first"
+    assert (tmp_path / "other" / "README.md").read_text() == "second"
+    assert not (tmp_path / "dst" / "README.md").exists()
+
+
+@pytest.mark.parametrize("same_fs", [True, False])
+def test_target_created_after_the_check_is_not_replaced(tmp_path, monkeypatch, same_fs):
+    """A target that appears between the existence check and the move is left alone."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "dst").mkdir()
+    (tmp_path / "src" / "a.md").write_text("mine")
+    mover = _mover(tmp_path)
+    real_append = file_mover.JsonlJournal.append
+
+    def append(journal, entry):
+        real_append(journal, entry)
+        if entry["status"] == "intent":  # another writer wins the race right after our check
+            (tmp_path / "dst" / "a.md").write_text("theirs")
+
+    monkeypatch.setattr(file_mover.JsonlJournal, "append", append)
+    monkeypatch.setattr(mover, "_same_filesystem", lambda source_repo, target_repo: same_fs)
+    entry = mover.move_all([_move("a.md")])["results"][0]
+    assert (entry["status"], entry["reason"]) == ("failed", "target already exists")
+    assert (tmp_path / "dst" / "a.md").read_text() == "theirs"
+    assert (tmp_path / "src" / "a.md").read_text() == "mine"
+    assert [p.name for p in (tmp_path / "dst").iterdir()] == ["a.md"]  # no temp file left behind
+
+
+def test_copy_falls_back_to_an_exclusive_placeholder_without_links(tmp_path, monkeypatch):
+    (tmp_path / "a.md").write_text("data")
+    monkeypatch.setattr(file_mover.os, "link", lambda *a: (_ for _ in ()).throw(OSError(errno.EPERM, "no links")))
+    assert file_mover.copy_verified(tmp_path / "a.md", tmp_path / "b.md")[1] == 4
+    with pytest.raises(FileExistsError):
+        file_mover.copy_verified(tmp_path / "a.md", tmp_path / "b.md")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.md", "b.md"]
@@ -0,0 +1,55 @@
+"""Import-time budget for the `ppp` CLI (status is polled by monitoring)."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative import time allowed for the CLI entry point, in microseconds
+CLI_IMPORT_BUDGET_US = 100_000
+# Modules the light commands must not pull in
+HEAVY_MODULES = ("yaml", "zipfile", "shutil", "http.client", "src.ppp.runner", "src.ppp.receipts.emitter")
+
+
+def _import_times(statement):
+    """Module -> cumulative import time (us) as reported by -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def _imported_by(statement):
+    """Modules imported by `statement` beyond interpreter startup (site hooks)."""
+    baseline = _import_times("pass")
+    return {m: t for m, t in _import_times(statement).items() if m not in baseline}
+
+
+def test_cli_entry_point_is_light():
+    """Importing the CLI does not import the runner graph."""
+    times = _imported_by("import src.ppp.main")
+    assert not [m for m in HEAVY_MODULES if m in times]
+    assert times["src.ppp.main"] <= CLI_IMPORT_BUDGET_US
+
+
+def test_status_imports_stay_light():
+    """The receipt index used by `ppp status` avoids the emitter and YAML."""
+    times = _imported_by("import src.ppp.storage.receipt_index")
+    assert not [m for m in HEAVY_MODULES if m in times]
+
+
+def test_lazy_package_exports():
+    import src.ppp as ppp
+    import src.ppp.receipts as receipts
+
+    assert "PPPRunner" in dir(ppp)
+    assert ppp.PolicyEvaluator.__name__ == "PolicyEvaluator"
+    assert receipts.ReceiptEmitter.__name__ == "ReceiptEmitter"
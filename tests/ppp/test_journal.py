@@ -0,0 +1,59 @@
+"""Tests for the shared JSONL journal and bounded pool helpers."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.ppp.storage.journal import JsonlJournal, iter_journal
+from src.ppp.workflows.parallel import run_bounded
+
+
+def test_torn_final_line_is_skipped_and_cut_before_appending(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    with JsonlJournal(path) as journal:
+        journal.append({"n": 1})
+    with open(path, 'a') as f:
+        f.write('{"n": 2, "tor')
+    assert list(iter_journal(path)) == [{"n": 1}]
+
+    with JsonlJournal(path) as journal:
+        journal.append({"n": 3})
+    assert path.read_text() == '{"n": 1}\n{"n": 3}\n'
+    assert list(iter_journal(tmp_path / "missing.jsonl")) == []
+
+
+def test_only_the_final_line_may_be_bad(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    path.write_text('{"n": 1}\nnot json\n')
+    assert list(iter_journal(path)) == [{"n": 1}]
+    JsonlJournal(path).close()  # reopening drops it too
+    assert path.read_text() == '{"n": 1}\n'
+
+    path.write_text('{"n": 1}\nnot json\n{"n": 3}\n')
+    with pytest.raises(ValueError, match="journal.jsonl:2: corrupt journal entry"):
+        list(iter_journal(path))
+
+
+def test_complete_entries_are_never_truncated(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    entries = [{"n": i, "pad": "x" * 40000} for i in range(4)]  # lines longer than one read chunk
+    path.write_text("".join(json.dumps(e) + "\n" for e in entries) + "\n")
+    with JsonlJournal(path) as journal:
+        journal.append({"n": 4})
+    assert [e["n"] for e in iter_journal(path)] == [0, 1, 2, 3, 4]
+
+
+def test_run_bounded_caps_in_flight_work_and_collects_every_item():
+    collected = {}
+    in_flight = []
+
+    def items():
+        for i in range(50):
+            in_flight.append(i - len(collected))  # futures still pending when the next item is drawn
+            yield i
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        run_bounded(pool, lambda item: item * 2, items(), collected.__setitem__, limit=3)
+    assert collected == {i: i * 2 for i in range(50)}
+    assert max(in_flight) < 3
@@ -0,0 +1,79 @@
+"""Tests for batch receipt sealing."""
+
+import hashlib
+
+from src.ppp.keon.seal import KeonSealer, NoopSealer, TemporalSealer
+from src.ppp.receipts.merkle import MerkleTree
+
+
+def _receipts(n):
+    return [{"receipt_id": f"r-{i}", "receipt_hash": hashlib.sha256(str(i).encode()).hexdigest()} for i in range(n)]
+
+
+def test_temporal_sealer_accepts_no_config():
+    """TemporalSealer() should work without a config dict."""
+    sealer = TemporalSealer()
+    assert sealer.sealer_id == "temporal-sealer-v0.1.0"
+
+
+def test_seal_batch_one_timestamp_and_root():
+    """A batch gets one sealed root and a path per receipt."""
+    receipts = _receipts(6)
+    sealer = TemporalSealer()
+    batch = sealer.seal_batch(receipts)
+
+    assert batch["leaf_count"] == 6
+    assert batch["merkle_root"] == MerkleTree([r["receipt_hash"] for r in receipts]).root
+    assert set(batch["seal"]) == {"timestamp_utc", "seal_hash", "sealed_by"}
+    assert [leaf["leaf_index"] for leaf in batch["leaves"]] == list(range(6))
+    assert sealer.verify_batch(receipts, batch)
+    for receipt, leaf in zip(receipts, batch["leaves"]):
+        assert sealer.verify_leaf(receipt, leaf, batch)
+
+
+def test_verify_batch_detects_tampering():
+    """Changed, reordered or truncated batches should fail."""
+    receipts = _receipts(5)
+    sealer = TemporalSealer()
+    batch = sealer.seal_batch(receipts)
+
+    tampered = [dict(r) for r in receipts]
+    tampered[2]["receipt_hash"] = "00" * 32
+    assert not sealer.verify_batch(tampered, batch)
+    assert not sealer.verify_batch(receipts[::-1], batch)
+    assert not sealer.verify_batch(receipts[:4], batch)
+    assert not sealer.verify_leaf(tampered[2], batch["leaves"][2], batch)
+
+    forged = dict(batch, seal=dict(batch["seal"], timestamp_utc="2020-01-01T00:00:00Z"))
+    assert not sealer.verify_batch(receipts, forged)
+
+
+def test_batch_without_a_seal_is_invalid():
+    """A missing or malformed root seal fails verification instead of raising."""
+    receipts = _receipts(3)
+    sealer = TemporalSealer()
+    batch = sealer.seal_batch(receipts)
+    unsealed = {k: v for k, v in batch.items() if k != "seal"}
+    for bad in (unsealed, dict(batch, seal=None), dict(batch, seal="deadbeef")):
+        assert not sealer.verify_batch(receipts, bad)
+        assert not sealer.verify_leaf(receipts[0], batch["leaves"][0], bad)
+    assert not KeonSealer().verify_batch(receipts, unsealed)
+
+
+def test_keon_sealer_reuses_delegate():
+    """KeonSealer should hold one TemporalSealer and delegate batches to it."""
+    sealer = KeonSealer({"sealer_id": "keon-fallback"})
+    delegate = sealer.delegate
+    receipts = _receipts(3)
+    batch = sealer.seal_batch(receipts)
+
+    assert sealer.delegate is delegate
+    assert batch["seal"]["sealed_by"] == "keon-fallback"
+    assert sealer.verify_batch(receipts, batch)
+
+
+def test_noop_sealer_batch():
+    """Noop batch verification always passes."""
+    sealer = NoopSealer()
+    receipts = _receipts(2)
+    assert sealer.verify_batch(receipts, sealer.seal_batch(receipts))
@@ -0,0 +1,94 @@
+"""Tests for guarantee-claim detection in LanguageRemediationEvaluator."""
+
+import re
+from pathlib import Path
+
+import pytest
+from src.ppp.evaluators.language_remediation_evaluator import LanguageRemediationEvaluator
+
+POLICY = Path(__file__).resolve().parents[2] / "configs" / "ppp" / "policies" / "policy.language-remediation.yaml"
+
+TEXT = """# Overview
+This layer guarantees delivery and ensures ordering.
+Nothing here.
+The audit log is complete.
+Fully
+documented API."""
+
+
+@pytest.fixture
+def evaluator():
+    return LanguageRemediationEvaluator(str(POLICY))
+
+
+def test_claims_have_lines_context_and_rule_order(evaluator):
+    claims = evaluator.detect_guarantee_claims(TEXT, "C")
+    assert [(c.line_number, c.pattern_matched) for c in claims] == [
+        (2, "guarantees"), (2, "ensures"), (4, "complete"),
+    ]
+    first = claims[0]
+    assert first.text == "This layer guarantees delivery and ensures ordering."
+    assert first.context_before == "# Overview"
+    assert first.context_after == "Nothing here. The audit log is complete."
+    assert claims[2].context_after == "Fully documented API."
+
+
+def test_matches_do_not_span_lines(evaluator):
+    """'fully\\s+documented' only matches within one line, as a per-line scan would."""
+    claims = evaluator.detect_guarantee_claims("It is fully  documented.\nfully\ndocumented", "G")
+    assert [(c.line_number, c.pattern_matched) for c in claims] == [(1, "fully  documented")]
+
+
+def test_unknown_directive_and_invalid_patterns(evaluator):
+    assert evaluator.detect_guarantee_claims(TEXT, "X") == []
+    evaluator.policy = {"directives": {"Z": {"rules": [
+        {"pattern": "[", "replacement": "-"},
+        {"pattern": r"^\s*must\b", "replacement": "should"},
+        {"pattern": "(will|shall) always", "replacement": "aims to"},
+    ]}}}
+    claims = evaluator.detect_guarantee_claims("  MUST run\nit will always work\nwe must", "Z")
+    assert [(c.line_number, c.pattern_matched) for c in claims] == [(1, "  MUST"), (2, "will always")]
+
+
+def test_suggestions_use_the_matching_rule(evaluator):
+    """Each claim is replaced per the rule that detected it, not the first rule matching its line."""
+    claims = evaluator.detect_guarantee_claims(TEXT, "C")
+    assert [c.rule_index for c in claims] == [0, 1, 4]
+    assert [c.claim_type for c in claims] == ["Type B", "Type A", "Type D"]
+    suggestions = evaluator.suggest_replacements(claims, "C")
+    assert [s["suggested_replacement"] for s in suggestions] == [
+        "provides", "provides", "covers core functionality",
+    ]
+
+
+def _per_line_scan(evaluator, text, directive_id):
+    """The former detection loop: every rule over every line."""
+    found = []
+    for line_num, line in enumerate(text.split('\n'), 1):
+        for index, rule in enumerate(evaluator.policy['directives'][directive_id]['rules']):
+            for match in re.compile(rule['pattern'], re.IGNORECASE).finditer(line):
+                found.append((line_num, index, match.group(0)))
+    return found
+
+
+def test_overlapping_rules_each_report_their_match(evaluator):
+    """Rules whose matches overlap on a line are all reported, not only the first at a position."""
+    evaluator.policy = {"directives": {"Z": {"rules": [
+        {"pattern": r"\bguarantee", "replacement": "aim"},
+        {"pattern": r"\bguaranteed delivery\b", "replacement": "delivery"},
+        {"pattern": r"delivery is complete", "replacement": "delivery finishes"},
+    ]}}}
+    claims = evaluator.detect_guarantee_claims("Guaranteed delivery is complete.\nnone", "Z")
+    assert [(c.line_number, c.rule_index, c.pattern_matched) for c in claims] == [
+        (1, 0, "Guarantee"), (1, 1, "Guaranteed delivery"), (1, 2, "delivery is complete"),
+    ]
+
+
+@pytest.mark.parametrize("directive_id", ["C", "G", "K"])
+def test_matches_the_per_line_scan(evaluator, directive_id):
+    words = [r["pattern"].replace(r"\b", "").replace(r"\s+", " ") for d in evaluator.policy["directives"].values()
+             for r in d["rules"]]
+    text = "\n".join(f"Line {i}: {words[i % len(words)]} and {words[(i * 7) % len(words)]}." for i in range(200))
+    claims = evaluator.detect_guarantee_claims(text, directive_id)
+    assert [(c.line_number, c.rule_index, c.pattern_matched) for c in claims] == \
+        _per_line_scan(evaluator, text, directive_id)
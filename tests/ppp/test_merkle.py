@@ -0,0 +1,106 @@
+"""Tests for the receipts Merkle tree and emitter inclusion proofs."""
+
+import hashlib
+import json
+
+import pytest
+from src.ppp.receipts.emitter import ReceiptEmitter
+from src.ppp.receipts.merkle import MerkleTree, verify_proof
+from src.ppp.receipts.schema import CanonicalSerializer
+
+
+def _hashes(n):
+    return [hashlib.sha256(str(i).encode()).hexdigest() for i in range(n)]
+
+
+def _receipt(i):
+    return CanonicalSerializer.create_receipt(
+        receipt_id=f"r-{i}",
+        run_id="run-merkle",
+        agent_id="agent-1",
+        event="test_event",
+        phase="test_phase",
+        status="completed",
+        policy={"policy_id": "policy.loose"},
+        decision={"intent": "test", "chosen_action": "test", "confidence": 1.0},
+        input_payload={"i": i},
+    )
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 8, 13])
+def test_every_leaf_proves_against_root(n):
+    """Each leaf's audit path should reproduce the root, for any leaf count."""
+    hashes = _hashes(n)
+    tree = MerkleTree(hashes)
+    for i, h in enumerate(hashes):
+        assert verify_proof(h, tree.prove(i), tree.root)
+
+
+def test_tampering_fails_verification():
+    """Wrong leaf, altered path or other root should all fail."""
+    hashes = _hashes(7)
+    tree = MerkleTree(hashes)
+    path = tree.prove(3)
+
+    assert not verify_proof(hashes[4], path, tree.root)
+    assert not verify_proof(hashes[3], path, MerkleTree(hashes[:6]).root)
+    bad = [dict(step) for step in path]
+    bad[0]["side"] = "left" if bad[0]["side"] == "right" else "right"
+    assert not verify_proof(hashes[3], bad, tree.root)
+
+
+def test_leaf_order_changes_root():
+    """Root commits to emission order."""
+    hashes = _hashes(4)
+    assert MerkleTree(hashes).root != MerkleTree(hashes[::-1]).root
+
+
+def test_empty_tree_rejected():
+    with pytest.raises(ValueError):
+        MerkleTree([])
+
+
+def test_emitter_manifest_root_and_proofs(tmp_path):
+    """Seal manifest root should verify proofs, including from a fresh emitter."""
+    receipts = [_receipt(i) for i in range(5)]
+    emitter = ReceiptEmitter(report_root=str(tmp_path))
+    emitter.emit_receipts("run-merkle", receipts)
+    evidence_dir = emitter.create_evidence_pack("run-merkle", receipts, "none", "none", "none")
+
+    manifest = json.loads((tmp_path / "run-merkle" / "evidence-pack" / "seal-manifest.json").read_text())
+    root = manifest["merkle"]["root"]
+    assert manifest["merkle"]["leaf_count"] == 5
+    assert evidence_dir.endswith("evidence-pack")
+
+    proof = emitter.prove("r-3")
+    assert proof["receipt_hash"] == receipts[3].receipt_hash
+    assert ReceiptEmitter.verify_proof(proof, root)
+
+    reloaded = ReceiptEmitter(report_root=str(tmp_path)).prove("r-3", run_id="run-merkle")
+    assert reloaded == proof
+
+    proof["receipt_hash"] = receipts[2].receipt_hash
+    assert not ReceiptEmitter.verify_proof(proof, root)
+
+    with pytest.raises(LookupError):
+        emitter.prove("missing")
+
+
+def test_emitter_looks_up_receipts_by_id(tmp_path):
+    """get_receipt reads one receipt through the cached index and follows re-emits."""
+    emitter = ReceiptEmitter(report_root=str(tmp_path))
+    emitter.emit_receipts("run-lookup", [_receipt(i) for i in range(5)])
+    assert emitter.get_receipt("run-lookup", "r-3")["receipt_hash"] == _receipt(3).receipt_hash
+    assert (tmp_path / "run-lookup" / "receipts.jsonl.idx").exists()
+    assert emitter.get_receipt("run-lookup", "r-9") is None
+
+    emitter.emit_receipts("run-lookup", [_receipt(i) for i in range(10)])
+    assert emitter.get_receipt("run-lookup", "r-9")["receipt_id"] == "r-9"
+    with pytest.raises(ValueError, match="Receipts not found"):
+        emitter.get_receipt("no-such-run", "r-0")
+
+
+def test_prove_all_matches_prove():
+    """Batch path generation should match per-leaf proofs."""
+    tree = MerkleTree(_hashes(11))
+    assert tree.prove_all() == [tree.prove(i) for i in range(11)]
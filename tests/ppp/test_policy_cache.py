@@ -0,0 +1,111 @@
+"""Tests for the compiled policy cache."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+import yaml
+
+from src.ppp.config.cache import PolicyCache
+from src.ppp.config.loader import ConfigLoader
+from src.ppp.config.models import PolicyConfig
+from src.ppp.policy.engine import PolicyEvaluator
+
+POLICY = Path(__file__).resolve().parents[2] / "configs" / "ppp" / "policies" / "policy.strict.yaml"
+
+
+def _load(cache, path):
+    return cache.load(str(path), "policy", ConfigLoader.build_policy_config, clone=PolicyConfig.clone)
+
+
+def test_repeat_loads_are_in_process_hits(tmp_path):
+    cache = PolicyCache(cache_dir=None)
+    first = _load(cache, POLICY)
+    second = _load(cache, POLICY)
+    assert second == first and second is not first
+    assert second.compiled is first.compiled  # the compiled plan is shared, not rebuilt
+    assert cache.stats == {"hits": 1, "disk_hits": 0, "misses": 1}
+    assert len(first.compiled) == len(first.rules)
+
+
+def test_disk_cache_survives_new_process_and_tracks_content(tmp_path):
+    """A fresh cache reuses the pickle; edited content is re-parsed."""
+    path = tmp_path / "policy.yaml"
+    shutil.copy(POLICY, path)
+    _load(PolicyCache(cache_dir=str(tmp_path / "cache")), path)
+
+    cache = PolicyCache(cache_dir=str(tmp_path / "cache"))
+    policy = _load(cache, path)
+    assert cache.stats["disk_hits"] == 1
+    assert policy == ConfigLoader.build_policy_config(yaml.safe_load(POLICY.read_text()))
+
+    # Touched but unchanged content is still a hit; changed content is a miss
+    os.utime(path, ns=(1, 1))
+    assert _load(cache, path) == policy
+    assert cache.stats["hits"] == 1
+    path.write_text(POLICY.read_text().replace("policy.strict", "policy.edited", 1))
+    assert _load(cache, path).id != policy.id
+    assert cache.stats["misses"] == 1
+
+
+def test_stale_pickle_is_ignored(tmp_path):
+    cache_dir = tmp_path / "cache"
+    _load(PolicyCache(cache_dir=str(cache_dir)), POLICY)
+    for pickle_file in cache_dir.iterdir():
+        pickle_file.write_bytes(b"not a pickle")
+    cache = PolicyCache(cache_dir=str(cache_dir))
+    assert _load(cache, POLICY).rules
+    assert cache.stats["misses"] == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership only")
+def test_shared_cache_dir_is_never_trusted(tmp_path):
+    """A group/other-writable cache dir is neither read from nor written to."""
+    cache_dir = tmp_path / "cache"
+    _load(PolicyCache(cache_dir=str(cache_dir)), POLICY)
+    assert (cache_dir.stat().st_mode & 0o777) == 0o700
+    pickles = list(cache_dir.iterdir())
+
+    cache_dir.chmod(0o777)
+    cache = PolicyCache(cache_dir=str(cache_dir))
+    _load(cache, POLICY)
+    assert cache.stats == {"hits": 0, "disk_hits": 0, "misses": 1}
+    assert list(cache_dir.iterdir()) == pickles
+
+    cache_dir.chmod(0o700)
+    pickles[0].chmod(0o666)
+    cache = PolicyCache(cache_dir=str(cache_dir))
+    _load(cache, POLICY)
+    assert cache.stats["disk_hits"] == 0
+
+
+def test_tests_use_a_private_cache_dir(private_policy_cache):
+    from src.ppp.config.cache import default_cache_dir, policy_cache
+    assert default_cache_dir() == policy_cache.cache_dir == private_policy_cache
+
+
+def test_cached_policy_evaluates_like_fresh_policy():
+    """The compiled rule plan gives the same decisions as uncompiled rules."""
+    cached = ConfigLoader.load_policy_config(str(POLICY))
+    fresh = ConfigLoader.build_policy_config(yaml.safe_load(POLICY.read_text()))
+    fresh.compiled = []
+    text = "Contact me at someone@example.com, this is guaranteed financial advice"
+    assert PolicyEvaluator(cached).evaluate({}, text) == PolicyEvaluator(fresh).evaluate({}, text)
+
+
+def test_edited_rules_are_recompiled_and_do_not_leak():
+    """An in-place rule edit changes that caller's decisions only."""
+    text = "Contact me at someone@example.com"
+    policy = ConfigLoader.load_policy_config(str(POLICY))
+    assert not PolicyEvaluator(policy).evaluate({}, text).allowed
+
+    for rule in policy.rules:
+        if rule["id"] == "no_pii":
+            rule["parameters"]["patterns"] = []
+    assert PolicyEvaluator(policy).evaluate({}, text).allowed
+
+    # The edit stayed in that caller's copy
+    again = ConfigLoader.load_policy_config(str(POLICY))
+    assert again.rules != policy.rules
+    assert not PolicyEvaluator(again).evaluate({}, text).allowed
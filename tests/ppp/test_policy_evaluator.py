@@ -187,3 +187,10 @@ def test_no_deception_detection(loose_policy):
     # Check if no_deception rule was triggered
     triggered_rules = [r for r in decision.rules_triggered if r["rule_id"] == "no_deception"]
     assert len(triggered_rules) > 0
+
+
+def test_malformed_rule_rejected_at_load(loose_policy):
+    """Rules are validated once, when the evaluator compiles the policy."""
+    loose_policy.rules.append({"id": "no_pii", "severity": "SOMETIMES", "parameters": {}})
+    with pytest.raises(ValueError):
+        PolicyEvaluator(loose_policy)
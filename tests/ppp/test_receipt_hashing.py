@@ -0,0 +1,47 @@
+"""Tests for classification and human decision receipt hashing."""
+
+import pytest
+from src.ppp.receipts.classification import ClassificationReceipt
+from src.ppp.receipts.human_decision import HumanDecisionReceipt
+
+
+def _classification(**overrides):
+    fields = dict(
+        receipt_id="r0", workflow_id="wf", document_id="d0", source_repo="omega-docs",
+        source_path="p/0.md", document_name="0.md", detected_audience="public", target_repo="keon-docs",
+        policy_decision="MITIGATE", detected_claims=["a", "b"], violated_rules=["x"],
+        timestamp="2026-01-01T00:00:00", policy_rationale="why",
+    )
+    fields.update(overrides)
+    return ClassificationReceipt(**fields)
+
+
+def _decision(**overrides):
+    fields = dict(
+        decision_id="d0", workflow_id="wf", finding_id="f0", decision_type="MODIFY", authority="me",
+        timestamp="2026-01-01T00:00:00", modified_content="new", original_finding_rule_id="r",
+    )
+    fields.update(overrides)
+    return HumanDecisionReceipt(**fields)
+
+
+def test_hashes_match_pinned_values():
+    """Lazily computed hashes are unchanged from the eager asdict-based ones."""
+    assert _classification().receipt_hash == "c8054cc63e638749331a34ad3d417357a4dec02c03bca2ba4e92eecaa67136f4"
+    assert _decision().decision_hash == "8386b55ab4b6533043b8b44e4cb63a9bf9400c3d5cc70321dd51011547437de8"
+
+
+def test_supplied_hash_is_ignored_and_serialized():
+    receipt = _classification(receipt_hash="forged")
+    assert receipt.receipt_hash == _classification().receipt_hash
+    data = receipt.to_dict()
+    assert data["receipt_hash"] == receipt.receipt_hash
+    assert ClassificationReceipt(**data) == receipt
+    assert "suggested_action" not in data
+
+
+def test_validation_still_runs_on_construction():
+    with pytest.raises(ValueError):
+        _classification(policy_decision="MAYBE")
+    with pytest.raises(ValueError):
+        _decision(decision_type="REJECT")
@@ -0,0 +1,144 @@
+"""Tests for the cross-run receipt index."""
+
+import json
+import sqlite3
+
+import pytest
+from src.ppp.receipts.schema import CanonicalSerializer
+from src.ppp.storage.receipt_index import ReceiptIndex
+
+
+def _finding_receipt(run_id, i, rule_id, status="flagged"):
+    return CanonicalSerializer.create_receipt(
+        receipt_id=f"{run_id}-f{i}",
+        run_id=run_id,
+        agent_id="docs-governance-tone-scan",
+        event="governance_finding_detected",
+        phase="emit_receipts",
+        status=status,
+        policy={"id": "docs-governance-tone"},
+        decision={"allowed": False, "rule_id": rule_id, "severity": "P1"},
+        artifacts={"finding": {
+            "location": f"docs/page{i}.md:3:4",
+            "message": f"Autonomy claim without governance context {i}",
+            "text_snippet": "fully autonomous agents",
+        }},
+    )
+
+
+@pytest.fixture
+def index(tmp_path):
+    return ReceiptIndex(str(tmp_path / "progress.db"))
+
+
+def test_ingest_and_summary(index):
+    """Ingested receipts are counted per status, event and rule."""
+    receipts = [_finding_receipt("run-a", i, f"rule_{i % 2}") for i in range(6)]
+    assert index.ingest("run-a", receipts) == 6
+
+    summary = index.run_summary("run-a")
+    assert summary["total_receipts"] == 6
+    assert summary["by_rule_id"] == {"rule_0": 3, "rule_1": 3}
+    assert summary["by_status"] == {"flagged": 6}
+    assert index.find("run-a", document_id="docs/page2.md")[0]["receipt_id"] == "run-a-f2"
+    assert len(index.find(rule_id="rule_1")) == 3
+
+
+def test_reingest_replaces_run(index):
+    """Indexing a run again replaces its rows instead of duplicating them."""
+    index.ingest("run-a", [_finding_receipt("run-a", i, "rule_0") for i in range(4)])
+    index.ingest("run-a", [_finding_receipt("run-a", i, "rule_0") for i in range(2)])
+    assert index.indexed_runs() == [{"run_id": "run-a", "receipts": 2}]
+    assert index.counts("run-a", "rule_id") == {"rule_0": 2}
+
+
+def test_search_messages(index):
+    """FTS over finding messages finds receipts by text."""
+    index.ingest("run-a", [_finding_receipt("run-a", i, "rule_0") for i in range(3)])
+    hits = index.search("autonomy", run_id="run-a")
+    assert len(hits) == 3
+    assert index.search("nonexistentword") == []
+
+
+def test_compare_runs(index):
+    """Drift between runs is reported per rule."""
+    index.ingest("pre", [_finding_receipt("pre", i, f"rule_{i % 3}") for i in range(9)])
+    index.ingest("post", [_finding_receipt("post", i, "rule_0") for i in range(2)])
+    diff = index.compare_runs("pre", "post")
+    assert diff["values"]["rule_0"] == {"a": 3, "b": 2, "delta": -1}
+    assert diff["values"]["rule_2"]["delta"] == -3
+    with pytest.raises(ValueError):
+        index.counts("pre", "agent_id")
+
+
+def test_ingest_jsonl_groups_by_run(index, tmp_path):
+    """JSONL ingest groups receipts by their own run_id."""
+    path = tmp_path / "receipts.jsonl"
+    with open(path, 'w') as f:
+        for run_id in ("r1", "r1", "r2"):
+            f.write(json.dumps(_finding_receipt(run_id, 0, "rule_0").to_dict()) + "\n")
+    assert index.ingest_jsonl(str(path)) == {"r1": 2, "r2": 1}
+
+
+def test_ingest_jsonl_appends_repeated_runs(index, tmp_path):
+    """A run interleaved with another is appended to, not replaced, when streamed."""
+    path = tmp_path / "receipts.jsonl"
+    with open(path, 'w') as f:
+        for i, run_id in enumerate(("r1", "r2", "r1")):
+            f.write(json.dumps(_finding_receipt(run_id, i, "rule_0").to_dict()) + "\n")
+    assert index.ingest_jsonl(str(path)) == {"r1": 2, "r2": 1}
+    assert [r["receipt_id"] for r in index.iter_run("r1")] == ["r1-f0", "r1-f2"]
+
+
+def test_ingest_retry_reinserts_generator_input(index, monkeypatch):
+    """A "database is locked" retry indexes the receipts again, not an exhausted iterator."""
+    chunks = ReceiptIndex._chunks
+    calls = []
+
+    def locked_once(run_id, receipts, start=0):
+        calls.append(run_id)
+        if len(calls) == 1:
+            list(receipts)
+            raise sqlite3.OperationalError("database is locked")
+        return chunks(run_id, receipts, start)
+
+    monkeypatch.setattr(ReceiptIndex, "_chunks", staticmethod(locked_once))
+    monkeypatch.setattr(index, "INITIAL_BACKOFF", 0)
+    count = index.ingest("r1", (_finding_receipt("r1", i, "rule_0") for i in range(3)))
+    assert (count, len(calls)) == (3, 2)
+    assert index.run_summary("r1")["total_receipts"] == 3
+
+
+def test_schema_ddl_runs_once_and_read_only_never_writes(tmp_path, monkeypatch):
+    """Reopening skips the DDL; read-only stores neither create nor change the database."""
+    db = tmp_path / "progress.db"
+    assert ReceiptIndex(str(db), read_only=True) and not db.exists()
+
+    created = []
+    create_schema = ReceiptIndex._create_schema
+    monkeypatch.setattr(ReceiptIndex, "_create_schema", lambda self, conn: created.append(1) or create_schema(self, conn))
+    ReceiptIndex(str(db)).ingest("run-a", [_finding_receipt("run-a", i, "rule_0") for i in range(2)])
+    ReceiptIndex(str(db))
+    assert len(created) == 1
+
+    before = db.read_bytes()
+    reader = ReceiptIndex(str(db), read_only=True)
+    assert reader.run_summary("run-a")["total_receipts"] == 2
+    with pytest.raises(sqlite3.OperationalError, match="readonly"):
+        reader.ingest("run-b", [_finding_receipt("run-b", 0, "rule_0")])
+    assert db.read_bytes() == before and len(created) == 1
+
+
+def test_status_command_opens_the_database_read_only(tmp_path, monkeypatch, capsys):
+    from src.ppp import main as cli
+
+    db = tmp_path / "progress.db"
+    monkeypatch.setattr("sys.argv", ["ppp", "status", "--db", str(db)])
+    assert cli.main() == 0 and not db.exists()
+
+    ReceiptIndex(str(db)).ingest("run-a", [_finding_receipt("run-a", 0, "rule_0")])
+    before = db.read_bytes()
+    monkeypatch.setattr("sys.argv", ["ppp", "status", "--db", str(db), "--run-id", "run-a"])
+    assert cli.main() == 0
+    assert "Receipts: 1" in capsys.readouterr().out
+    assert db.read_bytes() == before
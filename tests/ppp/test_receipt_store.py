@@ -0,0 +1,70 @@
+"""Tests for the memory-mapped receipt store."""
+
+import json
+import os
+
+import pytest
+from src.ppp.receipts.store import ReceiptStore
+
+
+def _write_receipts(path, n=10):
+    with open(path, 'w') as f:
+        for i in range(n):
+            f.write(json.dumps({
+                "receipt_id": f"r-{i}",
+                "event": "governance_finding_detected" if i % 2 else "phase_completed",
+                "status": "flagged" if i % 3 == 0 else "approved",
+                "decision": {"rule_id": f"rule_{i % 4}"},
+            }) + "\n")
+            if i == 4:
+                f.write("\n")  # blank lines are skipped
+
+
+def test_random_access_and_lookup(tmp_path):
+    """Receipts are addressable by ordinal and by receipt_id."""
+    path = tmp_path / "receipts.jsonl"
+    _write_receipts(path)
+    with ReceiptStore(str(path)) as store:
+        assert len(store) == 10
+        assert store[5]["receipt_id"] == "r-5"
+        assert store.get("r-7")["decision"]["rule_id"] == "rule_3"
+        assert store.get("missing") is None
+
+
+def test_filtered_iteration(tmp_path):
+    """Filters intersect across fields and accept lists of values."""
+    path = tmp_path / "receipts.jsonl"
+    _write_receipts(path)
+    with ReceiptStore(str(path)) as store:
+        ids = [r["receipt_id"] for r in store.find(event="governance_finding_detected", status="flagged")]
+        assert ids == ["r-3", "r-9"]
+        assert store.count(rule_id=["rule_0", "rule_1"]) == 6
+        assert store.values("status") == {"flagged": 4, "approved": 6}
+        with pytest.raises(ValueError):
+            store.count(agent_id="x")
+
+
+def test_index_cached_and_invalidated(tmp_path):
+    """The index is reused until the receipts file changes."""
+    path = tmp_path / "receipts.jsonl"
+    _write_receipts(path)
+    ReceiptStore(str(path)).close()
+    index_path = tmp_path / "receipts.jsonl.idx"
+    assert index_path.exists()
+
+    with ReceiptStore(str(path)) as store:
+        assert store.count(status="flagged") == 4
+
+    _write_receipts(path, n=3)
+    os.utime(path, ns=(1, 1))
+    with ReceiptStore(str(path)) as store:
+        assert len(store) == 3
+        assert store.get("r-5") is None
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "receipts.jsonl"
+    path.write_text("")
+    with ReceiptStore(str(path)) as store:
+        assert len(store) == 0
+        assert list(store.find(status="approved")) == []
@@ -183,3 +183,24 @@ def test_input_output_hash_different():
     
     assert receipt1.input_hash != receipt2.input_hash
     assert receipt1.output_hash != receipt2.output_hash
+
+
+def test_receipt_is_immutable_and_serializes_without_none():
+    """Receipts are frozen; to_dict drops unset optional fields."""
+    receipt = CanonicalSerializer.create_receipt(
+        receipt_id="test-1",
+        run_id="run-1",
+        agent_id="agent-1",
+        event="test",
+        phase="test",
+        status="completed",
+        policy={"id": "p"},
+        decision={"allowed": True},
+    )
+    with pytest.raises(AttributeError):
+        receipt.status = "denied"
+    data = receipt.to_dict()
+    assert "artifacts" not in data and "failure_stage" not in data
+    assert data["decision"] == {"allowed": True}
+    assert Receipt(**data) == receipt
+    assert CanonicalSerializer.verify_receipt_hash(receipt)
@@ -0,0 +1,97 @@
+"""Tests for the run-to-run diff engine."""
+
+import json
+
+import pytest
+from src.ppp.receipts.diff import RunDiff, iter_drift_report, open_source
+
+
+def _classified(doc, decision, target="omega-docs"):
+    return {
+        "receipt_id": f"r-{doc}",
+        "event": "document_classified",
+        "status": decision.lower(),
+        "decision": {"document_id": doc, "policy_decision": decision, "target_repo": target},
+        "receipt_hash": f"hash-{doc}-{decision}",
+    }
+
+
+BEFORE = [_classified("a", "MITIGATE"), _classified("b", "ALLOW"), _classified("c", "DENY")]
+AFTER = [_classified("a", "ALLOW"), _classified("b", "ALLOW"), _classified("d", "ALLOW")]
+
+
+def _by_key(entries):
+    return {e["key"]: e for e in entries}
+
+
+def test_hash_join_reports_transitions():
+    """Added, removed and changed documents are reported with transitions."""
+    engine = RunDiff()
+    entries = _by_key(engine.diff(BEFORE, AFTER))
+    assert entries["a"]["change"] == "changed"
+    assert entries["a"]["transition"] == "MITIGATE→ALLOW"
+    assert entries["c"]["change"] == "removed"
+    assert entries["d"]["change"] == "added"
+    assert "b" not in entries
+    assert engine.summary["mode"] == "hash"
+    assert engine.summary["counts"] == {"changed": 1, "removed": 1, "added": 1, "unchanged": 1}
+    assert engine.summary["transitions"] == {"MITIGATE→ALLOW": 1}
+
+
+def test_merge_join_matches_hash_join(tmp_path):
+    """Spilling to sorted runs on disk gives the same result in key order."""
+    before = [_classified(f"doc-{i:04d}", "MITIGATE" if i % 3 else "ALLOW") for i in range(500)]
+    after = [_classified(f"doc-{i:04d}", "ALLOW", target="keon-docs" if i % 7 == 0 else "omega-docs")
+             for i in range(100, 600)]
+    expected = sorted(RunDiff().diff(before, after), key=lambda e: e["key"])
+
+    engine = RunDiff(max_in_memory=50, spill_chunk=64, tmp_dir=str(tmp_path))
+    entries = list(engine.diff(before, after))
+    assert engine.summary["mode"] == "merge"
+    assert entries == expected
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_duplicate_keys_keep_last_record_in_both_modes(tmp_path):
+    """Both join modes compare the last record of a repeated key and keep key types."""
+    def row(doc, decision):
+        return {"decision": {"document_id": doc, "policy_decision": decision}}
+
+    before = [row(i, "DENY") for i in range(40)] + [row(3, "MITIGATE"), row(5, "ALLOW")]
+    after = [row(3, "ALLOW"), row(5, "DENY")] + [row(i, "DENY") for i in range(2, 60)] + [row(3, "MITIGATE")]
+
+    hashed = RunDiff()
+    merged = RunDiff(max_in_memory=10, spill_chunk=7, tmp_dir=str(tmp_path))
+    hash_entries = list(hashed.diff(before, after, include_unchanged=True))
+    merge_entries = list(merged.diff(before, after, include_unchanged=True))
+    assert (hashed.summary["mode"], merged.summary["mode"]) == ("hash", "merge")
+    assert merge_entries == sorted(hash_entries, key=lambda e: e["key"])
+    entries = _by_key(merge_entries)
+    assert entries[3]["transition"] == "MITIGATE→MITIGATE" and entries[3]["change"] == "unchanged"
+    assert entries[5]["transition"] == "ALLOW→DENY"
+    assert all(isinstance(key, int) for key in entries)
+    expected = {"changed": 1, "removed": 2, "added": 20, "unchanged": 37}
+    assert hashed.summary["counts"] == merged.summary["counts"] == expected
+
+
+def test_drift_reports_imply_allow(tmp_path):
+    """Documents dropping out of a drift report are ALLOW transitions."""
+    pre = {"phases": {"drift_report": {
+        "mitigations": [{"document_id": "a", "reason": "audience_mismatch"}],
+        "denials": [{"document_id": "c", "violation": "public_guarantee_claim"}],
+    }}}
+    post = {"mitigations": [], "denials": [{"document_id": "c", "violation": "public_guarantee_claim"}]}
+    path = tmp_path / "pre.json"
+    path.write_text(json.dumps(pre))
+
+    engine = RunDiff(absent_decision="ALLOW")
+    entries = list(engine.diff(open_source(str(path)), iter_drift_report(post)))
+    assert [(e["key"], e["transition"]) for e in entries] == [("a", "MITIGATE→ALLOW")]
+
+
+def test_open_source_requires_known_input(tmp_path):
+    (tmp_path / "evidence-pack").mkdir()
+    (tmp_path / "evidence-pack" / "receipts.jsonl").write_text(json.dumps(BEFORE[0]) + "\n")
+    assert [r["receipt_id"] for r in open_source(str(tmp_path))] == ["r-a"]
+    with pytest.raises(ValueError):
+        open_source(str(tmp_path / "missing-run"))
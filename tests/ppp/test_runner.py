@@ -4,6 +4,7 @@ import pytest
 import tempfile
 from pathlib import Path
 from src.ppp.runner import PPPRunner
+from src.ppp.storage.receipt_index import ReceiptIndex
 
 
 def test_runner_init():
@@ -64,3 +65,15 @@ def test_runner_with_mock_target():
     
     exit_code = runner.run_all()
     assert exit_code == 0
+
+
+def test_runner_indexes_each_run_separately(tmp_path):
+    """Each agent's run indexes only its own receipts, not earlier agents'."""
+    runner = PPPRunner("configs/ppp/ppp.run.yaml")
+    runner.store = ReceiptIndex(str(tmp_path / "progress.db"))
+    assert runner.run_all() == 0
+
+    runs = runner.store.indexed_runs()
+    assert len(runs) == len(runner.config.agents)
+    for run in runs:
+        assert {r["run_id"] for r in runner.store.iter_run(run["run_id"])} == {run["run_id"]}
@@ -0,0 +1,87 @@
+"""Tests for HTTP target and local stand-in server."""
+
+import time
+
+import pytest
+from src.ppp.targets.http import HttpTarget
+from src.ppp.targets.mock import MockTarget
+from src.ppp.targets.standin import StandInServer, StandInConfig
+
+
+@pytest.fixture
+def server():
+    """Start a stand-in server with no injected conditions."""
+    with StandInServer(StandInConfig(seed=1)) as srv:
+        yield srv
+
+
+def test_http_target_matches_mock_payloads(server):
+    """HTTP target should return the same payloads as the mock target."""
+    target = HttpTarget({"url": server.url})
+    mock = MockTarget({})
+
+    assert target.discover() == mock.discover()
+    assert target.observe("target_1") == mock.observe("target_1")
+    draft = target.participate("target_0", "thread_0", "draft text")
+    assert draft["not_posted"] is True
+    assert draft["text"] == "draft text"
+    target.close()
+
+
+def test_http_target_reuses_connections(server):
+    """Sequential calls should share one keep-alive connection."""
+    target = HttpTarget({"url": server.url, "pool_size": 2})
+    for _ in range(10):
+        target.discover()
+    target.close()
+
+    assert server.stats["requests"] == 10
+    assert server.stats["connections"] == 1
+
+
+def test_standin_error_injection():
+    """Injected failures should surface as errors from the target."""
+    with StandInServer(StandInConfig(error_rate=1.0)) as srv:
+        target = HttpTarget({"url": srv.url})
+        with pytest.raises(RuntimeError, match="503"):
+            target.discover()
+        target.close()
+
+
+def test_standin_rate_limit():
+    """Requests beyond the token bucket should be rejected with 429."""
+    with StandInServer(StandInConfig(rate_limit_per_sec=2)) as srv:
+        target = HttpTarget({"url": srv.url})
+        statuses = []
+        for _ in range(5):
+            try:
+                target.discover()
+                statuses.append(200)
+            except RuntimeError as e:
+                statuses.append(429 if "429" in str(e) else 0)
+        target.close()
+
+    assert statuses.count(200) == 2
+    assert statuses.count(429) == 3
+
+
+def test_standin_latency_and_payload_size():
+    """Latency and payload size should be injected per request."""
+    config = StandInConfig(latency_ms=30, payload_bytes=4096)
+    with StandInServer(config) as srv:
+        target = HttpTarget({"url": srv.url})
+        start = time.perf_counter()
+        observation = target.observe("target_0")
+        elapsed = time.perf_counter() - start
+        target.close()
+
+    assert elapsed >= 0.03
+    assert len(observation["padding"]) == 4096
+
+
+def test_standin_config_validation():
+    """Invalid stand-in settings should be rejected."""
+    with pytest.raises(ValueError):
+        StandInConfig(latency_distribution="pareto")
+    with pytest.raises(ValueError):
+        StandInConfig(error_rate=1.5)